@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Compare per-capability and batched capability classification.
+
+Runs both classification modes of the classifier node against an Osprey
+project's registered capabilities and reports wall-clock latency, number of
+LLM requests and prompt/completion tokens for each mode.
+
+Must be run from a project directory (or with CONFIG_FILE set) so the
+registry and classifier model configuration can be loaded.
+
+Usage:
+    # Live comparison against the configured classifier model
+    python scripts/benchmark_classification.py
+    python scripts/benchmark_classification.py --runs 3 --query "Plot the beam current"
+
+    # Estimate prompt tokens only (no LLM calls)
+    python scripts/benchmark_classification.py --dry-run
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+
+DEFAULT_QUERIES = [
+    "What is the current beam current?",
+    "Plot the beam lifetime over the last 24 hours",
+    "Find the channels for the storage ring BPMs and read their values",
+    "Hello, what can you do?",
+]
+
+
+@dataclass
+class ModeStats:
+    """Accumulated measurements for one classification mode."""
+
+    latencies: list[float] = field(default_factory=list)
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+def _create_usage_tracker():
+    """Register a LiteLLM callback that records request count and token usage."""
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class UsageTracker(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.stats = None
+
+        def _record(self, response_obj):
+            usage = getattr(response_obj, "usage", None)
+            if self.stats is None or usage is None:
+                return
+            self.stats.requests += 1
+            self.stats.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            self.stats.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+        def log_success_event(self, kwargs, response_obj, start_time, end_time):
+            self._record(response_obj)
+
+        async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+            self._record(response_obj)
+
+    tracker = UsageTracker()
+    litellm.callbacks.append(tracker)
+    return tracker
+
+
+def _initialize():
+    """Load the project registry quietly and return the classifiable capabilities."""
+    import logging
+
+    from osprey.registry import get_registry, initialize_registry
+    from osprey.utils.log_filter import quiet_logger
+
+    logging.getLogger("osprey").setLevel(logging.WARNING)
+    with quiet_logger(["REGISTRY", "CONFIG", "classifier"]):
+        initialize_registry(silent=True)
+
+    registry = get_registry()
+    always_active = registry.get_always_active_capability_names()
+    return [cap for cap in registry.get_all_capabilities() if cap.name not in always_active]
+
+
+async def _classify(mode: str, query: str, capabilities, max_concurrent: int, batch_size: int):
+    """Classify one query with the requested mode and return the selected names."""
+    from osprey.infrastructure.classification_node import CapabilityClassifier, _classify_batched
+    from osprey.utils.logger import get_logger
+
+    logger = get_logger("classifier")
+    classifier = CapabilityClassifier(query, {}, logger)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    if mode == "batched":
+        results = await _classify_batched(classifier, capabilities, semaphore, batch_size, logger)
+    else:
+        results = await asyncio.gather(
+            *(classifier.classify(cap, semaphore) for cap in capabilities),
+            return_exceptions=True,
+        )
+    return [cap.name for cap, result in zip(capabilities, results, strict=True) if result is True]
+
+
+async def run_live(args, capabilities) -> int:
+    tracker = _create_usage_tracker()
+    stats = {"per_capability": ModeStats(), "batched": ModeStats()}
+    disagreements = 0
+
+    for query in args.query or DEFAULT_QUERIES:
+        selections = {}
+        for _ in range(args.runs):
+            for mode, mode_stats in stats.items():
+                tracker.stats = mode_stats
+                start = time.perf_counter()
+                selections[mode] = await _classify(
+                    mode, query, capabilities, args.max_concurrent, args.batch_size
+                )
+                mode_stats.latencies.append(time.perf_counter() - start)
+        tracker.stats = None
+
+        agree = set(selections["per_capability"]) == set(selections["batched"])
+        disagreements += not agree
+        print(f"\n{query}")
+        print(f"  per_capability: {sorted(selections['per_capability'])}")
+        print(f"  batched:        {sorted(selections['batched'])}{'' if agree else '  (differs)'}")
+
+    print(
+        f"\n{'mode':<16}{'median s':>10}{'max s':>10}{'requests':>10}{'prompt':>10}{'completion':>12}"
+    )
+    for mode, mode_stats in stats.items():
+        print(
+            f"{mode:<16}{statistics.median(mode_stats.latencies):>10.2f}"
+            f"{max(mode_stats.latencies):>10.2f}{mode_stats.requests:>10}"
+            f"{mode_stats.prompt_tokens:>10}{mode_stats.completion_tokens:>12}"
+        )
+    print(f"\nQueries with differing selections: {disagreements}")
+    return 0
+
+
+def run_dry(args, capabilities) -> int:
+    import litellm
+
+    from osprey.base import ClassifierExample
+    from osprey.infrastructure.classification_node import CapabilityClassifier
+    from osprey.utils.config import get_model_config
+    from osprey.utils.logger import get_logger
+
+    model_id = get_model_config("classifier").get("model_id") or "gpt-4o"
+    logger = get_logger("classifier")
+
+    def count(text: str) -> int:
+        return litellm.token_counter(model=model_id, text=text)
+
+    for query in args.query or DEFAULT_QUERIES:
+        classifier = CapabilityClassifier(query, {}, logger)
+        entries = []
+        per_capability = 0
+        for cap in capabilities:
+            guide = classifier._get_classifier(cap)
+            if not guide:
+                continue
+            per_capability += count(classifier._build_classification_prompt(guide))
+            examples = ClassifierExample.join(guide.examples, randomize=True, seed=cap.name)
+            entries.append((cap.name, guide.instructions, examples))
+        batched = sum(
+            count(classifier._build_batch_classification_prompt(entries[i : i + args.batch_size]))
+            for i in range(0, len(entries), args.batch_size)
+        )
+        print(f"\n{query}")
+        print(f"  per_capability: {len(entries)} requests, ~{per_capability} prompt tokens")
+        print(
+            f"  batched:        {-(-len(entries) // args.batch_size)} requests, "
+            f"~{batched} prompt tokens"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--query", action="append", help="Query to classify (repeatable)")
+    parser.add_argument("--runs", type=int, default=1, help="Repetitions per query and mode")
+    parser.add_argument("--max-concurrent", type=int, default=5, help="Concurrent LLM requests")
+    parser.add_argument("--batch-size", type=int, default=20, help="Capabilities per batch")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Estimate prompt tokens without calling the LLM"
+    )
+    args = parser.parse_args()
+
+    capabilities = _initialize()
+    if not capabilities:
+        print("No classifiable capabilities registered.")
+        return 1
+    print(f"Benchmarking classification over {len(capabilities)} capabilities")
+
+    if args.dry_run:
+        return run_dry(args, capabilities)
+    return asyncio.run(run_live(args, capabilities))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of merging capability context into agent state.
+
+Builds a conversation's accumulated context (a number of context entries,
+each holding a large time series) and times ``merge_capability_context_data``
+merging one small update into it, next to the deep-copying merge the reducer
+used before structural sharing.
+
+Usage:
+    python scripts/benchmark_context_merge.py
+    python scripts/benchmark_context_merge.py --contexts 50 --points 100000 --runs 5
+"""
+
+import argparse
+import copy
+import statistics
+import sys
+import time
+
+from osprey.state.state import merge_capability_context_data
+
+
+def deepcopy_merge(existing, new):
+    """The previous reducer: deep copies all existing and new context data."""
+    if existing is None:
+        return copy.deepcopy(new)
+    result = copy.deepcopy(existing)
+    for context_type, contexts in new.items():
+        result.setdefault(context_type, {})
+        for context_key, context_data in contexts.items():
+            result[context_type][context_key] = copy.deepcopy(context_data)
+    return result
+
+
+def build_context(contexts: int, points: int) -> dict:
+    """Accumulated context: ``contexts`` archiver results of ``points`` samples each."""
+    return {
+        "ARCHIVER_DATA": {
+            f"series_{i}": {
+                "timestamps": [1_700_000_000.0 + t for t in range(points)],
+                "values": [float(t % 97) for t in range(points)],
+            }
+            for i in range(contexts)
+        }
+    }
+
+
+def time_merge(merge, existing, update, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        merge(existing, update)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _format(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--contexts", type=int, default=50, help="Accumulated context entries")
+    parser.add_argument("--points", type=int, default=100_000, help="Samples per context entry")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per merge")
+    parser.add_argument(
+        "--skip-deepcopy", action="store_true", help="Only time the structural-sharing merge"
+    )
+    args = parser.parse_args()
+
+    existing = build_context(args.contexts, args.points)
+    update = {"CHANNEL_VALUES": {"beam_current": {"value": 500.2}}}
+    print(
+        f"Merging one small update into {args.contexts} contexts "
+        f"of {args.points:,} points ({args.runs} runs)"
+    )
+
+    modes = [("structural sharing", merge_capability_context_data)]
+    if not args.skip_deepcopy:
+        modes.append(("deep copy (previous)", deepcopy_merge))
+
+    for name, merge in modes:
+        timings = time_merge(merge, existing, update, args.runs)
+        print(
+            f"  {name:<22} median {_format(statistics.median(timings)):>10}"
+            f"   max {_format(max(timings)):>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
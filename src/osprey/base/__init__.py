@@ -49,7 +49,13 @@ from .examples import (
 )
 from .nodes import BaseInfrastructureNode
 from .planning import ExecutionPlan, PlannedStep
-from .results import CapabilityMatch, ExecutionRecord, ExecutionResult
+from .results import (
+    CapabilityDecision,
+    CapabilityDecisions,
+    CapabilityMatch,
+    ExecutionRecord,
+    ExecutionResult,
+)
 
 __all__ = [
     "BaseCapability",
@@ -58,6 +64,8 @@ __all__ = [
     "infrastructure_node",
     "ExecutionResult",
     "ExecutionRecord",
+    "CapabilityDecision",
+    "CapabilityDecisions",
     "CapabilityMatch",
     "PlannedStep",
     "ExecutionPlan",
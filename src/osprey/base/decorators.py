@@ -47,6 +47,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from osprey.base.errors import ErrorSeverity
+from osprey.base.resilience import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    is_infrastructure_error,
+)
 from osprey.events import (
     CapabilityCompleteEvent,
     CapabilityStartEvent,
@@ -259,7 +264,13 @@ def capability_node(cls):
             )
         )
 
+        # Shared across sessions: fast-fail while this capability's services are down
+        breaker = get_circuit_breaker(f"capability:{capability_name}")
+
         try:
+            if breaker is not None:
+                breaker.check()
+
             # Execute based on method type
             if is_static:
                 # OLD: Static method (backward compatibility)
@@ -281,6 +292,9 @@ def capability_node(cls):
             execution_time = time.time() - start_time
             duration_ms = int(execution_time * 1000)
 
+            if breaker is not None:
+                breaker.record_success()
+
             # Emit CapabilityCompleteEvent on success
             emitter.emit(
                 CapabilityCompleteEvent(
@@ -356,6 +370,10 @@ def capability_node(cls):
                 )
             )
 
+            # Only unreachable/unresponsive services count towards opening the circuit
+            if breaker is not None and is_infrastructure_error(exc):
+                breaker.record_failure()
+
             # Get step info (use synthetic step in direct chat mode)
             if direct_chat_mode:
                 current_step_index = 0
@@ -398,6 +416,7 @@ def capability_node(cls):
                     "capability_name": capability_name,
                     "classification": error_classification,
                     "retry_policy": retry_policy,
+                    "circuit_open": isinstance(exc, CircuitOpenError),
                     "original_error": str(exc),
                     "user_message": error_classification.user_message or str(exc),
                     "execution_time": execution_time,
@@ -140,6 +140,7 @@ class BaseExample(ABC):
         max_examples: int | None = None,
         randomize: bool = False,
         add_numbering: bool = False,
+        seed: int | str | None = None,
     ) -> str:
         """Join multiple examples into a formatted string for prompt inclusion.
 
@@ -153,6 +154,8 @@ class BaseExample(ABC):
             max_examples: Optional limit on number of examples to include
             randomize: Whether to randomize order (prevents positional bias)
             add_numbering: Whether to add numbered headers to each example
+            seed: Optional seed for randomization; the same seed always yields the
+                same order, keeping prompts stable for provider-side prompt caching
 
         Returns:
             Formatted string ready for prompt inclusion, empty string if no examples
@@ -174,6 +177,9 @@ class BaseExample(ABC):
                 formatted = BaseExample.join(examples, randomize=True)
                 # Returns examples in random order
 
+                formatted = BaseExample.join(examples, randomize=True, seed="my_capability")
+                # Returns examples in a shuffled but reproducible order
+
         .. note::
            This method provides a unified interface for formatting example collections.
            All customization is handled through parameters.
@@ -192,7 +198,10 @@ class BaseExample(ABC):
             import random
 
             examples_to_use = examples_to_use.copy()
-            random.shuffle(examples_to_use)
+            if seed is None:
+                random.shuffle(examples_to_use)
+            else:
+                random.Random(seed).shuffle(examples_to_use)
 
         # Format examples
         formatted = []
@@ -0,0 +1,289 @@
+"""Retry Backoff and Circuit Breakers
+
+This module provides the process-wide failure memory used by the router and the
+connector factory. Retry delays use exponential backoff with jitter so that
+concurrent sessions retrying the same service do not hit it in lockstep, and
+circuit breakers fast-fail calls to a capability or connector after repeated
+infrastructure errors (archiver down, gateway unreachable) instead of letting
+every session wait for its own timeouts.
+
+Circuit states:
+    - **closed**: Calls pass through; consecutive infrastructure errors are counted
+    - **open**: Calls fail immediately with :class:`CircuitOpenError` until the
+      cool-down expires
+    - **half_open**: One trial call is let through; success closes the circuit,
+      failure opens it again
+
+Breakers are keyed by name (``capability:<name>``, ``control_system:<type>``,
+``archiver:<type>``) and shared by all sessions in the process. State changes are
+logged through the component logger and therefore appear as status events.
+
+Configuration (``execution_control.circuit_breaker`` in config.yml)::
+
+    execution_control:
+      circuit_breaker:
+        enabled: true
+        failure_threshold: 5        # Consecutive infrastructure errors before opening
+        reset_timeout_seconds: 30   # Cool-down before a trial call is allowed
+
+.. seealso::
+   :func:`osprey.infrastructure.router_node.router_conditional_edge` : Retry routing
+   :class:`osprey.connectors.factory.ConnectorFactory` : Per-connector breakers
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT_SECONDS = 30.0
+
+# Upper bound for a single retry delay unless the policy sets max_delay_seconds
+DEFAULT_MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Relative spread of retry delays unless the policy sets jitter
+DEFAULT_RETRY_JITTER = 0.25
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a service whose circuit breaker is open.
+
+    Subclasses :class:`ConnectionError` so existing error classification treats it
+    as an unavailable service.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit breaker '{name}' is open after repeated failures; "
+            f"retrying in {retry_after:.0f}s"
+        )
+
+
+def is_infrastructure_error(exc: BaseException) -> bool:
+    """Return whether an exception indicates an unreachable or unresponsive service.
+
+    Follows the ``__cause__`` / ``__context__`` chain, so a connection error or
+    timeout wrapped in a domain exception (``raise ChannelAccessError(...) from e``)
+    still counts. A :class:`CircuitOpenError` anywhere in the chain does not.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        if isinstance(current, CircuitOpenError):
+            return False
+        if isinstance(current, (ConnectionError, TimeoutError)):
+            return True
+        seen.add(id(current))
+        if current.__cause__ is not None:
+            current = current.__cause__
+        elif not current.__suppress_context__:
+            current = current.__context__
+        else:
+            current = None
+    return False
+
+
+def compute_retry_delay(
+    retry_policy: dict[str, Any], attempt: int, rng: random.Random | None = None
+) -> float:
+    """Compute the delay before a retry from a node's retry policy.
+
+    Uses exponential backoff (``delay_seconds * backoff_factor ** (attempt - 1)``),
+    capped at ``max_delay_seconds`` and spread by ``±jitter`` (a fraction of the
+    delay).
+
+    :param retry_policy: Policy from ``get_retry_policy()``
+    :param attempt: Number of failed attempts so far (1 for the first retry)
+    :param rng: Optional random generator, for reproducible delays
+    :return: Delay in seconds; 0 before the first attempt
+    """
+    if attempt < 1:
+        return 0.0
+
+    delay_seconds = retry_policy.get("delay_seconds", 0.5)
+    backoff_factor = retry_policy.get("backoff_factor", 1.5)
+    max_delay = retry_policy.get("max_delay_seconds", DEFAULT_MAX_RETRY_DELAY_SECONDS)
+    jitter = retry_policy.get("jitter", DEFAULT_RETRY_JITTER)
+
+    delay = min(delay_seconds * backoff_factor ** (attempt - 1), max_delay)
+    if jitter > 0 and delay > 0:
+        delay *= 1 + jitter * (2 * (rng or random).random() - 1)
+    return max(delay, 0.0)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial call.
+
+    Thread-safe; one instance is shared by all sessions using the same service.
+
+    :param name: Breaker name shown in logs and status events
+    :param failure_threshold: Consecutive failures that open the circuit
+    :param reset_timeout: Seconds the circuit stays open before a trial call
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the cool-down expired."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_started = None
+            logger.info(f"Circuit '{self.name}' half-open, allowing a trial call")
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit allows a trial call (0 when not open)."""
+        with self._lock:
+            if self._current_state(time.monotonic()) != OPEN:
+                return 0.0
+            return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed.
+
+        In the half-open state only one trial call is let through at a time; a trial
+        that never reports back is replaced after ``reset_timeout``.
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            if state == CLOSED:
+                return True
+            if state == OPEN:
+                return False
+            if self._probe_started is None or now - self._probe_started >= self.reset_timeout:
+                self._probe_started = now
+                return True
+            return False
+
+    def check(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may proceed."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_after())
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            previous = self._state
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_started = None
+        if previous != CLOSED:
+            logger.success(f"Circuit '{self.name}' closed, service recovered")
+
+    def record_failure(self) -> None:
+        """Record an infrastructure failure, opening the circuit at the threshold."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            self._failures += 1
+            opened = state == HALF_OPEN or (
+                state == CLOSED and self._failures >= self.failure_threshold
+            )
+            if opened:
+                self._state = OPEN
+                self._opened_at = now
+                self._probe_started = None
+            failures = self._failures
+        if opened:
+            logger.warning(
+                f"Circuit '{self.name}' open after {failures} consecutive failures; "
+                f"fast-failing for {self.reset_timeout:.0f}s"
+            )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state as a plain dictionary."""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _get_breaker_settings() -> dict[str, Any]:
+    try:
+        from osprey.utils.config import get_config_value
+
+        return get_config_value("execution_control.circuit_breaker", {}) or {}
+    except Exception:
+        return {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker | None:
+    """Get the process-wide circuit breaker for a service, creating it on first use.
+
+    :param name: Breaker name, e.g. ``capability:channel_read`` or ``archiver:epics_archiver``
+    :return: The breaker, or None when circuit breakers are disabled in config
+    """
+    breaker = _breakers.get(name)
+    if breaker is not None:
+        return breaker
+
+    settings = _get_breaker_settings()
+    if not settings.get("enabled", True):
+        return None
+
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+                reset_timeout=settings.get("reset_timeout_seconds", DEFAULT_RESET_TIMEOUT_SECONDS),
+            )
+        return _breakers[name]
+
+
+def is_circuit_open(name: str) -> bool:
+    """Return whether an existing circuit breaker currently rejects calls.
+
+    Unlike :func:`get_circuit_breaker`, this never creates a breaker.
+    """
+    breaker = _breakers.get(name)
+    return breaker is not None and breaker.state == OPEN
+
+
+def get_circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """Return a snapshot of every circuit breaker created in this process."""
+    return {name: breaker.snapshot() for name, breaker in list(_breakers.items())}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all circuit breakers (for tests and configuration reloads)."""
+    with _breakers_lock:
+        _breakers.clear()
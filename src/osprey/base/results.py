@@ -280,3 +280,37 @@ class CapabilityMatch(BaseModel):
     is_match: bool = Field(
         description="A boolean (true or false) indicating if the user's request matches the capability."
     )
+
+
+class CapabilityDecision(BaseModel):
+    """Classification decision for one capability within a batched request.
+
+    :param capability: Name of the capability the decision refers to
+    :param is_match: Whether the user's request requires the capability
+    :param certain: False if the request is ambiguous for this capability; such
+        decisions are re-checked with a dedicated single-capability request
+    """
+
+    capability: str = Field(description="The exact capability name being assessed.")
+    is_match: bool = Field(
+        description="A boolean (true or false) indicating if the user's request matches the capability."
+    )
+    certain: bool = Field(
+        description="false if the request is ambiguous for this capability, otherwise true."
+    )
+
+
+class CapabilityDecisions(BaseModel):
+    """Result of classifying several capabilities in one structured-output request.
+
+    Used by the batched classification mode (``execution_control.classification.mode:
+    batched``) as the output model of a single LLM call that assesses many
+    capabilities at once. Each entry mirrors a :class:`CapabilityMatch`.
+
+    .. seealso::
+       :class:`CapabilityMatch` : Single-capability classification result
+    """
+
+    decisions: list[CapabilityDecision] = Field(
+        description="One decision per capability listed in the prompt."
+    )
@@ -25,8 +25,12 @@ Configuration:
     The capability code remains the same - just change the config!
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+from pydantic import Field, PrivateAttr, model_validator
 
 from osprey.base.capability import BaseCapability
 from osprey.base.decorators import capability_node
@@ -37,6 +41,15 @@ from osprey.base.examples import (
 )
 from osprey.connectors.factory import ConnectorFactory
 from osprey.context import CapabilityContext
+from osprey.context.artifacts import (
+    ArtifactNotFoundError,
+    TimeSeriesArtifact,
+    load_timeseries,
+    save_timeseries,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ========================================================
 # Context Class
@@ -47,52 +60,151 @@ class ArchiverDataContext(CapabilityContext):
     """
     Structured context for archiver data capability results.
 
-    This stores archiver data with datetime objects for full datetime functionality and consistency.
+    The time series itself lives out-of-band in a memory-mappable artifact (see
+    :mod:`osprey.context.artifacts`); the context only carries the handle plus a
+    small summary, so state updates, checkpoints and ``context.json`` stay small.
+    ``timestamps`` and ``time_series_data`` load the artifact lazily and keep the
+    familiar access patterns working. Contexts built with inline ``timestamps``
+    and ``time_series_data`` (older checkpoints, tests) are still supported.
     Based on ALS Assistant's ArchiverDataContext pattern with downsampling support.
     """
 
     CONTEXT_TYPE: ClassVar[str] = "ARCHIVER_DATA"
     CONTEXT_CATEGORY: ClassVar[str] = "COMPUTATIONAL_DATA"
 
-    timestamps: list[datetime]  # List of datetime objects for full datetime functionality
     precision_ms: int  # Data precision in milliseconds
-    time_series_data: dict[
-        str, list[float]
-    ]  # Channel name -> time series values (aligned with timestamps)
     available_channels: list[str]  # List of available channel names for intuitive filtering
+    artifact: str | None = None  # artifact:// handle of the stored time series
+    total_points: int = 0  # Number of timestamps in the series
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+
+    # Legacy inline payload (only used when no artifact is set)
+    inline_timestamps: list[datetime] | None = Field(default=None, alias="timestamps")
+    inline_time_series_data: dict[str, list[float]] | None = Field(
+        default=None, alias="time_series_data"
+    )
+
+    _series: TimeSeriesArtifact | None = PrivateAttr(default=None)
+    _unavailable_reason: str | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _summarize_inline_data(self) -> "ArchiverDataContext":
+        """Fill the summary fields for contexts created with inline data."""
+        if self.artifact is None and self.inline_timestamps and not self.total_points:
+            self.total_points = len(self.inline_timestamps)
+            self.start_time = self.inline_timestamps[0]
+            self.end_time = self.inline_timestamps[-1]
+        return self
+
+    @property
+    def series(self) -> TimeSeriesArtifact | None:
+        """Memory-mapped view over the stored artifact (None for inline data).
+
+        Raises:
+            ArtifactNotFoundError: If the artifact no longer exists (e.g. pruned
+                from the artifact store); the data must be retrieved again
+        """
+        if self.artifact is None:
+            return None
+        if self._unavailable_reason is not None:
+            raise ArtifactNotFoundError(self._unavailable_reason)
+        if self._series is None:
+            try:
+                self._series = load_timeseries(self.artifact)
+            except ArtifactNotFoundError as e:
+                self._unavailable_reason = (
+                    f"Archiver data {self.artifact} is no longer available "
+                    f"(the stored artifact was removed); retrieve the data again. {e}"
+                )
+                raise ArtifactNotFoundError(self._unavailable_reason) from e
+        return self._series
+
+    @property
+    def data_available(self) -> bool:
+        """Whether the time series can still be read."""
+        try:
+            return self.artifact is None or self.series is not None
+        except ArtifactNotFoundError:
+            return False
+
+    @property
+    def timestamps(self) -> Any:
+        """Timestamps of the series (DatetimeIndex when artifact-backed).
+
+        Raises:
+            ArtifactNotFoundError: If the stored artifact is no longer available
+        """
+        if self.artifact is None:
+            return self.inline_timestamps or []
+        return self.series.index
+
+    @property
+    def time_series_data(self) -> dict[str, Any]:
+        """Channel name -> values (memory-mapped NumPy arrays when artifact-backed).
+
+        Raises:
+            ArtifactNotFoundError: If the stored artifact is no longer available
+        """
+        if self.artifact is None:
+            return self.inline_time_series_data or {}
+        return self.series.columns
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Get the data as a DataFrame indexed by timestamp (zero-copy when artifact-backed).
+
+        Raises:
+            ArtifactNotFoundError: If the stored artifact is no longer available
+        """
+        if self.artifact is not None:
+            return self.series.to_dataframe()
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.inline_time_series_data or {}, index=pd.DatetimeIndex(self.timestamps)
+        )
+
+    def _unavailable_details(self) -> dict[str, Any]:
+        return {
+            "ERROR": self._unavailable_reason,
+            "total_points": self.total_points,
+            "available_channels": self.available_channels,
+            "time_range": {"start": self.start_time, "end": self.end_time},
+        }
 
     def get_access_details(self, key: str) -> dict[str, Any]:
         """Rich description of the archiver data structure."""
-        total_points = len(self.timestamps)
+        if not self.data_available:
+            return self._unavailable_details()
 
         # Get example channel for demo purposes
         example_channel = self.available_channels[0] if self.available_channels else "SR:CURRENT:RB"
-        example_value = (
-            self.time_series_data[example_channel][0]
-            if self.available_channels and self.time_series_data.get(example_channel)
-            else 100.5
-        )
+        example_values = self.time_series_data.get(example_channel) if self.total_points else None
+        example_value = example_values[0] if example_values is not None else 100.5
 
-        start_time = self.timestamps[0]
-        end_time = self.timestamps[-1]
-        duration = end_time - start_time
+        duration = (
+            self.end_time - self.start_time if self.start_time and self.end_time else "unknown"
+        )
 
         return {
-            "total_points": total_points,
+            "total_points": self.total_points,
             "precision_ms": self.precision_ms,
             "channel_count": len(self.available_channels),
             "available_channels": self.available_channels,
-            "time_info": f"Data spans from {start_time} to {end_time} (duration: {duration})",
-            "data_structure": "4 attributes: timestamps (list of datetime objects), precision_ms (int), time_series_data (dict of channel_name -> list of float values), available_channels (list of channel names)",
+            "time_info": f"Data spans from {self.start_time} to {self.end_time} (duration: {duration})",
+            "data_structure": "timestamps (pandas DatetimeIndex of timestamps), precision_ms (int), time_series_data (dict of channel_name -> NumPy array of values, aligned with timestamps), available_channels (list of channel names), to_dataframe() (pandas DataFrame with one column per channel)",
             "CRITICAL_ACCESS_PATTERNS": {
+                "get_dataframe": f"df = context.{self.CONTEXT_TYPE}.{key}.to_dataframe()",
                 "get_channel_names": f"channel_names = context.{self.CONTEXT_TYPE}.{key}.available_channels",
                 "get_channel_data": f"data = context.{self.CONTEXT_TYPE}.{key}.time_series_data['CHANNEL_NAME']",
                 "get_timestamps": f"timestamps = context.{self.CONTEXT_TYPE}.{key}.timestamps",
                 "get_single_value": f"value = context.{self.CONTEXT_TYPE}.{key}.time_series_data['CHANNEL_NAME'][index]",
                 "get_time_at_index": f"time = context.{self.CONTEXT_TYPE}.{key}.timestamps[index]",
             },
-            "example_usage": f"context.{self.CONTEXT_TYPE}.{key}.time_series_data['{example_channel}'][0] gives {example_value}, context.{self.CONTEXT_TYPE}.{key}.timestamps[0] gives datetime object",
+            "example_usage": f"context.{self.CONTEXT_TYPE}.{key}.time_series_data['{example_channel}'][0] gives {example_value}, context.{self.CONTEXT_TYPE}.{key}.timestamps[0] gives a datetime (pandas Timestamp)",
             "datetime_features": "Full datetime functionality: arithmetic, comparison, formatting with .strftime(), timezone operations",
+            "performance_note": "Data is memory-mapped: prefer vectorized NumPy/pandas operations over Python loops and avoid .tolist() on large arrays",
         }
 
     def get_summary(self) -> dict[str, Any]:
@@ -100,10 +212,13 @@ class ArchiverDataContext(CapabilityContext):
         FOR HUMAN DISPLAY: Format data for response generation.
         Downsamples large datasets to prevent context window overflow.
         """
+        if not self.data_available:
+            return self._unavailable_details()
+
         max_samples = 10
 
         try:
-            total_points = len(self.timestamps)
+            total_points = self.total_points
 
             # Create sample indices (start, middle, end)
             if total_points <= max_samples:
@@ -119,23 +234,24 @@ class ArchiverDataContext(CapabilityContext):
                 sample_indices = sorted(set(sample_indices))  # Remove duplicates and sort
 
             # Sample timestamps
-            sample_timestamps = [self.timestamps[i] for i in sample_indices]
+            timestamps = self.timestamps
+            sample_timestamps = [timestamps[i] for i in sample_indices]
 
-            # Sample channel data
+            # Sample channel data (vectorized; memory-mapped data is only paged in as read)
             channel_summary = {}
             for channel_name, values in self.time_series_data.items():
-                sample_values = [values[i] for i in sample_indices]
+                values = np.asarray(values)
 
                 channel_summary[channel_name] = {
-                    "sample_values": sample_values,
+                    "sample_values": values[sample_indices].tolist(),
                     "sample_timestamps": sample_timestamps,
                     "statistics": {
                         "total_points": len(values),
-                        "min_value": min(values),
-                        "max_value": max(values),
-                        "first_value": values[0],
-                        "last_value": values[-1],
-                        "mean_value": sum(values) / len(values),
+                        "min_value": values.min().item(),
+                        "max_value": values.max().item(),
+                        "first_value": values[0].item(),
+                        "last_value": values[-1].item(),
+                        "mean_value": values.mean().item(),
                     },
                 }
 
@@ -146,8 +262,8 @@ class ArchiverDataContext(CapabilityContext):
                     "total_points": total_points,
                     "precision_ms": self.precision_ms,
                     "time_range": {
-                        "start": self.timestamps[0] if self.timestamps else None,
-                        "end": self.timestamps[-1] if self.timestamps else None,
+                        "start": self.start_time,
+                        "end": self.end_time,
                     },
                     "downsampling_info": f"Showing {len(sample_indices)} sample points out of {total_points} total points",
                 },
@@ -269,12 +385,10 @@ class ArchiverRetrievalCapability(BaseCapability):
             params = self.get_parameters()
             precision_ms = params.get("precision_ms", 1000)
 
-            # Create archiver connector from configuration
+            # Lease a pooled archiver connector from configuration
             # This will use 'mock_archiver' for development or 'epics_archiver' for production
             # based on the 'archiver' section in config.yml
-            connector = await ConnectorFactory.create_archiver_connector()
-
-            try:
+            async with ConnectorFactory.lease_archiver_connector() as connector:
                 # Retrieve the data from archiver (returns pandas DataFrame)
                 archiver_df = await connector.get_data(
                     pv_list=channels_to_retrieve,
@@ -283,41 +397,39 @@ class ArchiverRetrievalCapability(BaseCapability):
                     precision_ms=precision_ms,
                 )
 
-                logger.status("Converting archiver data to structured format...")
+                logger.status("Storing archiver data...")
 
-                # Extract timestamps from DataFrame index
-                timestamps = [ts.to_pydatetime() for ts in archiver_df.index]
-
-                # Extract time series data for each channel
-                time_series_data = {
-                    channel: archiver_df[channel].tolist()
-                    for channel in channels_to_retrieve
+                # Keep only the requested channels the archiver actually returned
+                available_channels = [
+                    channel
+                    for channel in dict.fromkeys(channels_to_retrieve)
                     if channel in archiver_df.columns
-                }
+                ]
+                archiver_df = archiver_df[available_channels]
+
+                # Write the series out-of-band; the context only carries the handle
+                artifact = await asyncio.to_thread(save_timeseries, archiver_df)
 
                 logger.debug(
-                    f"Retrieved archiver data with {len(timestamps)} timestamps and {len(time_series_data)} channels"
+                    f"Retrieved archiver data with {len(archiver_df.index)} timestamps and {len(available_channels)} channels ({artifact})"
                 )
 
-            finally:
-                # Always disconnect connector
-                await connector.disconnect()
-
             logger.status("Creating archiver data context...")
 
-            # Create rich context object
+            # Create context object holding the handle plus summary
             archiver_context = ArchiverDataContext(
-                timestamps=timestamps,
+                artifact=artifact,
                 precision_ms=precision_ms,
-                time_series_data=time_series_data,
-                available_channels=list(time_series_data.keys()),
+                available_channels=available_channels,
+                total_points=len(archiver_df.index),
+                start_time=archiver_df.index[0].to_pydatetime() if len(archiver_df.index) else None,
+                end_time=archiver_df.index[-1].to_pydatetime() if len(archiver_df.index) else None,
             )
 
-            # Log archiver data info with safe timestamp access
-            start_time = archiver_context.timestamps[0] if archiver_context.timestamps else "N/A"
-            end_time = archiver_context.timestamps[-1] if archiver_context.timestamps else "N/A"
+            start_time = archiver_context.start_time or "N/A"
+            end_time = archiver_context.end_time or "N/A"
             logger.info(
-                f"Retrieved archiver data: {len(archiver_context.timestamps)} points for {len(archiver_context.available_channels)} channels from {start_time} to {end_time}"
+                f"Retrieved archiver data: {archiver_context.total_points} points for {len(archiver_context.available_channels)} channels from {start_time} to {end_time}"
             )
 
             # Store result in execution context
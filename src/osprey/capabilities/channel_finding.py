@@ -10,6 +10,7 @@ Based on ALS Assistant's PV Address Finding capability pattern.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, ClassVar
 
@@ -21,7 +22,7 @@ from osprey.base.examples import (
     TaskClassifierGuide,
 )
 from osprey.context import CapabilityContext
-from osprey.services.channel_finder.service import ChannelFinderService
+from osprey.services.channel_finder.service import get_channel_finder_service
 
 # ========================================================
 # Context Class
@@ -156,8 +157,9 @@ class ChannelFindingCapability(BaseCapability):
         _configure_service_logging(logger, "osprey")
 
         try:
-            # Initialize service (reads pipeline_mode from config.yml at runtime)
-            service = ChannelFinderService()
+            # Shared service (database loaded once per process, reloaded on change);
+            # loading may read and expand the database, so keep it off the event loop
+            service = await asyncio.to_thread(get_channel_finder_service)
 
             logger.status("Searching channel database...")
 
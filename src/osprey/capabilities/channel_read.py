@@ -26,8 +26,19 @@ Configuration:
                             port: 5064
 
     The capability code remains the same - just change the config!
+
+    Bulk reads (config.yml, all optional):
+        control_system:
+            channel_read:
+                batch_size: 100               # Channels per bulk read request
+                max_concurrent_batches: 4     # Batches in flight at once
+                allow_partial_results: false  # Return successes + failure map
+
+    Channels are read through the connector's bulk API in bounded-concurrency
+    batches, with one progress update per completed batch.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any, ClassVar
 
@@ -66,6 +77,7 @@ class ChannelValuesContext(CapabilityContext):
     CONTEXT_CATEGORY: ClassVar[str] = "COMPUTATIONAL_DATA"
 
     channel_values: dict[str, ChannelValue]  # Clean structure - no DotDict needed
+    failed_channels: dict[str, str] = {}  # channel -> error reason (partial results only)
 
     @property
     def channel_count(self) -> int:
@@ -87,7 +99,7 @@ class ChannelValuesContext(CapabilityContext):
         except Exception:
             example_value = "400.5"
 
-        return {
+        details = {
             "channel_count": self.channel_count,
             "channels": channels_preview,
             "data_structure": "Dict[channel_name -> ChannelValue] where ChannelValue has .value, .timestamp, .units fields - IMPORTANT: use bracket notation for channel names (due to special characters like colons), but dot notation for fields",
@@ -95,6 +107,13 @@ class ChannelValuesContext(CapabilityContext):
             "example_usage": f"context.{self.CONTEXT_TYPE}.{key}.channel_values['{example_channel}'].value gives '{example_value}' (use .value not ['value'])",
             "available_fields": ["value", "timestamp", "units"],
         }
+        if self.failed_channels:
+            details["failed_channels"] = list(self.failed_channels)[:10]
+            details["failed_count"] = len(self.failed_channels)
+            details["failure_access_pattern"] = (
+                f"context.{self.CONTEXT_TYPE}.{key}.failed_channels['CHANNEL_NAME'] gives the error reason"
+            )
+        return details
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -109,10 +128,13 @@ class ChannelValuesContext(CapabilityContext):
                 "units": channel_info.units,
             }
 
-        return {
+        summary = {
             "type": "Channel Values",
             "channel_data": channel_data,
         }
+        if self.failed_channels:
+            summary["failed_channels"] = dict(self.failed_channels)
+        return summary
 
 
 # ========================================================
@@ -192,42 +214,55 @@ class ChannelReadCapability(BaseCapability):
 
         logger.status(f"Reading {len(channels_to_read)} channel values...")
 
-        # Create control system connector from configuration
+        read_config = _get_channel_read_config()
+        allow_partial = self.get_parameters().get(
+            "allow_partial_results", read_config["allow_partial_results"]
+        )
+
+        # Lease a pooled control system connector from configuration
         # This will use 'mock' for development or 'epics' for production
-        # based on the 'control_system' section in config.yml
-        connector = await ConnectorFactory.create_control_system_connector()
+        # based on the 'control_system' section in config.yml. The connector
+        # stays connected between steps so repeated reads reuse its channel cache.
+        async with ConnectorFactory.lease_control_system_connector() as connector:
+            try:
+                raw_values, failures = await _read_in_batches(
+                    connector,
+                    channels_to_read,
+                    batch_size=read_config["batch_size"],
+                    max_concurrent_batches=read_config["max_concurrent_batches"],
+                    logger=logger,
+                )
+            except Exception as e:
+                logger.error(f"Bulk channel read failed: {e}")
+                raise ChannelAccessError(f"Failed to read channels: {str(e)}") from e
+
+        if failures:
+            preview = "; ".join(f"{ch}: {reason}" for ch, reason in list(failures.items())[:5])
+            more = f" (and {len(failures) - 5} more)" if len(failures) > 5 else ""
+            if not allow_partial or not raw_values:
+                logger.error(f"Failed to read {len(failures)} channel(s): {preview}{more}")
+                raise ChannelAccessError(
+                    f"Failed to read {len(failures)}/{len(channels_to_read)} channel(s): "
+                    f"{preview}{more}"
+                )
+            logger.warning(
+                f"Returning partial results: {len(failures)} channel(s) failed: {preview}{more}"
+            )
 
-        try:
-            # Get all channel values
-            channel_values = {}
-            total_channels = len(channels_to_read)
-
-            for i, channel_address in enumerate(channels_to_read):
-                logger.status(f"Reading channel {i + 1}/{total_channels}: {channel_address}")
-
-                try:
-                    # Read channel using connector (returns ChannelValue with metadata)
-                    channel_result = await connector.read_channel(channel_address)
-
-                    # Convert to ChannelValue format expected by context
-                    channel_values[channel_address] = ChannelValue(
-                        value=str(channel_result.value),
-                        timestamp=channel_result.timestamp,
-                        units=channel_result.metadata.units if channel_result.metadata else "",
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to read channel {channel_address}: {e}")
-                    # Continue with other channels
-                    raise ChannelAccessError(
-                        f"Failed to read channel {channel_address}: {str(e)}"
-                    ) from e
-
-        finally:
-            # Always disconnect connector
-            await connector.disconnect()
+        # Convert to ChannelValue format expected by context (preserve request order)
+        channel_values = {}
+        for channel_address in channels_to_read:
+            channel_result = raw_values.get(channel_address)
+            if channel_result is None:
+                continue
+            channel_values[channel_address] = ChannelValue(
+                value=str(channel_result.value),
+                timestamp=channel_result.timestamp,
+                units=channel_result.metadata.units if channel_result.metadata else "",
+            )
 
         # Create structured result
-        result = ChannelValuesContext(channel_values=channel_values)
+        result = ChannelValuesContext(channel_values=channel_values, failed_channels=failures)
 
         logger.status(f"Successfully read {result.channel_count} channel values")
 
@@ -322,3 +357,74 @@ class ChannelReadCapability(BaseCapability):
 
         builder = get_framework_prompts().get_channel_read_prompt_builder()
         return builder.get_classifier_guide()
+
+
+# ========================================================
+# Bulk Read Helpers
+# ========================================================
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_MAX_CONCURRENT_BATCHES = 4
+
+
+def _get_channel_read_config() -> dict[str, Any]:
+    """Load bulk read settings from ``control_system.channel_read`` with safe defaults."""
+    config = {
+        "batch_size": _DEFAULT_BATCH_SIZE,
+        "max_concurrent_batches": _DEFAULT_MAX_CONCURRENT_BATCHES,
+        "allow_partial_results": False,
+    }
+    try:
+        from osprey.utils.config import get_config_value
+
+        configured = get_config_value("control_system.channel_read", {}) or {}
+        config.update({k: v for k, v in configured.items() if k in config and v is not None})
+    except Exception:
+        pass  # Config unavailable - keep defaults
+
+    config["batch_size"] = max(1, int(config["batch_size"]))
+    config["max_concurrent_batches"] = max(1, int(config["max_concurrent_batches"]))
+    return config
+
+
+async def _read_in_batches(
+    connector,
+    channels: list[str],
+    batch_size: int,
+    max_concurrent_batches: int,
+    logger,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Read channels through the connector bulk API in bounded-concurrency batches.
+
+    Returns:
+        Tuple of (connector ChannelValue by address, error reason by address)
+    """
+    unique_channels = list(dict.fromkeys(channels))
+    batches = [
+        unique_channels[i : i + batch_size] for i in range(0, len(unique_channels), batch_size)
+    ]
+    if not batches:
+        return {}, {}
+
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+    values: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    completed = 0
+
+    async def read_batch(batch: list[str]) -> None:
+        nonlocal completed
+        async with semaphore:
+            bulk = await connector.read_multiple_channels_detailed(batch)
+        values.update(bulk.values)
+        errors.update(bulk.errors)
+        completed += 1
+        logger.status(
+            f"Read batch {completed}/{len(batches)} "
+            f"({len(values)}/{len(unique_channels)} channels, {len(errors)} failed)"
+        )
+
+    await asyncio.gather(*(read_batch(batch) for batch in batches))
+
+    # Order failures by request order for deterministic reporting
+    ordered_errors = {ch: errors[ch] for ch in unique_channels if ch in errors}
+    return values, ordered_errors
@@ -56,6 +56,13 @@ Configuration:
       write_verification:
         default_level: callback  # or readback for full verification
 
+    # Write scheduling (ordering groups run sequentially, writes within a group in parallel)
+    control_system:
+      write_scheduling:
+        max_concurrent_writes: 8     # Writes in flight within one group
+        stop_on_group_failure: true  # Skip later groups if a group has failures
+        batch_readback: true         # One bulk readback per group
+
     # Connector configuration (development vs production)
     control_system:
       type: mock  # or epics for production
@@ -87,6 +94,7 @@ from osprey.base.examples import (
     OrchestratorGuide,
     TaskClassifierGuide,
 )
+from osprey.connectors.control_system.write_scheduler import ScheduledWrite, WriteScheduler
 from osprey.connectors.factory import ConnectorFactory
 from osprey.context import CapabilityContext
 from osprey.utils.config import get_model_config
@@ -219,6 +227,11 @@ class WriteOperation(BaseModel):
     value: float = Field(description="Numeric value to write")
     units: str | None = Field(default=None, description="Units if specified")
     notes: str | None = Field(default=None, description="Additional context")
+    group: int = Field(
+        default=0,
+        description="Ordering group. Lower groups are written first; writes in the "
+        "same group are independent and may run in parallel",
+    )
 
 
 class WriteOperationsOutput(BaseModel):
@@ -548,66 +561,61 @@ class ChannelWriteCapability(BaseCapability):
                 # If we reach here, something went wrong with the interrupt mechanism
                 raise RuntimeError("Interrupt mechanism failed - execution should have paused")
 
-        # Create control system connector from configuration
+        # Lease a pooled control system connector from configuration
         # NOTE: Connector now handles limits validation (Safety Layer 3) and
         # verification config (Safety Layer 4) automatically
-        connector = await ConnectorFactory.create_control_system_connector()
+        #
+        # Writes are scheduled by ordering group: groups run one after another,
+        # writes within a group run concurrently (control_system.write_scheduling)
+        # and readback verification is batched once per group.
+        total_writes = len(write_operations)
+        scheduled_writes = [
+            ScheduledWrite(op.channel_address, op.value, group=op.group or 0)
+            for op in write_operations
+        ]
+
+        def report_group(group_number: int, group_count: int, group_results) -> None:
+            if group_count > 1:
+                ok = sum(1 for r in group_results if r.success)
+                logger.status(
+                    f"Write group {group_number}/{group_count}: "
+                    f"{ok}/{len(group_results)} channel(s) written"
+                )
 
-        try:
-            # Execute all write operations
-            results = []
-            total_writes = len(write_operations)
-
-            for i, operation in enumerate(write_operations, 1):
-                units_str = f" {operation.units}" if operation.units else ""
-                logger.status(f"Writing {i}/{total_writes}: {operation.channel_address}...")
-
-                try:
-                    # Write using connector (handles limits validation and verification automatically)
-                    connector_result = await connector.write_channel(
-                        operation.channel_address, operation.value
-                    )
-
-                    # Convert connector result to context model
-                    verification_info = None
-                    if connector_result.verification:
-                        verification_info = WriteVerificationInfo(
-                            level=connector_result.verification.level,
-                            verified=connector_result.verification.verified,
-                            readback_value=connector_result.verification.readback_value,
-                            tolerance_used=connector_result.verification.tolerance_used,
-                            notes=connector_result.verification.notes,
-                        )
+        logger.status(f"Writing {total_writes} channel(s)...")
+        async with ConnectorFactory.lease_control_system_connector() as connector:
+            scheduler = WriteScheduler.from_config(connector)
+            outcome = await scheduler.execute(scheduled_writes, on_group_complete=report_group)
+
+        # Convert connector results to context models
+        results = []
+        for operation, connector_result in zip(write_operations, outcome.results, strict=True):
+            units_str = f" {operation.units}" if operation.units else ""
+
+            verification_info = None
+            if connector_result.verification:
+                verification_info = WriteVerificationInfo(
+                    level=connector_result.verification.level,
+                    verified=connector_result.verification.verified,
+                    readback_value=connector_result.verification.readback_value,
+                    tolerance_used=connector_result.verification.tolerance_used,
+                    notes=connector_result.verification.notes,
+                )
 
-                    # Store result
-                    result = ChannelWriteResult(
-                        channel_address=connector_result.channel_address,
-                        value_written=connector_result.value_written,
-                        success=connector_result.success,
-                        verification=verification_info,
-                        error_message=connector_result.error_message,
-                    )
-                    results.append(result)
-
-                    # Log outcome (delegated to helper)
-                    _log_write_outcome(result, operation, units_str, logger)
-
-                except Exception as e:
-                    logger.error(f"Failed to write {operation.channel_address}: {e}")
-                    results.append(
-                        ChannelWriteResult(
-                            channel_address=operation.channel_address,
-                            value_written=operation.value,
-                            success=False,
-                            verification=None,
-                            error_message=str(e),
-                        )
-                    )
-                    # Continue with other channels rather than failing completely
+            result = ChannelWriteResult(
+                channel_address=connector_result.channel_address,
+                value_written=connector_result.value_written,
+                success=connector_result.success,
+                verification=verification_info,
+                error_message=connector_result.error_message,
+            )
+            results.append(result)
 
-        finally:
-            # Always disconnect connector
-            await connector.disconnect()
+            if result.success:
+                # Log outcome (delegated to helper)
+                _log_write_outcome(result, operation, units_str, logger)
+            else:
+                logger.error(f"Failed to write {operation.channel_address}: {result.error_message}")
 
         # Calculate counts
         successful_count = sum(1 for r in results if r.success)
@@ -237,18 +237,19 @@ def create_context_tools(state: AgentState, capability_name: str) -> list:
             if not context_class:
                 # Try to use a generic context storage approach
                 logger.warning(f"Context type {context_type} not registered, using raw storage")
-                # Store as raw dict in capability_context_data
-                context_data = state.get("capability_context_data", {})
-                if context_type not in context_data:
-                    context_data[context_type] = {}
-
-                context_data[context_type][context_key_full] = {
-                    "tool": "react_agent",
-                    "results": last_result.get("full_response"),
-                    "description": description or f"Saved from direct chat: {context_key}",
-                    "origin": "direct_chat",
-                    "capability": result_capability,
-                    "timestamp": last_result.get("timestamp", time.time()),
+                # Store as raw dict in capability_context_data. Copy the outer and
+                # per-type dicts: they are shared with earlier state snapshots
+                context_data = dict(state.get("capability_context_data", {}))
+                context_data[context_type] = {
+                    **context_data.get(context_type, {}),
+                    context_key_full: {
+                        "tool": "react_agent",
+                        "results": last_result.get("full_response"),
+                        "description": description or f"Saved from direct chat: {context_key}",
+                        "origin": "direct_chat",
+                        "capability": result_capability,
+                        "timestamp": last_result.get("timestamp", time.time()),
+                    },
                 }
 
                 state["capability_context_data"] = context_data
@@ -312,12 +313,18 @@ def create_context_tools(state: AgentState, capability_name: str) -> list:
             if context_key not in context_data[context_type]:
                 return f"❌ Context key '{context_key}' not found in {context_type}"
 
-            # Delete the context
-            del context_data[context_type][context_key]
+            # Delete the context from copies; the dicts are shared with earlier
+            # state snapshots
+            context_data = dict(context_data)
+            type_data = dict(context_data[context_type])
+            del type_data[context_key]
 
             # If type is now empty, remove it
-            if not context_data[context_type]:
+            if type_data:
+                context_data[context_type] = type_data
+            else:
                 del context_data[context_type]
+            state["capability_context_data"] = context_data
 
             logger.info(f"Removed context: {context_type}.{context_key}")
             return f"✓ Removed {context_type}.{context_key} from context"
@@ -347,8 +354,10 @@ def create_context_tools(state: AgentState, capability_name: str) -> list:
             count = len(context_data[context_type])
             keys = list(context_data[context_type].keys())
 
-            # Delete the context type
+            # Delete the context type from a copy shared snapshots do not see
+            context_data = dict(context_data)
             del context_data[context_type]
+            state["capability_context_data"] = context_data
 
             logger.info(f"Cleared context type: {context_type} ({count} items)")
             return f"✓ Removed all {count} entries of type {context_type}: {', '.join(keys[:5])}{'...' if len(keys) > 5 else ''}"
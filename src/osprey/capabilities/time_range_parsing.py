@@ -11,6 +11,7 @@ It supports a wide variety of temporal expressions from simple relative referenc
 to complex multi-part time specifications.
 
 Key Features:
+    - Rule-based fast path resolving common expressions locally, without an LLM call
     - LLM-based natural language time parsing with sophisticated prompting
     - Comprehensive validation including range validation and future date detection
     - Support for relative time expressions ("last 24 hours", "yesterday", etc.)
@@ -42,9 +43,13 @@ type safety through Pydantic models and comprehensive error handling.
    :mod:`datetime` : Python datetime functionality leveraged by parsed results
 """
 
-import asyncio
-from datetime import datetime
+import calendar
+import os
+import re
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta, tzinfo
 from typing import Any, ClassVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -54,14 +59,14 @@ from osprey.base.errors import ErrorClassification, ErrorSeverity
 from osprey.base.examples import OrchestratorGuide, TaskClassifierGuide
 from osprey.context.base import CapabilityContext
 from osprey.prompts.loader import get_framework_prompts
-from osprey.utils.config import get_model_config
+from osprey.utils.config import get_config_value, get_model_config
 
 # Import model completion - adapt based on your model system
 try:
-    from osprey.models import get_chat_completion
+    from osprey.models import aget_chat_completion
 except ImportError:
     # Fallback for testing or if models not available
-    get_chat_completion = None
+    aget_chat_completion = None
 
 
 # ========================================================
@@ -333,6 +338,388 @@ class TimeRangeOutput(BaseModel):
     )
 
 
+# ========================================================
+# Rule-Based Fast Path
+# ========================================================
+
+
+class RuleBasedTimeRange(BaseModel):
+    """Time range resolved by the rule-based parser.
+
+    :param start_date: Start of the range (timezone-aware, UTC)
+    :param end_date: End of the range (timezone-aware, UTC)
+    :param confidence: How unambiguous the matched expression is (0-1)
+    :param rule: Name of the rule that matched
+    """
+
+    start_date: datetime
+    end_date: datetime
+    confidence: float
+    rule: str
+
+
+_NUMBER_WORDS = {
+    "a": 1,
+    "an": 1,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+    "fifteen": 15,
+    "twenty": 20,
+    "thirty": 30,
+}
+_UNIT_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800}
+_UNIT_ALIASES = {
+    "s": "second",
+    "sec": "second",
+    "secs": "second",
+    "m": "minute",
+    "min": "minute",
+    "mins": "minute",
+    "h": "hour",
+    "hr": "hour",
+    "hrs": "hour",
+    "d": "day",
+    "w": "week",
+    "wk": "week",
+    "wks": "week",
+    "yr": "year",
+    "yrs": "year",
+}
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+_NUM = r"(?P<num>\d+(?:\.\d+)?|" + "|".join(_NUMBER_WORDS) + r")"
+_UNIT = (
+    r"(?P<unit>seconds?|secs?|minutes?|mins?|hours?|hrs?|days?|weeks?|wks?|months?|years?|yrs?"
+    r"|(?<=\d)(?:s|m|h|d|w))"
+)
+_CLOCK = r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>[ap]\.?m\.?)?"
+_DATE = (
+    r"\d{4}[-/]\d{2}[-/]\d{2}"
+    r"(?:[ t]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?)?"
+)
+_WEEKDAY = r"(?P<weekday>" + "|".join(_WEEKDAYS) + r")"
+
+# Words that signal a time reference the rules did not consume, or a negation
+# ("not the last hour", "except ...") the rules cannot express; their presence
+# outside the matched span makes the parser decline.
+_TEMPORAL_RESIDUE = re.compile(
+    r"\b(?:\d{1,2}:\d{2}|\d{4}[-/]\d{2}|(?:19|20)\d{2}|\d+\s*(?:[ap]\.?m\b|h\b|d\b)|[ap]\.m\."
+    r"|not|\w+n't|except|excluding|other\s+than"
+    r"|yesterday|today|tonight|tomorrow|now|morning|afternoon|evening|night|noon|midnight"
+    r"|seconds?|minutes?|hours?|days?|weeks?|months?|years?|weekend|shift|ago"
+    r"|since|until|till|before|after|between|last|past|previous|prior|next|recent(?:ly)?"
+    r"|" + "|".join(_WEEKDAYS) + r"|january|february|march|april|june|july|august"
+    r"|september|october|november|december|jan|feb|mar|apr|may\s+\d|jun|jul|aug|sept?|oct|nov|dec)\b"
+)
+
+
+def _unit_name(raw: str) -> str:
+    raw = raw.lower()
+    return _UNIT_ALIASES.get(raw, raw.rstrip("s") if len(raw) > 1 else raw)
+
+
+def _number(raw: str) -> float:
+    return float(_NUMBER_WORDS.get(raw, raw))
+
+
+def _start_of_day(moment: datetime) -> datetime:
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _end_of_day(moment: datetime) -> datetime:
+    return moment.replace(hour=23, minute=59, second=59, microsecond=0)
+
+
+def _shift_months(moment: datetime, months: int) -> datetime:
+    month_index = moment.year * 12 + moment.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
+def _go_back(now: datetime, amount: float, unit: str) -> datetime | None:
+    if unit in ("second", "minute", "hour"):
+        # Elapsed time: subtract in UTC so DST transitions don't stretch the window
+        delta = timedelta(seconds=amount * _UNIT_SECONDS[unit])
+        return (now.astimezone(UTC) - delta).astimezone(now.tzinfo)
+    if unit in _UNIT_SECONDS:
+        # Calendar days/weeks keep the local clock time
+        return now - timedelta(seconds=amount * _UNIT_SECONDS[unit])
+    if not amount.is_integer():
+        return None
+    months = int(amount) * (12 if unit == "year" else 1)
+    return _shift_months(now, -months)
+
+
+def _previous_period(now: datetime, unit: str) -> tuple[datetime, datetime]:
+    """Return the previous calendar week (Mon-Sun), month or year."""
+    today = _start_of_day(now)
+    if unit == "week":
+        start = today - timedelta(days=today.weekday() + 7)
+        return start, _end_of_day(start + timedelta(days=6))
+    if unit == "month":
+        start = _shift_months(today.replace(day=1), -1)
+        return start, _end_of_day(today.replace(day=1) - timedelta(days=1))
+    start = today.replace(year=today.year - 1, month=1, day=1)
+    return start, _end_of_day(start.replace(month=12, day=31))
+
+
+def _current_period_start(now: datetime, unit: str) -> datetime:
+    today = _start_of_day(now)
+    if unit == "week":
+        return today - timedelta(days=today.weekday())
+    if unit == "month":
+        return today.replace(day=1)
+    return today.replace(month=1, day=1)
+
+
+def _clock_time(match: re.Match, now: datetime) -> tuple[datetime, float] | None:
+    """Resolve a clock time to its most recent occurrence (with confidence)."""
+    hour = int(match["hour"])
+    minute = int(match["minute"] or 0)
+    ampm = (match["ampm"] or "").replace(".", "")
+    if not ampm and match["minute"] is None:
+        return None  # "since 8" could mean 8am or 8pm
+    if ampm:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if ampm == "pm" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    moment = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if moment > now:
+        # "since 11pm" in the morning most likely means last night
+        return moment - timedelta(days=1), 0.75
+    return moment, 0.9
+
+
+def _most_recent_weekday(now: datetime, weekday: str) -> datetime:
+    days_back = (now.weekday() - _WEEKDAYS.index(weekday)) % 7 or 7
+    return _start_of_day(now - timedelta(days=days_back))
+
+
+def _parse_date(raw: str, tz: tzinfo) -> tuple[datetime, bool]:
+    """Parse an ISO-like date or datetime; returns (value, has_time)."""
+    # Matched against lowercased text, so restore the ISO "T"/"Z" markers
+    value = datetime.fromisoformat(raw.upper().replace("/", "-").replace("Z", "+00:00"))
+    has_time = len(raw) > 10
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return value, has_time
+
+
+_Resolved = tuple[datetime, datetime, float] | None
+
+
+def _rule_relative(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    unit = _unit_name(match["unit"])
+    if match["num"] is None:
+        rolling = match["prefix"] is not None or match["direction"] == "past"
+        if unit in ("week", "month", "year") and not rolling:
+            start, end = _previous_period(now, unit)
+            return start, end, 0.9
+        if unit == "day" and match["direction"] in ("previous", "prior"):
+            yesterday = now - timedelta(days=1)
+            return _start_of_day(yesterday), _end_of_day(yesterday), 0.9
+        amount = 1.0
+    else:
+        amount = _number(match["num"])
+    start = _go_back(now, amount, unit)
+    if start is None or amount <= 0:
+        return None
+    return start, now, 0.95
+
+
+def _rule_named_day(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    name = match["name"]
+    if name == "today":
+        return _start_of_day(now), now, 0.9
+    if name == "yesterday":
+        yesterday = now - timedelta(days=1)
+        return _start_of_day(yesterday), _end_of_day(yesterday), 0.9
+    return _current_period_start(now, name.split()[-1]), now, 0.9
+
+
+def _rule_since(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    if match["num"] is not None:
+        start = _go_back(now, _number(match["num"]), _unit_name(match["unit"]))
+        return (start, now, 0.95) if start is not None else None
+    if match["anchor"] == "midnight":
+        return _start_of_day(now), now, 0.9
+    if match["anchor"] == "noon":
+        noon = now.replace(hour=12, minute=0, second=0, microsecond=0)
+        return (noon, now, 0.9) if noon < now else None
+    if match["anchor"] == "yesterday":
+        return _start_of_day(now - timedelta(days=1)), now, 0.9
+    if match["weekday"] is not None:
+        return _most_recent_weekday(now, match["weekday"]), now, 0.85
+    if match["date"] is not None:
+        start, _ = _parse_date(match["date"], tz)
+        return start, now, 0.95
+    resolved = _clock_time(match, now)
+    if resolved is None:
+        return None
+    return resolved[0], now, resolved[1]
+
+
+def _rule_weekday(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    day = _most_recent_weekday(now, match["weekday"])
+    return day, _end_of_day(day), 0.85
+
+
+def _rule_date_range(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    start, _ = _parse_date(match["start"], tz)
+    end, end_has_time = _parse_date(match["end"], tz)
+    if not end_has_time:
+        end = _end_of_day(end)
+    return start, end, 0.99
+
+
+def _rule_single_date(match: re.Match, now: datetime, tz: tzinfo) -> _Resolved:
+    day, has_time = _parse_date(match["date"], tz)
+    if has_time:
+        return None  # a single instant is not a range
+    return day, _end_of_day(day), 0.9
+
+
+_RULES: list[tuple[str, re.Pattern, Callable[[re.Match, datetime, tzinfo], _Resolved]]] = [
+    (
+        "relative",
+        re.compile(
+            r"\b(?:(?P<prefix>(?:over|in|within|during|for|from)\s+the|the)\s+)?"
+            r"(?P<direction>last|past|previous|prior)\s+(?:" + _NUM + r"\s*)?" + _UNIT + r"\b"
+        ),
+        _rule_relative,
+    ),
+    (
+        "named_day",
+        re.compile(
+            r"\b(?:(?:for|on|from|during)\s+)?"
+            r"(?P<name>today|yesterday|this\s+(?:week|month|year))(?:\s+so\s+far)?\b"
+        ),
+        _rule_named_day,
+    ),
+    (
+        "since",
+        re.compile(
+            r"\bsince\s+(?:"
+            + _NUM
+            + r"\s*"
+            + _UNIT
+            + r"\s+ago|(?P<anchor>midnight|noon|yesterday)|(?:last\s+)?"
+            + _WEEKDAY
+            + r"|(?P<date>"
+            + _DATE
+            + r")|"
+            + _CLOCK
+            + r")(?![\w:])"
+        ),
+        _rule_since,
+    ),
+    ("weekday", re.compile(r"\b(?:on|last)\s+" + _WEEKDAY + r"\b"), _rule_weekday),
+    (
+        "date_range",
+        re.compile(
+            r"\b(?:(?:from|between)\s+)?(?P<start>"
+            + _DATE
+            + r")(?:\s+(?:to|until|till|through|and)\s+|\s*[–—]\s*|\s+-\s+)(?P<end>"
+            + _DATE
+            + r")(?![\w:])"
+        ),
+        _rule_date_range,
+    ),
+    (
+        "single_date",
+        re.compile(r"\b(?:on\s+)?(?P<date>" + _DATE + r")(?![\w:])"),
+        _rule_single_date,
+    ),
+]
+
+
+def _get_facility_timezone() -> tzinfo:
+    """Return the facility timezone (``system.timezone``, then ``$TZ``, then UTC)."""
+    try:
+        name = get_config_value("system.timezone", None)
+    except Exception:
+        name = None
+    name = name or os.environ.get("TZ")
+    if not name:
+        return UTC
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return UTC
+
+
+def parse_time_range_rules(
+    text: str,
+    now: datetime | None = None,
+    tz: tzinfo | None = None,
+) -> RuleBasedTimeRange | None:
+    """Resolve common time expressions without an LLM.
+
+    Handles relative windows ("last 24 hours", "past 2 weeks"), named periods
+    ("today", "yesterday", "this week", "last month"), "since" anchors (clock
+    times, weekdays, dates, "N hours ago"), weekdays ("on Monday") and explicit
+    ISO/date ranges. Day boundaries and clock times are interpreted in the
+    facility timezone.
+
+    The parser is deliberately conservative: it declines (returns None) unless
+    exactly one supported expression is found and the rest of the text holds no
+    other temporal words, so anything unusual is left to the LLM.
+
+    :param text: Text containing the time expression (e.g. the task objective)
+    :param now: Reference time (defaults to the current time)
+    :param tz: Facility timezone (defaults to ``system.timezone``)
+    :return: Parsed range in UTC with confidence, or None if the rules decline
+    """
+    tz = tz or _get_facility_timezone()
+    now = (now or datetime.now(UTC)).astimezone(tz)
+    lowered = text.lower()
+
+    candidates = []
+    for name, pattern, handler in _RULES:
+        for match in pattern.finditer(lowered):
+            candidates.append((match.start(), match.end(), name, match, handler))
+    if not candidates:
+        return None
+
+    # Overlapping rules (e.g. "since yesterday" vs "yesterday") resolve to the longest
+    # match; any match outside it means several time references, which is ambiguous
+    start, end, name, match, handler = max(candidates, key=lambda c: (c[1] - c[0], -c[0]))
+    if any(c[0] < start or c[1] > end for c in candidates):
+        return None
+    if _TEMPORAL_RESIDUE.search(lowered[:start] + " " + lowered[end:]):
+        return None
+
+    try:
+        resolved = handler(match, now, tz)
+    except (ValueError, OverflowError):
+        return None
+    if resolved is None:
+        return None
+
+    start_date, end_date, confidence = resolved
+    if start_date >= end_date or start_date > now:
+        return None
+    return RuleBasedTimeRange(
+        start_date=start_date.astimezone(UTC),
+        end_date=min(end_date, now).astimezone(UTC),
+        confidence=confidence,
+        rule=name,
+    )
+
+
 # ========================================================
 # LLM Prompting System
 # ========================================================
@@ -407,6 +794,9 @@ class TimeRangeParsingCapability(BaseCapability):
     provides = ["TIME_RANGE"]
     requires = []
 
+    # Rule-based results at or above this confidence skip the LLM call
+    rule_confidence_threshold: ClassVar[float] = 0.8
+
     async def execute(self) -> dict[str, Any]:
         """Execute comprehensive time range parsing with LLM integration and validation.
 
@@ -417,8 +807,10 @@ class TimeRangeParsingCapability(BaseCapability):
 
         The execution process follows this sophisticated pattern:
         1. **Context Extraction**: Retrieves task objective and current execution step
-        2. **Prompt Engineering**: Creates detailed system prompt with current time context
-        3. **LLM Analysis**: Performs structured parsing using Pydantic output models
+        2. **Rule-Based Fast Path**: Resolves common expressions locally via
+           :func:`parse_time_range_rules`; the LLM is only called when it declines
+           or its confidence is below ``rule_confidence_threshold``
+        3. **LLM Analysis**: Builds the time-aware prompt and performs structured parsing
         4. **Validation**: Comprehensive validation including range and future date checks
         5. **Context Creation**: Generates rich TimeRangeContext with datetime objects
 
@@ -445,7 +837,7 @@ class TimeRangeParsingCapability(BaseCapability):
            :func:`_get_time_parsing_system_prompt` : Prompt generation used by this method
            :class:`TimeRangeOutput` : Pydantic model for structured LLM output
            :class:`TimeRangeContext` : Context structure returned by this method
-           :class:`osprey.models.get_chat_completion` : LLM interface used for parsing
+           :func:`osprey.models.aget_chat_completion` : LLM interface used for parsing
            :meth:`classify_error` : Error classification method for parsing failures
         """
 
@@ -458,48 +850,27 @@ class TimeRangeParsingCapability(BaseCapability):
         # Display task with structured formatting
         logger.info("Starting time range parsing")
         logger.info(f'[bold]Query:[/bold] "[italic]{task_objective}[/italic]"')
-        logger.status("Parsing time range with LLM...")
-
-        # Build sophisticated system prompt
-        full_prompt = _get_time_parsing_system_prompt(task_objective)
 
-        logger.debug(f"Time parsing for task '{task_objective}': {task_objective}")
-
-        try:
-            # Get model config from LangGraph configurable
-            model_config = get_model_config("time_parsing")
-
-            # Set caller context for API call logging (propagates through asyncio.to_thread)
-            from osprey.models import set_api_call_context
-
-            set_api_call_context(
-                function="execute",
-                module="time_range_parsing",
-                class_name="TimeRangeParsingCapability",
-                extra={"capability": "time_range_parsing"},
+        # Fast path: resolve regular expressions locally and skip the LLM
+        rule_result = parse_time_range_rules(task_objective)
+        if rule_result is not None and rule_result.confidence >= self.rule_confidence_threshold:
+            logger.debug(
+                f"Rule-based time parsing ({rule_result.rule}, "
+                f"confidence {rule_result.confidence:.2f})"
             )
-
-            # LLM call with structured output
-            response_data = await asyncio.to_thread(
-                get_chat_completion,
-                model_config=model_config,
-                message=full_prompt,
-                output_model=TimeRangeOutput,
+            response_data = TimeRangeOutput(
+                start_date=rule_result.start_date,
+                end_date=rule_result.end_date,
+                found=True,
             )
-
-        except Exception as e:
-            logger.error(f"LLM call failed for time parsing: {e}")
-            raise TimeParsingError(f"LLM failed to parse time range: {str(e)}") from e
-
-        if not isinstance(response_data, TimeRangeOutput):
-            logger.error(f"LLM did not return TimeRangeOutput. Got: {type(response_data)}")
-            raise TimeParsingError("LLM failed to return structured time range output")
+        else:
+            response_data = await self._parse_with_llm(task_objective)
 
         logger.status("Validating parsed time range...")
 
-        # Debug logging to see what LLM actually returned
+        # Debug logging to see what the parser actually returned
         logger.debug(
-            f"LLM returned: start={response_data.start_date}, end={response_data.end_date}, found={response_data.found}"
+            f"Parsed: start={response_data.start_date}, end={response_data.end_date}, found={response_data.found}"
         )
 
         # Check if the LLM found a valid time range
@@ -550,6 +921,55 @@ class TimeRangeParsingCapability(BaseCapability):
         # Return state updates (LangGraph will merge automatically)
         return self.store_output_context(time_context)
 
+    async def _parse_with_llm(self, task_objective: str) -> TimeRangeOutput:
+        """Parse the time range with a structured-output LLM call.
+
+        :param task_objective: Task text containing the time expression
+        :type task_objective: str
+        :return: Structured LLM output
+        :rtype: TimeRangeOutput
+
+        :raises TimeParsingError: If the LLM call fails or returns invalid output
+        """
+        logger = self.get_logger()
+        logger.status("Parsing time range with LLM...")
+
+        # Build sophisticated system prompt
+        full_prompt = _get_time_parsing_system_prompt(task_objective)
+
+        logger.debug(f"Time parsing for task '{task_objective}': {task_objective}")
+
+        try:
+            # Get model config from LangGraph configurable
+            model_config = get_model_config("time_parsing")
+
+            # Set caller context for API call logging (propagates across awaits)
+            from osprey.models import set_api_call_context
+
+            set_api_call_context(
+                function="execute",
+                module="time_range_parsing",
+                class_name="TimeRangeParsingCapability",
+                extra={"capability": "time_range_parsing"},
+            )
+
+            # LLM call with structured output
+            response_data = await aget_chat_completion(
+                model_config=model_config,
+                message=full_prompt,
+                output_model=TimeRangeOutput,
+            )
+
+        except Exception as e:
+            logger.error(f"LLM call failed for time parsing: {e}")
+            raise TimeParsingError(f"LLM failed to parse time range: {str(e)}") from e
+
+        if not isinstance(response_data, TimeRangeOutput):
+            logger.error(f"LLM did not return TimeRangeOutput. Got: {type(response_data)}")
+            raise TimeParsingError("LLM failed to return structured time range output")
+
+        return response_data
+
     @staticmethod
     def classify_error(exc: Exception, context: dict) -> ErrorClassification:
         """Classify time parsing errors for sophisticated recovery strategies.
@@ -192,7 +192,11 @@ def ingest_command(
 
     async def _ingest() -> None:
         from osprey.services.ariel_search import ARIELConfig, create_ariel_service
-        from osprey.services.ariel_search.enhancement import create_enhancers_from_config
+        from osprey.services.ariel_search.enhancement import (
+            create_enhancers_from_config,
+            enhance_entries,
+            enhancement_batch_size,
+        )
         from osprey.services.ariel_search.ingestion import get_adapter
 
         # Load config (get_config imported at module level)
@@ -242,6 +246,8 @@ def ingest_command(
             count = 0
             enhanced_count = 0
             failed_count = 0
+            batch_size = enhancement_batch_size(enhancers)
+            batch = []
 
             try:
                 async with service.pool.connection() as conn:
@@ -250,23 +256,16 @@ def ingest_command(
                         await service.repository.upsert_entry(entry)
                         count += 1
 
-                        # Run enabled enhancement modules
+                        # Run enabled enhancement modules on batches of entries
                         if enhancers:
-                            for enhancer in enhancers:
-                                try:
-                                    await enhancer.enhance(entry, conn)
-                                    await service.repository.mark_enhancement_complete(
-                                        entry["entry_id"],
-                                        enhancer.name,
-                                    )
-                                    enhanced_count += 1
-                                except Exception as e:
-                                    await service.repository.mark_enhancement_failed(
-                                        entry["entry_id"],
-                                        enhancer.name,
-                                        str(e),
-                                    )
-                                    failed_count += 1
+                            batch.append(entry)
+                            if len(batch) >= batch_size:
+                                applied, failed = await enhance_entries(
+                                    enhancers, batch, conn, service.repository
+                                )
+                                enhanced_count += applied
+                                failed_count += failed
+                                batch = []
 
                         if count % 100 == 0:
                             if enhancers:
@@ -274,6 +273,13 @@ def ingest_command(
                             else:
                                 click.echo(f"  Ingested {count} entries...")
 
+                    if batch:
+                        applied, failed = await enhance_entries(
+                            enhancers, batch, conn, service.repository
+                        )
+                        enhanced_count += applied
+                        failed_count += failed
+
                 await service.repository.complete_ingestion_run(
                     run_id,
                     entries_added=count,
@@ -447,7 +453,11 @@ def enhance_command(module: str | None, force: bool, limit: int) -> None:
 
     async def _enhance() -> None:
         from osprey.services.ariel_search import ARIELConfig, create_ariel_service
-        from osprey.services.ariel_search.enhancement import create_enhancers_from_config
+        from osprey.services.ariel_search.enhancement import (
+            create_enhancers_from_config,
+            enhance_entries,
+            enhancement_batch_size,
+        )
 
         # Load config (get_config imported at module level)
         config_dict = get_config_value("ariel", {})
@@ -481,24 +491,14 @@ def enhance_command(module: str | None, force: bool, limit: int) -> None:
 
             click.echo(f"Processing {len(entries)} entries...")
 
+            batch_size = enhancement_batch_size(enhancers)
             async with service.pool.connection() as conn:
-                for i, entry in enumerate(entries):
-                    for enhancer in enhancers:
-                        try:
-                            await enhancer.enhance(entry, conn)
-                            await service.repository.mark_enhancement_complete(
-                                entry["entry_id"],
-                                enhancer.name,
-                            )
-                        except Exception as e:
-                            await service.repository.mark_enhancement_failed(
-                                entry["entry_id"],
-                                enhancer.name,
-                                str(e),
-                            )
-
-                    if (i + 1) % 10 == 0:
-                        click.echo(f"  Processed {i + 1} entries...")
+                for start in range(0, len(entries), batch_size):
+                    batch = entries[start : start + batch_size]
+                    await enhance_entries(enhancers, batch, conn, service.repository)
+                    processed = start + len(batch)
+                    if processed // 10 > start // 10:
+                        click.echo(f"  Processed {processed} entries...")
 
             click.echo(f"\nEnhancement complete: {len(entries)} entries processed")
 
@@ -728,7 +728,7 @@ def reembed_command(
                         if len(batch_texts) >= batch_size:
                             # Process batch
                             try:
-                                embeddings = embedder.execute_embedding(
+                                embeddings = await embedder.aembed_texts(
                                     texts=batch_texts,
                                     model_id=model,
                                     base_url=base_url,
@@ -765,7 +765,7 @@ def reembed_command(
                     # Process remaining batch
                     if batch_texts:
                         try:
-                            embeddings = embedder.execute_embedding(
+                            embeddings = await embedder.aembed_texts(
                                 texts=batch_texts,
                                 model_id=model,
                                 base_url=base_url,
@@ -880,6 +880,8 @@ def quickstart_command(source: str | None) -> None:
 
                 from osprey.services.ariel_search.enhancement import (
                     create_enhancers_from_config,
+                    enhance_entries,
+                    enhancement_batch_size,
                 )
 
                 enhancers = create_enhancers_from_config(config)
@@ -891,6 +893,8 @@ def quickstart_command(source: str | None) -> None:
                     count = 0
                     enhanced_count = 0
                     failed_count = 0
+                    batch_size = enhancement_batch_size(enhancers)
+                    batch = []
 
                     async with service.pool.connection() as conn:
                         async for entry in adapter_instance.fetch_entries():
@@ -898,24 +902,21 @@ def quickstart_command(source: str | None) -> None:
                             count += 1
 
                             if enhancers:
-                                for enhancer in enhancers:
-                                    try:
-                                        await enhancer.enhance(entry, conn)
-                                        await service.repository.mark_enhancement_complete(
-                                            entry["entry_id"],
-                                            enhancer.name,
-                                        )
-                                        enhanced_count += 1
-                                    except Exception as e:
-                                        await service.repository.mark_enhancement_failed(
-                                            entry["entry_id"],
-                                            enhancer.name,
-                                            str(e),
-                                        )
-                                        failed_count += 1
-                                        logger.debug(
-                                            f"Enhancement failed for {entry['entry_id']}: {e}"
-                                        )
+                                batch.append(entry)
+                                if len(batch) >= batch_size:
+                                    applied, failed = await enhance_entries(
+                                        enhancers, batch, conn, service.repository
+                                    )
+                                    enhanced_count += applied
+                                    failed_count += failed
+                                    batch = []
+
+                        if batch:
+                            applied, failed = await enhance_entries(
+                                enhancers, batch, conn, service.repository
+                            )
+                            enhanced_count += applied
+                            failed_count += failed
 
                     click.echo(f"  Entries: {count} ingested")
                     if enhancers:
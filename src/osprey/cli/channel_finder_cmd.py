@@ -6,6 +6,7 @@ Provides the 'osprey channel-finder' command group with subcommands:
 - Benchmarks (osprey channel-finder benchmark)
 - Build database (osprey channel-finder build-database)
 - Validate database (osprey channel-finder validate)
+- Compile database snapshot (osprey channel-finder compile)
 - Preview database (osprey channel-finder preview)
 """
 
@@ -321,6 +322,37 @@ def validate(ctx, database: str | None, verbose: bool, pipeline: str | None):
         raise SystemExit(exit_code)
 
 
+@channel_finder.command("compile")
+@click.option(
+    "--database",
+    "-d",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Path to hierarchical database file (default: from config)",
+)
+@click.pass_context
+def compile_database(ctx, database: str | None):
+    """Compile a hierarchical database into a fast-loading snapshot.
+
+    Writes <database>.snapshot next to the JSON file. The snapshot is used
+    automatically while it matches the JSON; recompile after editing the database.
+
+    Examples:
+
+    \b
+      osprey channel-finder compile
+      osprey channel-finder compile --database data/channel_databases/hierarchical.json
+    """
+    if not database:
+        _setup_config(ctx.obj.get("project"))
+
+    from osprey.services.channel_finder.tools.compile_database import run_compile
+
+    exit_code = run_compile(database=database)
+    if exit_code:
+        raise SystemExit(exit_code)
+
+
 @channel_finder.command("preview")
 @click.option(
     "--depth",
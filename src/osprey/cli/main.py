@@ -61,6 +61,7 @@ class LazyGroup(click.Group):
             "config": "osprey.cli.config_cmd",
             "export-config": "osprey.cli.export_config_cmd",  # DEPRECATED: kept for backward compat
             "health": "osprey.cli.health_cmd",
+            "metrics": "osprey.cli.metrics_cmd",
             "generate": "osprey.cli.generate_cmd",
             "remove": "osprey.cli.remove_cmd",
             "migrate": "osprey.cli.migrate_cmd",
@@ -108,6 +109,7 @@ class LazyGroup(click.Group):
             "remove",
             "migrate",
             "health",
+            "metrics",
             "tasks",
             "channel-finder",
             "claude",
@@ -139,6 +141,7 @@ def cli(ctx):
       osprey deploy up                Start services
       osprey chat                     Interactive conversation
       osprey health                   Check system health
+      osprey metrics                  Show LLM usage and cost per node
       osprey tasks                    Browse AI assistant tasks
       osprey claude install <task>    Install Claude Code skill
       osprey channel-finder           Interactive channel search
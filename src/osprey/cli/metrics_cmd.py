@@ -0,0 +1,174 @@
+"""LLM usage metrics command for Osprey Framework.
+
+This module provides the 'osprey metrics' command which reports LLM call
+telemetry (latency, token usage, cost, retries and cache hits) aggregated by
+node, caller, provider, model or session. It reads the snapshots that agent
+processes write to ``file_paths.llm_metrics_dir`` when
+``llm_telemetry.persist_interval_seconds`` is set.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import click
+from rich.table import Table
+
+from osprey.cli.styles import Messages, Styles, console
+from osprey.models.telemetry import (
+    GROUP_BY_FIELDS,
+    SNAPSHOT_PREFIX,
+    LLMStats,
+    load_snapshots,
+    merge_snapshots,
+    render_prometheus,
+    summarize,
+)
+
+
+def _metrics_dir(project: str | None) -> Path:
+    """Resolve the telemetry snapshot directory of a project."""
+    from osprey.utils.config import get_agent_dir
+
+    from .project_utils import resolve_config_path
+
+    config_path = resolve_config_path(project)
+    if not os.path.exists(config_path):
+        raise click.ClickException(
+            f"Configuration file not found: {config_path}\n"
+            "Run 'osprey init' to create a project, or use --project to specify the project directory."
+        )
+    os.environ["CONFIG_FILE"] = str(config_path)
+    return Path(get_agent_dir("llm_metrics_dir"))
+
+
+def _display_table(groups: dict[str, LLMStats], group_by: str) -> None:
+    """Display aggregated stats in a formatted table, most expensive groups first."""
+    table = Table(
+        show_header=True, header_style=Styles.HEADER, border_style=Styles.DIM, expand=False
+    )
+    table.add_column(group_by.capitalize(), style=Styles.ACCENT, no_wrap=True)
+    for column in (
+        "Calls",
+        "Errors",
+        "Cache hits",
+        "Retries",
+        "Avg s",
+        "Max s",
+        "Prompt",
+        "Completion",
+        "Thinking",
+        "Cached read",
+        "Cost $",
+    ):
+        table.add_column(column, justify="right", style=Styles.VALUE)
+
+    total = LLMStats()
+    ordered = sorted(
+        groups.items(),
+        key=lambda item: (item[1].cost_usd, item[1].prompt_tokens + item[1].completion_tokens),
+        reverse=True,
+    )
+    for name, stats in ordered:
+        total.merge(stats)
+        table.add_row(name, *_format_row(stats))
+
+    table.add_section()
+    table.add_row("Total", *_format_row(total), style="bold")
+    console.print(table)
+
+
+def _format_row(stats: LLMStats) -> list[str]:
+    return [
+        str(stats.calls),
+        str(stats.errors),
+        str(stats.cache_hits),
+        str(stats.retries),
+        f"{stats.avg_latency_seconds:.2f}",
+        f"{stats.max_latency_seconds:.2f}",
+        f"{stats.prompt_tokens:,}",
+        f"{stats.completion_tokens:,}",
+        f"{stats.thinking_tokens:,}",
+        f"{stats.cache_read_tokens:,}",
+        f"{stats.cost_usd:.4f}",
+    ]
+
+
+@click.command()
+@click.option(
+    "--project",
+    "-p",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    help="Project directory (default: current directory or OSPREY_PROJECT env var)",
+)
+@click.option(
+    "--by",
+    "group_by",
+    type=click.Choice(GROUP_BY_FIELDS),
+    default="node",
+    show_default=True,
+    help="Dimension to aggregate by",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json", "prometheus"]),
+    default="table",
+    show_default=True,
+    help="Output format",
+)
+@click.option("--reset", is_flag=True, help="Delete stored snapshots after reporting")
+def metrics(project: str | None, group_by: str, output_format: str, reset: bool):
+    """Show LLM call latency, token usage and cost per node, caller or session.
+
+    Reports the telemetry recorded by agent processes of this project. Agents
+    write snapshots when llm_telemetry.persist_interval_seconds is set in
+    config.yml; running agents update them periodically.
+
+    Examples:
+
+    \b
+      # Token usage and cost per LangGraph node
+      $ osprey metrics
+
+      # Per caller (module.function) or per session
+      $ osprey metrics --by caller
+      $ osprey metrics --by session
+
+      # Machine-readable output
+      $ osprey metrics --format json
+      $ osprey metrics --format prometheus
+    """
+    directory = _metrics_dir(project)
+    snapshots = load_snapshots(directory)
+    if not snapshots:
+        console.print(
+            Messages.warning(
+                f"No LLM telemetry recorded in {directory}. "
+                "Set llm_telemetry.persist_interval_seconds in config.yml and run the agent."
+            )
+        )
+        sys.exit(1)
+
+    merged = merge_snapshots(snapshots)
+    if output_format == "prometheus":
+        click.echo(render_prometheus(merged), nl=False)
+    elif output_format == "json":
+        groups = summarize(merged, group_by)
+        click.echo(
+            json.dumps(
+                {name: stats.to_dict() for name, stats in groups.items()},
+                indent=2,
+            )
+        )
+    else:
+        console.print(
+            f"\n{Messages.header('LLM Usage')} "
+            f"[{Styles.DIM}]({len(snapshots)} process snapshot(s) in {directory})[/{Styles.DIM}]\n"
+        )
+        _display_table(summarize(merged, group_by), group_by)
+
+    if reset:
+        for path in directory.glob(f"{SNAPSHOT_PREFIX}*.json"):
+            path.unlink(missing_ok=True)
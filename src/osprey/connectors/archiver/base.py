@@ -124,3 +124,16 @@ class ArchiverConnector(ABC):
             Dictionary mapping PV name to availability status
         """
         pass
+
+    async def health_check(self) -> bool:
+        """
+        Report whether this connector is still usable.
+
+        Called by the connector pool before handing out a cached instance.
+        The default checks the ``_connected`` flag maintained by the built-in
+        connectors; override to perform a real liveness probe.
+
+        Returns:
+            True if the connector can serve further requests
+        """
+        return bool(getattr(self, "_connected", True))
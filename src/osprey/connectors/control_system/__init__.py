@@ -1,6 +1,7 @@
 """Control system connector implementations."""
 
 from osprey.connectors.control_system.base import (
+    BulkReadResult,
     ChannelMetadata,
     ChannelValue,
     ChannelWriteResult,
@@ -9,6 +10,11 @@ from osprey.connectors.control_system.base import (
     PVValue,  # Deprecated alias
     WriteVerification,
 )
+from osprey.connectors.control_system.write_scheduler import (
+    ScheduledWrite,
+    WriteScheduleOutcome,
+    WriteScheduler,
+)
 
 __all__ = [
     "ControlSystemConnector",
@@ -16,6 +22,10 @@ __all__ = [
     "ChannelMetadata",
     "ChannelWriteResult",
     "WriteVerification",
+    "BulkReadResult",
+    "ScheduledWrite",
+    "WriteScheduleOutcome",
+    "WriteScheduler",
     # Deprecated aliases (backward compatibility)
     "PVValue",
     "PVMetadata",
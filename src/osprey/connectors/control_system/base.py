@@ -7,6 +7,7 @@ subscribing to changes, and retrieving metadata from various control systems.
 Related to Issue #18 - Control System Abstraction (Layer 2)
 """
 
+import time
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Callable
@@ -77,6 +78,37 @@ class ChannelWriteResult:
     error_message: str | None = None  # Error message if write failed
 
 
+@dataclass
+class BulkReadResult:
+    """
+    Result from a bulk channel read with per-channel failure reasons.
+
+    Unlike :meth:`ControlSystemConnector.read_multiple_channels`, which silently
+    omits failed channels, this keeps an explicit error message for every
+    channel that could not be read, plus timing statistics for the batch.
+    """
+
+    values: dict[str, ChannelValue] = field(default_factory=dict)  # Successfully read channels
+    errors: dict[str, str] = field(default_factory=dict)  # Channel -> failure reason
+    elapsed_seconds: float = 0.0  # Wall time for the whole batch
+    stats: dict[str, Any] = field(default_factory=dict)  # Connector-specific timing breakdown
+
+    @property
+    def requested_count(self) -> int:
+        """Number of channels requested."""
+        return len(self.values) + len(self.errors)
+
+    @property
+    def success_count(self) -> int:
+        """Number of channels read successfully."""
+        return len(self.values)
+
+    @property
+    def failure_count(self) -> int:
+        """Number of channels that failed."""
+        return len(self.errors)
+
+
 class ControlSystemConnector(ABC):
     """
     Abstract base class for control system connectors.
@@ -243,6 +275,74 @@ class ControlSystemConnector(ABC):
         """
         pass
 
+    async def read_multiple_channels_detailed(
+        self, channel_addresses: list[str], timeout: float | None = None
+    ) -> BulkReadResult:
+        """
+        Read multiple channels, reporting a failure reason for each unread channel.
+
+        The default implementation delegates to :meth:`read_multiple_channels` and
+        reports omitted channels generically. Connectors with a native bulk path
+        (e.g. EPICS) override this to return precise per-channel errors.
+
+        Args:
+            channel_addresses: List of channel addresses to read
+            timeout: Optional timeout in seconds for the whole batch
+
+        Returns:
+            BulkReadResult with values, per-channel errors and timing stats
+        """
+        start = time.perf_counter()
+        values = await self.read_multiple_channels(channel_addresses, timeout)
+        errors = {
+            address: "Channel not returned by connector"
+            for address in channel_addresses
+            if address not in values
+        }
+        elapsed = time.perf_counter() - start
+        return BulkReadResult(
+            values=values,
+            errors=errors,
+            elapsed_seconds=elapsed,
+            stats={"requested": len(channel_addresses), "read_seconds": elapsed},
+        )
+
+    def get_verification_config(
+        self, channel_address: str, value: float
+    ) -> tuple[str | None, float | None]:
+        """
+        Resolve the verification level and tolerance that a write would use.
+
+        Lets callers such as the write scheduler plan verification (e.g. batch
+        readbacks) without performing the write. Connectors that auto-determine
+        verification implement ``_get_verification_config()``; others return
+        ``(None, None)`` meaning "decided by the connector at write time".
+
+        Args:
+            channel_address: Channel that would be written
+            value: Value that would be written
+
+        Returns:
+            Tuple of (verification_level, tolerance)
+        """
+        resolver = getattr(self, "_get_verification_config", None)
+        if resolver is None:
+            return None, None
+        return resolver(channel_address, value)
+
+    async def health_check(self) -> bool:
+        """
+        Report whether this connector is still usable.
+
+        Called by the connector pool before handing out a cached instance.
+        The default checks the ``_connected`` flag maintained by the built-in
+        connectors; override to perform a real liveness probe.
+
+        Returns:
+            True if the connector can serve further requests
+        """
+        return bool(getattr(self, "_connected", True))
+
     # Deprecated method aliases for backward compatibility
     async def read_pv(self, pv_address: str, timeout: float | None = None) -> ChannelValue:
         """
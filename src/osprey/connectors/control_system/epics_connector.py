@@ -10,11 +10,13 @@ Related to Issue #18 - Control System Abstraction (Layer 2 - EPICS Implementatio
 import asyncio
 import os
 import threading
+import time
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from osprey.connectors.control_system.base import (
+    BulkReadResult,
     ChannelMetadata,
     ChannelValue,
     ChannelWriteResult,
@@ -194,11 +196,7 @@ class EPICSConnector(ControlSystemConnector):
         This prevents subscription floods when reading the same channel rapidly,
         which can crash soft IOCs like caproto due to race conditions.
         """
-        # Get or create cached PV object (thread-safe)
-        with self._pv_cache_lock:
-            if pv_address not in self._pv_cache:
-                self._pv_cache[pv_address] = self._epics.PV(pv_address)
-            pv = self._pv_cache[pv_address]
+        pv = self._get_cached_pv(pv_address)
 
         pv.wait_for_connection(timeout=timeout)
 
@@ -207,11 +205,100 @@ class EPICSConnector(ControlSystemConnector):
                 f"Failed to connect to PV '{pv_address}' (timeout after {timeout}s)"
             )
 
-        value = pv.value
+        return self._channel_value_from_pv(pv, pv.value)
+
+    def _read_many_sync(self, pv_addresses: list[str], timeout: float) -> BulkReadResult:
+        """Synchronous bulk PV read (runs in a single worker thread).
+
+        Mirrors pyepics ``caget_many``: every PV object is created up front so all
+        Channel Access searches are issued together, then one shared deadline is
+        used to wait for connections. Value requests are likewise all issued
+        before any reply is awaited, so batch latency is bounded by the slowest PV
+        instead of N sequential connects and gets.
+        """
+        start = time.perf_counter()
+        addresses = list(dict.fromkeys(pv_addresses))  # De-duplicate, keep order
+
+        # Phase 1: issue all searches (PV creation is non-blocking)
+        pvs = {address: self._get_cached_pv(address) for address in addresses}
+
+        # Phase 2: single pend for all connections
+        deadline = time.monotonic() + timeout
+        pending = [address for address, pv in pvs.items() if not pv.connected]
+        while pending and time.monotonic() < deadline:
+            self._epics.ca.poll(evt=0.01)
+            pending = [address for address in pending if not pvs[address].connected]
+        connect_done = time.perf_counter()
+
+        # Phase 3: issue all value requests (with timestamp and alarm metadata)
+        # without waiting for replies
+        ca = self._epics.ca
+        values: dict[str, ChannelValue] = {}
+        errors: dict[str, str] = {}
+        requests: dict[str, int] = {}
+        for address, pv in pvs.items():
+            if not pv.connected:
+                errors[address] = f"Failed to connect to PV '{address}' (timeout after {timeout}s)"
+                continue
+            try:
+                ftype = ca.promote_type(pv.chid, use_time=True)
+                ca.get_with_metadata(pv.chid, ftype=ftype, wait=False)
+                requests[address] = ftype
+            except Exception as e:
+                errors[address] = str(e)
+
+        # Phase 4: single pend for all replies on the remaining time; replies
+        # arrive concurrently, so only the first collection actually waits
+        read_deadline = max(deadline, time.monotonic() + 0.1)
+        for address, ftype in requests.items():
+            pv = pvs[address]
+            try:
+                reply = ca.get_complete_with_metadata(
+                    pv.chid, ftype=ftype, timeout=max(read_deadline - time.monotonic(), 0.0)
+                )
+                if reply is None or reply.get("value") is None:
+                    errors[address] = f"No value received for PV '{address}'"
+                    continue
+                values[address] = self._channel_value_from_pv(pv, reply["value"], reply)
+            except Exception as e:
+                errors[address] = str(e)
+        end = time.perf_counter()
+
+        return BulkReadResult(
+            values=values,
+            errors=errors,
+            elapsed_seconds=end - start,
+            stats={
+                "requested": len(pv_addresses),
+                "unique": len(addresses),
+                "connected": len(addresses) - len(pending),
+                "connect_seconds": connect_done - start,
+                "read_seconds": end - connect_done,
+            },
+        )
+
+    def _get_cached_pv(self, pv_address: str) -> Any:
+        """Get or create the cached PV object for an address (thread-safe)."""
+        with self._pv_cache_lock:
+            if pv_address not in self._pv_cache:
+                self._pv_cache[pv_address] = self._epics.PV(pv_address)
+            return self._pv_cache[pv_address]
+
+    @staticmethod
+    def _channel_value_from_pv(
+        pv: Any, value: Any, reply: dict[str, Any] | None = None
+    ) -> ChannelValue:
+        """Build a ChannelValue from a connected PV object and its current value.
+
+        ``reply`` is the metadata of an explicit Channel Access get; its
+        timestamp and alarm fields take precedence over the PV's monitor state.
+        """
+        reply = reply or {}
 
         # Get timestamp from EPICS (seconds since epoch)
-        if pv.timestamp:
-            timestamp = datetime.fromtimestamp(pv.timestamp)
+        epics_timestamp = reply.get("timestamp") or pv.timestamp
+        if epics_timestamp:
+            timestamp = datetime.fromtimestamp(epics_timestamp)
         else:
             timestamp = datetime.now()
 
@@ -219,10 +306,10 @@ class EPICSConnector(ControlSystemConnector):
         metadata = ChannelMetadata(
             units=getattr(pv, "units", "") or "",
             precision=getattr(pv, "precision", None),
-            alarm_status=pv.status if hasattr(pv, "status") else None,
+            alarm_status=reply.get("status", getattr(pv, "status", None)),
             timestamp=timestamp,
             raw_metadata={
-                "severity": getattr(pv, "severity", None),
+                "severity": reply.get("severity", getattr(pv, "severity", None)),
                 "type": getattr(pv, "type", None),
                 "count": getattr(pv, "count", None),
             },
@@ -463,15 +550,40 @@ class EPICSConnector(ControlSystemConnector):
     async def read_multiple_channels(
         self, channel_addresses: list[str], timeout: float | None = None
     ) -> dict[str, ChannelValue]:
-        """Read multiple channels concurrently."""
-        tasks = [self.read_channel(ch_addr, timeout) for ch_addr in channel_addresses]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        return {
-            ch_addr: result
-            for ch_addr, result in zip(channel_addresses, results, strict=False)
-            if not isinstance(result, Exception)
-        }
+        """Read multiple channels in one batched Channel Access pass."""
+        result = await self.read_multiple_channels_detailed(channel_addresses, timeout)
+        return result.values
+
+    async def read_multiple_channels_detailed(
+        self, channel_addresses: list[str], timeout: float | None = None
+    ) -> BulkReadResult:
+        """
+        Read multiple EPICS channels with a single connection wait.
+
+        All PV searches are issued at once and share one timeout, so the batch
+        completes in roughly the time of the slowest PV. Channels that fail to
+        connect or read are reported in ``errors`` instead of being dropped.
+
+        Args:
+            channel_addresses: EPICS channel addresses to read
+            timeout: Timeout in seconds for the whole batch (uses default if None)
+
+        Returns:
+            BulkReadResult with values, per-channel errors and timing stats
+        """
+        timeout = timeout or self._timeout
+
+        if not channel_addresses:
+            return BulkReadResult()
+
+        result = await asyncio.to_thread(self._read_many_sync, channel_addresses, timeout)
+
+        logger.debug(
+            f"EPICS bulk read: {result.success_count}/{result.requested_count} channels "
+            f"in {result.elapsed_seconds:.3f}s "
+            f"(connect {result.stats.get('connect_seconds', 0.0):.3f}s)"
+        )
+        return result
 
     async def subscribe(
         self, channel_address: str, callback: Callable[[ChannelValue], None]
@@ -294,6 +294,10 @@ class MockConnector(ControlSystemConnector):
             offset = np.random.normal(0, abs(float(value)) * 0.001)
             self._state[readback_ch] = float(value) + offset
 
+        self._notify_subscribers(channel_address)
+        if readback_ch != channel_address:
+            self._notify_subscribers(readback_ch)
+
         if verification_level == "none":
             logger.debug(f"Mock write (no verification): {channel_address} = {value}")
             return ChannelWriteResult(
@@ -396,6 +400,22 @@ class MockConnector(ControlSystemConnector):
         logger.debug(f"Mock subscription created: {sub_id}")
         return sub_id
 
+    def _notify_subscribers(self, channel_address: str) -> None:
+        """Invoke subscription callbacks for a channel after its value changed."""
+        subscribers = [cb for ch, cb in self._subscriptions.values() if ch == channel_address]
+        if not subscribers:
+            return
+        channel_value = ChannelValue(
+            value=self._state[channel_address],
+            timestamp=datetime.now(),
+            metadata=ChannelMetadata(units=self._infer_units(channel_address)),
+        )
+        for callback in subscribers:
+            try:
+                callback(channel_value)
+            except Exception as e:
+                logger.warning(f"Mock subscription callback failed for {channel_address}: {e}")
+
     async def unsubscribe(self, subscription_id: str) -> None:
         """Unsubscribe from channel changes."""
         if subscription_id in self._subscriptions:
@@ -0,0 +1,303 @@
+"""
+Grouped, concurrent channel write scheduling.
+
+Runs a list of channel writes through a :class:`ControlSystemConnector` while
+honoring ordering groups: groups execute strictly one after another (lowest
+group first), and the writes inside a group run concurrently up to a
+configurable cap. Readback verification for a group is performed with one
+batched read after all of its writes complete, instead of one read per write.
+
+Limits validation is unchanged - every write still goes through
+``connector.write_channel()``, which validates each value individually.
+
+Example:
+    >>> scheduler = WriteScheduler(connector, max_concurrent_writes=16)
+    >>> outcome = await scheduler.execute([
+    >>>     ScheduledWrite("SR01:HCM:SP", 1.2, group=0),   # correctors in parallel...
+    >>>     ScheduledWrite("SR02:HCM:SP", -0.4, group=0),
+    >>>     ScheduledWrite("RF:FREQ:SP", 499.65, group=1),  # ...then the RF setpoint
+    >>> ])
+    >>> print(outcome.successful_count, outcome.elapsed_seconds)
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from osprey.connectors.control_system.base import (
+    ChannelWriteResult,
+    ControlSystemConnector,
+    WriteVerification,
+)
+from osprey.utils.logger import get_logger
+
+logger = get_logger("write_scheduler")
+
+DEFAULT_MAX_CONCURRENT_WRITES = 8
+DEFAULT_READBACK_TOLERANCE = 0.001
+
+
+@dataclass
+class ScheduledWrite:
+    """A single channel write with its ordering group."""
+
+    channel_address: str
+    value: Any
+    group: int = 0  # Lower groups are written first; same group runs concurrently
+    verification_level: str | None = None  # None: connector decides from config
+    tolerance: float | None = None  # Readback tolerance override
+
+
+@dataclass
+class WriteScheduleOutcome:
+    """Results of a scheduled write run, in the same order as the input writes."""
+
+    results: list[ChannelWriteResult] = field(default_factory=list)
+    exceptions: dict[int, BaseException] = field(default_factory=dict)  # input index -> error
+    groups_completed: int = 0
+    groups_total: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def successful_count(self) -> int:
+        """Number of writes that succeeded."""
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed_count(self) -> int:
+        """Number of writes that failed or were skipped."""
+        return len(self.results) - self.successful_count
+
+    @property
+    def all_succeeded(self) -> bool:
+        """True if every scheduled write succeeded."""
+        return self.failed_count == 0
+
+
+class WriteScheduler:
+    """
+    Execute channel writes in ordered groups with bounded concurrency.
+
+    Args:
+        connector: Connected control system connector
+        max_concurrent_writes: Maximum writes in flight within a group
+        stop_on_group_failure: Skip later groups if any write in a group fails or
+            fails readback verification. Later groups usually depend on earlier
+            ones (e.g. correctors before RF), so continuing after a failure is
+            unsafe by default.
+        batch_readback: Verify "readback"-level writes with one bulk read per
+            group rather than letting the connector read back each write
+        timeout: Optional per-write timeout passed to the connector
+    """
+
+    def __init__(
+        self,
+        connector: ControlSystemConnector,
+        max_concurrent_writes: int = DEFAULT_MAX_CONCURRENT_WRITES,
+        stop_on_group_failure: bool = True,
+        batch_readback: bool = True,
+        timeout: float | None = None,
+    ):
+        self.connector = connector
+        self.max_concurrent_writes = max(1, int(max_concurrent_writes))
+        self.stop_on_group_failure = stop_on_group_failure
+        self.batch_readback = batch_readback
+        self.timeout = timeout
+
+    @classmethod
+    def from_config(cls, connector: ControlSystemConnector, **overrides) -> "WriteScheduler":
+        """
+        Create a scheduler using ``control_system.write_scheduling`` settings.
+
+        Keys: ``max_concurrent_writes``, ``stop_on_group_failure``, ``batch_readback``.
+        Explicit keyword overrides take precedence over config values.
+        """
+        settings: dict[str, Any] = {}
+        try:
+            from osprey.utils.config import get_config_value
+
+            settings = get_config_value("control_system.write_scheduling", {}) or {}
+        except Exception:
+            pass  # Config unavailable - use defaults
+
+        kwargs = {
+            key: settings[key]
+            for key in ("max_concurrent_writes", "stop_on_group_failure", "batch_readback")
+            if settings.get(key) is not None
+        }
+        kwargs.update(overrides)
+        return cls(connector, **kwargs)
+
+    async def execute(
+        self,
+        writes: list[ScheduledWrite],
+        on_group_complete: Callable[[int, int, list[ChannelWriteResult]], None] | None = None,
+    ) -> WriteScheduleOutcome:
+        """
+        Run all writes, group by group.
+
+        Args:
+            writes: Writes to perform
+            on_group_complete: Optional callback ``(group_number, group_count, results)``
+                invoked after each group (1-based group number)
+
+        Returns:
+            WriteScheduleOutcome with one result per input write
+        """
+        start = time.perf_counter()
+        results: list[ChannelWriteResult | None] = [None] * len(writes)
+        outcome = WriteScheduleOutcome()
+
+        groups: dict[int, list[int]] = {}
+        for index, write in enumerate(writes):
+            groups.setdefault(write.group, []).append(index)
+        ordered_groups = sorted(groups)
+        outcome.groups_total = len(ordered_groups)
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_writes)
+        abort_reason: str | None = None
+
+        for group_number, group_key in enumerate(ordered_groups, 1):
+            indices = groups[group_key]
+
+            if abort_reason is not None:
+                for index in indices:
+                    results[index] = ChannelWriteResult(
+                        channel_address=writes[index].channel_address,
+                        value_written=writes[index].value,
+                        success=False,
+                        error_message=abort_reason,
+                    )
+                continue
+
+            readback_checks: dict[int, float | None] = {}
+
+            async def run_write(index: int, checks: dict[int, float | None] = readback_checks):
+                write = writes[index]
+                level, tolerance = self._resolve_verification(write)
+                deferred = self.batch_readback and level == "readback"
+                async with semaphore:
+                    try:
+                        result = await self.connector.write_channel(
+                            write.channel_address,
+                            write.value,
+                            timeout=self.timeout,
+                            verification_level="callback" if deferred else level,
+                            tolerance=tolerance,
+                        )
+                    except Exception as e:
+                        outcome.exceptions[index] = e
+                        result = ChannelWriteResult(
+                            channel_address=write.channel_address,
+                            value_written=write.value,
+                            success=False,
+                            error_message=str(e),
+                        )
+                if deferred and result.success:
+                    checks[index] = tolerance
+                results[index] = result
+
+            await asyncio.gather(*(run_write(index) for index in indices))
+
+            if readback_checks:
+                await self._verify_readbacks(writes, results, readback_checks)
+
+            outcome.groups_completed += 1
+            group_results = [results[index] for index in indices]
+            if on_group_complete is not None:
+                on_group_complete(group_number, len(ordered_groups), group_results)
+
+            if self.stop_on_group_failure and any(_write_failed(r) for r in group_results):
+                abort_reason = (
+                    f"Skipped: write group {group_number}/{len(ordered_groups)} "
+                    f"had failures, later groups were not executed"
+                )
+
+        outcome.results = [r for r in results if r is not None]
+        outcome.elapsed_seconds = time.perf_counter() - start
+        logger.debug(
+            f"Scheduled {len(writes)} write(s) in {outcome.groups_total} group(s): "
+            f"{outcome.successful_count} succeeded in {outcome.elapsed_seconds:.3f}s"
+        )
+        return outcome
+
+    def _resolve_verification(self, write: ScheduledWrite) -> tuple[str | None, float | None]:
+        """Resolve the verification level/tolerance the connector would use for a write."""
+        if write.verification_level is not None:
+            return write.verification_level, write.tolerance
+
+        resolver = getattr(self.connector, "get_verification_config", None)
+        if not self.batch_readback or resolver is None:
+            return None, write.tolerance
+
+        try:
+            level, tolerance = resolver(write.channel_address, float(write.value))
+        except (TypeError, ValueError):
+            return None, write.tolerance
+        return level, write.tolerance if write.tolerance is not None else tolerance
+
+    async def _verify_readbacks(
+        self,
+        writes: list[ScheduledWrite],
+        results: list[ChannelWriteResult | None],
+        checks: dict[int, float | None],
+    ) -> None:
+        """Verify deferred readback writes with a single bulk read."""
+        addresses = list(dict.fromkeys(writes[index].channel_address for index in checks))
+        try:
+            bulk = await self.connector.read_multiple_channels_detailed(addresses, self.timeout)
+            readbacks, errors = bulk.values, bulk.errors
+        except Exception as e:
+            logger.warning(f"Batched readback failed: {e}")
+            readbacks, errors = {}, dict.fromkeys(addresses, str(e))
+
+        for index, tolerance in checks.items():
+            write = writes[index]
+            result = results[index]
+            readback = readbacks.get(write.channel_address)
+
+            if readback is None:
+                reason = errors.get(write.channel_address, "Channel not returned by connector")
+                result.verification = WriteVerification(
+                    level="readback", verified=False, notes=f"Readback failed: {reason}"
+                )
+                result.error_message = f"Readback verification failed: {reason}"
+                continue
+
+            try:
+                readback_value = float(readback.value)
+                diff = abs(readback_value - float(write.value))
+            except (TypeError, ValueError) as e:
+                result.verification = WriteVerification(
+                    level="readback", verified=False, notes=f"Readback not numeric: {e}"
+                )
+                continue
+
+            limit = tolerance if tolerance is not None else DEFAULT_READBACK_TOLERANCE
+            verified = diff <= limit
+            result.verification = WriteVerification(
+                level="readback",
+                verified=verified,
+                readback_value=readback_value,
+                tolerance_used=limit,
+                notes=(
+                    f"Readback: {readback_value}, tolerance: ±{limit}, diff: {diff:.6f}"
+                    if verified
+                    else f"Readback mismatch: {readback_value} (expected {write.value}, "
+                    f"diff: {diff:.6f} > tolerance {limit})"
+                ),
+            )
+
+
+def _write_failed(result: ChannelWriteResult) -> bool:
+    """Whether a write failed outright or its readback did not confirm the value."""
+    if not result.success:
+        return True
+    verification = result.verification
+    return (
+        verification is not None
+        and verification.level == "readback"
+        and verification.verified is False
+    )
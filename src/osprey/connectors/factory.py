@@ -5,11 +5,30 @@ Provides centralized factory for instantiating and configuring connectors
 based on configuration. Connectors are registered through the Osprey registry
 system for unified component management and lazy loading.
 
+Connectors can also be leased from a process-wide :class:`ConnectorPool`, which
+keeps one long-lived, health-checked instance per (kind, type, config) key. This
+lets capabilities reuse expensive connection state (e.g. the EPICS PV cache)
+across agent steps instead of reconnecting on every execution.
+
+Leases are guarded by a per-connector circuit breaker (see
+:mod:`osprey.base.resilience`): after repeated connection errors or timeouts,
+leases fail immediately with ``CircuitOpenError`` until the cool-down expires.
+
 Related to Issue #18 - Control System Abstraction (Layer 2 - Factory)
 """
 
+import asyncio
+import atexit
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+from osprey.base.resilience import get_circuit_breaker, is_infrastructure_error
 from osprey.connectors.archiver.base import ArchiverConnector
 from osprey.connectors.control_system.base import ControlSystemConnector
 from osprey.utils.logger import get_logger
@@ -17,6 +36,303 @@ from osprey.utils.logger import get_logger
 logger = get_logger("connector_factory")
 
 
+# ========================================================
+# Connector Pool
+# ========================================================
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass
+class _PoolEntry:
+    """Bookkeeping for a single pooled connector."""
+
+    key: tuple[str, str, str]
+    connector: Any
+    leases: int = 0
+    retired: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ConnectorPool:
+    """
+    Process-wide pool of long-lived connectors with lease/release semantics.
+
+    Each distinct (kind, connector type, type-specific config) key maps to one
+    connected instance. Leasing a connector runs its ``health_check()`` and
+    transparently replaces it if it is no longer usable. A replaced connector is
+    retired rather than closed: it stays connected for the leases that still hold
+    it and is disconnected once the last of them is released. Connectors that
+    have not been leased for ``idle_timeout`` seconds are disconnected the next
+    time the pool is touched, and :meth:`shutdown` disconnects everything.
+
+    Instances are shared between concurrent leases, so pooled connectors must
+    be safe for concurrent use (all built-in connectors are).
+
+    Example:
+        >>> pool = ConnectorFactory.get_pool()
+        >>> async with pool.lease_control_system() as connector:
+        >>>     value = await connector.read_channel('BEAM:CURRENT')
+    """
+
+    def __init__(self, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT_SECONDS):
+        """
+        Initialize an empty pool.
+
+        Args:
+            idle_timeout: Seconds an unleased connector may stay idle before it is
+                evicted. None disables idle eviction.
+        """
+        self.idle_timeout = idle_timeout
+        self._entries: dict[tuple[str, str, str], _PoolEntry] = {}
+        self._by_connector: dict[int, _PoolEntry] = {}
+        self._closing: list[Any] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        connector_type: str,
+        type_config: dict[str, Any],
+        write_policy: dict[str, Any] | None = None,
+    ) -> tuple[str, str, str]:
+        """
+        Build a hashable pool key from a connector type and its configuration.
+
+        Args:
+            kind: Connector kind ('control_system' or 'archiver')
+            connector_type: Registered connector type name
+            type_config: Type-specific connector configuration
+            write_policy: Optional snapshot of the settings a connector loads once
+                in ``connect()`` (see ``ConnectorFactory._write_policy_fingerprint``),
+                so that a change to them yields a freshly connected instance
+        """
+        keyed = type_config if write_policy is None else [type_config, write_policy]
+        try:
+            config_repr = json.dumps(keyed, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            config_repr = repr(keyed)
+        return (kind, connector_type, config_repr)
+
+    async def acquire(
+        self,
+        key: tuple[str, str, str],
+        create: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Lease the connector for ``key``, creating it with ``create()`` if needed.
+
+        Every successful call must be balanced with :meth:`release`.
+
+        Args:
+            key: Pool key from :meth:`make_key`
+            create: Coroutine factory returning a connected connector
+
+        Returns:
+            Connected connector instance
+        """
+        await self.evict_idle()
+
+        # Reserve a lease before the health check so that no other task can
+        # disconnect the entry while it is being checked or used.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.leases += 1
+
+        if entry is not None and not await self._is_healthy(entry.connector):
+            logger.info(f"Pooled {key[0]} connector '{key[1]}' failed health check, replacing")
+            with self._lock:
+                self._retire(entry)
+                self._drop_lease(entry)
+            await self._close_retired()
+            entry = None
+
+        if entry is None:
+            connector = await create()
+            with self._lock:
+                existing = self._entries.get(key)
+                if existing is None:
+                    entry = _PoolEntry(key=key, connector=connector)
+                    self._entries[key] = entry
+                    self._by_connector[id(connector)] = entry
+                    connector = None
+                else:
+                    # Another task created the same connector concurrently
+                    entry = existing
+                entry.leases += 1
+            if connector is not None:
+                await self._safe_disconnect(connector)
+            logger.debug(f"Pooled new {key[0]} connector: {key[1]}")
+
+        with self._lock:
+            entry.last_used = time.monotonic()
+        return entry.connector
+
+    def release(self, connector: Any) -> None:
+        """
+        Return a leased connector to the pool.
+
+        A retired connector whose last lease is returned here is disconnected by
+        the next pool operation; use :meth:`arelease` to disconnect it right away.
+
+        Args:
+            connector: Connector previously returned by :meth:`acquire`
+        """
+        with self._lock:
+            entry = self._by_connector.get(id(connector))
+            if entry is None or entry.connector is not connector:
+                return
+            self._drop_lease(entry)
+
+    async def arelease(self, connector: Any) -> None:
+        """
+        Return a leased connector and disconnect it if it was retired meanwhile.
+
+        Args:
+            connector: Connector previously returned by :meth:`acquire`
+        """
+        self.release(connector)
+        await self._close_retired()
+
+    async def evict_idle(self, now: float | None = None) -> int:
+        """
+        Disconnect unleased connectors that exceeded the idle timeout.
+
+        Args:
+            now: Reference time from ``time.monotonic()`` (defaults to current time)
+
+        Returns:
+            Number of evicted connectors
+        """
+        if self.idle_timeout is None:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [
+                entry
+                for entry in self._entries.values()
+                if entry.leases == 0 and now - entry.last_used > self.idle_timeout
+            ]
+            for entry in expired:
+                logger.debug(f"Evicting idle {entry.key[0]} connector: {entry.key[1]}")
+                self._retire(entry)
+
+        await self._close_retired()
+        return len(expired)
+
+    async def shutdown(self) -> None:
+        """Disconnect every pooled connector, leased or not, and empty the pool."""
+        with self._lock:
+            connectors = [entry.connector for entry in self._by_connector.values()]
+            connectors.extend(self._closing)
+            self._entries.clear()
+            self._by_connector.clear()
+            self._closing = []
+
+        for connector in connectors:
+            await self._safe_disconnect(connector)
+
+        if connectors:
+            logger.debug(f"Connector pool shut down ({len(connectors)} connectors closed)")
+
+    def clear(self) -> None:
+        """Forget all pooled connectors without disconnecting them (for tests and forks)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_connector.clear()
+            self._closing = []
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of pool contents for diagnostics."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "idle_timeout": self.idle_timeout,
+                "connectors": [
+                    {
+                        "kind": entry.key[0],
+                        "type": entry.key[1],
+                        "leases": entry.leases,
+                        "age_seconds": now - entry.created_at,
+                        "idle_seconds": now - entry.last_used,
+                    }
+                    for entry in self._entries.values()
+                ],
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _retire(self, entry: _PoolEntry) -> None:
+        """Stop handing out an entry and queue it for disconnect once unleased (lock held)."""
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        if not entry.retired:
+            entry.retired = True
+            self._queue_if_unleased(entry)
+
+    def _drop_lease(self, entry: _PoolEntry) -> None:
+        """Return one lease on an entry (lock held)."""
+        entry.leases = max(0, entry.leases - 1)
+        entry.last_used = time.monotonic()
+        if entry.retired:
+            self._queue_if_unleased(entry)
+
+    def _queue_if_unleased(self, entry: _PoolEntry) -> None:
+        if entry.leases == 0 and self._by_connector.get(id(entry.connector)) is entry:
+            del self._by_connector[id(entry.connector)]
+            self._closing.append(entry.connector)
+
+    async def _close_retired(self) -> None:
+        """Disconnect retired connectors whose last lease has been returned."""
+        with self._lock:
+            closing, self._closing = self._closing, []
+        for connector in closing:
+            await self._safe_disconnect(connector)
+
+    @staticmethod
+    async def _is_healthy(connector: Any) -> bool:
+        try:
+            health_check = getattr(connector, "health_check", None)
+            if health_check is None:
+                return bool(getattr(connector, "_connected", True))
+            return bool(await health_check())
+        except Exception as e:
+            logger.debug(f"Connector health check raised: {e}")
+            return False
+
+    @staticmethod
+    async def _safe_disconnect(connector: Any) -> None:
+        try:
+            await connector.disconnect()
+        except Exception as e:
+            logger.warning(f"Error disconnecting pooled connector: {e}")
+
+
+@asynccontextmanager
+async def _circuit_guard(name: str) -> AsyncIterator[None]:
+    """Fast-fail while a connector's circuit is open and record the outcome of a lease."""
+    breaker = get_circuit_breaker(name)
+    if breaker is None:
+        yield
+        return
+
+    breaker.check()
+    try:
+        yield
+    except Exception as exc:
+        if is_infrastructure_error(exc):
+            breaker.record_failure()
+        raise
+    else:
+        breaker.record_success()
+
+
 class ConnectorFactory:
     """
     Factory for creating control system and archiver connectors.
@@ -195,3 +511,205 @@ class ConnectorFactory:
     def list_archivers(cls) -> list:
         """List available archiver connector types."""
         return list(cls._archiver_connectors.keys())
+
+    # ========================================================
+    # Pooled access
+    # ========================================================
+
+    @classmethod
+    def get_pool(cls) -> ConnectorPool:
+        """
+        Get the process-wide connector pool, creating it on first use.
+
+        The idle timeout is read from ``connector_pool.idle_timeout_seconds``
+        in config.yml (default: 300 seconds).
+        """
+        global _connector_pool
+
+        if _connector_pool is None:
+            idle_timeout = DEFAULT_IDLE_TIMEOUT_SECONDS
+            try:
+                from osprey.utils.config import get_config_value
+
+                idle_timeout = get_config_value(
+                    "connector_pool.idle_timeout_seconds", DEFAULT_IDLE_TIMEOUT_SECONDS
+                )
+            except Exception:
+                pass  # Config unavailable - keep default
+            _connector_pool = ConnectorPool(idle_timeout=idle_timeout)
+        return _connector_pool
+
+    @classmethod
+    def _pooling_enabled(cls) -> bool:
+        try:
+            from osprey.utils.config import get_config_value
+
+            return bool(get_config_value("connector_pool.enabled", True))
+        except Exception:
+            return True
+
+    @classmethod
+    @asynccontextmanager
+    async def lease_control_system_connector(
+        cls, config: dict[str, Any] = None
+    ) -> AsyncIterator[ControlSystemConnector]:
+        """
+        Lease a pooled control system connector for the duration of a block.
+
+        The connector is shared with other leases of the same configuration and
+        stays connected after the block exits. Do not call ``disconnect()`` on it.
+        When ``connector_pool.enabled`` is false, a fresh connector is created and
+        disconnected on exit instead.
+
+        Connectors load ``writes_enabled`` and the channel limits database once in
+        ``connect()``, so the pool key includes those settings and the limits
+        file's modification time: editing any of them makes the next lease use a
+        newly connected instance that enforces the new policy.
+
+        Connection errors and timeouts raised in the block count towards the
+        ``control_system:<type>`` circuit breaker; while it is open the lease raises
+        ``CircuitOpenError`` without connecting.
+
+        Args:
+            config: Control system configuration (same format as
+                :meth:`create_control_system_connector`). If None, loads from global config
+
+        Example:
+            >>> async with ConnectorFactory.lease_control_system_connector() as connector:
+            >>>     value = await connector.read_channel('BEAM:CURRENT')
+        """
+        if config is None:
+            config = cls._load_config("control_system")
+
+        connector_type = config.get("type", "epics")
+        async with _circuit_guard(f"control_system:{connector_type}"):
+            if not cls._pooling_enabled():
+                connector = await cls.create_control_system_connector(config)
+                try:
+                    yield connector
+                finally:
+                    await connector.disconnect()
+                return
+
+            type_config = config.get("connector", {}).get(connector_type, {})
+            pool = cls.get_pool()
+            connector = await pool.acquire(
+                pool.make_key(
+                    "control_system",
+                    connector_type,
+                    type_config,
+                    write_policy=cls._write_policy_fingerprint(),
+                ),
+                lambda: cls.create_control_system_connector(config),
+            )
+            try:
+                yield connector
+            finally:
+                await pool.arelease(connector)
+
+    @classmethod
+    @asynccontextmanager
+    async def lease_archiver_connector(
+        cls, config: dict[str, Any] = None
+    ) -> AsyncIterator[ArchiverConnector]:
+        """
+        Lease a pooled archiver connector for the duration of a block.
+
+        See :meth:`lease_control_system_connector` for lifetime semantics.
+
+        Args:
+            config: Archiver configuration (same format as
+                :meth:`create_archiver_connector`). If None, loads from global config
+        """
+        if config is None:
+            config = cls._load_config("archiver")
+
+        connector_type = config.get("type", "epics_archiver")
+        async with _circuit_guard(f"archiver:{connector_type}"):
+            if not cls._pooling_enabled():
+                connector = await cls.create_archiver_connector(config)
+                try:
+                    yield connector
+                finally:
+                    await connector.disconnect()
+                return
+
+            type_config = config.get(connector_type, {})
+            pool = cls.get_pool()
+            connector = await pool.acquire(
+                pool.make_key("archiver", connector_type, type_config),
+                lambda: cls.create_archiver_connector(config),
+            )
+            try:
+                yield connector
+            finally:
+                await pool.arelease(connector)
+
+    @classmethod
+    async def shutdown_pool(cls) -> None:
+        """Disconnect all pooled connectors. Safe to call when no pool exists."""
+        if _connector_pool is not None:
+            await _connector_pool.shutdown()
+
+    @classmethod
+    def _write_policy_fingerprint(cls) -> dict[str, Any]:
+        """
+        Snapshot the write-safety settings control system connectors load in ``connect()``.
+
+        Covers the writes-enabled flags, the limits checking policy, and the
+        resolved limits database path with its modification time and size.
+        """
+        try:
+            from osprey.utils.config import get_config_value
+
+            fingerprint = {
+                key: get_config_value(key, None)
+                for key in (
+                    "control_system.writes_enabled",
+                    "execution_control.epics.writes_enabled",
+                    "control_system.limits_checking.enabled",
+                    "control_system.limits_checking.allow_unlisted_channels",
+                    "control_system.limits_checking.on_violation",
+                )
+            }
+            db_path = get_config_value("control_system.limits_checking.database_path", None)
+            if db_path and isinstance(db_path, str):
+                path = Path(db_path)
+                if not path.is_absolute():
+                    project_root = get_config_value("project_root", None)
+                    if project_root:
+                        path = Path(project_root) / path
+                try:
+                    stat = path.expanduser().stat()
+                    fingerprint["limits_database"] = [str(path), stat.st_mtime_ns, stat.st_size]
+                except OSError:
+                    fingerprint["limits_database"] = [str(path), None, None]
+            return fingerprint
+        except Exception:
+            return {}  # Config unavailable - connectors fall back to their defaults
+
+    @classmethod
+    def _load_config(cls, section: str) -> dict[str, Any]:
+        """Load a connector config section from global config, falling back to {}."""
+        try:
+            from osprey.utils.config import get_config_value
+
+            return get_config_value(section, {})
+        except Exception as e:
+            logger.warning(f"Could not load config: {e}, using defaults")
+            return {}
+
+
+_connector_pool: ConnectorPool | None = None
+
+
+def _shutdown_pool_on_exit() -> None:
+    """Synchronous cleanup for atexit handler."""
+    if _connector_pool is not None and len(_connector_pool):
+        try:
+            asyncio.run(_connector_pool.shutdown())
+        except Exception:
+            pass  # Best effort cleanup
+
+
+atexit.register(_shutdown_pool_on_exit)
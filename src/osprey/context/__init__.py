@@ -13,6 +13,12 @@ Key benefits:
 - Production-proven robustness
 """
 
+from .artifacts import (
+    TimeSeriesArtifact,
+    load_timeseries,
+    prune_artifact_store,
+    save_timeseries,
+)
 from .base import CapabilityContext
 from .context_manager import ContextManager, ContextNamespace
 from .loader import load_context
@@ -22,4 +28,8 @@ __all__ = [
     "ContextManager",  # Simplified LangGraph-native context manager
     "ContextNamespace",  # Namespace object for dot notation access to context objects
     "load_context",  # Utility function for loading context from JSON files
+    "load_timeseries",  # Zero-copy loader for out-of-band time series artifacts
+    "save_timeseries",  # Store a time-indexed DataFrame as an artifact
+    "prune_artifact_store",  # Delete stored artifacts by age and total size
+    "TimeSeriesArtifact",  # Memory-mapped view returned by load_timeseries
 ]
@@ -0,0 +1,471 @@
+"""
+Out-of-band Context Artifacts
+
+Large numerical payloads (archiver time series and similar) do not belong in the
+capability context dictionaries: those are copied on every state update, written
+into checkpoints and dumped into ``context.json`` for the Python executor. This
+module stores such payloads as memory-mappable ``.npy`` files next to a small
+JSON manifest, and lets contexts keep only an ``artifact://`` handle plus a summary.
+
+Layout of a stored time series artifact::
+
+    <store>/<artifact_id>/
+        manifest.json   # columns, dtypes, length, time range
+        index.npy       # int64 nanoseconds since epoch (UTC)
+        c0.npy, c1.npy  # one array per column, in manifest order
+
+Handles are resolved against, in order: directories registered with
+:func:`add_artifact_search_path` (``load_context`` registers ``artifacts/`` next
+to the loaded ``context.json``), then the agent artifact store. This makes the
+same handle work on the host and inside execution containers, where
+:meth:`ContextManager.save_context_to_file` has linked the artifacts into the
+mounted execution folder.
+
+The agent artifact store is pruned by age and total size (see
+:func:`prune_artifact_store`), at most every ``prune_interval_seconds`` when new
+artifacts are saved. Configuration (``context_artifacts`` in config.yml)::
+
+    context_artifacts:
+      max_age_hours: 168        # Delete artifacts older than this (null disables)
+      max_total_size_mb: null   # Delete oldest artifacts beyond this total size
+      prune_interval_seconds: 600
+
+Usage:
+    >>> from osprey.context import load_timeseries
+    >>> series = load_timeseries(context.ARCHIVER_DATA.beam_current.artifact)
+    >>> df = series.to_dataframe()  # Zero-copy view over the memory-mapped columns
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from osprey.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger("context_artifacts")
+
+ARTIFACT_SCHEME = "artifact://"
+ARTIFACTS_FOLDER = "artifacts"
+MANIFEST_FILE = "manifest.json"
+
+DEFAULT_MAX_AGE_HOURS = 168.0
+DEFAULT_PRUNE_INTERVAL_SECONDS = 600.0
+
+_search_paths: list[Path] = []
+_search_paths_lock = threading.Lock()
+
+# Monotonic time of the last automatic prune per store directory
+_last_prune: dict[Path, float] = {}
+_prune_lock = threading.Lock()
+
+
+class ArtifactNotFoundError(FileNotFoundError):
+    """Raised when an artifact handle cannot be resolved to a stored artifact."""
+
+
+def get_artifact_store_dir() -> Path:
+    """Get the agent directory where new artifacts are written.
+
+    Uses ``file_paths.context_artifacts_dir`` from the configuration, falling
+    back to a temporary directory when no configuration is available.
+
+    Returns:
+        Absolute path to the artifact store (not necessarily existing yet)
+    """
+    try:
+        from osprey.utils.config import get_agent_dir
+
+        return Path(get_agent_dir("context_artifacts_dir"))
+    except Exception as e:
+        logger.debug(f"Agent directory unavailable, using temp artifact store: {e}")
+        return Path(tempfile.gettempdir()) / "osprey_context_artifacts"
+
+
+def add_artifact_search_path(path: str | Path) -> None:
+    """Register a directory that is searched first when resolving artifact handles.
+
+    Args:
+        path: Directory containing ``<artifact_id>/`` artifact folders
+    """
+    resolved = Path(path).resolve()
+    with _search_paths_lock:
+        if resolved in _search_paths:
+            _search_paths.remove(resolved)
+        _search_paths.insert(0, resolved)
+
+
+def clear_artifact_search_paths() -> None:
+    """Forget all directories registered with :func:`add_artifact_search_path`."""
+    with _search_paths_lock:
+        _search_paths.clear()
+
+
+def is_artifact_handle(value: Any) -> bool:
+    """Check whether a value is an ``artifact://`` handle."""
+    return isinstance(value, str) and value.startswith(ARTIFACT_SCHEME)
+
+
+def _artifact_id(handle: str) -> str:
+    if not is_artifact_handle(handle):
+        raise ValueError(f"Not an artifact handle: {handle!r}")
+    artifact_id = handle[len(ARTIFACT_SCHEME) :]
+    if not artifact_id or "/" in artifact_id or "\\" in artifact_id or artifact_id in (".", ".."):
+        raise ValueError(f"Invalid artifact handle: {handle!r}")
+    return artifact_id
+
+
+def resolve_artifact(handle: str) -> Path:
+    """Resolve an artifact handle to the folder holding its files.
+
+    Args:
+        handle: ``artifact://<artifact_id>`` handle
+
+    Returns:
+        Path to the artifact folder
+
+    Raises:
+        ValueError: If the handle is malformed
+        ArtifactNotFoundError: If no search location holds the artifact
+    """
+    artifact_id = _artifact_id(handle)
+    with _search_paths_lock:
+        candidates = list(_search_paths)
+    candidates.append(get_artifact_store_dir())
+
+    for directory in candidates:
+        path = directory / artifact_id
+        if (path / MANIFEST_FILE).exists():
+            return path
+
+    raise ArtifactNotFoundError(
+        f"Artifact {handle} not found (searched: {', '.join(str(c) for c in candidates)})"
+    )
+
+
+def _column_array(values: Any) -> np.ndarray:
+    """Convert a column to a plain, memory-mappable array."""
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return np.ascontiguousarray(array)
+    try:
+        return np.ascontiguousarray(array.astype(np.float64))
+    except (TypeError, ValueError):
+        return np.ascontiguousarray(array.astype(str))
+
+
+def save_timeseries(frame: "pd.DataFrame", store_dir: str | Path | None = None) -> str:
+    """Store a time-indexed DataFrame as a memory-mappable artifact.
+
+    Args:
+        frame: DataFrame with a DatetimeIndex and one column per series
+        store_dir: Directory to write into (default: :func:`get_artifact_store_dir`)
+
+    Returns:
+        ``artifact://`` handle for the stored data
+    """
+    import pandas as pd
+
+    index = pd.DatetimeIndex(frame.index)
+    timezone = str(index.tz) if index.tz is not None else None
+    if timezone is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+
+    artifact_id = uuid.uuid4().hex
+    store = Path(store_dir) if store_dir is not None else get_artifact_store_dir()
+    final_path = store / artifact_id
+    staging_path = store / f".{artifact_id}.tmp"
+    staging_path.mkdir(parents=True, exist_ok=False)
+
+    try:
+        np.save(staging_path / "index.npy", index.as_unit("ns").asi8, allow_pickle=False)
+
+        columns = []
+        for position, name in enumerate(frame.columns):
+            array = _column_array(frame[name].to_numpy())
+            filename = f"c{position}.npy"
+            np.save(staging_path / filename, array, allow_pickle=False)
+            columns.append({"name": str(name), "file": filename, "dtype": str(array.dtype)})
+
+        manifest = {
+            "kind": "timeseries",
+            "version": 1,
+            "length": len(index),
+            "timezone": timezone,
+            "start": index[0].isoformat() if len(index) else None,
+            "end": index[-1].isoformat() if len(index) else None,
+            "columns": columns,
+        }
+        with open(staging_path / MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        # Publish atomically so readers never see a half-written artifact
+        os.replace(staging_path, final_path)
+    except Exception:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
+    logger.debug(f"Stored time series artifact {artifact_id} ({len(index)} rows) in {store}")
+    _maybe_prune(store)
+    return f"{ARTIFACT_SCHEME}{artifact_id}"
+
+
+def _get_artifact_settings() -> dict[str, Any]:
+    try:
+        from osprey.utils.config import get_config_value
+
+        settings = get_config_value("context_artifacts", {}) or {}
+    except Exception:
+        # No configuration available (e.g. standalone use): defaults apply
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+def _maybe_prune(store: Path) -> None:
+    """Prune a store with the configured limits, at most once per prune interval."""
+    settings = _get_artifact_settings()
+    interval = settings.get("prune_interval_seconds", DEFAULT_PRUNE_INTERVAL_SECONDS)
+    now = time.monotonic()
+    with _prune_lock:
+        last = _last_prune.get(store)
+        if last is not None and now - last < interval:
+            return
+        _last_prune[store] = now
+
+    max_age_hours = settings.get("max_age_hours", DEFAULT_MAX_AGE_HOURS)
+    max_total_size_mb = settings.get("max_total_size_mb")
+    try:
+        prune_artifact_store(
+            max_age_seconds=max_age_hours * 3600 if max_age_hours is not None else None,
+            max_total_bytes=(
+                int(max_total_size_mb * 1024 * 1024) if max_total_size_mb is not None else None
+            ),
+            store_dir=store,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to prune artifact store {store}: {e}")
+
+
+def prune_artifact_store(
+    max_age_seconds: float | None = None,
+    max_total_bytes: int | None = None,
+    store_dir: str | Path | None = None,
+) -> list[str]:
+    """Delete stored artifacts by age and total size.
+
+    Artifacts older than ``max_age_seconds`` are deleted first; then the oldest
+    remaining artifacts are deleted until the store holds at most
+    ``max_total_bytes``. Contexts referring to a deleted artifact report their
+    data as no longer available.
+
+    Args:
+        max_age_seconds: Maximum artifact age (None: no age limit)
+        max_total_bytes: Maximum total size of the store (None: no size limit)
+        store_dir: Store to prune (default: :func:`get_artifact_store_dir`)
+
+    Returns:
+        Handles of the deleted artifacts
+    """
+    store = Path(store_dir) if store_dir is not None else get_artifact_store_dir()
+    if not store.is_dir():
+        return []
+
+    now = time.time()
+    artifacts = []
+    for path in store.iterdir():
+        if not path.is_dir():
+            continue
+        try:
+            files = [f.stat() for f in path.iterdir() if f.is_file()]
+            modified = max((f.st_mtime for f in files), default=path.stat().st_mtime)
+        except OSError:
+            continue  # Removed concurrently
+        artifacts.append((modified, sum(f.st_size for f in files), path))
+    artifacts.sort(key=lambda artifact: artifact[0])
+
+    removed = []
+    total = sum(size for _, size, _ in artifacts)
+    newest = artifacts[-1][2] if artifacts else None
+    for modified, size, path in artifacts:
+        # Staging folders (".<id>.tmp") may be in use by a writer unless they are stale
+        staging = path.name.startswith(".")
+        too_old = max_age_seconds is not None and now - modified > max_age_seconds
+        # The size limit never deletes the newest artifact, which was usually just saved
+        too_big = (
+            max_total_bytes is not None
+            and total > max_total_bytes
+            and not staging
+            and path != newest
+        )
+        if not (too_old or too_big):
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+        if not staging:
+            removed.append(f"{ARTIFACT_SCHEME}{path.name}")
+
+    if removed:
+        logger.info(f"Pruned {len(removed)} artifact(s) from {store}")
+    return removed
+
+
+class TimeSeriesArtifact:
+    """Read-only view over a stored time series artifact.
+
+    Columns are memory-mapped lazily on first access, so opening an artifact
+    and reading a handful of samples never loads the full payload.
+    """
+
+    def __init__(self, handle: str, path: Path, manifest: dict[str, Any], mmap: bool = True):
+        self.handle = handle
+        self.path = path
+        self.manifest = manifest
+        self._mmap_mode = "r" if mmap else None
+        self._index: pd.DatetimeIndex | None = None
+        self._columns: dict[str, np.ndarray] = {}
+        self._files = {column["name"]: column["file"] for column in manifest["columns"]}
+
+    def __len__(self) -> int:
+        return self.manifest["length"]
+
+    def __repr__(self) -> str:
+        return (
+            f"TimeSeriesArtifact({self.handle}, rows={len(self)}, columns={len(self.column_names)})"
+        )
+
+    @property
+    def column_names(self) -> list[str]:
+        """Column names in stored order."""
+        return list(self._files)
+
+    @property
+    def index(self) -> "pd.DatetimeIndex":
+        """Timestamps as a DatetimeIndex (in the original timezone, if any)."""
+        if self._index is None:
+            import pandas as pd
+
+            raw = np.load(self.path / "index.npy", mmap_mode=self._mmap_mode, allow_pickle=False)
+            index = pd.DatetimeIndex(raw.view("datetime64[ns]"), copy=False)
+            timezone = self.manifest.get("timezone")
+            if timezone is not None:
+                index = index.tz_localize("UTC").tz_convert(timezone)
+            self._index = index
+        return self._index
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one column as a (read-only, memory-mapped) NumPy array.
+
+        Raises:
+            KeyError: If the artifact has no such column
+        """
+        if name not in self._columns:
+            if name not in self._files:
+                raise KeyError(name)
+            self._columns[name] = np.load(
+                self.path / self._files[name], mmap_mode=self._mmap_mode, allow_pickle=False
+            )
+        return self._columns[name]
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """All columns as a ``name -> array`` mapping."""
+        return {name: self.column(name) for name in self._files}
+
+    def to_dataframe(self, columns: list[str] | None = None) -> "pd.DataFrame":
+        """Build a DataFrame backed by the memory-mapped arrays without copying them.
+
+        Args:
+            columns: Optional subset of columns to include (default: all)
+        """
+        import pandas as pd
+
+        names = columns if columns is not None else self.column_names
+        return pd.DataFrame(
+            {name: self.column(name) for name in names}, index=self.index, copy=False
+        )
+
+
+def load_timeseries(handle: str, mmap: bool = True) -> TimeSeriesArtifact:
+    """Open a stored time series artifact.
+
+    Args:
+        handle: ``artifact://`` handle returned by :func:`save_timeseries`
+        mmap: Memory-map the arrays (default) instead of reading them into memory
+
+    Returns:
+        TimeSeriesArtifact view over the stored data
+
+    Raises:
+        ArtifactNotFoundError: If the artifact cannot be found
+    """
+    path = resolve_artifact(handle)
+    with open(path / MANIFEST_FILE, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return TimeSeriesArtifact(handle, path, manifest, mmap=mmap)
+
+
+def iter_artifact_handles(data: Any) -> Iterator[str]:
+    """Yield every artifact handle referenced anywhere inside nested context data."""
+    if is_artifact_handle(data):
+        yield data
+    elif isinstance(data, dict):
+        for value in data.values():
+            yield from iter_artifact_handles(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            yield from iter_artifact_handles(value)
+
+
+def export_artifacts(data: Any, folder_path: str | Path) -> list[str]:
+    """Make the artifacts referenced by context data available under ``folder/artifacts``.
+
+    Files are hard-linked when possible (same filesystem) and copied otherwise,
+    so the folder stays self-contained when mounted into an execution container.
+
+    Args:
+        data: Context data (as stored in ``capability_context_data``)
+        folder_path: Execution folder receiving the ``artifacts/`` directory
+
+    Returns:
+        Handles that were exported
+    """
+    target_root = Path(folder_path) / ARTIFACTS_FOLDER
+    exported = []
+
+    for handle in dict.fromkeys(iter_artifact_handles(data)):
+        try:
+            source = resolve_artifact(handle)
+        except (ArtifactNotFoundError, ValueError) as e:
+            logger.warning(f"Skipping artifact export: {e}")
+            continue
+
+        target = target_root / source.name
+        if target.resolve() == source.resolve():
+            exported.append(handle)
+            continue
+
+        target.mkdir(parents=True, exist_ok=True)
+        for file in source.iterdir():
+            destination = target / file.name
+            if destination.exists():
+                continue
+            try:
+                os.link(file, destination)
+            except OSError:
+                shutil.copy2(file, destination)
+        exported.append(handle)
+
+    if exported:
+        logger.debug(f"Exported {len(exported)} artifact(s) to {target_root}")
+    return exported
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from osprey.utils.logger import get_logger
 
+from .artifacts import export_artifacts
+
 if TYPE_CHECKING:
     from osprey.context.base import CapabilityContext
     from osprey.state.state import AgentState
@@ -262,9 +264,6 @@ class ContextManager:
                 logger.debug(f"Registry not available, skipping validation for {context_type}")
 
         # Use Pydantic's built-in .model_dump() method for serialization
-        if context_type not in self._data:
-            self._data[context_type] = {}
-
         context_dict = value.model_dump()
 
         # Store task_objective as metadata for orchestrator context reuse optimization
@@ -273,7 +272,9 @@ class ContextManager:
         if task_objective:
             context_dict["_meta"] = {"task_objective": task_objective}
 
-        self._data[context_type][key] = context_dict
+        # Copy-on-write: per-type dicts may be shared with earlier state snapshots
+        # (see merge_capability_context_data), so replace rather than mutate them
+        self._data[context_type] = {**self._data.get(context_type, {}), key: context_dict}
 
         # Update cache
         if context_type not in self._object_cache:
@@ -540,6 +541,8 @@ class ContextManager:
 
         This method always saves the current context data to ensure it reflects
         the latest state. It uses the same serialization format as the state system.
+        Out-of-band artifacts referenced by the contexts are linked into an
+        ``artifacts/`` folder next to the file so the folder is self-contained.
 
         Args:
             folder_path: Path to the folder where the context file should be saved
@@ -573,6 +576,8 @@ class ContextManager:
             with open(context_file, "w", encoding="utf-8") as f:
                 json.dump(self._data, f, indent=2, ensure_ascii=False, default=str)
 
+            export_artifacts(self._data, folder_path)
+
             logger.info(f"Saved context data to: {context_file}")
             return context_file
 
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from osprey.utils.logger import get_logger
 
+from .artifacts import ARTIFACTS_FOLDER, add_artifact_search_path
 from .context_manager import ContextManager
 
 logger = get_logger("context_loader")
@@ -49,6 +50,9 @@ def load_context(context_file: str = "context.json") -> ContextManager | None:
         with open(context_path, encoding="utf-8") as f:
             context_data = json.load(f)
 
+        # Artifacts exported alongside the context file take precedence over the agent store
+        add_artifact_search_path(context_path.parent / ARTIFACTS_FOLDER)
+
         # Ensure registry is initialized before creating ContextManager
         # This is required for context reconstruction to work properly
         try:
@@ -12,11 +12,13 @@ from .graph_builder import (
     create_memory_checkpointer,
     setup_postgres_checkpointer,
 )
+from .session_checkpointer import SessionCheckpointer
 
 __all__ = [
     "create_graph",
     "create_async_postgres_checkpointer",
     "create_memory_checkpointer",
     "setup_postgres_checkpointer",
+    "SessionCheckpointer",
     "GraphBuildError",
 ]
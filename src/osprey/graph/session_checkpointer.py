@@ -0,0 +1,362 @@
+"""
+Session-Scoped In-Memory Checkpointer
+
+Bounded checkpointer for long-running interfaces (OpenWebUI pipelines) that serve
+many independent chat sessions from one compiled graph. Each LangGraph thread gets
+its own :class:`~langgraph.checkpoint.memory.InMemorySaver`; sessions are evicted
+least-recently-used once ``max_sessions`` is exceeded or after ``idle_ttl_seconds``
+without activity. Evicted sessions can optionally be spilled to a local SQLite file
+(latest checkpoint plus its pending writes, so interrupted approvals survive) and are
+restored transparently on their next access.
+
+Because sessions are routed by ``thread_id`` inside the checkpointer, the graph is
+compiled once with this checkpointer and never has to be rebound per request.
+
+The async methods run the synchronous implementation in a worker thread: lookups
+may restore a spilled session and writes may evict one to SQLite, which must not
+block the event loop.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("session_checkpointer")
+
+
+class _Session:
+    """One in-memory session and its bookkeeping."""
+
+    __slots__ = ("saver", "last_access")
+
+    def __init__(self, saver: InMemorySaver):
+        self.saver = saver
+        self.last_access = time.monotonic()
+
+
+class SessionCheckpointer(BaseCheckpointSaver[str]):
+    """Checkpointer holding one bounded, evictable in-memory store per thread.
+
+    Args:
+        max_sessions: Maximum number of sessions kept in memory (LRU eviction)
+        idle_ttl_seconds: Evict sessions idle for longer than this (None disables)
+        spill_path: SQLite file for evicted sessions (None drops them instead)
+        spill_retention_seconds: Delete spilled sessions older than this (None keeps them)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = 200,
+        idle_ttl_seconds: float | None = 6 * 3600,
+        spill_path: str | Path | None = None,
+        spill_retention_seconds: float | None = 7 * 24 * 3600,
+    ):
+        super().__init__()
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.spill_retention_seconds = spill_retention_seconds
+        self.spill_path = Path(spill_path) if spill_path is not None else None
+
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._lock = threading.RLock()
+        self._spill_db: sqlite3.Connection | None = None
+        self._counters = {"evictions": 0, "spills": 0, "restores": 0, "expired_spills": 0}
+
+        if self.spill_path is not None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_db = sqlite3.connect(str(self.spill_path), check_same_thread=False)
+            self._spill_db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "thread_id TEXT PRIMARY KEY, type TEXT, data BLOB, spilled_at REAL)"
+            )
+            self._spill_db.commit()
+
+    # ===== Session management =====
+
+    def _session(self, thread_id: str, create: bool = True) -> InMemorySaver | None:
+        """Get the saver for a thread, restoring it from the spill file if needed."""
+        session = self._sessions.get(thread_id)
+        if session is None:
+            saver = self._restore(thread_id)
+            if saver is None:
+                if not create:
+                    return None
+                saver = InMemorySaver(serde=self.serde)
+            session = _Session(saver)
+            self._sessions[thread_id] = session
+        else:
+            session.last_access = time.monotonic()
+            self._sessions.move_to_end(thread_id)
+
+        self._enforce_limits(keep=thread_id)
+        return session.saver
+
+    def _enforce_limits(self, keep: str | None = None) -> None:
+        """Evict expired sessions, then least-recently-used ones over capacity."""
+        if self.idle_ttl_seconds is not None:
+            cutoff = time.monotonic() - self.idle_ttl_seconds
+            for thread_id, session in list(self._sessions.items()):
+                if session.last_access >= cutoff:
+                    break  # Ordered by recency; the rest are newer
+                if thread_id != keep:
+                    self._evict(thread_id)
+
+        while len(self._sessions) > self.max_sessions:
+            thread_id = next(iter(self._sessions))
+            if thread_id == keep:
+                self._sessions.move_to_end(thread_id)
+                thread_id = next(iter(self._sessions))
+            self._evict(thread_id)
+
+    def _evict(self, thread_id: str) -> None:
+        session = self._sessions.pop(thread_id)
+        self._counters["evictions"] += 1
+        if self._spill_db is not None:
+            try:
+                self._spill(thread_id, session.saver)
+            except Exception as e:
+                logger.warning(f"Failed to spill session {thread_id}, dropping it: {e}")
+        logger.debug(f"Evicted checkpointer session {thread_id}")
+
+    def _spill(self, thread_id: str, saver: InMemorySaver) -> None:
+        """Write the latest checkpoint (and pending writes) of each namespace to SQLite."""
+        latest: dict[str, CheckpointTuple] = {}
+        for item in saver.list({"configurable": {"thread_id": thread_id}}):
+            namespace = item.config["configurable"].get("checkpoint_ns", "")
+            current = latest.get(namespace)
+            if current is None or item.checkpoint["id"] > current.checkpoint["id"]:
+                latest[namespace] = item
+        if not latest:
+            return
+
+        payload = [
+            {
+                "checkpoint_ns": namespace,
+                "checkpoint": item.checkpoint,
+                "metadata": item.metadata,
+                "pending_writes": [list(write) for write in item.pending_writes or []],
+            }
+            for namespace, item in latest.items()
+        ]
+        type_, data = self.serde.dumps_typed(payload)
+
+        now = time.time()
+        self._spill_db.execute(
+            "INSERT OR REPLACE INTO sessions (thread_id, type, data, spilled_at) VALUES (?, ?, ?, ?)",
+            (thread_id, type_, data, now),
+        )
+        if self.spill_retention_seconds is not None:
+            cursor = self._spill_db.execute(
+                "DELETE FROM sessions WHERE spilled_at < ?", (now - self.spill_retention_seconds,)
+            )
+            self._counters["expired_spills"] += max(cursor.rowcount, 0)
+        self._spill_db.commit()
+        self._counters["spills"] += 1
+
+    def _restore(self, thread_id: str) -> InMemorySaver | None:
+        """Rebuild an in-memory session from the spill file (and remove it there)."""
+        if self._spill_db is None:
+            return None
+        row = self._spill_db.execute(
+            "SELECT type, data FROM sessions WHERE thread_id = ?", (thread_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        saver = InMemorySaver(serde=self.serde)
+        for entry in self.serde.loads_typed((row[0], row[1])):
+            checkpoint = entry["checkpoint"]
+            config = saver.put(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": entry["checkpoint_ns"]}},
+                checkpoint,
+                entry["metadata"],
+                checkpoint["channel_versions"],
+            )
+            writes_by_task: dict[str, list[tuple[str, Any]]] = {}
+            for task_id, channel, value in entry["pending_writes"]:
+                writes_by_task.setdefault(task_id, []).append((channel, value))
+            for task_id, writes in writes_by_task.items():
+                saver.put_writes(config, writes, task_id)
+
+        self._spill_db.execute("DELETE FROM sessions WHERE thread_id = ?", (thread_id,))
+        self._spill_db.commit()
+        self._counters["restores"] += 1
+        logger.debug(f"Restored checkpointer session {thread_id} from spill file")
+        return saver
+
+    def stats(self) -> dict[str, Any]:
+        """Get session and memory usage metrics.
+
+        Returns:
+            Dictionary with session counts, approximate serialized bytes held in
+            memory, and eviction/spill/restore counters
+        """
+        with self._lock:
+            memory_bytes = sum(_saver_bytes(s.saver) for s in self._sessions.values())
+            spilled = 0
+            if self._spill_db is not None:
+                spilled = self._spill_db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            return {
+                "sessions_in_memory": len(self._sessions),
+                "sessions_spilled": spilled,
+                "max_sessions": self.max_sessions,
+                "memory_bytes": memory_bytes,
+                **self._counters,
+            }
+
+    def close(self) -> None:
+        """Close the spill file (in-memory sessions are discarded)."""
+        with self._lock:
+            self._sessions.clear()
+            if self._spill_db is not None:
+                self._spill_db.close()
+                self._spill_db = None
+
+    # ===== BaseCheckpointSaver interface =====
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        with self._lock:
+            saver = self._session(config["configurable"]["thread_id"], create=False)
+            return saver.get_tuple(config) if saver is not None else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        with self._lock:
+            if config and "thread_id" in config.get("configurable", {}):
+                saver = self._session(config["configurable"]["thread_id"], create=False)
+                savers = [saver] if saver is not None else []
+            else:
+                savers = [session.saver for session in self._sessions.values()]
+            items = []
+            for saver in savers:
+                remaining = None if limit is None else limit - len(items)
+                if remaining is not None and remaining <= 0:
+                    break
+                items.extend(saver.list(config, filter=filter, before=before, limit=remaining))
+        yield from items
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            saver = self._session(config["configurable"]["thread_id"])
+            return saver.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        with self._lock:
+            saver = self._session(config["configurable"]["thread_id"])
+            saver.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(thread_id, None)
+            if self._spill_db is not None:
+                self._spill_db.execute("DELETE FROM sessions WHERE thread_id = ?", (thread_id,))
+                self._spill_db.commit()
+
+    def get_delta_channel_history(self, *, config: RunnableConfig, channels: Sequence[str]):
+        with self._lock:
+            saver = self._session(config["configurable"]["thread_id"], create=False)
+            if saver is None:
+                return super().get_delta_channel_history(config=config, channels=channels)
+            return saver.get_delta_channel_history(config=config, channels=channels)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        return InMemorySaver.get_next_version(self, current, channel)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ):
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aget_delta_channel_history(
+        self, *, config: RunnableConfig, channels: Sequence[str]
+    ) -> Mapping[str, Any]:
+        return await asyncio.to_thread(
+            self.get_delta_channel_history, config=config, channels=channels
+        )
+
+
+def _saver_bytes(saver: InMemorySaver) -> int:
+    """Approximate serialized size of everything an InMemorySaver holds."""
+    total = 0
+    for namespaces in saver.storage.values():
+        for checkpoints in namespaces.values():
+            for checkpoint, metadata, _parent in checkpoints.values():
+                total += len(checkpoint[1]) + len(metadata[1])
+    for writes in saver.writes.values():
+        for _task_id, _channel, value, _path in writes.values():
+            total += len(value[1])
+    for value in saver.blobs.values():
+        total += len(value[1])
+    return total
@@ -13,12 +13,17 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-from osprey.base import BaseCapability, CapabilityMatch, ClassifierExample
+from osprey.base import (
+    BaseCapability,
+    CapabilityDecisions,
+    CapabilityMatch,
+    ClassifierExample,
+)
 from osprey.base.decorators import infrastructure_node
 from osprey.base.errors import ErrorClassification, ErrorSeverity, ReclassificationRequiredError
 from osprey.base.nodes import BaseInfrastructureNode
 from osprey.events import EventEmitter, StatusEvent
-from osprey.models import get_chat_completion
+from osprey.models import aget_chat_completion
 from osprey.prompts.loader import get_framework_prompts
 from osprey.registry import get_registry
 from osprey.state import AgentState
@@ -444,7 +449,7 @@ class CapabilityClassifier:
 
         # Execute classification
         try:
-            # Set caller context for API call logging (propagates through asyncio.to_thread)
+            # Set caller context for API call logging (propagates across awaits)
             from osprey.models import set_api_call_context
 
             set_api_call_context(
@@ -455,11 +460,11 @@ class CapabilityClassifier:
                 extra={"capability": capability.name},
             )
 
-            response_data = await asyncio.to_thread(
-                get_chat_completion,
+            response_data = await aget_chat_completion(
                 model_config=get_model_config("classifier"),
                 message=message,
                 output_model=CapabilityMatch,
+                cache_prefix=self._cache_prefix(message),
             )
 
             # Emit LLM response event for TUI display (key=capability.name for accumulation)
@@ -477,6 +482,116 @@ class CapabilityClassifier:
             self.logger.error(f"Error in capability classification for '{capability.name}': {e}")
             return False
 
+    async def classify_batch(
+        self, capabilities: list[BaseCapability], semaphore: asyncio.Semaphore
+    ) -> dict[str, bool | None]:
+        """Classify several capabilities with a single structured LLM request.
+
+        Entries that the batch could not settle (failed call, missing, duplicated
+        or uncertain decisions) are returned as ``None`` so the caller can fall
+        back to per-capability classification for them.
+
+        :param capabilities: Capabilities to assess in one request
+        :param semaphore: Semaphore for concurrency control
+        :return: Mapping of capability name to match result, or None if unresolved
+        """
+        async with semaphore:
+            return await self._perform_batch_classification(capabilities)
+
+    async def _perform_batch_classification(
+        self, capabilities: list[BaseCapability]
+    ) -> dict[str, bool | None]:
+        """Perform the batched classification logic."""
+        results: dict[str, bool | None] = {}
+        entries: list[tuple[str, str, str]] = []
+
+        for capability in capabilities:
+            classifier = self._get_classifier(capability)
+            if not classifier:
+                results[capability.name] = False
+                continue
+            results[capability.name] = None
+            entries.append(
+                (
+                    capability.name,
+                    classifier.instructions,
+                    ClassifierExample.join(
+                        classifier.examples, randomize=True, seed=capability.name
+                    ),
+                )
+            )
+
+        if not entries:
+            return results
+
+        message = self._build_batch_classification_prompt(entries)
+        batch_key = "batch:" + ",".join(name for name, _, _ in entries)
+        self.logger.debug(f"\n\nTask Analyzer batched System Prompt:\n{message}\n\n")
+        self.logger.emit_llm_request(message, key=batch_key)
+
+        try:
+            from osprey.models import set_api_call_context
+
+            set_api_call_context(
+                function="_perform_batch_classification",
+                module="classification_node",
+                class_name="CapabilityClassifier",
+                extra={"capabilities": [name for name, _, _ in entries]},
+            )
+
+            response_data = await aget_chat_completion(
+                model_config=get_model_config("classifier"),
+                message=message,
+                output_model=CapabilityDecisions,
+                cache_prefix=self._cache_prefix(message),
+            )
+        except Exception as e:
+            self.logger.warning(f"Batched classification failed, falling back per capability: {e}")
+            return results
+
+        if not isinstance(response_data, CapabilityDecisions):
+            self.logger.warning(
+                f"Batched classification did not return CapabilityDecisions. Got: {type(response_data)}"
+            )
+            return results
+
+        self.logger.emit_llm_response(response_data.model_dump_json(), key=batch_key)
+
+        # Collect decisions, discarding conflicting duplicates and unknown names
+        decided: dict[str, bool | None] = {}
+        for decision in response_data.decisions:
+            if decision.capability not in results or results[decision.capability] is False:
+                continue
+            value = decision.is_match if decision.certain else None
+            if decision.capability in decided and decided[decision.capability] != value:
+                value = None
+            decided[decision.capability] = value
+
+        for name, _, _ in entries:
+            result = decided.get(name)
+            results[name] = result
+            if result is None:
+                self.logger.debug(f"Batched classification unresolved for '{name}'")
+            else:
+                self.logger.info(f" >>> Capability '{name}' >>> {result}")
+
+        return results
+
+    def _build_batch_classification_prompt(self, entries: list[tuple[str, str, str]]) -> str:
+        """Build the batched classification prompt."""
+        prompt_provider = get_framework_prompts()
+        classification_builder = prompt_provider.get_classification_prompt_builder()
+        prompt = classification_builder.build_batch_prompt(
+            capabilities=entries,
+            context=None,
+            previous_failure=self.previous_failure,
+        )
+        return f"{prompt}\n\nUser request:\n{self.task}"
+
+    def _cache_prefix(self, message: str) -> str:
+        """Return the part of a classification prompt that precedes the user request."""
+        return message[: len(message) - len(self.task)]
+
     def _get_classifier(self, capability: BaseCapability):
         """Get classifier with proper error handling."""
         try:
@@ -503,7 +618,11 @@ class CapabilityClassifier:
     def _build_classification_prompt(self, classifier) -> str:
         """Build the classification prompt."""
         capability_instructions = classifier.instructions
-        examples_string = ClassifierExample.join(classifier.examples, randomize=True)
+        # Seeded shuffle: order is mixed but identical across turns, so the prompt
+        # prefix stays cacheable by the provider
+        examples_string = ClassifierExample.join(
+            classifier.examples, randomize=True, seed=capability_instructions
+        )
 
         prompt_provider = get_framework_prompts()
         classification_builder = prompt_provider.get_classification_prompt_builder()
@@ -567,9 +686,10 @@ async def select_capabilities(
         # Get classification configuration for concurrency control
         classification_config = get_classification_config()
         max_concurrent = classification_config["max_concurrent_classifications"]
+        mode = classification_config.get("mode", "per_capability")
 
         logger.info(
-            f"Classifying {len(remaining_capabilities)} capabilities with max {max_concurrent} concurrent requests"
+            f"Classifying {len(remaining_capabilities)} capabilities ({mode}) with max {max_concurrent} concurrent requests"
         )
 
         # Create classifier instance with shared context
@@ -578,13 +698,24 @@ async def select_capabilities(
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        # Create classification tasks with proper semaphore usage
-        classification_tasks = [
-            classifier.classify(capability, semaphore) for capability in remaining_capabilities
-        ]
-
-        # Execute all classifications in parallel with semaphore control
-        classification_results = await asyncio.gather(*classification_tasks, return_exceptions=True)
+        if mode == "batched":
+            classification_results = await _classify_batched(
+                classifier,
+                remaining_capabilities,
+                semaphore,
+                classification_config.get("batch_size", 20),
+                logger,
+            )
+        else:
+            # Create classification tasks with proper semaphore usage
+            classification_tasks = [
+                classifier.classify(capability, semaphore) for capability in remaining_capabilities
+            ]
+
+            # Execute all classifications in parallel with semaphore control
+            classification_results = await asyncio.gather(
+                *classification_tasks, return_exceptions=True
+            )
 
         # Process results and collect active capabilities
         for capability, result in zip(remaining_capabilities, classification_results, strict=False):
@@ -602,6 +733,62 @@ async def select_capabilities(
     return active_capabilities
 
 
+async def _classify_batched(
+    classifier: CapabilityClassifier,
+    capabilities: list[BaseCapability],
+    semaphore: asyncio.Semaphore,
+    batch_size: int,
+    logger,
+) -> list[bool | BaseException]:
+    """Classify capabilities in batched requests with per-capability fallback.
+
+    Capabilities are split into chunks of ``batch_size`` and each chunk is
+    classified with one structured request. Capabilities the batch could not
+    settle are then classified individually, exactly as in per-capability mode.
+
+    :param classifier: Classifier bound to the current task
+    :param capabilities: Capabilities to classify
+    :param semaphore: Semaphore for concurrency control
+    :param batch_size: Maximum number of capabilities per batched request
+    :param logger: Logger instance
+    :return: Results aligned with ``capabilities`` (bool or exception)
+    """
+    chunks = [capabilities[i : i + batch_size] for i in range(0, len(capabilities), batch_size)]
+    batch_results = await asyncio.gather(
+        *(classifier.classify_batch(chunk, semaphore) for chunk in chunks),
+        return_exceptions=True,
+    )
+
+    decisions: dict[str, bool | None] = {}
+    for batch_result in batch_results:
+        if isinstance(batch_result, BaseException):
+            logger.warning(
+                f"Batched classification error, falling back per capability: {batch_result}"
+            )
+            continue
+        decisions.update(batch_result)
+
+    unresolved = [cap for cap in capabilities if decisions.get(cap.name) is None]
+    if unresolved:
+        logger.info(
+            f"Falling back to per-capability classification for {len(unresolved)} capabilities"
+        )
+        fallback_results = await asyncio.gather(
+            *(classifier.classify(capability, semaphore) for capability in unresolved),
+            return_exceptions=True,
+        )
+        fallback_by_name = {
+            cap.name: result for cap, result in zip(unresolved, fallback_results, strict=True)
+        }
+    else:
+        fallback_by_name = {}
+
+    return [
+        fallback_by_name[cap.name] if cap.name in fallback_by_name else decisions[cap.name]
+        for cap in capabilities
+    ]
+
+
 def _expand_capability_dependencies(
     selected_names: list[str],
     state: AgentState,
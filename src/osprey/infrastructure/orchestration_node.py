@@ -7,7 +7,6 @@ Convention-based implementation with native LangGraph interrupt support.
 
 from __future__ import annotations
 
-import asyncio
 import datetime
 import json
 import time
@@ -32,7 +31,9 @@ from osprey.base.errors import (
 from osprey.base.nodes import BaseInfrastructureNode
 from osprey.base.planning import ExecutionPlan, PlannedStep
 from osprey.context.context_manager import ContextManager
-from osprey.models import get_chat_completion, set_api_call_context
+from osprey.models import aget_chat_completion, set_api_call_context
+from osprey.prompts.base import PromptParts
+from osprey.prompts.defaults.orchestrator import DefaultOrchestratorPromptBuilder
 from osprey.prompts.loader import get_framework_prompts
 from osprey.registry import get_registry
 from osprey.state import AgentState
@@ -559,7 +560,8 @@ class OrchestrationNode(BaseInfrastructureNode):
             # Get messages for chat history context (only used when task_depends_on_chat_history=True)
             messages = state.get("messages", [])
 
-            prompt = orchestrator_builder.get_planning_instructions(
+            prompt_parts = _build_planning_prompt_parts(
+                orchestrator_builder,
                 active_capabilities=active_capabilities,
                 context_manager=context_manager,
                 task_depends_on_chat_history=state.get("task_depends_on_chat_history", False),
@@ -567,6 +569,7 @@ class OrchestrationNode(BaseInfrastructureNode):
                 error_context=error_context,
                 messages=messages,
             )
+            prompt = prompt_parts.text
 
             if not prompt:
                 logger.error("No prompt text generated. The instructions will be empty.")
@@ -602,14 +605,14 @@ class OrchestrationNode(BaseInfrastructureNode):
                 f"\n\n\n------------Orchestrator System Prompt:\n{prompt}\n------------\n\n\n"
             )
 
-            return prompt
+            return prompt, prompt_parts.static
 
         # =====================================================================
         # GENERATE EXECUTION PLAN
         # =====================================================================
 
         # Create system prompt
-        prompt = await create_system_prompt()
+        prompt, cache_prefix = await create_system_prompt()
 
         logger.status("Generating execution plan...")
 
@@ -624,7 +627,7 @@ class OrchestrationNode(BaseInfrastructureNode):
         # Emit LLM prompt event for TUI display
         logger.emit_llm_request(message)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         set_api_call_context(
             function="_create_execution_plan",
             module="orchestration_node",
@@ -632,12 +635,12 @@ class OrchestrationNode(BaseInfrastructureNode):
             line=428,
         )
 
-        # Run sync LLM call in thread pool to avoid blocking event loop for streaming
-        execution_plan = await asyncio.to_thread(
-            get_chat_completion,
+        # Native async LLM call keeps the event loop free for streaming
+        execution_plan = await aget_chat_completion(
             message=message,
             model_config=model_config,
             output_model=ExecutionPlan,
+            cache_prefix=cache_prefix or None,
         )
 
         execution_time = time.time() - plan_start_time
@@ -741,6 +744,28 @@ def _clear_error_state() -> dict[str, Any]:
     }
 
 
+def _build_planning_prompt_parts(orchestrator_builder, **kwargs) -> PromptParts:
+    """Build the planning prompt, split into a cacheable prefix where possible.
+
+    Builders that override ``get_planning_instructions()`` control the whole prompt,
+    so their output is returned as a single dynamic part with no cache prefix.
+
+    Returns:
+        PromptParts whose ``text`` is the complete orchestrator prompt
+    """
+    builder_class = type(orchestrator_builder)
+    if (
+        isinstance(orchestrator_builder, DefaultOrchestratorPromptBuilder)
+        and builder_class.get_planning_instructions
+        is DefaultOrchestratorPromptBuilder.get_planning_instructions
+    ):
+        parts = orchestrator_builder.build_planning_prompt_parts(**kwargs)
+        orchestrator_builder.debug_print_prompt(parts.text)
+        return parts
+
+    return PromptParts("", orchestrator_builder.get_planning_instructions(**kwargs))
+
+
 def _log_execution_plan(execution_plan: ExecutionPlan, logger):
     """Log execution plan with clean formatting."""
 
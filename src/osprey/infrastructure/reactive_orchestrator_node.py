@@ -15,7 +15,6 @@ Key components:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import time
 from typing import Any
@@ -42,7 +41,7 @@ from osprey.infrastructure.orchestration_node import (
     _is_planning_mode_enabled,
     validate_single_step,
 )
-from osprey.models import get_chat_completion, set_api_call_context
+from osprey.models import aget_chat_completion, set_api_call_context
 from osprey.models.messages import ChatCompletionRequest, ChatMessage
 from osprey.prompts.loader import get_framework_prompts
 from osprey.registry import get_registry
@@ -278,8 +277,7 @@ class ReactiveOrchestratorNode(BaseInfrastructureNode):
 
             plan_start_time = time.time()
 
-            response = await asyncio.to_thread(
-                get_chat_completion,
+            response = await aget_chat_completion(
                 chat_request=chat_request,
                 model_config=model_config,
                 tools=all_tool_defs,
@@ -610,8 +608,7 @@ class ReactiveOrchestratorNode(BaseInfrastructureNode):
 
         response_model_config = get_model_config("response")
         resp_start_time = time.time()
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             chat_request=chat_request,
             model_config=response_model_config,
         )
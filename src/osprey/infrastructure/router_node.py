@@ -5,19 +5,21 @@ This module contains the router node and conditional edge function for routing d
 The router is the central decision-making authority that determines what happens next.
 
 Architecture:
-- RouterNode: Minimal node that handles routing metadata and decisions
+- RouterNode: Minimal node that handles routing metadata and awaits retry delays
 - router_conditional_edge: Pure conditional edge function for actual routing
 - All business logic nodes route back to router for next decisions
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
 from osprey.base.decorators import infrastructure_node
 from osprey.base.errors import ErrorSeverity
 from osprey.base.nodes import BaseInfrastructureNode
+from osprey.base.resilience import compute_retry_delay, is_circuit_open
 from osprey.registry import get_registry
 
 # Fixed import to use new TypedDict state
@@ -47,11 +49,25 @@ class RouterNode(BaseInfrastructureNode):
         The actual routing decision is made by the conditional edge function.
         This keeps the logic DRY and avoids duplication.
 
+        When the conditional edge is about to retry a failed capability, the backoff
+        delay is awaited here so that other sessions keep running on the event loop.
+
         :return: Dictionary of state updates for routing metadata
         :rtype: Dict[str, Any]
         """
         state = self._state
 
+        pending_retry = _pending_retry(state)
+        if pending_retry:
+            capability_name, attempt, max_retries, retry_policy = pending_retry
+            delay = compute_retry_delay(retry_policy, attempt)
+            if delay > 0:
+                self.get_logger().status(
+                    f"Retrying {capability_name} in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+
         # Update routing metadata only - no routing logic to avoid duplication
         return {
             "control_routing_timestamp": time.time(),
@@ -59,6 +75,41 @@ class RouterNode(BaseInfrastructureNode):
         }
 
 
+def _circuit_blocks_retry(error_info: dict[str, Any], capability_name: str) -> bool:
+    """Return whether a circuit breaker makes retrying the failed capability pointless."""
+    return bool(error_info.get("circuit_open")) or is_circuit_open(f"capability:{capability_name}")
+
+
+def _pending_retry(state: AgentState) -> tuple[str, int, int, dict[str, Any]] | None:
+    """Return the retry the conditional edge is about to route to, if any.
+
+    :param state: Current agent state
+    :return: Tuple of (capability name, failed attempts, max attempts, retry policy),
+        or None when the current state does not lead to a retry
+    """
+    if not state.get("control_has_error", False):
+        return None
+    if (state.get("session_state") or {}).get("direct_chat_capability"):
+        return None
+
+    error_info = state.get("control_error_info") or {}
+    error_classification = error_info.get("classification")
+    capability_name = error_info.get("capability_name") or error_info.get("node_name")
+    if not error_classification or not capability_name:
+        return None
+    if error_classification.severity != ErrorSeverity.RETRIABLE:
+        return None
+    if _circuit_blocks_retry(error_info, capability_name):
+        return None
+
+    retry_policy = error_info.get("retry_policy") or {}
+    retry_count = state.get("control_retry_count", 0)
+    max_retries = retry_policy.get("max_attempts", 3)
+    if retry_count >= max_retries:
+        return None
+    return capability_name, retry_count, max_retries, retry_policy
+
+
 def router_conditional_edge(state: AgentState) -> str:
     """LangGraph conditional edge function for dynamic routing.
 
@@ -70,7 +121,7 @@ def router_conditional_edge(state: AgentState) -> str:
 
     Routing priority:
     1. Direct chat mode - routes directly to capability, bypassing pipeline
-    2. Manual retry handling - checks errors and retry count
+    2. Manual retry handling - checks errors, retry count and circuit breakers
     3. Normal routing - task extraction → classification → orchestration → execution
 
     :param state: Current agent state containing all execution context
@@ -146,24 +197,18 @@ def router_conditional_edge(state: AgentState) -> str:
 
             # Use node-specific retry policy, with fallback defaults
             max_retries = retry_policy.get("max_attempts", 3)
-            delay_seconds = retry_policy.get("delay_seconds", 0.5)
-            backoff_factor = retry_policy.get("backoff_factor", 1.5)
 
             if error_classification.severity == ErrorSeverity.RETRIABLE:
-                if retry_count < max_retries:
-                    # Calculate delay with backoff for this retry attempt
-                    actual_delay = (
-                        delay_seconds * (backoff_factor ** (retry_count - 1))
-                        if retry_count > 0
-                        else 0
+                if _circuit_blocks_retry(error_info, capability_name):
+                    # Service is known to be down - fail fast instead of retrying
+                    logger.error(
+                        f"Circuit open for {capability_name}, skipping retries and "
+                        "routing to error node"
                     )
+                    return "error"
 
-                    # Apply delay if this is a retry (not the first attempt)
-                    if retry_count > 0 and actual_delay > 0:
-                        logger.error(
-                            f"Applying {actual_delay:.2f}s delay before retry {retry_count + 1}"
-                        )
-                        time.sleep(actual_delay)  # Simple sleep for now, could be async
+                if retry_count < max_retries:
+                    # Backoff delay was already awaited by RouterNode.execute()
 
                     # CRITICAL FIX: Increment retry count in state before routing back
                     new_retry_count = retry_count + 1
@@ -356,6 +401,13 @@ def _reactive_routing(state: AgentState, logger) -> str:
             max_retries = retry_policy.get("max_attempts", 3)
 
             if error_classification.severity == ErrorSeverity.RETRIABLE:
+                if _circuit_blocks_retry(error_info, capability_name):
+                    logger.error(
+                        f"Reactive routing: circuit open for {capability_name}, "
+                        "routing to reactive_orchestrator for re-evaluation"
+                    )
+                    return "reactive_orchestrator"
+
                 if retry_count < max_retries:
                     state["control_retry_count"] = retry_count + 1
                     logger.error(
@@ -21,12 +21,23 @@ from osprey.data_management import (
     create_data_source_request,
     get_data_source_manager,
 )
-from osprey.models import get_chat_completion
-from osprey.prompts.defaults.task_extraction import ExtractedTask
+from osprey.models import aget_chat_completion
+from osprey.prompts.base import PromptParts
+from osprey.prompts.defaults.task_extraction import (
+    DefaultTaskExtractionPromptBuilder,
+    ExtractedTask,
+)
 from osprey.prompts.loader import get_framework_prompts
+from osprey.state.history import (
+    CHAT_HISTORY_SUMMARY_KEY,
+    ChatHistoryManager,
+    HistoryWindow,
+    extractive_summary,
+    format_summary_source,
+)
 
 # Updated imports for LangGraph compatibility with TypedDict state
-from osprey.utils.config import get_model_config
+from osprey.utils.config import get_chat_history_config, get_model_config
 from osprey.utils.logger import get_logger
 
 # Module-level logger for helper functions
@@ -37,6 +48,69 @@ logger = get_logger("task_extraction")
 # =============================================================================
 
 
+async def _summarize_history(
+    previous: str | None, messages: list[BaseMessage], max_tokens: int
+) -> str:
+    """Fold messages that left the history window into the rolling summary.
+
+    Falls back to an extractive summary when the LLM call fails, so a summarization
+    problem never blocks task extraction.
+
+    :param previous: Summary of messages evicted on earlier turns
+    :param messages: Newly evicted messages
+    :param max_tokens: Approximate size limit of the summary
+    :return: Updated summary
+    """
+    previous_section = previous or "(none yet)"
+    prompt = f"""Update the running summary of a conversation between a user and an assistant.
+
+Keep every concrete detail later requests may refer to: names, identifiers, numeric
+values, times and time ranges, decisions and open questions. Drop pleasantries.
+Write plain sentences, at most {max_tokens * 3 // 4} words.
+
+## Current summary:
+{previous_section}
+
+## New messages to fold into the summary:
+{format_summary_source(messages)}
+
+Respond with the updated summary only."""
+
+    try:
+        summary = await aget_chat_completion(
+            message=prompt, model_config=get_model_config("task_extraction")
+        )
+        if isinstance(summary, str) and summary.strip():
+            return summary.strip()
+        logger.warning("History summarization returned no text, using extractive summary")
+    except Exception as e:
+        logger.warning(f"History summarization failed, using extractive summary: {e}")
+    return await extractive_summary(previous, messages, max_tokens)
+
+
+async def _select_history(
+    messages: list[BaseMessage], session_state: dict[str, Any], logger
+) -> HistoryWindow:
+    """Apply the configured token budget to the chat history.
+
+    :param messages: Complete conversation history
+    :param session_state: Session state holding the cached rolling summary
+    :param logger: Logger instance
+    :return: History window to build the prompt from
+    """
+    config = get_chat_history_config()
+    manager = ChatHistoryManager(
+        max_tokens=config["max_tokens"],
+        min_recent_messages=config["min_recent_messages"],
+        summary_max_tokens=config["summary_max_tokens"],
+        summarizer=_summarize_history if config["summary_mode"] == "llm" else None,
+    )
+    window = await manager.build_window(messages, session_state.get(CHAT_HISTORY_SUMMARY_KEY))
+    if window.summarized_count:
+        logger.info(f" * Chat history: {window.describe()}")
+    return window
+
+
 def _format_task_context(messages: list[BaseMessage], retrieval_result, logger) -> ExtractedTask:
     """Format task context for bypass mode without LLM processing.
 
@@ -104,15 +178,41 @@ def _build_task_extraction_prompt(messages: list[BaseMessage], retrieval_result)
     :rtype: str
     """
 
+    return _build_task_extraction_prompt_parts(messages, retrieval_result).text
+
+
+def _build_task_extraction_prompt_parts(
+    messages: list[BaseMessage], retrieval_result
+) -> PromptParts:
+    """Build the task extraction prompt, split into a cacheable prefix where possible.
+
+    Builders that override ``build_prompt()`` control the whole prompt, so their
+    output is returned as a single dynamic part with no cache prefix.
+
+    :param messages: The native LangGraph messages to extract task from
+    :param retrieval_result: Data retrieval result from external sources
+    :return: Prompt parts for task extraction
+    :rtype: PromptParts
+    """
     prompt_provider = get_framework_prompts()
     task_extraction_builder = prompt_provider.get_task_extraction_prompt_builder()
 
-    return task_extraction_builder.build_prompt(
-        messages=messages, retrieval_result=retrieval_result
+    if (
+        isinstance(task_extraction_builder, DefaultTaskExtractionPromptBuilder)
+        and type(task_extraction_builder).build_prompt
+        is DefaultTaskExtractionPromptBuilder.build_prompt
+    ):
+        parts = task_extraction_builder.build_prompt_parts(messages, retrieval_result)
+        task_extraction_builder.debug_print_prompt(parts.text)
+        return parts
+
+    return PromptParts(
+        "",
+        task_extraction_builder.build_prompt(messages=messages, retrieval_result=retrieval_result),
     )
 
 
-def _extract_task(messages: list[BaseMessage], retrieval_result, logger) -> ExtractedTask:
+async def _extract_task(messages: list[BaseMessage], retrieval_result, logger) -> ExtractedTask:
     """Extract actionable task from native LangGraph messages with integrated data sources.
 
     Uses LLM completion to analyze conversation and extract structured
@@ -130,15 +230,19 @@ def _extract_task(messages: list[BaseMessage], retrieval_result, logger) -> Extr
             f"Injecting data sources into task extraction: {retrieval_result.get_summary()}"
         )
 
-    prompt = _build_task_extraction_prompt(messages, retrieval_result)
+    prompt_parts = _build_task_extraction_prompt_parts(messages, retrieval_result)
+    prompt = prompt_parts.text
 
     # Emit LLM prompt event for TUI display
     logger.emit_llm_request(prompt)
 
     # Use structured LLM generation for task extraction
     task_extraction_config = get_model_config("task_extraction")
-    response = get_chat_completion(
-        message=prompt, model_config=task_extraction_config, output_model=ExtractedTask
+    response = await aget_chat_completion(
+        message=prompt,
+        model_config=task_extraction_config,
+        output_model=ExtractedTask,
+        cache_prefix=prompt_parts.static or None,
     )
 
     # Emit LLM response event for TUI display
@@ -245,6 +349,10 @@ class TaskExtractionNode(BaseInfrastructureNode):
         Supports bypass mode where full chat history is passed directly as the task,
         skipping LLM-based extraction for performance optimization.
 
+        When ``execution_control.chat_history.max_tokens`` is set, only recent turns
+        are passed verbatim and older ones are replaced by a rolling summary that
+        is cached in ``session_state``.
+
         :return: Dictionary of state updates to apply
         :rtype: Dict[str, Any]
         """
@@ -277,6 +385,12 @@ class TaskExtractionNode(BaseInfrastructureNode):
         else:
             logger.status("Extracting actionable task from conversation")
         try:
+            # Keep recent turns verbatim within the token budget, summarize the rest
+            history_window = await _select_history(
+                messages, state.get("session_state") or {}, logger
+            )
+            messages = history_window.messages
+
             # Attempt to retrieve context from data sources if available
             retrieval_result = None
             try:
@@ -297,15 +411,13 @@ class TaskExtractionNode(BaseInfrastructureNode):
                 )
 
             # Extract task using LLM or bypass mode with integrated data sources
-            # Run sync function in thread pool to avoid blocking event loop for streaming
+            # Bypass formatting is sync; run it in a thread to avoid blocking event loop for streaming
             if bypass_enabled:
                 processed_task = await asyncio.to_thread(
                     _format_task_context, messages, retrieval_result, logger
                 )
             else:
-                processed_task = await asyncio.to_thread(
-                    _extract_task, messages, retrieval_result, logger
-                )
+                processed_task = await _extract_task(messages, retrieval_result, logger)
 
             if bypass_enabled:
                 logger.info(
@@ -342,12 +454,18 @@ class TaskExtractionNode(BaseInfrastructureNode):
             )
 
             # Create direct state update with correct field names
-            return {
+            updates = {
                 "task_current_task": processed_task.task,
                 "task_depends_on_chat_history": processed_task.depends_on_chat_history,
                 "task_depends_on_user_memory": processed_task.depends_on_user_memory,
             }
 
+            # Cache the rolling summary so later turns only summarize new evictions
+            if history_window.summary_updated:
+                updates["session_state"] = {CHAT_HISTORY_SUMMARY_KEY: history_window.cache}
+
+            return updates
+
         except Exception as e:
             # Emit phase complete event with failure
             duration_ms = int((time.time() - start_time) * 1000)
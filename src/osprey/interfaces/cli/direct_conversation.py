@@ -598,6 +598,13 @@ class CLI:
         if self._unregister_fallback:
             self._unregister_fallback()
 
+        # Close the Python executor's kernel connections for this session
+        from osprey.services.python_executor.execution.container_engine import (
+            close_container_sessions,
+        )
+
+        await close_container_sessions(self.thread_id)
+
     async def _process_user_input(self, user_input: str) -> bool:
         """Process user input through the Gateway and handle execution flow.
 
@@ -8,6 +8,7 @@ The server:
     - Accepts WebSocket connections for real-time event streaming
     - Executes agent queries and streams events to connected clients
     - Supports multiple concurrent client connections
+    - Optionally exposes LLM call telemetry in Prometheus format at ``/metrics``
 """
 
 from pathlib import Path
@@ -24,11 +25,12 @@ WebSocket = None
 WebSocketDisconnect = None
 StaticFiles = None
 HTMLResponse = None
+PlainTextResponse = None
 
 
 def _ensure_dependencies():
     """Ensure FastAPI and related dependencies are available."""
-    global FastAPI, WebSocket, WebSocketDisconnect, StaticFiles, HTMLResponse
+    global FastAPI, WebSocket, WebSocketDisconnect, StaticFiles, HTMLResponse, PlainTextResponse
 
     if FastAPI is None:
         try:
@@ -36,6 +38,7 @@ def _ensure_dependencies():
             from fastapi import WebSocket as _WebSocket
             from fastapi import WebSocketDisconnect as _WebSocketDisconnect
             from fastapi.responses import HTMLResponse as _HTMLResponse
+            from fastapi.responses import PlainTextResponse as _PlainTextResponse
             from fastapi.staticfiles import StaticFiles as _StaticFiles
 
             FastAPI = _FastAPI
@@ -43,6 +46,7 @@ def _ensure_dependencies():
             WebSocketDisconnect = _WebSocketDisconnect
             StaticFiles = _StaticFiles
             HTMLResponse = _HTMLResponse
+            PlainTextResponse = _PlainTextResponse
         except ImportError as e:
             raise ImportError(
                 "Web UI dependencies not installed. Install with: pip install osprey-framework[web]"
@@ -134,6 +138,17 @@ def create_app(
         except Exception:
             return {"colors": {}, "palette": {}}
 
+    if _prometheus_endpoint_enabled():
+
+        @app.get("/metrics", response_class=PlainTextResponse)
+        async def metrics():
+            """Return LLM call telemetry in Prometheus text exposition format."""
+            from osprey.models.telemetry import get_llm_telemetry
+
+            telemetry = get_llm_telemetry()
+            body = telemetry.render_prometheus() if telemetry is not None else ""
+            return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
     @app.websocket("/ws/events")
     async def websocket_events(websocket: WebSocket):
         """WebSocket endpoint for streaming events.
@@ -188,6 +203,14 @@ def create_app(
     return app
 
 
+def _prometheus_endpoint_enabled() -> bool:
+    """Whether ``llm_telemetry.prometheus_endpoint`` is enabled in config."""
+    try:
+        return bool(get_config_value("llm_telemetry.prometheus_endpoint", False))
+    except Exception:
+        return False
+
+
 async def _execute_query(
     handler: WebEventHandler,
     query: str,
@@ -206,6 +229,7 @@ async def _execute_query(
         query: User query to execute
         config_path: Optional config path for graph initialization
     """
+    thread_id = None
     try:
         import uuid
         from datetime import datetime
@@ -335,6 +359,14 @@ async def _execute_query(
                 "timestamp": datetime.now().isoformat(),
             }
         )
+    finally:
+        # Each query runs in its own session; close its Python executor kernel connections
+        if thread_id is not None:
+            from osprey.services.python_executor.execution.container_engine import (
+                close_container_sessions,
+            )
+
+            await close_container_sessions(thread_id)
 
 
 def run_server(
@@ -14,6 +14,7 @@ Key features:
 
 .. seealso::
    :func:`get_chat_completion` : Direct chat completion requests (LiteLLM-based)
+   :func:`aget_chat_completion` : Async chat completion for use inside event loops
    :func:`get_langchain_model` : LangChain model factory for LangGraph
    :mod:`configs.config` : Provider configuration management
 """
@@ -29,7 +30,7 @@ warnings.filterwarnings(
     category=UserWarning,
 )
 
-from .completion import get_chat_completion  # noqa: E402
+from .completion import aget_chat_completion, get_chat_completion  # noqa: E402
 from .langchain import (  # noqa: E402
     SUPPORTED_PROVIDERS,
     get_langchain_model,
@@ -42,6 +43,7 @@ from .messages import ChatCompletionRequest, ChatMessage  # noqa: E402
 __all__ = [
     "ChatCompletionRequest",
     "ChatMessage",
+    "aget_chat_completion",
     "get_chat_completion",
     "get_langchain_model",
     "get_langchain_model_from_name",
@@ -11,26 +11,45 @@ Key capabilities include:
 - Structured output generation with Pydantic models or TypedDict
 - Automatic TypedDict to Pydantic conversion for seamless integration
 - HTTP proxy support via standard environment variables
+- Native async completions via :func:`aget_chat_completion` (no worker thread per call)
+- Provider instances cached per provider class and reused across calls
+- Opt-in persistent cache for deterministic calls (:mod:`osprey.models.response_cache`)
 
 .. seealso::
    :func:`get_chat_completion` : Main chat completion interface
+   :func:`aget_chat_completion` : Async chat completion interface
    :mod:`configs.config` : Provider configuration management
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, create_model
 
+from osprey.models.logging import consume_call_usage
+from osprey.models.response_cache import (
+    _resolve_caller,
+    lookup_cached_completion,
+    read_cached_completion,
+)
+from osprey.models.telemetry import record_llm_call
 from osprey.utils.config import get_provider_config
 from osprey.utils.logger import get_logger
 
 if TYPE_CHECKING:
     from osprey.models.messages import ChatCompletionRequest
+    from osprey.models.providers.base import BaseProvider
 
 logger = get_logger("completion")
 
+# Provider adapters are stateless; one instance per class is shared by all calls
+_provider_instances: dict[type, BaseProvider] = {}
+_provider_instances_lock = threading.Lock()
+
 
 def _is_typed_dict(cls) -> bool:
     """Check if a class is a TypedDict by examining its attributes.
@@ -63,6 +82,182 @@ def _convert_typed_dict_to_pydantic(typed_dict_cls) -> type[BaseModel]:
     return pydantic_model
 
 
+def _get_provider_instance(provider_class: type[BaseProvider]) -> BaseProvider:
+    """Get the shared instance of a provider adapter class, creating it on first use.
+
+    :param provider_class: Provider class from the registry
+    :return: Cached provider instance
+    """
+    instance = _provider_instances.get(provider_class)
+    if instance is None:
+        with _provider_instances_lock:
+            instance = _provider_instances.get(provider_class)
+            if instance is None:
+                instance = provider_class()
+                _provider_instances[provider_class] = instance
+    return instance
+
+
+def clear_provider_instances() -> None:
+    """Drop cached provider instances (e.g. after the registry was reloaded)."""
+    with _provider_instances_lock:
+        _provider_instances.clear()
+
+
+def _store_cached_completion(cache_entry: tuple, result: Any) -> None:
+    """Store a fresh response in the response cache without failing the call."""
+    cache, key, caller = cache_entry
+    try:
+        cache.set(key, result, caller=caller)
+    except Exception as e:
+        logger.warning(f"Failed to store LLM response in cache: {e}")
+
+
+def _log_call_usage(log_kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Collect the token usage recorded by the adapter and log prompt-cache activity."""
+    usage = consume_call_usage()
+    if usage and (usage.get("cache_read_tokens") or usage.get("cache_write_tokens")):
+        logger.debug(
+            f"Prompt cache ({log_kwargs['provider']}/{log_kwargs['model_id']}): "
+            f"{usage.get('cache_read_tokens', 0)} read, "
+            f"{usage.get('cache_write_tokens', 0)} written, "
+            f"{usage.get('prompt_tokens', 0)} prompt tokens"
+        )
+    return usage
+
+
+def _record_telemetry(
+    log_kwargs: dict[str, Any],
+    started: float,
+    usage: dict[str, Any] | None = None,
+    cache_hit: bool = False,
+    error: bool = False,
+) -> None:
+    """Record wall time and usage of a completion call in the LLM telemetry."""
+    record_llm_call(
+        log_kwargs["provider"],
+        log_kwargs["model_id"],
+        time.perf_counter() - started,
+        usage=usage,
+        cache_hit=cache_hit,
+        error=error,
+    )
+
+
+def _prepare_completion(
+    message: str,
+    max_tokens: int,
+    model_config: dict | None,
+    provider: str | None,
+    model_id: str | None,
+    budget_tokens: int | None,
+    enable_thinking: bool,
+    output_model: type[BaseModel] | None,
+    base_url: str | None,
+    provider_config: dict | None,
+    temperature: float,
+    chat_request: ChatCompletionRequest | None,
+    tools: list[dict] | None,
+    tool_choice: str | dict | None,
+    cache_prefix: str | None = None,
+) -> tuple[BaseProvider, dict[str, Any], dict[str, Any]]:
+    """Validate arguments and resolve the provider for a chat completion.
+
+    Shared by :func:`get_chat_completion` and :func:`aget_chat_completion`.
+
+    :return: (provider_instance, execute_kwargs, log_kwargs) tuple
+    """
+    # Validate message / chat_request exclusivity
+    if message and chat_request is not None:
+        raise ValueError("Cannot pass both 'message' and 'chat_request'")
+    if not message and chat_request is None:
+        raise ValueError("Must pass either 'message' or 'chat_request'")
+
+    # Mutual exclusion: tools and output_model cannot coexist
+    if tools is not None and output_model is not None:
+        raise ValueError("Cannot pass both 'tools' and 'output_model'")
+
+    # Handle TypedDict to Pydantic conversion
+    is_typed_dict_output = False
+    if output_model is not None and _is_typed_dict(output_model):
+        is_typed_dict_output = True
+        output_model = _convert_typed_dict_to_pydantic(output_model)
+
+    # Configuration setup
+    if model_config is not None:
+        provider = model_config.get("provider", provider)
+        model_id = model_config.get("model_id", model_id)
+        max_tokens = model_config.get("max_tokens", max_tokens)
+        if provider_config is None:
+            provider_config = get_provider_config(provider) if provider else {}
+        base_url = provider_config.get("base_url", base_url)
+        api_key = provider_config.get("api_key")
+    else:
+        if not provider:
+            raise ValueError("Provider must be specified either directly or via model_config")
+        if provider_config is None:
+            provider_config = get_provider_config(provider)
+        if not model_id:
+            model_id = provider_config.get("default_model_id")
+        if base_url is None:
+            base_url = provider_config.get("base_url")
+        api_key = provider_config.get("api_key")
+
+    # Get provider from registry
+    from osprey.registry import get_registry
+
+    registry = get_registry()
+    provider_class = registry.get_provider(provider)
+
+    if not provider_class:
+        raise ValueError(f"Unknown provider: {provider}")
+
+    # Validate requirements using provider metadata
+    if provider_class.requires_api_key and not api_key:
+        raise ValueError(f"API key required for {provider}")
+    if provider_class.requires_base_url and not base_url:
+        raise ValueError(f"Base URL required for {provider}")
+    if provider_class.requires_model_id and not model_id:
+        raise ValueError(f"Model ID required for {provider}")
+
+    # Execute completion using provider adapter (LiteLLM handles proxy via env vars)
+    provider_instance = _get_provider_instance(provider_class)
+
+    execute_kwargs = {
+        "message": message,
+        "model_id": model_id,
+        "api_key": api_key,
+        "base_url": base_url,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "enable_thinking": enable_thinking,
+        "budget_tokens": budget_tokens,
+        "output_format": output_model,
+        "is_typed_dict_output": is_typed_dict_output,
+        "chat_request": chat_request,
+        "tools": tools,
+        "tool_choice": tool_choice,
+    }
+
+    # Only forward a prompt-cache prefix that actually prefixes the message;
+    # providers that don't support explicit cache markers ignore it
+    if cache_prefix and message and message.startswith(cache_prefix):
+        execute_kwargs["cache_prefix"] = cache_prefix
+
+    log_kwargs = {
+        "message": message if message else chat_request.to_single_string(),
+        "provider": provider,
+        "model_id": model_id,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "enable_thinking": enable_thinking,
+        "budget_tokens": budget_tokens,
+        "output_model": output_model,
+    }
+
+    return provider_instance, execute_kwargs, log_kwargs
+
+
 def get_chat_completion(
     message: str = "",
     max_tokens: int = 1024,
@@ -78,6 +273,7 @@ def get_chat_completion(
     chat_request: ChatCompletionRequest | None = None,
     tools: list[dict] | None = None,
     tool_choice: str | dict | None = None,
+    cache_prefix: str | None = None,
 ) -> str | BaseModel | list:
     """Execute direct chat completion requests across multiple AI providers via LiteLLM.
 
@@ -96,6 +292,9 @@ def get_chat_completion(
     :param base_url: Custom API endpoint, required for Ollama and CBORG providers
     :param provider_config: Optional provider configuration dict with api_key, base_url, etc.
     :param temperature: Sampling temperature (0.0-2.0)
+    :param cache_prefix: Leading part of ``message`` that is stable across calls
+        (system instructions, examples). Marked for provider-side prompt caching
+        where the provider needs explicit markers (Anthropic)
     :raises ValueError: If required provider, model_id, api_key, or base_url are missing
     :return: Model response (str, Pydantic model, or list of content blocks for thinking)
 
@@ -123,97 +322,132 @@ def get_chat_completion(
             ...     output_model=Result
             ... )
     """
-    # Validate message / chat_request exclusivity
-    if message and chat_request is not None:
-        raise ValueError("Cannot pass both 'message' and 'chat_request'")
-    if not message and chat_request is None:
-        raise ValueError("Must pass either 'message' or 'chat_request'")
+    provider_instance, execute_kwargs, log_kwargs = _prepare_completion(
+        message,
+        max_tokens,
+        model_config,
+        provider,
+        model_id,
+        budget_tokens,
+        enable_thinking,
+        output_model,
+        base_url,
+        provider_config,
+        temperature,
+        chat_request,
+        tools,
+        tool_choice,
+        cache_prefix,
+    )
 
-    # Mutual exclusion: tools and output_model cannot coexist
-    if tools is not None and output_model is not None:
-        raise ValueError("Cannot pass both 'tools' and 'output_model'")
+    started = time.perf_counter()
+    cache_entry = lookup_cached_completion(log_kwargs["provider"], execute_kwargs)
+    if cache_entry is not None:
+        hit, cached = read_cached_completion(cache_entry, execute_kwargs["output_format"])
+        if hit:
+            _record_telemetry(log_kwargs, started, cache_hit=True)
+            return cached
+
+    consume_call_usage()
+    try:
+        result = provider_instance.execute_completion(**execute_kwargs)
+    except Exception:
+        _record_telemetry(log_kwargs, started, consume_call_usage(), error=True)
+        raise
+    usage = _log_call_usage(log_kwargs)
+    _record_telemetry(log_kwargs, started, usage)
+
+    if cache_entry is not None:
+        _store_cached_completion(cache_entry, result)
 
-    # Handle TypedDict to Pydantic conversion
-    is_typed_dict_output = False
-    if output_model is not None and _is_typed_dict(output_model):
-        is_typed_dict_output = True
-        output_model = _convert_typed_dict_to_pydantic(output_model)
+    # Log API call for transparency and debugging
+    from osprey.models.logging import log_api_call
 
-    # Configuration setup
-    if model_config is not None:
-        provider = model_config.get("provider", provider)
-        model_id = model_config.get("model_id", model_id)
-        max_tokens = model_config.get("max_tokens", max_tokens)
-        if provider_config is None:
-            provider_config = get_provider_config(provider) if provider else {}
-        base_url = provider_config.get("base_url", base_url)
-        api_key = provider_config.get("api_key")
-    else:
-        if not provider:
-            raise ValueError("Provider must be specified either directly or via model_config")
-        if provider_config is None:
-            provider_config = get_provider_config(provider)
-        if not model_id:
-            model_id = provider_config.get("default_model_id")
-        if base_url is None:
-            base_url = provider_config.get("base_url")
-        api_key = provider_config.get("api_key")
+    log_api_call(result=result, usage=usage, **log_kwargs)
 
-    # Get provider from registry
-    from osprey.registry import get_registry
+    return result
 
-    registry = get_registry()
-    provider_class = registry.get_provider(provider)
 
-    if not provider_class:
-        raise ValueError(f"Unknown provider: {provider}")
+async def aget_chat_completion(
+    message: str = "",
+    max_tokens: int = 1024,
+    model_config: dict | None = None,
+    provider: str | None = None,
+    model_id: str | None = None,
+    budget_tokens: int | None = None,
+    enable_thinking: bool = False,
+    output_model: type[BaseModel] | None = None,
+    base_url: str | None = None,
+    provider_config: dict | None = None,
+    temperature: float = 0.0,
+    chat_request: ChatCompletionRequest | None = None,
+    tools: list[dict] | None = None,
+    tool_choice: str | dict | None = None,
+    cache_prefix: str | None = None,
+) -> str | BaseModel | list:
+    """Async version of :func:`get_chat_completion` for use inside event loops.
 
-    # Validate requirements using provider metadata
-    if provider_class.requires_api_key and not api_key:
-        raise ValueError(f"API key required for {provider}")
-    if provider_class.requires_base_url and not base_url:
-        raise ValueError(f"Base URL required for {provider}")
-    if provider_class.requires_model_id and not model_id:
-        raise ValueError(f"Model ID required for {provider}")
+    Accepts the same arguments and returns the same results, but awaits the
+    provider's native async path (``litellm.acompletion`` for LiteLLM-based
+    providers) instead of blocking a worker thread for the whole request.
+    Providers without an async implementation fall back to a worker thread.
 
-    # Execute completion using provider adapter (LiteLLM handles proxy via env vars)
-    provider_instance = provider_class()
+    Examples:
+        Inside an async node::
 
-    completion_kwargs = {
-        "enable_thinking": enable_thinking,
-        "budget_tokens": budget_tokens,
-        "output_format": output_model,
-        "is_typed_dict_output": is_typed_dict_output,
-        "chat_request": chat_request,
-        "tools": tools,
-        "tool_choice": tool_choice,
-    }
+            >>> from osprey.models import aget_chat_completion
+            >>> response = await aget_chat_completion(
+            ...     message="Summarize the beam status",
+            ...     model_config=get_model_config("response"),
+            ... )
+    """
+    provider_instance, execute_kwargs, log_kwargs = _prepare_completion(
+        message,
+        max_tokens,
+        model_config,
+        provider,
+        model_id,
+        budget_tokens,
+        enable_thinking,
+        output_model,
+        base_url,
+        provider_config,
+        temperature,
+        chat_request,
+        tools,
+        tool_choice,
+        cache_prefix,
+    )
 
-    result = provider_instance.execute_completion(
-        message=message,
-        model_id=model_id,
-        api_key=api_key,
-        base_url=base_url,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        **completion_kwargs,
+    # Cache keys hash the request and entries live on disk; keep both off the loop.
+    # The caller is resolved here because the worker thread's stack lacks it.
+    started = time.perf_counter()
+    cache_entry = await asyncio.to_thread(
+        lookup_cached_completion, log_kwargs["provider"], execute_kwargs, _resolve_caller()
     )
+    if cache_entry is not None:
+        hit, cached = await asyncio.to_thread(
+            read_cached_completion, cache_entry, execute_kwargs["output_format"]
+        )
+        if hit:
+            _record_telemetry(log_kwargs, started, cache_hit=True)
+            return cached
+
+    consume_call_usage()
+    try:
+        result = await provider_instance.aexecute_completion(**execute_kwargs)
+    except Exception:
+        _record_telemetry(log_kwargs, started, consume_call_usage(), error=True)
+        raise
+    usage = _log_call_usage(log_kwargs)
+    _record_telemetry(log_kwargs, started, usage)
+
+    if cache_entry is not None:
+        await asyncio.to_thread(_store_cached_completion, cache_entry, result)
 
     # Log API call for transparency and debugging
     from osprey.models.logging import log_api_call
 
-    log_message = message if message else chat_request.to_single_string()
-
-    log_api_call(
-        message=log_message,
-        result=result,
-        provider=provider,
-        model_id=model_id,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        enable_thinking=enable_thinking,
-        budget_tokens=budget_tokens,
-        output_model=output_model,
-    )
+    log_api_call(result=result, usage=usage, **log_kwargs)
 
     return result
@@ -4,10 +4,11 @@ This module provides the base class for embedding providers
 and the Ollama implementation.
 """
 
-from osprey.models.embeddings.base import BaseEmbeddingProvider
+from osprey.models.embeddings.base import BaseEmbeddingProvider, clear_endpoint_cache
 from osprey.models.embeddings.ollama import OllamaEmbeddingProvider
 
 __all__ = [
     "BaseEmbeddingProvider",
     "OllamaEmbeddingProvider",
+    "clear_endpoint_cache",
 ]
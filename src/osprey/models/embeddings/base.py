@@ -1,12 +1,33 @@
 """Base embedding provider interface.
 
 This module defines the abstract base class for ARIEL embedding providers.
+Besides the single-request ``execute_embedding`` contract, the base class
+provides the client behaviour shared by all providers: cached endpoint
+resolution, chunking of large inputs into batches, retry with backoff and
+bounded concurrent async requests (``aembed_texts``).
 
 See 01_DATA_LAYER.md Section 6.3.1 for specification.
 """
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
 
+from osprey.utils.logger import get_logger
+
+logger = get_logger("embeddings")
+
+# Resolved endpoints shared by all provider instances: (provider, url) -> (resolved, expiry)
+_endpoint_cache: dict[tuple[str, str], tuple[str, float]] = {}
+_endpoint_cache_lock = threading.Lock()
+
+
+def clear_endpoint_cache() -> None:
+    """Forget all resolved embedding endpoints (forces re-validation)."""
+    with _endpoint_cache_lock:
+        _endpoint_cache.clear()
+
 
 class BaseEmbeddingProvider(ABC):
     """Abstract base class for embedding model providers.
@@ -30,6 +51,14 @@ class BaseEmbeddingProvider(ABC):
     LiteLLM Integration Attributes:
         litellm_prefix: LiteLLM provider prefix (e.g., "ollama")
         is_openai_compatible: True if uses OpenAI-compatible API endpoint
+
+    Client Tuning Attributes:
+        max_batch_size: Texts sent per embedding request by embed_texts/aembed_texts
+        max_concurrency: Concurrent requests issued by aembed_texts
+        max_retries: Retries per batch after a RuntimeError
+        retry_backoff_seconds: Initial backoff, doubled on every retry
+        endpoint_ttl_seconds: How long a resolved endpoint is trusted before
+            it is validated again
     """
 
     # === METADATA (class attributes, single source of truth) ===
@@ -49,6 +78,13 @@ class BaseEmbeddingProvider(ABC):
     litellm_prefix: str | None = None
     is_openai_compatible: bool = False
 
+    # Client tuning
+    max_batch_size: int = 64
+    max_concurrency: int = 4
+    max_retries: int = 2
+    retry_backoff_seconds: float = 0.5
+    endpoint_ttl_seconds: float = 300.0
+
     @abstractmethod
     def execute_embedding(
         self,
@@ -79,6 +115,33 @@ class BaseEmbeddingProvider(ABC):
             RuntimeError: API/network failures (retriable)
         """
 
+    async def aexecute_embedding(
+        self,
+        texts: list[str],
+        model_id: str,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        dimensions: int | None = None,
+        timeout: float = 600.0,
+        **kwargs,
+    ) -> list[list[float]]:
+        """Generate embeddings without blocking the event loop.
+
+        Takes the same arguments as :meth:`execute_embedding`. The default
+        implementation delegates to it in a worker thread; override it to use
+        a native async client.
+        """
+        return await asyncio.to_thread(
+            self.execute_embedding,
+            texts=texts,
+            model_id=model_id,
+            api_key=api_key,
+            base_url=base_url,
+            dimensions=dimensions,
+            timeout=timeout,
+            **kwargs,
+        )
+
     @abstractmethod
     def check_health(
         self,
@@ -100,6 +163,67 @@ class BaseEmbeddingProvider(ABC):
             is accessible and model is available.
         """
 
+    def _resolve_base_url(self, base_url: str) -> str:
+        """Return a working endpoint for ``base_url``.
+
+        Providers with fallback logic (e.g. probing container host names)
+        override this. Results are cached by :meth:`get_base_url`.
+        """
+        return base_url
+
+    def get_base_url(self, base_url: str) -> str:
+        """Resolve ``base_url`` once and reuse the result until it expires.
+
+        The resolved endpoint is cached process-wide for
+        ``endpoint_ttl_seconds`` so that live connectivity probes run
+        periodically rather than on every request.
+        """
+        key = (self.name, base_url)
+        now = time.monotonic()
+        cached = _endpoint_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        resolved = self._resolve_base_url(base_url)
+        with _endpoint_cache_lock:
+            _endpoint_cache[key] = (resolved, now + self.endpoint_ttl_seconds)
+        return resolved
+
+    def invalidate_base_url(self, base_url: str) -> None:
+        """Drop the cached endpoint for ``base_url`` (e.g. after a failed request)."""
+        with _endpoint_cache_lock:
+            _endpoint_cache.pop((self.name, base_url), None)
+
+    def _batches(self, texts: list[str], batch_size: int | None) -> list[list[str]]:
+        size = max(1, batch_size or self.max_batch_size)
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    def _embed_batch(self, batch: list[str], **kwargs) -> list[list[float]]:
+        """Embed one batch, retrying RuntimeErrors with exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.execute_embedding(texts=batch, **kwargs)
+            except RuntimeError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff_seconds * 2**attempt
+                logger.debug(f"Embedding batch failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def _aembed_batch(self, batch: list[str], **kwargs) -> list[list[float]]:
+        """Async counterpart of :meth:`_embed_batch`."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.aexecute_embedding(texts=batch, **kwargs)
+            except RuntimeError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff_seconds * 2**attempt
+                logger.debug(f"Embedding batch failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
     def embed_text(
         self,
         text: str,
@@ -118,47 +242,86 @@ class BaseEmbeddingProvider(ABC):
         Returns:
             Single embedding vector as list of floats.
         """
+        embeddings = self.embed_texts([text], model_id=model_id, base_url=base_url, **kwargs)
+        return embeddings[0]
+
+    def embed_texts(
+        self,
+        texts: list[str],
+        model_id: str | None = None,
+        base_url: str | None = None,
+        batch_size: int | None = None,
+        **kwargs,
+    ) -> list[list[float]]:
+        """Convenience method to embed multiple texts.
+
+        Large inputs are split into batches of ``batch_size`` texts, each sent
+        as one request and retried on failure.
+
+        Args:
+            texts: List of texts to embed
+            model_id: Model identifier (defaults to default_model_id)
+            base_url: Base URL (defaults to default_base_url)
+            batch_size: Texts per request (defaults to max_batch_size)
+            **kwargs: Additional arguments passed to execute_embedding
+
+        Returns:
+            List of embedding vectors, in input order.
+        """
         model = model_id or self.default_model_id
         if not model:
             raise ValueError(f"model_id required for provider {self.name}")
 
         url = base_url or self.default_base_url
 
-        embeddings = self.execute_embedding(
-            texts=[text],
-            model_id=model,
-            base_url=url,
-            **kwargs,
-        )
-        return embeddings[0]
+        embeddings: list[list[float]] = []
+        for batch in self._batches(texts, batch_size):
+            embeddings.extend(self._embed_batch(batch, model_id=model, base_url=url, **kwargs))
+        return embeddings
 
-    def embed_texts(
+    async def aembed_texts(
         self,
         texts: list[str],
         model_id: str | None = None,
         base_url: str | None = None,
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
         **kwargs,
     ) -> list[list[float]]:
-        """Convenience method to embed multiple texts.
+        """Embed multiple texts with bounded concurrent async requests.
 
         Args:
             texts: List of texts to embed
             model_id: Model identifier (defaults to default_model_id)
             base_url: Base URL (defaults to default_base_url)
-            **kwargs: Additional arguments passed to execute_embedding
+            batch_size: Texts per request (defaults to max_batch_size)
+            max_concurrency: Requests in flight at once (defaults to max_concurrency)
+            **kwargs: Additional arguments passed to aexecute_embedding
 
         Returns:
-            List of embedding vectors.
+            List of embedding vectors, in input order.
         """
         model = model_id or self.default_model_id
         if not model:
             raise ValueError(f"model_id required for provider {self.name}")
 
         url = base_url or self.default_base_url
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
 
-        return self.execute_embedding(
-            texts=texts,
-            model_id=model,
-            base_url=url,
-            **kwargs,
-        )
+        async def run(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._aembed_batch(batch, model_id=model, base_url=url, **kwargs)
+
+        results = await asyncio.gather(*(run(b) for b in self._batches(texts, batch_size)))
+        return [embedding for batch in results for embedding in batch]
+
+    async def aembed_text(
+        self,
+        text: str,
+        model_id: str | None = None,
+        base_url: str | None = None,
+        **kwargs,
+    ) -> list[float]:
+        """Async counterpart of :meth:`embed_text`."""
+        embeddings = await self.aembed_texts([text], model_id=model_id, base_url=base_url, **kwargs)
+        return embeddings[0]
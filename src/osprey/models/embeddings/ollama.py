@@ -6,6 +6,7 @@ embeddings using Ollama's local models.
 See 01_DATA_LAYER.md Section 6.3.1 for specification.
 """
 
+import asyncio
 import os
 
 from osprey.models.embeddings.base import BaseEmbeddingProvider
@@ -127,6 +128,33 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
             f"and accessible, or update your configuration."
         )
 
+    def _embedding_kwargs(
+        self,
+        texts: list[str],
+        model_id: str,
+        base_url: str | None,
+        dimensions: int | None,
+        timeout: float,
+    ) -> dict:
+        """Build LiteLLM embedding arguments, resolving the endpoint via the cache."""
+        url = base_url or self.default_base_url
+        if not url:
+            raise ValueError("base_url is required for Ollama provider")
+
+        # LiteLLM expects model format: "ollama/model_name"
+        embed_kwargs: dict = {
+            "model": f"{self.litellm_prefix}/{model_id}",
+            "input": texts,
+            "timeout": timeout,
+            "api_base": self.get_base_url(url),
+        }
+
+        # Add dimensions if specified and supported
+        if dimensions is not None:
+            embed_kwargs["dimensions"] = dimensions
+
+        return embed_kwargs
+
     def execute_embedding(
         self,
         texts: list[str],
@@ -139,6 +167,10 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
     ) -> list[list[float]]:
         """Generate embeddings using Ollama via LiteLLM.
 
+        The working Ollama URL (including container fallbacks) is resolved
+        once and cached for ``endpoint_ttl_seconds``; a failed request drops
+        the cached URL so the next call probes again.
+
         Args:
             texts: List of texts to embed
             model_id: Model identifier (e.g., "nomic-embed-text")
@@ -157,41 +189,50 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
         if not texts:
             return []
 
-        url = base_url or self.default_base_url
-        if not url:
-            raise ValueError("base_url is required for Ollama provider")
-
-        # Resolve working URL with fallback
-        resolved_url = self._resolve_base_url(url)
+        embed_kwargs = self._embedding_kwargs(texts, model_id, base_url, dimensions, timeout)
 
         try:
             import litellm
 
-            # LiteLLM expects model format: "ollama/model_name"
-            litellm_model = f"{self.litellm_prefix}/{model_id}"
+            response = litellm.embedding(**embed_kwargs)
+            return [item["embedding"] for item in response.data]
 
-            # Prepare kwargs for LiteLLM
-            embed_kwargs: dict = {
-                "model": litellm_model,
-                "input": texts,
-                "timeout": timeout,
-            }
+        except ImportError as e:
+            raise RuntimeError(
+                "litellm is required for Ollama embedding support. "
+                "Install with: pip install litellm"
+            ) from e
+        except Exception as e:
+            self.invalidate_base_url(base_url or self.default_base_url)
+            raise RuntimeError(f"Failed to generate embeddings with Ollama: {e}") from e
 
-            # Add base URL for local Ollama
-            if resolved_url:
-                embed_kwargs["api_base"] = resolved_url
+    async def aexecute_embedding(
+        self,
+        texts: list[str],
+        model_id: str,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        dimensions: int | None = None,
+        timeout: float = 600.0,
+        **kwargs,
+    ) -> list[list[float]]:
+        """Generate embeddings using ``litellm.aembedding``.
 
-            # Add dimensions if specified and supported
-            if dimensions is not None:
-                embed_kwargs["dimensions"] = dimensions
+        Takes the same arguments as :meth:`execute_embedding`. Endpoint
+        resolution probes (on a cache miss) run in a worker thread.
+        """
+        if not texts:
+            return []
 
-            # Execute embedding request
-            response = litellm.embedding(**embed_kwargs)
+        embed_kwargs = await asyncio.to_thread(
+            self._embedding_kwargs, texts, model_id, base_url, dimensions, timeout
+        )
 
-            # Extract embeddings from response
-            embeddings = [item["embedding"] for item in response.data]
+        try:
+            import litellm
 
-            return embeddings
+            response = await litellm.aembedding(**embed_kwargs)
+            return [item["embedding"] for item in response.data]
 
         except ImportError as e:
             raise RuntimeError(
@@ -199,6 +240,7 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
                 "Install with: pip install litellm"
             ) from e
         except Exception as e:
+            self.invalidate_base_url(base_url or self.default_base_url)
             raise RuntimeError(f"Failed to generate embeddings with Ollama: {e}") from e
 
     def check_health(
@@ -0,0 +1,116 @@
+"""Shared Keep-Alive HTTP Clients for Direct Provider Calls.
+
+Most completions go through LiteLLM, which already caches its own HTTP clients.
+The few code paths that talk to provider APIs directly (the Ollama chat endpoint,
+used to work around LiteLLM's thinking-model handling) previously opened a new
+connection per request via ``httpx.post``. This module hands out pooled clients
+instead so consecutive calls reuse keep-alive connections.
+
+``httpx.AsyncClient`` instances are bound to the event loop they were first used
+on, and several entry points (the OpenWebUI pipeline, ``asyncio.run`` in CLI
+tools) create a fresh loop per request. Async clients are therefore cached per
+running loop and released together with it.
+
+Usage:
+    >>> from osprey.models.http_clients import get_async_http_client
+    >>> client = get_async_http_client()
+    >>> response = await client.post(url, json=payload)
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+
+import httpx
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("http_clients")
+
+# Generous read timeout: local models can take minutes on long prompts
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+_sync_client: httpx.Client | None = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled synchronous HTTP client.
+
+    ``httpx.Client`` is thread-safe, so the same instance serves calls made from
+    worker threads (e.g. ``asyncio.to_thread``).
+
+    Returns:
+        Shared httpx.Client with keep-alive connection pooling
+    """
+    global _sync_client
+
+    client = _sync_client
+    if client is None or client.is_closed:
+        with _clients_lock:
+            if _sync_client is None or _sync_client.is_closed:
+                _sync_client = httpx.Client(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS)
+            client = _sync_client
+    return client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the pooled asynchronous HTTP client for the running event loop.
+
+    Returns:
+        httpx.AsyncClient shared by all coroutines on the current loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+
+    with _clients_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS)
+            _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_http_client() -> None:
+    """Close the pooled async client of the running event loop, if any.
+
+    Call this before shutting down a short-lived event loop so its keep-alive
+    connections are closed cleanly instead of when the loop is collected.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the shared synchronous client and forget all async clients.
+
+    Async clients cannot be closed from outside their own loop; they are
+    dropped here and their connections are released with the loop.
+    """
+    global _sync_client
+
+    with _clients_lock:
+        client, _sync_client = _sync_client, None
+        _async_clients.clear()
+    if client is not None:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared HTTP client: {e}")
+
+
+atexit.register(close_http_clients)
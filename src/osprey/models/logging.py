@@ -11,6 +11,7 @@ Key capabilities:
 - Integration with existing debug_print_prompt pattern
 - Configurable output directory and file naming
 - Support for both timestamped and latest-only file modes
+- Buffered JSONL audit log written by a background thread, with size-based rotation
 
 .. note::
    This logging is controlled by development.api_calls configuration:
@@ -18,6 +19,8 @@ Key capabilities:
    - save_all: Enable file output to configured api_calls directory
    - latest_only: Use latest.txt filenames vs timestamped files
    - include_stack_trace: Include full stack trace in metadata
+   - format: ``text`` (one file per call) or ``jsonl`` (buffered audit log)
+   - max_file_mb / backup_count / queue_size: JSONL rotation and buffering limits
 
 .. seealso::
    :func:`~completion.get_chat_completion` : Main chat completion interface
@@ -25,10 +28,15 @@ Key capabilities:
    :func:`set_api_call_context` : Set caller context for async/thread pool calls
 """
 
+import atexit
 import contextvars
 import inspect
 import json
+import os
+import queue
+import sys
 import textwrap
+import threading
 import traceback
 import warnings
 from datetime import datetime
@@ -40,12 +48,22 @@ from osprey.utils.logger import get_logger
 
 logger = get_logger("osprey.models")
 
+JSONL_FILENAME = "api_calls.jsonl"
+DEFAULT_MAX_FILE_MB = 50
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_QUEUE_SIZE = 1000
+
 # Context variable for passing caller information across async/thread boundaries
 # This automatically propagates through asyncio.to_thread() calls
 _api_call_context: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
     "_api_call_context", default=None
 )
 
+# Token usage of the most recent provider response in this context (set by the adapter)
+_call_usage: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "_call_usage", default=None
+)
+
 
 def set_api_call_context(
     function: str,
@@ -112,6 +130,26 @@ def set_api_call_context(
     _api_call_context.set(context)
 
 
+def record_call_usage(usage: dict[str, Any] | None) -> None:
+    """Record token usage reported by the provider for the current completion call.
+
+    Called by provider adapters after each response. Includes prompt-cache
+    read/write token counts where the provider reports them.
+
+    :param usage: Token counts (``prompt_tokens``, ``completion_tokens``,
+        ``thinking_tokens``, ``cache_read_tokens``, ``cache_write_tokens``) plus
+        ``retries`` and ``cost_usd``, or None to reset
+    """
+    _call_usage.set(usage)
+
+
+def consume_call_usage() -> dict[str, Any] | None:
+    """Return and clear the token usage recorded for the current completion call."""
+    usage = _call_usage.get()
+    _call_usage.set(None)
+    return usage
+
+
 def _get_caller_info(skip_frames: int = 2) -> dict[str, Any]:
     """Extract detailed information about the calling function.
 
@@ -296,6 +334,44 @@ def _get_caller_info(skip_frames: int = 2) -> dict[str, Any]:
         }
 
 
+def _get_caller_info_fast() -> dict[str, Any]:
+    """Return caller information without ``inspect`` on the request path.
+
+    Uses the context variable set by :func:`set_api_call_context` when present.
+    Otherwise walks raw frames (no source lookups) to the first frame outside
+    the logging/completion wrappers, stdlib and third-party packages.
+
+    :return: Dictionary containing caller metadata
+    :rtype: dict[str, Any]
+    """
+    context = _api_call_context.get()
+    if context is not None:
+        return context
+
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        is_wrapper = filename.endswith(("/models/logging.py", "/models/completion.py"))
+        is_external = (
+            "/lib/python" in filename or "/site-packages/" in filename
+        ) and "/osprey/" not in filename
+        if not is_wrapper and not is_external:
+            caller_info = {
+                "function": frame.f_code.co_name,
+                "filename": filename,
+                "line_number": frame.f_lineno,
+                "module": Path(filename).stem,
+                "source": "frame",
+            }
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                caller_info["class"] = type(owner).__name__
+            return caller_info
+        frame = frame.f_back
+
+    return {"function": "Unknown", "filename": "Unknown", "line_number": 0, "module": "Unknown"}
+
+
 def _format_metadata_header(
     caller_info: dict,
     provider: str,
@@ -306,6 +382,7 @@ def _format_metadata_header(
     budget_tokens: int | None,
     output_model: Any,
     include_stack_trace: bool = False,
+    usage: dict[str, Any] | None = None,
 ) -> str:
     """Format a comprehensive metadata header for the log file.
 
@@ -318,6 +395,7 @@ def _format_metadata_header(
     :param budget_tokens: Thinking budget tokens if applicable
     :param output_model: Structured output model if used
     :param include_stack_trace: Whether to include full stack trace
+    :param usage: Token usage reported by the provider, if available
     :return: Formatted metadata header string
     :rtype: str
     """
@@ -349,6 +427,18 @@ def _format_metadata_header(
     if output_model is not None:
         output_model_info = getattr(output_model, "__name__", str(output_model))
 
+    # Build token usage info (including prompt-cache reads/writes) if reported
+    usage_info = ""
+    if usage:
+        usage_info = (
+            f"\n#\n# TOKEN USAGE\n# ------------------------------------------"
+            f"\n# Prompt Tokens: {usage.get('prompt_tokens', 0)}"
+            f"\n# Completion Tokens: {usage.get('completion_tokens', 0)}"
+            f"\n# Thinking Tokens: {usage.get('thinking_tokens', 0)}"
+            f"\n# Cache Read Tokens: {usage.get('cache_read_tokens', 0)}"
+            f"\n# Cache Write Tokens: {usage.get('cache_write_tokens', 0)}"
+        )
+
     header = textwrap.dedent(
         f"""
         # ==========================================
@@ -377,6 +467,12 @@ def _format_metadata_header(
     """
     ).strip()
 
+    if usage_info:
+        # Insert before the closing rule
+        closing = "#\n# =========================================="
+        head, _, _ = header.rpartition(closing)
+        header = f"{head}{usage_info[1:]}\n{closing}"
+
     # Add stack trace if requested
     if include_stack_trace:
         stack_trace = "".join(
@@ -424,6 +520,195 @@ def _sanitize_result_for_logging(result: Any) -> str:
         return str(result)
 
 
+class _JsonlApiCallWriter:
+    """Buffered JSONL writer for API call records running on a daemon thread.
+
+    Callers only enqueue a record; serialization and file I/O happen on the
+    worker thread. When the queue is full, records are dropped (and counted)
+    rather than blocking the completion call. The log file is rotated to
+    ``api_calls.1.jsonl`` ... ``api_calls.<backup_count>.jsonl`` once it
+    exceeds ``max_bytes``, so disk usage stays bounded.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        backup_count: int,
+        queue_size: int,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self.written = 0
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="api-call-log", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """Enqueue a record without blocking. Returns False if it was dropped."""
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued records are written. Returns False on timeout."""
+        done = threading.Event()
+        try:
+            self._queue.put({"_flush": done}, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write pending records and stop the worker thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Drain whatever else is queued so one file open covers the batch
+            while len(batch) < 100:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            flushes = [r["_flush"] for r in batch if r is not None and "_flush" in r]
+            records = [r for r in batch if r is not None and "_flush" not in r]
+            if records:
+                self._write(records)
+            for done in flushes:
+                done.set()
+            if stop:
+                return
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        try:
+            lines = "".join(_serialize_record(record) + "\n" for record in records)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(lines) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            self.written += len(records)
+        except Exception as e:
+            logger.warning(f"Failed to write API call log: {e}")
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_suffix(f".{index}.jsonl")
+            if source.exists():
+                os.replace(source, self.path.with_suffix(f".{index + 1}.jsonl"))
+        os.replace(self.path, self.path.with_suffix(".1.jsonl"))
+
+
+def _serialize_record(record: dict[str, Any]) -> str:
+    """Serialize a queued API call record (runs on the writer thread)."""
+    result = record.pop("response")
+    if isinstance(result, str) or hasattr(result, "model_dump"):
+        result = _sanitize_result_for_logging(result)
+    output_model = record.get("output_model")
+    if output_model is not None:
+        record["output_model"] = getattr(output_model, "__name__", str(output_model))
+    record["response"] = result
+    return json.dumps(record, default=str)
+
+
+_jsonl_writer: _JsonlApiCallWriter | None = None
+_jsonl_writer_lock = threading.Lock()
+
+
+def _get_jsonl_writer(api_calls_config: dict[str, Any]) -> _JsonlApiCallWriter:
+    """Get the process-wide JSONL writer, creating it on first use."""
+    global _jsonl_writer
+
+    if _jsonl_writer is None:
+        with _jsonl_writer_lock:
+            if _jsonl_writer is None:
+                max_file_mb = api_calls_config.get("max_file_mb", DEFAULT_MAX_FILE_MB)
+                _jsonl_writer = _JsonlApiCallWriter(
+                    path=Path(get_agent_dir("api_calls_dir")) / JSONL_FILENAME,
+                    max_bytes=int(max_file_mb * 1024 * 1024),
+                    backup_count=api_calls_config.get("backup_count", DEFAULT_BACKUP_COUNT),
+                    queue_size=api_calls_config.get("queue_size", DEFAULT_QUEUE_SIZE),
+                )
+                atexit.register(_jsonl_writer.close)
+    return _jsonl_writer
+
+
+def flush_api_call_log(timeout: float | None = 5.0) -> bool:
+    """Block until buffered JSONL API call records are on disk.
+
+    :param timeout: Maximum seconds to wait, or None to wait indefinitely
+    :return: False if the writer did not catch up within ``timeout``
+    """
+    if _jsonl_writer is None:
+        return True
+    return _jsonl_writer.flush(timeout)
+
+
+def reset_api_call_log() -> None:
+    """Flush and stop the JSONL writer (used by tests and on config changes)."""
+    global _jsonl_writer
+
+    with _jsonl_writer_lock:
+        if _jsonl_writer is not None:
+            _jsonl_writer.close()
+            atexit.unregister(_jsonl_writer.close)
+            _jsonl_writer = None
+
+
+def _enqueue_jsonl_record(
+    api_calls_config: dict[str, Any],
+    message: str,
+    result: Any,
+    provider: str,
+    model_id: str,
+    max_tokens: int,
+    temperature: float,
+    enable_thinking: bool,
+    budget_tokens: int | None,
+    output_model: Any,
+    usage: dict[str, Any] | None,
+) -> None:
+    """Hand an API call record to the background writer without blocking."""
+    caller = _get_caller_info_fast()
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+        "caller": {k: v for k, v in caller.items() if k != "source"},
+        "provider": provider,
+        "model_id": model_id,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "enable_thinking": enable_thinking,
+        "budget_tokens": budget_tokens,
+        "output_model": output_model,
+        "usage": usage,
+        "message": message,
+        "response": result,
+    }
+    writer = _get_jsonl_writer(api_calls_config)
+    if not writer.submit(record) and (writer.dropped == 1 or writer.dropped % 1000 == 0):
+        logger.warning(f"API call log queue full; dropped {writer.dropped} record(s) so far")
+
+
 def log_api_call(
     message: str,
     result: Any,
@@ -434,6 +719,7 @@ def log_api_call(
     enable_thinking: bool = False,
     budget_tokens: int | None = None,
     output_model: Any = None,
+    usage: dict[str, Any] | None = None,
 ) -> None:
     """Log complete LLM API call with input, output, and rich metadata.
 
@@ -448,7 +734,10 @@ def log_api_call(
     - Uses development.api_calls.include_stack_trace for detailed debugging
 
     Files are saved to the api_calls directory within _agent_data with structured
-    naming based on the calling function and timestamp.
+    naming based on the calling function and timestamp. With
+    ``development.api_calls.format: jsonl`` the call is instead appended to a
+    rotating ``api_calls.jsonl`` by a background thread; the completion call
+    only enqueues the record and never waits for disk I/O.
 
     :param message: Input message/prompt sent to the LLM
     :type message: str
@@ -468,6 +757,8 @@ def log_api_call(
     :type budget_tokens: int | None
     :param output_model: Structured output model class if used
     :type output_model: Any | None
+    :param usage: Token usage reported by the provider (incl. prompt-cache reads/writes)
+    :type usage: dict[str, Any] | None
 
     .. note::
        This function is designed to be called from get_chat_completion and
@@ -487,6 +778,7 @@ def log_api_call(
                 save_all: true          # Enable API call logging
                 latest_only: false      # Create timestamped files
                 include_stack_trace: true  # Add full stack traces
+                format: jsonl           # Buffered audit log for production
     """
     try:
         # Check if API call logging is enabled
@@ -496,6 +788,22 @@ def log_api_call(
         if not api_calls_config.get("save_all", False):
             return
 
+        if api_calls_config.get("format", "text") == "jsonl":
+            _enqueue_jsonl_record(
+                api_calls_config,
+                message,
+                result,
+                provider,
+                model_id,
+                max_tokens,
+                temperature,
+                enable_thinking,
+                budget_tokens,
+                output_model,
+                usage,
+            )
+            return
+
         # Get caller information
         caller_info = _get_caller_info(
             skip_frames=3
@@ -541,6 +849,7 @@ def log_api_call(
             budget_tokens=budget_tokens,
             output_model=output_model,
             include_stack_trace=include_stack_trace,
+            usage=usage,
         )
 
         # Format output
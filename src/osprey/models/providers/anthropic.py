@@ -6,7 +6,11 @@ This provider uses LiteLLM as the backend for unified API access.
 from typing import Any
 
 from .base import BaseProvider
-from .litellm_adapter import check_litellm_health, execute_litellm_completion
+from .litellm_adapter import (
+    aexecute_litellm_completion,
+    check_litellm_health,
+    execute_litellm_completion,
+)
 
 
 class AnthropicProviderAdapter(BaseProvider):
@@ -63,6 +67,32 @@ class AnthropicProviderAdapter(BaseProvider):
             **kwargs,
         )
 
+    async def aexecute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs,
+    ) -> str | list | Any:
+        """Execute Anthropic chat completion via LiteLLM (native async)."""
+        return await aexecute_litellm_completion(
+            provider=self.name,
+            message=message,
+            model_id=model_id,
+            api_key=api_key,
+            base_url=base_url,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            output_format=output_format,
+            **kwargs,
+        )
+
     def check_health(
         self,
         api_key: str | None,
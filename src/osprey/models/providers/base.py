@@ -1,14 +1,25 @@
 """Base Provider Interface for AI Model Access."""
 
+import asyncio
+import contextvars
+import functools
 from abc import ABC, abstractmethod
 from typing import Any
 
+from osprey.models.logging import consume_call_usage, record_call_usage
+
 
 class BaseProvider(ABC):
     """Abstract base class for AI model providers.
 
     All provider implementations must inherit from this class and implement
-    the two core methods: execute_completion and check_health.
+    the two core methods: execute_completion and check_health. Providers with a
+    native async path should also override aexecute_completion; the default runs
+    execute_completion in a worker thread.
+
+    Provider instances are cached and reused across calls (see
+    :func:`osprey.models.completion.get_chat_completion`), so they must not keep
+    per-request state.
 
     **Metadata as Class Attributes** (SINGLE SOURCE OF TRUTH):
     Subclasses define provider metadata as class attributes. The registry
@@ -97,6 +108,47 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def aexecute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs,
+    ) -> str | Any:
+        """Execute a chat completion without blocking the event loop.
+
+        Takes the same arguments as :meth:`execute_completion`. The default
+        implementation delegates to it in a worker thread; override it to use
+        a native async client.
+        """
+        # Run in an explicit context copy so the token usage the provider records
+        # in the worker thread can be handed back to the caller's context
+        context = contextvars.copy_context()
+        call = functools.partial(
+            context.run,
+            self.execute_completion,
+            message=message,
+            model_id=model_id,
+            api_key=api_key,
+            base_url=base_url,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            thinking=thinking,
+            system_prompt=system_prompt,
+            output_format=output_format,
+            **kwargs,
+        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, call)
+        finally:
+            record_call_usage(context.run(consume_call_usage))
+
     @abstractmethod
     def check_health(
         self,
@@ -7,7 +7,11 @@ CBORG is LBNL's OpenAI-compatible proxy service.
 from typing import Any
 
 from .base import BaseProvider
-from .litellm_adapter import check_litellm_health, execute_litellm_completion
+from .litellm_adapter import (
+    aexecute_litellm_completion,
+    check_litellm_health,
+    execute_litellm_completion,
+)
 
 
 class CBorgProviderAdapter(BaseProvider):
@@ -70,6 +74,32 @@ class CBorgProviderAdapter(BaseProvider):
             **kwargs,
         )
 
+    async def aexecute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs,
+    ) -> str | Any:
+        """Execute CBORG chat completion via LiteLLM (native async)."""
+        return await aexecute_litellm_completion(
+            provider=self.name,
+            message=message,
+            model_id=model_id,
+            api_key=api_key,
+            base_url=base_url,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            output_format=output_format,
+            **kwargs,
+        )
+
     def check_health(
         self,
         api_key: str | None,
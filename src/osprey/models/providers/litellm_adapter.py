@@ -8,6 +8,8 @@ Key features:
 - Structured output detection via LiteLLM's supports_response_schema()
 - Extended thinking support via LiteLLM's standardized interface
 - HTTP proxy configuration
+- Native async completions via litellm.acompletion
+- Provider prompt-cache markers for stable prompt prefixes (Anthropic ``cache_control``)
 - Health check utilities
 
 Provider Integration:
@@ -20,13 +22,14 @@ Provider Integration:
 """
 
 import json
-import os
 import warnings
 from typing import TYPE_CHECKING, Any
 
 import litellm
 from pydantic import BaseModel
 
+from osprey.models.http_clients import get_async_http_client, get_http_client
+from osprey.models.logging import record_call_usage
 from osprey.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -110,35 +113,27 @@ def get_litellm_model_name(
     return f"{provider}/{model_id}"
 
 
-def execute_litellm_completion(
+def _build_completion_kwargs(
     provider: str,
     message: str,
     model_id: str,
     api_key: str | None,
     base_url: str | None,
-    max_tokens: int = 1024,
-    temperature: float = 0.0,
-    **kwargs,
-) -> str | BaseModel | list:
-    """Execute chat completion using LiteLLM.
+    max_tokens: int,
+    temperature: float,
+    kwargs: dict[str, Any],
+) -> tuple[str, dict[str, Any], Any]:
+    """Build the LiteLLM request shared by the sync and async completion paths.
 
-    This is the core completion function that handles all provider-specific
-    details through LiteLLM's unified interface.
+    Pops ``chat_request``, ``tools``, ``tool_choice`` and ``cache_prefix`` from ``kwargs``.
 
-    :param provider: Osprey provider name
-    :param message: User message
-    :param model_id: Model identifier
-    :param api_key: API key for authentication
-    :param base_url: Custom API endpoint URL
-    :param max_tokens: Maximum tokens to generate
-    :param temperature: Sampling temperature
-    :param kwargs: Additional arguments (enable_thinking, budget_tokens, output_format, etc.)
-    :return: Response text, Pydantic model instance, or list of content blocks
+    :return: (litellm_model, completion_kwargs, chat_request) tuple
     """
     # Pop chat_request and tools from kwargs (passed through from get_chat_completion)
     chat_request = kwargs.pop("chat_request", None)
     tools = kwargs.pop("tools", None)
     tool_choice = kwargs.pop("tool_choice", None)
+    cache_prefix = kwargs.pop("cache_prefix", None)
 
     # Get LiteLLM model name
     litellm_model = get_litellm_model_name(provider, model_id, base_url)
@@ -147,7 +142,9 @@ def execute_litellm_completion(
     if chat_request is not None:
         messages = chat_request.to_litellm_messages(provider=provider)
     else:
-        messages = [{"role": "user", "content": message}]
+        messages = [
+            {"role": "user", "content": _build_user_content(provider, message, cache_prefix)}
+        ]
 
     completion_kwargs: dict[str, Any] = {
         "model": litellm_model,
@@ -169,12 +166,8 @@ def execute_litellm_completion(
         completion_kwargs["tools"] = tools
         completion_kwargs["tool_choice"] = tool_choice if tool_choice is not None else "auto"
 
-    # Handle HTTP proxy from environment
-    proxy_url = os.environ.get("HTTP_PROXY")
-    if proxy_url:
-        # LiteLLM respects standard proxy environment variables
-        # No additional configuration needed
-        pass
+    # HTTP proxy: LiteLLM respects the standard proxy environment variables
+    # (HTTP_PROXY, HTTPS_PROXY), so no additional configuration is needed
 
     # Handle extended thinking
     enable_thinking = kwargs.get("enable_thinking", False)
@@ -196,38 +189,116 @@ def execute_litellm_completion(
     # The Retry-After cap in langchain.py prevents 60s waits on 429s.
     completion_kwargs.setdefault("num_retries", 2)
 
-    # Handle structured output
-    output_format = kwargs.get("output_format")
-    is_typed_dict_output = kwargs.get("is_typed_dict_output", False)
-
-    if output_format is not None and tools is not None:
+    if kwargs.get("output_format") is not None and tools is not None:
         raise ValueError("Cannot use both 'tools' and 'output_format' simultaneously")
 
-    if output_format is not None:
-        return _handle_structured_output(
-            provider=provider,
-            model_id=model_id,
-            litellm_model=litellm_model,
-            message=message,
-            completion_kwargs=completion_kwargs,
-            output_format=output_format,
-            is_typed_dict_output=is_typed_dict_output,
-            chat_request=chat_request,
-        )
+    return litellm_model, completion_kwargs, chat_request
 
-    # Ollama: Use direct API to bypass LiteLLM bug #15463 with thinking models
-    if provider == "ollama":
-        return _execute_ollama_completion(
-            model_id=model_id,
-            message=message,
-            base_url=completion_kwargs.get("api_base", "http://localhost:11434"),
-            max_tokens=max_tokens,
-        )
 
-    # Regular text completion
-    response = litellm.completion(**completion_kwargs)
+def _build_user_content(provider: str, message: str, cache_prefix: str | None) -> str | list:
+    """Build user message content, marking a stable prompt prefix as cacheable.
+
+    Anthropic only caches content explicitly marked with ``cache_control``, so the
+    stable prefix is split into its own content block carrying the marker. Other
+    providers (OpenAI, Gemini, vLLM) cache matching prompt prefixes automatically
+    and receive the message unchanged - keeping the stable part first is enough.
+
+    :param provider: Osprey provider name
+    :param message: Full user message
+    :param cache_prefix: Leading part of ``message`` that is identical across calls
+    :return: Plain string content or a list of Anthropic content blocks
+    """
+    if provider != "anthropic" or not cache_prefix or not message.startswith(cache_prefix):
+        return message
+
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}}
+    ]
+    suffix = message[len(cache_prefix) :]
+    if suffix:
+        blocks.append({"type": "text", "text": suffix})
+    return blocks
+
+
+def _has_cache_blocks(completion_kwargs: dict[str, Any]) -> bool:
+    """Whether the request's user content was split into prompt-cache blocks."""
+    messages = completion_kwargs.get("messages") or []
+    return bool(messages) and isinstance(messages[-1].get("content"), list)
+
+
+def _usage_count(source: Any, name: str) -> int:
+    """Read an integer token count from a usage object or dict, defaulting to 0."""
+    value = source.get(name) if isinstance(source, dict) else getattr(source, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _usage_details(usage: Any, name: str) -> Any:
+    """Read a nested usage details object (e.g. ``prompt_tokens_details``)."""
+    return usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+
+
+def _response_retries(response: Any) -> int:
+    """Number of retries LiteLLM reports for a response (0 if not reported)."""
+    hidden_params = getattr(response, "_hidden_params", None)
+    if not isinstance(hidden_params, dict):
+        return 0
+    headers = hidden_params.get("additional_headers") or {}
+    try:
+        return int(headers.get("x-litellm-attempted-retries", 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _response_cost(response: Any) -> float:
+    """Estimated cost of a response from LiteLLM's pricing map (0.0 if unknown)."""
+    try:
+        cost = litellm.completion_cost(completion_response=response)
+    except Exception:
+        # Model not in LiteLLM's pricing map (local/proxy models)
+        return 0.0
+    return float(cost) if isinstance(cost, int | float) else 0.0
+
+
+def _record_response_usage(response: Any) -> None:
+    """Record token usage, including prompt-cache reads and writes, for this call.
+
+    Anthropic reports ``cache_read_input_tokens`` / ``cache_creation_input_tokens``;
+    OpenAI-compatible providers report ``prompt_tokens_details.cached_tokens``.
+    Reasoning tokens come from ``completion_tokens_details.reasoning_tokens``.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+
+    cache_read = _usage_count(usage, "cache_read_input_tokens")
+    if not cache_read:
+        details = _usage_details(usage, "prompt_tokens_details")
+        if details is not None:
+            cache_read = _usage_count(details, "cached_tokens")
+
+    completion_details = _usage_details(usage, "completion_tokens_details")
+    thinking = _usage_count(completion_details, "reasoning_tokens") if completion_details else 0
+
+    record_call_usage(
+        {
+            "prompt_tokens": _usage_count(usage, "prompt_tokens"),
+            "completion_tokens": _usage_count(usage, "completion_tokens"),
+            "thinking_tokens": thinking,
+            "cache_read_tokens": cache_read,
+            "cache_write_tokens": _usage_count(usage, "cache_creation_input_tokens"),
+            "retries": _response_retries(response),
+            "cost_usd": _response_cost(response),
+        }
+    )
+
+
+def _parse_completion_response(response: Any, provider: str, kwargs: dict[str, Any]) -> str | list:
+    """Extract thinking blocks, tool calls or text from a LiteLLM response."""
+    _record_response_usage(response)
 
     # Handle extended thinking response (returns content blocks)
+    enable_thinking = kwargs.get("enable_thinking", False)
+    budget_tokens = kwargs.get("budget_tokens")
     if enable_thinking and budget_tokens is not None and provider == "anthropic":
         # Return raw content blocks for thinking responses
         if hasattr(response, "choices") and response.choices:
@@ -258,44 +329,128 @@ def execute_litellm_completion(
     return ""
 
 
-def _handle_structured_output(
+def execute_litellm_completion(
     provider: str,
-    model_id: str,
-    litellm_model: str,
     message: str,
-    completion_kwargs: dict[str, Any],
-    output_format: type[BaseModel],
-    is_typed_dict_output: bool,
-    chat_request=None,
-) -> BaseModel | dict:
-    """Handle structured output generation.
+    model_id: str,
+    api_key: str | None,
+    base_url: str | None,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    **kwargs,
+) -> str | BaseModel | list:
+    """Execute chat completion using LiteLLM.
 
-    Uses native JSON schema support for providers that support it,
-    falls back to prompt-based approach for others.
+    This is the core completion function that handles all provider-specific
+    details through LiteLLM's unified interface.
 
-    :param provider: Provider name
+    :param provider: Osprey provider name
+    :param message: User message
     :param model_id: Model identifier
-    :param litellm_model: LiteLLM-formatted model name
-    :param message: Original message
-    :param completion_kwargs: Base completion kwargs
-    :param output_format: Pydantic model for output validation
-    :param is_typed_dict_output: Whether to convert result to dict
-    :param chat_request: Optional ChatCompletionRequest (preserves multi-turn messages)
-    :return: Validated Pydantic model instance or dict
+    :param api_key: API key for authentication
+    :param base_url: Custom API endpoint URL
+    :param max_tokens: Maximum tokens to generate
+    :param temperature: Sampling temperature
+    :param kwargs: Additional arguments (enable_thinking, budget_tokens, output_format, etc.)
+    :return: Response text, Pydantic model instance, or list of content blocks
     """
+    litellm_model, completion_kwargs, chat_request = _build_completion_kwargs(
+        provider, message, model_id, api_key, base_url, max_tokens, temperature, kwargs
+    )
+
+    # Handle structured output
+    output_format = kwargs.get("output_format")
+    if output_format is not None:
+        return _handle_structured_output(
+            provider=provider,
+            model_id=model_id,
+            litellm_model=litellm_model,
+            message=message,
+            completion_kwargs=completion_kwargs,
+            output_format=output_format,
+            is_typed_dict_output=kwargs.get("is_typed_dict_output", False),
+            chat_request=chat_request,
+        )
+
     # Ollama: Use direct API to bypass LiteLLM bug #15463 with thinking models
     if provider == "ollama":
-        base_url = completion_kwargs.get("api_base", "http://localhost:11434")
-        max_tokens = completion_kwargs.get("max_tokens", 1024)
-        return _execute_ollama_structured_output(
+        return _execute_ollama_completion(
+            model_id=model_id,
+            message=message,
+            base_url=completion_kwargs.get("api_base", "http://localhost:11434"),
+            max_tokens=max_tokens,
+        )
+
+    # Regular text completion
+    response = litellm.completion(**completion_kwargs)
+    return _parse_completion_response(response, provider, kwargs)
+
+
+async def aexecute_litellm_completion(
+    provider: str,
+    message: str,
+    model_id: str,
+    api_key: str | None,
+    base_url: str | None,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    **kwargs,
+) -> str | BaseModel | list:
+    """Async variant of :func:`execute_litellm_completion` using ``litellm.acompletion``.
+
+    Runs on the caller's event loop without occupying a worker thread. LiteLLM
+    caches its async HTTP clients per event loop, so calls on the same loop share
+    keep-alive connections; direct Ollama calls use the pooled client from
+    :mod:`osprey.models.http_clients`.
+
+    :param provider: Osprey provider name
+    :param message: User message
+    :param model_id: Model identifier
+    :param api_key: API key for authentication
+    :param base_url: Custom API endpoint URL
+    :param max_tokens: Maximum tokens to generate
+    :param temperature: Sampling temperature
+    :param kwargs: Additional arguments (enable_thinking, budget_tokens, output_format, etc.)
+    :return: Response text, Pydantic model instance, or list of content blocks
+    """
+    litellm_model, completion_kwargs, chat_request = _build_completion_kwargs(
+        provider, message, model_id, api_key, base_url, max_tokens, temperature, kwargs
+    )
+
+    output_format = kwargs.get("output_format")
+    if output_format is not None:
+        return await _ahandle_structured_output(
+            provider=provider,
             model_id=model_id,
+            litellm_model=litellm_model,
             message=message,
+            completion_kwargs=completion_kwargs,
             output_format=output_format,
-            base_url=base_url,
+            is_typed_dict_output=kwargs.get("is_typed_dict_output", False),
+            chat_request=chat_request,
+        )
+
+    if provider == "ollama":
+        return await _aexecute_ollama_completion(
+            model_id=model_id,
+            message=message,
+            base_url=completion_kwargs.get("api_base", "http://localhost:11434"),
             max_tokens=max_tokens,
-            is_typed_dict_output=is_typed_dict_output,
         )
 
+    response = await litellm.acompletion(**completion_kwargs)
+    return _parse_completion_response(response, provider, kwargs)
+
+
+def _prepare_structured_request(
+    provider: str,
+    litellm_model: str,
+    message: str,
+    completion_kwargs: dict[str, Any],
+    output_format: type[BaseModel],
+    chat_request=None,
+) -> None:
+    """Add native response_format or prompt-based schema instructions to the request."""
     schema = output_format.model_json_schema()
 
     # Check if model supports native structured outputs using LiteLLM's detection
@@ -307,43 +462,50 @@ def _handle_structured_output(
             "type": "json_schema",
             "json_schema": {"name": output_format.__name__, "schema": schema},
         }
-        # Only rebuild messages when chat_request is not providing them
-        if chat_request is None:
+        # Only rebuild messages when neither chat_request nor prompt-cache blocks provide them
+        if chat_request is None and not _has_cache_blocks(completion_kwargs):
             completion_kwargs["messages"] = [{"role": "user", "content": message}]
+        return
 
-        response = litellm.completion(**completion_kwargs)
-        response_text = response.choices[0].message.content or ""
-        # Clean response even for native support (some models still return Python-style booleans)
-        response_text = _clean_json_response(response_text)
-    else:
-        # Prompt-based fallback for models without native support
-        schema_instruction = (
-            f"\n\nYou must respond with valid JSON that matches this schema:\n"
-            f"{json.dumps(schema, indent=2)}\n\n"
-            f"Respond ONLY with the JSON object, no additional text or markdown formatting."
-        )
+    # Prompt-based fallback for models without native support
+    schema_instruction = (
+        f"\n\nYou must respond with valid JSON that matches this schema:\n"
+        f"{json.dumps(schema, indent=2)}\n\n"
+        f"Respond ONLY with the JSON object, no additional text or markdown formatting."
+    )
 
-        if chat_request is not None:
-            # Append schema instruction to the last user message
-            msgs = completion_kwargs["messages"]
-            for i in range(len(msgs) - 1, -1, -1):
-                if msgs[i]["role"] == "user":
-                    content = msgs[i]["content"]
-                    # Handle content that's already a list (Anthropic cache blocks)
-                    if isinstance(content, list):
-                        content[-1]["text"] += schema_instruction
+    if chat_request is not None or _has_cache_blocks(completion_kwargs):
+        # Append schema instruction to the last user message
+        msgs = completion_kwargs["messages"]
+        for i in range(len(msgs) - 1, -1, -1):
+            if msgs[i]["role"] == "user":
+                content = msgs[i]["content"]
+                # Handle content that's already a list (Anthropic cache blocks)
+                if isinstance(content, list):
+                    if "cache_control" in content[-1]:
+                        # Keep the cached prefix block byte-identical across calls
+                        content.append({"type": "text", "text": schema_instruction.lstrip()})
                     else:
-                        msgs[i]["content"] = content + schema_instruction
-                    break
-        else:
-            structured_message = f"{message}{schema_instruction}"
-            completion_kwargs["messages"] = [{"role": "user", "content": structured_message}]
+                        content[-1]["text"] += schema_instruction
+                else:
+                    msgs[i]["content"] = content + schema_instruction
+                break
+    else:
+        structured_message = f"{message}{schema_instruction}"
+        completion_kwargs["messages"] = [{"role": "user", "content": structured_message}]
 
-        response = litellm.completion(**completion_kwargs)
-        response_text = response.choices[0].message.content or ""
 
-        # Clean up markdown code blocks and fix common JSON issues
-        response_text = _clean_json_response(response_text)
+def _parse_structured_response(
+    response: Any,
+    provider: str,
+    output_format: type[BaseModel],
+    is_typed_dict_output: bool,
+) -> BaseModel | dict:
+    """Clean and validate a structured output response."""
+    _record_response_usage(response)
+    response_text = response.choices[0].message.content or ""
+    # Clean markdown code blocks and Python-style booleans (even with native support)
+    response_text = _clean_json_response(response_text)
 
     # Parse and validate
     try:
@@ -359,6 +521,77 @@ def _handle_structured_output(
         ) from e
 
 
+def _handle_structured_output(
+    provider: str,
+    model_id: str,
+    litellm_model: str,
+    message: str,
+    completion_kwargs: dict[str, Any],
+    output_format: type[BaseModel],
+    is_typed_dict_output: bool,
+    chat_request=None,
+) -> BaseModel | dict:
+    """Handle structured output generation.
+
+    Uses native JSON schema support for providers that support it,
+    falls back to prompt-based approach for others.
+
+    :param provider: Provider name
+    :param model_id: Model identifier
+    :param litellm_model: LiteLLM-formatted model name
+    :param message: Original message
+    :param completion_kwargs: Base completion kwargs
+    :param output_format: Pydantic model for output validation
+    :param is_typed_dict_output: Whether to convert result to dict
+    :param chat_request: Optional ChatCompletionRequest (preserves multi-turn messages)
+    :return: Validated Pydantic model instance or dict
+    """
+    # Ollama: Use direct API to bypass LiteLLM bug #15463 with thinking models
+    if provider == "ollama":
+        return _execute_ollama_structured_output(
+            model_id=model_id,
+            message=message,
+            output_format=output_format,
+            base_url=completion_kwargs.get("api_base", "http://localhost:11434"),
+            max_tokens=completion_kwargs.get("max_tokens", 1024),
+            is_typed_dict_output=is_typed_dict_output,
+        )
+
+    _prepare_structured_request(
+        provider, litellm_model, message, completion_kwargs, output_format, chat_request
+    )
+    response = litellm.completion(**completion_kwargs)
+    return _parse_structured_response(response, provider, output_format, is_typed_dict_output)
+
+
+async def _ahandle_structured_output(
+    provider: str,
+    model_id: str,
+    litellm_model: str,
+    message: str,
+    completion_kwargs: dict[str, Any],
+    output_format: type[BaseModel],
+    is_typed_dict_output: bool,
+    chat_request=None,
+) -> BaseModel | dict:
+    """Async variant of :func:`_handle_structured_output`."""
+    if provider == "ollama":
+        return await _aexecute_ollama_structured_output(
+            model_id=model_id,
+            message=message,
+            output_format=output_format,
+            base_url=completion_kwargs.get("api_base", "http://localhost:11434"),
+            max_tokens=completion_kwargs.get("max_tokens", 1024),
+            is_typed_dict_output=is_typed_dict_output,
+        )
+
+    _prepare_structured_request(
+        provider, litellm_model, message, completion_kwargs, output_format, chat_request
+    )
+    response = await litellm.acompletion(**completion_kwargs)
+    return _parse_structured_response(response, provider, output_format, is_typed_dict_output)
+
+
 def _supports_native_structured_output(litellm_model: str, provider: str) -> bool:
     """Check if a model supports native structured outputs.
 
@@ -413,6 +646,47 @@ def _clean_json_response(text: str) -> str:
     return text
 
 
+def _ollama_chat_request(
+    model_id: str, message: str, base_url: str, num_predict: int, json_format: bool = False
+) -> tuple[str, dict[str, Any]]:
+    """Build the URL and payload for a non-streaming Ollama ``/api/chat`` call."""
+    payload: dict[str, Any] = {
+        "model": model_id,
+        "messages": [{"role": "user", "content": message}],
+        "stream": False,
+        "options": {"num_predict": num_predict},
+    }
+    if json_format:
+        payload["format"] = "json"
+    return f"{base_url.rstrip('/')}/api/chat", payload
+
+
+def _ollama_structured_message(message: str, output_format: type[BaseModel]) -> str:
+    """Append the JSON schema instruction used for Ollama structured output."""
+    schema = output_format.model_json_schema()
+    return f"""{message}
+
+You must respond with valid JSON that matches this schema:
+{json.dumps(schema, indent=2)}
+
+Respond ONLY with the JSON object, no additional text."""
+
+
+def _parse_ollama_structured_output(
+    content: str, output_format: type[BaseModel], is_typed_dict_output: bool
+) -> BaseModel | dict:
+    """Validate Ollama JSON content against the requested output model."""
+    try:
+        result = output_format.model_validate_json(content)
+        if is_typed_dict_output and hasattr(result, "model_dump"):
+            return result.model_dump()
+        return result
+    except Exception as e:
+        raise ValueError(
+            f"Failed to parse structured output from Ollama: {e}\nResponse: {content[:200]}"
+        ) from e
+
+
 def _execute_ollama_completion(
     model_id: str,
     message: str,
@@ -431,29 +705,30 @@ def _execute_ollama_completion(
     :param max_tokens: Maximum tokens to generate
     :return: Response text
     """
-    import httpx
-
-    url = f"{base_url.rstrip('/')}/api/chat"
-
     # Thinking models (like gpt-oss) need extra tokens for the thinking phase
     # Ensure minimum of 100 tokens to avoid truncation during thinking
-    effective_max_tokens = max(max_tokens, 100)
-
-    response = httpx.post(
-        url,
-        json={
-            "model": model_id,
-            "messages": [{"role": "user", "content": message}],
-            "stream": False,
-            "options": {"num_predict": effective_max_tokens},
-        },
-        timeout=120.0,
-    )
+    url, payload = _ollama_chat_request(model_id, message, base_url, max(max_tokens, 100))
+
+    response = get_http_client().post(url, json=payload)
     response.raise_for_status()
 
     # Extract content - works correctly even with thinking field present
-    data = response.json()
-    return data["message"]["content"]
+    return response.json()["message"]["content"]
+
+
+async def _aexecute_ollama_completion(
+    model_id: str,
+    message: str,
+    base_url: str,
+    max_tokens: int,
+) -> str:
+    """Async variant of :func:`_execute_ollama_completion` on the pooled async client."""
+    url, payload = _ollama_chat_request(model_id, message, base_url, max(max_tokens, 100))
+
+    response = await get_async_http_client().post(url, json=payload)
+    response.raise_for_status()
+
+    return response.json()["message"]["content"]
 
 
 def _execute_ollama_structured_output(
@@ -478,46 +753,44 @@ def _execute_ollama_structured_output(
     :param is_typed_dict_output: Whether to convert result to dict
     :return: Validated Pydantic model instance or dict
     """
-    import httpx
-
-    schema = output_format.model_json_schema()
+    url, payload = _ollama_chat_request(
+        model_id,
+        _ollama_structured_message(message, output_format),
+        base_url,
+        max_tokens,
+        json_format=True,
+    )
 
-    # Build prompt with schema instruction
-    structured_message = f"""{message}
+    # Direct Ollama API call - bypasses LiteLLM's broken response handling
+    response = get_http_client().post(url, json=payload)
+    response.raise_for_status()
 
-You must respond with valid JSON that matches this schema:
-{json.dumps(schema, indent=2)}
+    content = response.json()["message"]["content"]
+    return _parse_ollama_structured_output(content, output_format, is_typed_dict_output)
 
-Respond ONLY with the JSON object, no additional text."""
 
-    # Direct Ollama API call - bypasses LiteLLM's broken response handling
-    response = httpx.post(
-        f"{base_url.rstrip('/')}/api/chat",
-        json={
-            "model": model_id,
-            "messages": [{"role": "user", "content": structured_message}],
-            "stream": False,
-            "format": "json",
-            "options": {"num_predict": max_tokens},
-        },
-        timeout=120.0,
+async def _aexecute_ollama_structured_output(
+    model_id: str,
+    message: str,
+    output_format: type[BaseModel],
+    base_url: str,
+    max_tokens: int,
+    is_typed_dict_output: bool = False,
+) -> BaseModel | dict:
+    """Async variant of :func:`_execute_ollama_structured_output`."""
+    url, payload = _ollama_chat_request(
+        model_id,
+        _ollama_structured_message(message, output_format),
+        base_url,
+        max_tokens,
+        json_format=True,
     )
-    response.raise_for_status()
 
-    # Extract content - works correctly even with thinking field present
-    data = response.json()
-    content = data["message"]["content"]
+    response = await get_async_http_client().post(url, json=payload)
+    response.raise_for_status()
 
-    # Parse and validate
-    try:
-        result = output_format.model_validate_json(content)
-        if is_typed_dict_output and hasattr(result, "model_dump"):
-            return result.model_dump()
-        return result
-    except Exception as e:
-        raise ValueError(
-            f"Failed to parse structured output from Ollama: {e}\nResponse: {content[:200]}"
-        ) from e
+    content = response.json()["message"]["content"]
+    return _parse_ollama_structured_output(content, output_format, is_typed_dict_output)
 
 
 def check_litellm_health(
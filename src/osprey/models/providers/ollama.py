@@ -4,12 +4,13 @@ This provider uses LiteLLM as the backend for unified API access,
 while preserving Ollama-specific fallback URL logic for development workflows.
 """
 
+import asyncio
 from typing import Any
 
 from osprey.utils.logger import get_logger
 
 from .base import BaseProvider
-from .litellm_adapter import execute_litellm_completion
+from .litellm_adapter import aexecute_litellm_completion, execute_litellm_completion
 
 logger = get_logger("ollama")
 
@@ -128,6 +129,35 @@ class OllamaProviderAdapter(BaseProvider):
             **kwargs,
         )
 
+    async def aexecute_completion(
+        self,
+        message: str,
+        model_id: str,
+        api_key: str | None,
+        base_url: str | None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        thinking: dict | None = None,
+        system_prompt: str | None = None,
+        output_format: Any | None = None,
+        **kwargs,
+    ) -> str | Any:
+        """Execute Ollama chat completion on the pooled async client with fallback support."""
+        # The connection probe is a short blocking request; keep it off the event loop
+        effective_base_url = await asyncio.to_thread(self._resolve_base_url, base_url)
+
+        return await aexecute_litellm_completion(
+            provider=self.name,
+            message=message,
+            model_id=model_id,
+            api_key=api_key or "ollama",  # Ollama doesn't need real key
+            base_url=effective_base_url,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            output_format=output_format,
+            **kwargs,
+        )
+
     def check_health(
         self,
         api_key: str | None,
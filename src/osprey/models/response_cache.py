@@ -0,0 +1,398 @@
+"""Persistent LLM Response Cache for Deterministic Framework Calls.
+
+Many framework LLM calls (capability classification, time range parsing, channel
+finder query splitting and level selection) run at ``temperature=0.0`` with
+prompts that repeat across turns and sessions. This module stores their results
+in a small SQLite database under ``_agent_data`` so a repeated request is answered
+locally instead of round-tripping to the provider.
+
+Entries are keyed on everything that determines the response: provider, model ID,
+the full message or chat request, the structured output schema, tools and
+sampling parameters. Entries expire after ``ttl_seconds`` and the least recently
+used ones are evicted once ``max_entries`` is exceeded.
+
+The cache is opt-in and only applies to deterministic calls (temperature 0,
+no extended thinking). Callers are identified by module name (the ``module``
+given to :func:`~osprey.models.logging.set_api_call_context`, or the calling
+module otherwise) and can be enabled or disabled individually.
+
+.. note::
+   Controlled by the ``llm_cache`` configuration section::
+
+       llm_cache:
+         enabled: true
+         ttl_seconds: 604800      # 7 days
+         max_entries: 5000
+         callers:                 # Per-caller overrides (default: enabled)
+           orchestration_node: false
+
+.. seealso::
+   :func:`~osprey.models.completion.get_chat_completion` : Uses this cache when enabled
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from osprey.utils.config import get_agent_dir, get_config_value
+from osprey.utils.logger import get_logger
+
+logger = get_logger("llm_cache")
+
+CACHE_FILENAME = "responses.sqlite"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+# Module prefixes that are never the "real" caller of a completion
+_INTERNAL_MODULE_PREFIXES = ("osprey.models", "asyncio", "concurrent", "threading", "contextvars")
+
+_cache: ResponseCache | None = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+class ResponseCache:
+    """SQLite-backed LLM response store with TTL expiry and LRU eviction.
+
+    Args:
+        path: SQLite database file
+        ttl_seconds: Entries older than this are treated as misses (None disables)
+        max_entries: Maximum number of stored responses (least recently used evicted)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, caller TEXT, type TEXT, data TEXT, "
+            "created_at REAL, last_access REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+        )
+        self._db.commit()
+        self._purge_expired()
+
+    # ===== Keys =====
+
+    @staticmethod
+    def make_key(provider: str | None, execute_kwargs: dict[str, Any]) -> str:
+        """Build a stable cache key for a prepared completion request.
+
+        :param provider: Provider name
+        :param execute_kwargs: Keyword arguments passed to the provider adapter
+        :return: Hex digest identifying the request
+        """
+        output_format = execute_kwargs.get("output_format")
+        chat_request = execute_kwargs.get("chat_request")
+        payload = {
+            "provider": provider,
+            "model_id": execute_kwargs.get("model_id"),
+            "base_url": execute_kwargs.get("base_url"),
+            "message": execute_kwargs.get("message"),
+            "chat_request": (
+                [m.to_dict() for m in chat_request.messages] if chat_request is not None else None
+            ),
+            "output_schema": (
+                output_format.model_json_schema() if output_format is not None else None
+            ),
+            "is_typed_dict_output": execute_kwargs.get("is_typed_dict_output", False),
+            "tools": execute_kwargs.get("tools"),
+            "tool_choice": execute_kwargs.get("tool_choice"),
+            "max_tokens": execute_kwargs.get("max_tokens"),
+            "temperature": execute_kwargs.get("temperature"),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    # ===== Lookup and store =====
+
+    def get(
+        self, key: str, output_model: type[BaseModel] | None = None
+    ) -> tuple[bool, str | BaseModel | list | dict | None]:
+        """Look up a cached response.
+
+        :param key: Key from :meth:`make_key`
+        :param output_model: Pydantic model used to rebuild structured responses
+        :return: (hit, response) tuple; response is None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT type, data, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[2], now):
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                self._counters["expired"] += 1
+                row = None
+            if row is None:
+                self._counters["misses"] += 1
+                return False, None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+
+        result_type, data, _created_at = row
+        try:
+            value = json.loads(data)
+            if result_type == "model":
+                if output_model is None:
+                    raise ValueError("structured response cached without output model")
+                value = output_model.model_validate(value)
+        except Exception as e:
+            # Schema drift or corrupt entry: drop it and call the provider instead
+            logger.debug(f"Discarding unreadable cache entry: {e}")
+            self.delete(key)
+            with self._lock:
+                self._counters["misses"] += 1
+            return False, None
+
+        with self._lock:
+            self._counters["hits"] += 1
+        return True, value
+
+    def set(self, key: str, result: Any, caller: str | None = None) -> bool:
+        """Store a response.
+
+        Only responses that round-trip through JSON (text, structured outputs,
+        TypedDict results and tool calls) are stored.
+
+        :param key: Key from :meth:`make_key`
+        :param result: Provider response
+        :param caller: Caller module name, recorded for inspection
+        :return: True if the response was stored
+        """
+        try:
+            if isinstance(result, BaseModel):
+                result_type, data = "model", result.model_dump_json()
+            else:
+                result_type, data = "json", json.dumps(result)
+        except (TypeError, ValueError):
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, caller, type, data, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, caller, result_type, data, now, now),
+            )
+            self._counters["stores"] += 1
+            self._enforce_size()
+            self._db.commit()
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._counters = dict.fromkeys(self._counters, 0)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._db.close()
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Snapshot of the hit/miss/store/eviction counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and the current number of entries."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "entries": entries,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
+
+    # ===== Maintenance =====
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and created_at < now - self.ttl_seconds
+
+    def _purge_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._counters["expired"] += cursor.rowcount
+            self._db.commit()
+
+    def _enforce_size(self) -> None:
+        """Evict least recently used entries over capacity (caller holds the lock)."""
+        count = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._counters["evictions"] += overflow
+
+
+def _resolve_caller() -> str:
+    """Identify the module that requested the completion.
+
+    Prefers the module recorded via ``set_api_call_context``; otherwise walks
+    the stack to the first frame outside ``osprey.models`` and async machinery.
+    """
+    from osprey.models.logging import _api_call_context
+
+    context = _api_call_context.get()
+    if context is not None and context.get("module"):
+        return context["module"]
+
+    frame = sys._getframe(1)
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__", "")
+        if not module_name.startswith(_INTERNAL_MODULE_PREFIXES):
+            return module_name.rsplit(".", 1)[-1]
+        frame = frame.f_back
+    return "unknown"
+
+
+def _get_cache_settings() -> dict[str, Any]:
+    try:
+        settings = get_config_value("llm_cache", {}) or {}
+    except Exception:
+        # No configuration available (e.g. standalone use): caching stays off
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+def get_response_cache(settings: dict[str, Any] | None = None) -> ResponseCache | None:
+    """Get the shared response cache, or None if caching is disabled in config.
+
+    :param settings: Pre-loaded ``llm_cache`` settings (read from config if omitted)
+    """
+    global _cache, _cache_failed
+
+    if settings is None:
+        settings = _get_cache_settings()
+    if not settings.get("enabled", False) or _cache_failed:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None and not _cache_failed:
+                try:
+                    path = Path(get_agent_dir("llm_cache_dir")) / CACHE_FILENAME
+                    _cache = ResponseCache(
+                        path,
+                        ttl_seconds=settings.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+                        max_entries=settings.get("max_entries", DEFAULT_MAX_ENTRIES),
+                    )
+                    logger.info(f"LLM response cache enabled at {path}")
+                except Exception as e:
+                    _cache_failed = True
+                    logger.warning(f"LLM response cache unavailable, continuing without it: {e}")
+    return _cache
+
+
+def reset_response_cache() -> None:
+    """Close and forget the shared cache (e.g. after configuration changes)."""
+    global _cache, _cache_failed
+
+    with _cache_lock:
+        cache, _cache = _cache, None
+        _cache_failed = False
+    if cache is not None:
+        cache.close()
+
+
+def lookup_cached_completion(
+    provider: str | None, execute_kwargs: dict[str, Any], caller: str | None = None
+) -> tuple[ResponseCache, str, str] | None:
+    """Resolve the cache entry for a completion request, if it is cacheable.
+
+    :param provider: Provider name
+    :param execute_kwargs: Keyword arguments passed to the provider adapter
+    :param caller: Requesting module, resolved from the current stack if omitted.
+        Pass it explicitly when calling from a worker thread, whose stack no
+        longer contains the requesting code.
+    :return: (cache, key, caller) tuple, or None if the request bypasses the cache
+    """
+    # Only deterministic calls are safe to replay
+    if execute_kwargs.get("temperature") or execute_kwargs.get("enable_thinking"):
+        return None
+
+    settings = _get_cache_settings()
+    cache = get_response_cache(settings)
+    if cache is None:
+        return None
+
+    if caller is None:
+        caller = _resolve_caller()
+    callers = settings.get("callers") or {}
+    if not callers.get(caller, True):
+        return None
+
+    return cache, ResponseCache.make_key(provider, execute_kwargs), caller
+
+
+def read_cached_completion(
+    entry: tuple[ResponseCache, str, str], output_model: type[BaseModel] | None
+) -> tuple[bool, Any]:
+    """Look up a resolved entry and log the outcome with running hit/miss counters.
+
+    Cache errors are logged and reported as a miss so the provider is called instead.
+    """
+    cache, key, caller = entry
+    try:
+        hit, result = cache.get(key, output_model=output_model)
+    except Exception as e:
+        logger.warning(f"LLM response cache lookup failed: {e}")
+        return False, None
+
+    counters = cache.counters
+    if hit:
+        logger.info(
+            f"LLM cache hit for {caller} (hits={counters['hits']}, misses={counters['misses']})"
+        )
+    else:
+        logger.debug(
+            f"LLM cache miss for {caller} (hits={counters['hits']}, misses={counters['misses']})"
+        )
+    return hit, result
@@ -0,0 +1,458 @@
+"""LLM Call Telemetry: Latency, Token Usage and Cost per Caller.
+
+Every :func:`~osprey.models.completion.get_chat_completion` and
+:func:`~osprey.models.completion.aget_chat_completion` call is recorded here with
+its wall time, token usage reported by the provider (prompt, completion,
+thinking, prompt-cache reads/writes), estimated cost, retries, errors and
+response cache hits.
+
+Calls are aggregated in memory along two axes:
+
+- **Caller**: the ``module`` / ``function`` given to
+  :func:`~osprey.models.logging.set_api_call_context` (or the calling module),
+  together with the LangGraph node, provider and model. These series are exposed
+  in Prometheus text format by the web server's ``/metrics`` endpoint.
+- **Session**: the LangGraph ``session_id`` / ``thread_id`` of the running graph.
+  Sessions are unbounded over a process lifetime, so only the most recently
+  active ``max_sessions`` are kept and they are not exported as Prometheus labels.
+
+When ``persist_interval_seconds`` is set, each process periodically writes its
+snapshot to ``file_paths.llm_metrics_dir`` so ``osprey metrics`` can report on
+running or finished agents from a separate shell.
+
+.. note::
+   Controlled by the ``llm_telemetry`` configuration section::
+
+       llm_telemetry:
+         enabled: true
+         max_sessions: 100
+         persist_interval_seconds: 30   # 0 disables snapshot files
+         prometheus_endpoint: false     # Serve /metrics on the web server
+
+.. seealso::
+   :mod:`osprey.cli.metrics_cmd` : ``osprey metrics`` command
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.config import get_agent_dir, get_config_value
+from osprey.utils.logger import get_logger
+
+logger = get_logger("llm_telemetry")
+
+DEFAULT_MAX_SESSIONS = 100
+SNAPSHOT_PREFIX = "telemetry_"
+GROUP_BY_FIELDS = ("caller", "node", "provider", "model", "session")
+
+_telemetry: LLMTelemetry | None = None
+_telemetry_lock = threading.Lock()
+
+
+@dataclass
+class LLMStats:
+    """Accumulated measurements for a group of LLM calls."""
+
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    thinking_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(
+        self,
+        latency: float,
+        usage: dict[str, Any] | None,
+        cache_hit: bool,
+        error: bool,
+    ) -> None:
+        """Add one call to the totals."""
+        self.calls += 1
+        self.errors += int(error)
+        self.cache_hits += int(cache_hit)
+        self.latency_seconds += latency
+        self.max_latency_seconds = max(self.max_latency_seconds, latency)
+        if usage:
+            self.retries += int(usage.get("retries", 0) or 0)
+            self.prompt_tokens += int(usage.get("prompt_tokens", 0) or 0)
+            self.completion_tokens += int(usage.get("completion_tokens", 0) or 0)
+            self.thinking_tokens += int(usage.get("thinking_tokens", 0) or 0)
+            self.cache_read_tokens += int(usage.get("cache_read_tokens", 0) or 0)
+            self.cache_write_tokens += int(usage.get("cache_write_tokens", 0) or 0)
+            self.cost_usd += float(usage.get("cost_usd", 0.0) or 0.0)
+
+    def merge(self, other: LLMStats) -> None:
+        """Add another group's totals to this one."""
+        for f in fields(self):
+            if f.name == "max_latency_seconds":
+                self.max_latency_seconds = max(self.max_latency_seconds, other.max_latency_seconds)
+            else:
+                setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        """Mean wall time per call."""
+        return self.latency_seconds / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LLMStats:
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class LLMTelemetry:
+    """Thread-safe in-memory aggregator of LLM call measurements.
+
+    :param max_sessions: Number of most recently active sessions to keep
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        # (caller, node, provider, model) -> stats
+        self._series: dict[tuple[str, str, str, str], LLMStats] = {}
+        self._sessions: OrderedDict[str, LLMStats] = OrderedDict()
+
+    def record(
+        self,
+        *,
+        caller: str,
+        node: str,
+        provider: str,
+        model: str,
+        latency: float,
+        usage: dict[str, Any] | None = None,
+        session: str | None = None,
+        cache_hit: bool = False,
+        error: bool = False,
+    ) -> None:
+        """Record one completed (or failed) LLM call."""
+        key = (caller, node, provider, model)
+        with self._lock:
+            stats = self._series.get(key)
+            if stats is None:
+                stats = self._series[key] = LLMStats()
+            stats.add(latency, usage, cache_hit, error)
+
+            if session:
+                session_stats = self._sessions.get(session)
+                if session_stats is None:
+                    session_stats = self._sessions[session] = LLMStats()
+                    while len(self._sessions) > self.max_sessions:
+                        self._sessions.popitem(last=False)
+                else:
+                    self._sessions.move_to_end(session)
+                session_stats.add(latency, usage, cache_hit, error)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of all aggregated measurements."""
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "updated_at": time.time(),
+                "series": [
+                    {
+                        "caller": caller,
+                        "node": node,
+                        "provider": provider,
+                        "model": model,
+                        **stats.to_dict(),
+                    }
+                    for (caller, node, provider, model), stats in self._series.items()
+                ],
+                "sessions": {name: stats.to_dict() for name, stats in self._sessions.items()},
+            }
+
+    def summary(self, group_by: str = "node") -> dict[str, LLMStats]:
+        """Aggregate measurements by ``caller``, ``node``, ``provider``, ``model`` or ``session``."""
+        return summarize(self.snapshot(), group_by)
+
+    def render_prometheus(self) -> str:
+        """Render the per-caller series in Prometheus text exposition format."""
+        return render_prometheus(self.snapshot())
+
+    def reset(self) -> None:
+        """Discard all measurements."""
+        with self._lock:
+            self._series.clear()
+            self._sessions.clear()
+            self.started_at = time.time()
+
+
+def summarize(snapshot: dict[str, Any], group_by: str = "node") -> dict[str, LLMStats]:
+    """Aggregate a telemetry snapshot by one dimension.
+
+    :param snapshot: Output of :meth:`LLMTelemetry.snapshot` (or merged snapshots)
+    :param group_by: One of ``caller``, ``node``, ``provider``, ``model``, ``session``
+    :return: Mapping of group name to accumulated stats
+    """
+    if group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f"group_by must be one of {', '.join(GROUP_BY_FIELDS)}")
+
+    groups: dict[str, LLMStats] = {}
+    if group_by == "session":
+        for name, data in snapshot.get("sessions", {}).items():
+            groups.setdefault(name, LLMStats()).merge(LLMStats.from_dict(data))
+        return groups
+
+    for entry in snapshot.get("series", []):
+        groups.setdefault(entry[group_by], LLMStats()).merge(LLMStats.from_dict(entry))
+    return groups
+
+
+_PROMETHEUS_METRICS = (
+    ("osprey_llm_calls_total", "counter", "LLM completion calls", "calls"),
+    ("osprey_llm_errors_total", "counter", "LLM completion calls that raised", "errors"),
+    (
+        "osprey_llm_cache_hits_total",
+        "counter",
+        "Calls served from the response cache",
+        "cache_hits",
+    ),
+    ("osprey_llm_retries_total", "counter", "Provider-side retries", "retries"),
+    (
+        "osprey_llm_latency_seconds_total",
+        "counter",
+        "Total wall time of LLM calls",
+        "latency_seconds",
+    ),
+    (
+        "osprey_llm_latency_seconds_max",
+        "gauge",
+        "Slowest LLM call",
+        "max_latency_seconds",
+    ),
+    ("osprey_llm_prompt_tokens_total", "counter", "Prompt tokens", "prompt_tokens"),
+    ("osprey_llm_completion_tokens_total", "counter", "Completion tokens", "completion_tokens"),
+    ("osprey_llm_thinking_tokens_total", "counter", "Reasoning tokens", "thinking_tokens"),
+    (
+        "osprey_llm_cache_read_tokens_total",
+        "counter",
+        "Prompt tokens read from the provider prompt cache",
+        "cache_read_tokens",
+    ),
+    (
+        "osprey_llm_cache_write_tokens_total",
+        "counter",
+        "Prompt tokens written to the provider prompt cache",
+        "cache_write_tokens",
+    ),
+    ("osprey_llm_cost_usd_total", "counter", "Estimated cost in USD", "cost_usd"),
+)
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(snapshot: dict[str, Any]) -> str:
+    """Render the per-caller series of a snapshot in Prometheus text format."""
+    lines = []
+    series = snapshot.get("series", [])
+    for name, metric_type, help_text, attr in _PROMETHEUS_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for entry in series:
+            labels = ",".join(
+                f'{label}="{_escape_label(entry[label])}"'
+                for label in ("caller", "node", "provider", "model")
+            )
+            lines.append(f"{name}{{{labels}}} {entry.get(attr, 0)}")
+    return "\n".join(lines) + "\n"
+
+
+def _get_telemetry_settings() -> dict[str, Any]:
+    try:
+        settings = get_config_value("llm_telemetry", {}) or {}
+    except Exception:
+        # No configuration available (e.g. standalone use): in-memory defaults
+        return {}
+    return settings if isinstance(settings, dict) else {}
+
+
+class _SnapshotWriter:
+    """Write the process snapshot to disk at most once per interval.
+
+    Periodic writes run in a background thread so recording a call (possibly on
+    the event loop) never waits on file I/O; the final write at exit is direct.
+    """
+
+    def __init__(self, telemetry: LLMTelemetry, path: Path, interval: float):
+        self.telemetry = telemetry
+        self.path = path
+        self.interval = interval
+        self._last_write = 0.0
+        self._lock = threading.Lock()
+
+    def maybe_write(self) -> None:
+        now = time.monotonic()
+        if now - self._last_write < self.interval:
+            return
+        # Claim this interval before starting the thread so calls racing in
+        # behind this one do not start writers of their own
+        self._last_write = now
+        threading.Thread(
+            target=self.write, kwargs={"wait": False}, name="llm-telemetry-writer", daemon=True
+        ).start()
+
+    def write(self, wait: bool = True) -> None:
+        if not self._lock.acquire(blocking=wait):
+            return
+        try:
+            self._last_write = time.monotonic()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.telemetry.snapshot()))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.debug(f"Could not write LLM telemetry snapshot: {e}")
+        finally:
+            self._lock.release()
+
+
+_writer: _SnapshotWriter | None = None
+
+
+def get_llm_telemetry() -> LLMTelemetry | None:
+    """Get the process-wide telemetry aggregator, or None if disabled in config."""
+    global _telemetry, _writer
+
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                settings = _get_telemetry_settings()
+                if not settings.get("enabled", True):
+                    return None
+                telemetry = LLMTelemetry(settings.get("max_sessions", DEFAULT_MAX_SESSIONS))
+                interval = settings.get("persist_interval_seconds", 0) or 0
+                if interval > 0:
+                    try:
+                        path = Path(get_agent_dir("llm_metrics_dir")) / (
+                            f"{SNAPSHOT_PREFIX}{os.getpid()}.json"
+                        )
+                        _writer = _SnapshotWriter(telemetry, path, interval)
+                        atexit.register(_writer.write)
+                    except Exception as e:
+                        logger.warning(f"LLM telemetry snapshots disabled: {e}")
+                _telemetry = telemetry
+    return _telemetry
+
+
+def reset_llm_telemetry() -> None:
+    """Forget the shared aggregator (e.g. after configuration changes)."""
+    global _telemetry, _writer
+
+    with _telemetry_lock:
+        if _writer is not None:
+            atexit.unregister(_writer.write)
+        _telemetry = None
+        _writer = None
+
+
+def _resolve_graph_context() -> tuple[str | None, str | None]:
+    """Return (session, node) of the LangGraph run this call belongs to, if any."""
+    try:
+        from langgraph.config import get_config
+
+        config = get_config()
+    except Exception:
+        # Not inside a LangGraph runnable (scripts, tests, CLI tools)
+        return None, None
+    configurable = config.get("configurable", {}) or {}
+    session = configurable.get("session_id") or configurable.get("thread_id")
+    node = (config.get("metadata", {}) or {}).get("langgraph_node")
+    return session, node
+
+
+def record_llm_call(
+    provider: str | None,
+    model_id: str | None,
+    latency: float,
+    usage: dict[str, Any] | None = None,
+    cache_hit: bool = False,
+    error: bool = False,
+) -> None:
+    """Record one completion call against the current caller, node and session.
+
+    Never raises: telemetry must not fail the completion it measures.
+    """
+    try:
+        telemetry = get_llm_telemetry()
+        if telemetry is None:
+            return
+
+        from osprey.models.logging import _api_call_context
+
+        context = _api_call_context.get() or {}
+        module = context.get("module") or "unknown"
+        function = context.get("function")
+        caller = f"{module}.{function}" if function else module
+        session, node = _resolve_graph_context()
+
+        telemetry.record(
+            caller=caller,
+            node=node or module,
+            provider=provider or "unknown",
+            model=model_id or "unknown",
+            latency=latency,
+            usage=usage,
+            session=session,
+            cache_hit=cache_hit,
+            error=error,
+        )
+        if _writer is not None:
+            _writer.maybe_write()
+    except Exception as e:
+        logger.debug(f"Failed to record LLM telemetry: {e}")
+
+
+def load_snapshots(directory: str | Path) -> list[dict[str, Any]]:
+    """Load all process snapshots written to a telemetry directory."""
+    snapshots = []
+    for path in sorted(Path(directory).glob(f"{SNAPSHOT_PREFIX}*.json")):
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Skipping unreadable telemetry snapshot {path}: {e}")
+    return snapshots
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine snapshots from several processes into one."""
+    series: dict[tuple, LLMStats] = {}
+    sessions: dict[str, LLMStats] = {}
+    for snapshot in snapshots:
+        for entry in snapshot.get("series", []):
+            key = (entry["caller"], entry["node"], entry["provider"], entry["model"])
+            series.setdefault(key, LLMStats()).merge(LLMStats.from_dict(entry))
+        for name, data in snapshot.get("sessions", {}).items():
+            sessions.setdefault(name, LLMStats()).merge(LLMStats.from_dict(data))
+
+    return {
+        "series": [
+            {"caller": c, "node": n, "provider": p, "model": m, **stats.to_dict()}
+            for (c, n, p, m), stats in series.items()
+        ],
+        "sessions": {name: stats.to_dict() for name, stats in sessions.items()},
+    }
@@ -13,6 +13,7 @@ inversion - the framework depends on abstractions, not concrete implementations.
 
 Key Components:
     - **FrameworkPromptBuilder**: Abstract base class for building modular prompts
+    - **PromptParts**: Prompt split into a cacheable static prefix and dynamic suffix
     - **get_framework_prompts**: Primary access function for framework infrastructure
     - **FrameworkPromptProvider**: Provider interface for application-specific prompts
     - **FrameworkPromptLoader**: Global registry for prompt provider management
@@ -59,7 +60,7 @@ Examples:
    :class:`applications.als_assistant.framework_prompts.ALSPromptProvider` : Example application customization
 """
 
-from .base import FrameworkPromptBuilder
+from .base import FrameworkPromptBuilder, PromptParts
 from .loader import get_framework_prompts
 
-__all__ = ["FrameworkPromptBuilder", "get_framework_prompts"]
+__all__ = ["FrameworkPromptBuilder", "PromptParts", "get_framework_prompts"]
@@ -14,7 +14,7 @@ import textwrap
 import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from osprey.base import TaskClassifierGuide
 from osprey.utils.config import get_agent_dir, get_config_value
@@ -25,6 +25,30 @@ if TYPE_CHECKING:
 logger = get_logger("osprey")
 
 
+class PromptParts(NamedTuple):
+    """A prompt split into a stable prefix and a per-call dynamic suffix.
+
+    The static part (role, task, instructions, examples) is identical across
+    calls and is sent first so providers can serve it from their prompt cache.
+    The dynamic part (chat history, runtime context) changes every turn.
+
+    :param static: Stable, cacheable prompt prefix
+    :param dynamic: Per-call prompt suffix
+    """
+
+    static: str
+    dynamic: str = ""
+
+    @property
+    def text(self) -> str:
+        """Full prompt text, static prefix first."""
+        if not self.dynamic:
+            return self.static
+        if not self.static:
+            return self.dynamic
+        return f"{self.static}\n\n{self.dynamic}"
+
+
 class FrameworkPromptBuilder(ABC):
     """Abstract base class for building domain-agnostic framework prompts with flexible composition.
 
@@ -343,6 +367,27 @@ class FrameworkPromptBuilder(ABC):
            :meth:`debug_print_prompt` : Debug output for prompt development
            :meth:`format_examples` : Custom example formatting override
         """
+        final_prompt = self.build_prompt_parts(**context).text
+
+        # Debug: Print prompt if enabled (automatic for all framework prompts)
+        self.debug_print_prompt(final_prompt)
+
+        return final_prompt
+
+    def build_prompt_parts(self, **context) -> PromptParts:
+        """Compose the prompt as a stable prefix and a dynamic suffix.
+
+        Role, task, instructions and examples form the static prefix; the output of
+        :meth:`build_dynamic_context` forms the dynamic suffix. Joining both with
+        :attr:`PromptParts.text` yields exactly :meth:`build_prompt`'s output.
+        Callers pass ``parts.static`` as ``cache_prefix`` to the completion API so
+        providers can reuse the cached prefix across calls.
+
+        :param context: Runtime context data passed to dynamic methods
+        :type context: dict
+        :return: Static and dynamic prompt parts
+        :rtype: PromptParts
+        """
         sections = []
 
         # Role (always present)
@@ -365,15 +410,8 @@ class FrameworkPromptBuilder(ABC):
 
         # Dynamic context (optional)
         dynamic_context = self.build_dynamic_context(**context)
-        if dynamic_context:
-            sections.append(dynamic_context)
 
-        final_prompt = "\n\n".join(sections)
-
-        # Debug: Print prompt if enabled (automatic for all framework prompts)
-        self.debug_print_prompt(final_prompt)
-
-        return final_prompt
+        return PromptParts("\n\n".join(sections), dynamic_context or "")
 
     def get_system_instructions(self, *args, **kwargs) -> str:
         """Deprecated: use ``build_prompt()`` instead.
@@ -144,6 +144,23 @@ class DefaultChannelWritePromptBuilder(FrameworkPromptBuilder):
             Note: Same task as Example 4, but now ARCHIVER_DATA IS present in the
             available data, so the value can be extracted.
 
+            Example 6 - Ordered writes (ordering groups):
+            Task: "Set correctors HCM01 and HCM02 to 1.5, then set the RF frequency to 499.6"
+            Available channels:
+              "horizontal correctors" → HCM01:CURRENT:SP
+              "horizontal correctors" → HCM02:CURRENT:SP
+              "RF frequency" → RF:FREQ:SP
+            Response:
+            {{
+                "write_operations": [
+                    {{"channel_address": "HCM01:CURRENT:SP", "value": 1.5, "group": 0}},
+                    {{"channel_address": "HCM02:CURRENT:SP", "value": 1.5, "group": 0}},
+                    {{"channel_address": "RF:FREQ:SP", "value": 499.6, "group": 1}}
+                ]
+            }}
+            Note: Writes in the same group run in parallel; group 1 starts only after
+            every group 0 write has completed.
+
             CRITICAL RULES:
             - NEVER compute, calculate, or guess values. Only use values that are
               either stated literally in the task ("set X to 5") or present in the
@@ -157,6 +174,8 @@ class DefaultChannelWritePromptBuilder(FrameworkPromptBuilder):
             - All values must be numeric (float or int)
             - Extract units if mentioned in task (optional)
             - Add notes about value source if helpful (optional)
+            - Use "group" only when the task implies an order ("then", "after", "first");
+              otherwise leave every operation in group 0
 
             IMPORTANT: Always use the exact channel address from the right side of the → mapping.
 
@@ -22,6 +22,10 @@ class DefaultClassificationPromptBuilder(FrameworkPromptBuilder):
     +---------------------------------+----------------------------------------------+
     | Change dynamic context assembly | ``build_dynamic_context(...)``               |
     +---------------------------------+----------------------------------------------+
+    | Change batched-mode output      | ``get_batch_instructions()``                 |
+    +---------------------------------+----------------------------------------------+
+    | Change batched-mode assembly    | ``build_batch_prompt(...)``                  |
+    +---------------------------------+----------------------------------------------+
     """
 
     PROMPT_TYPE = "classification"
@@ -108,3 +112,54 @@ class DefaultClassificationPromptBuilder(FrameworkPromptBuilder):
         self.debug_print_prompt(final_prompt)
 
         return final_prompt
+
+    def get_batch_instructions(self) -> str:
+        """Get the output instructions for batched classification."""
+        return textwrap.dedent(
+            """
+            Assess EACH capability listed below independently. Based on each capability's instructions and examples, you must output a JSON object with a key "decisions": a list containing exactly one entry per capability, each with:
+            - "capability": the exact capability name as given in its heading
+            - "is_match": a boolean (true or false) indicating if the user's request matches the capability
+            - "certain": false if the request is ambiguous for this capability, otherwise true
+
+            Respond ONLY with the JSON object. Do not provide any explanation, preamble, or additional text.
+            """
+        ).strip()
+
+    def build_batch_prompt(
+        self,
+        capabilities: list[tuple[str, str, str]],
+        context: dict | None = None,
+        previous_failure: str | None = None,
+        **kwargs,
+    ) -> str:
+        """Get system instructions for classifying several capabilities in one request.
+
+        :param capabilities: ``(name, instructions, examples)`` for each capability to assess
+        :param context: Optional previous execution context
+        :param previous_failure: Failure reason when reclassifying
+        :return: Complete batched classification prompt
+        """
+        sections = [
+            self.get_role(),
+            "Your goal is to determine which of several capabilities a user's request requires.",
+            self.get_batch_instructions(),
+        ]
+
+        for name, capability_instructions, classifier_examples in capabilities:
+            capability_section = f"### Capability: {name}\n{capability_instructions}"
+            if classifier_examples:
+                capability_section += f"\n\nExamples:\n{classifier_examples}"
+            sections.append(capability_section)
+
+        if context:
+            sections.append(f"Previous execution context:\n{json.dumps(context, indent=4)}")
+
+        if previous_failure:
+            sections.append(f"Previous approach failed: {previous_failure}")
+
+        final_prompt = "\n\n".join(sections)
+
+        self.debug_print_prompt(final_prompt)
+
+        return final_prompt
@@ -7,7 +7,7 @@ from langchain_core.messages import BaseMessage
 
 from osprey.base import BaseCapability, OrchestratorExample
 from osprey.context import ContextManager
-from osprey.prompts.base import FrameworkPromptBuilder
+from osprey.prompts.base import FrameworkPromptBuilder, PromptParts
 from osprey.state import ChatHistoryFormatter
 
 
@@ -168,57 +168,81 @@ class DefaultOrchestratorPromptBuilder(FrameworkPromptBuilder):
         Returns:
             Complete orchestrator prompt text
         """
+        final_prompt = self.build_planning_prompt_parts(
+            active_capabilities=active_capabilities,
+            context_manager=context_manager,
+            task_depends_on_chat_history=task_depends_on_chat_history,
+            task_depends_on_user_memory=task_depends_on_user_memory,
+            error_context=error_context,
+            messages=messages,
+        ).text
+
+        # Debug: Print prompt if enabled (same as base class)
+        self.debug_print_prompt(final_prompt)
+
+        return final_prompt
+
+    def build_planning_prompt_parts(
+        self,
+        active_capabilities: list[BaseCapability] = None,
+        context_manager: ContextManager = None,
+        task_depends_on_chat_history: bool = False,
+        task_depends_on_user_memory: bool = False,
+        error_context: str | None = None,
+        messages: list[BaseMessage] | None = None,
+        **kwargs,
+    ) -> PromptParts:
+        """Build the plan-first prompt as a cacheable prefix and a per-turn suffix.
+
+        The static prefix holds the base orchestrator prompt and the capability
+        sections, which only change with the set of active capabilities. Chat
+        history, context reuse guidance, error context and available context data
+        change every turn and form the dynamic suffix. Accepts the same arguments
+        as :meth:`get_planning_instructions`.
+
+        Returns:
+            PromptParts whose ``text`` is the complete orchestrator prompt
+        """
         if not active_capabilities:
             active_capabilities = []
 
-        # Build the main prompt sections
-        prompt_sections = []
-
-        # 1. Add base orchestrator prompt (role, task, step format, planning strategy)
-        base_prompt_parts = [
+        # Static prefix: base orchestrator prompt (role, task, step format, planning
+        # strategy) followed by capability-specific prompts with examples
+        static_sections = [
             self.get_role(),
             self.get_task(),
             self.get_step_format(),
             self.get_planning_strategy(),
         ]
-        base_prompt = "\n\n".join(base_prompt_parts)
-        prompt_sections.append(base_prompt)
+        static_sections.extend(self.build_capability_sections(active_capabilities))
 
-        # 2. Add chat history first (with visual separators) if task depends on conversation context
+        dynamic_sections = []
+
+        # 1. Add chat history first (with visual separators) if task depends on conversation context
         if task_depends_on_chat_history and messages:
             chat_history_section = self.build_chat_history_section(messages)
             if chat_history_section:
-                prompt_sections.append(chat_history_section)
+                dynamic_sections.append(chat_history_section)
 
-        # 3. Add context reuse guidance if task builds on previous context
+        # 2. Add context reuse guidance if task builds on previous context
         context_guidance = self.build_context_reuse_guidance(
             task_depends_on_chat_history, task_depends_on_user_memory
         )
         if context_guidance:
-            prompt_sections.append(context_guidance)
+            dynamic_sections.append(context_guidance)
 
-        # 4. Add error context for replanning if available
+        # 3. Add error context for replanning if available
         if error_context:
             error_section = self.build_error_context_section(error_context)
-            prompt_sections.append(error_section)
+            dynamic_sections.append(error_section)
 
-        # 5. Add context information if available
+        # 4. Add context information if available
         if context_manager and context_manager.get_raw_data():
             context_section = self.build_context_section(context_manager)
             if context_section:
-                prompt_sections.append(context_section)
-
-        # 6. Add capability-specific prompts with examples
-        capability_sections = self.build_capability_sections(active_capabilities)
-        prompt_sections.extend(capability_sections)
-
-        # Combine all sections
-        final_prompt = "\n\n".join(prompt_sections)
+                dynamic_sections.append(context_section)
 
-        # Debug: Print prompt if enabled (same as base class)
-        self.debug_print_prompt(final_prompt)
-
-        return final_prompt
+        return PromptParts("\n\n".join(static_sections), "\n\n".join(dynamic_sections))
 
     def get_system_instructions(self, **kwargs) -> str:
         """Deprecated: use ``get_planning_instructions()`` instead.
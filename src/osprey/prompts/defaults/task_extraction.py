@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 from osprey.base import BaseExample
 from osprey.state import ChatHistoryFormatter, MessageUtils, UserMemories
 
-from ..base import FrameworkPromptBuilder
+from ..base import FrameworkPromptBuilder, PromptParts
 
 
 @dataclass
@@ -402,34 +402,48 @@ Core requirements:
         :param retrieval_result: Optional data retrieval result
         :return: Complete prompt for task extraction
         """
-        sections = []
+        final_prompt = self.build_prompt_parts(messages, retrieval_result).text
+
+        # Debug: Print prompt if enabled
+        self.debug_print_prompt(final_prompt)
+
+        return final_prompt
+
+    def build_prompt_parts(self, messages: list[BaseMessage], retrieval_result=None) -> PromptParts:
+        """Build the task extraction prompt as a cacheable prefix and a per-turn suffix.
+
+        Role, guidelines and examples are identical for every request; chat history,
+        retrieved data and user memory form the dynamic suffix.
+
+        :param messages: Native LangGraph messages to extract task from
+        :param retrieval_result: Optional data retrieval result
+        :return: PromptParts whose ``text`` is the complete prompt
+        """
+        static_sections = []
 
         # 1. Role definition (overridable)
-        sections.append(self.get_role())
+        static_sections.append(self.get_role())
 
         # 2. Instructions (overridable)
-        sections.append(f"## Guidelines:\n{self.get_instructions()}")
+        static_sections.append(f"## Guidelines:\n{self.get_instructions()}")
 
         # 3. Examples
         examples_text = self.build_examples_section()
-        sections.append(f"## Examples:\n{examples_text}")
+        static_sections.append(f"## Examples:\n{examples_text}")
 
         # 4. Chat history
         chat_formatted = self.build_chat_history_section(messages)
-        sections.append(f"## Current Chat History:\n{chat_formatted}")
+        dynamic_sections = [f"## Current Chat History:\n{chat_formatted}"]
 
         # 5. Data source context
         data_context = self.build_data_source_section(retrieval_result)
         if data_context:
-            sections.append(data_context)
+            dynamic_sections.append(data_context)
 
         # 6. User memory placeholder + final instruction
-        sections.append("## User Memory:\nNo stored memories")
-        sections.append("Now extract the task from the provided chat history and user memory.")
-
-        final_prompt = "\n\n".join(sections)
-
-        # Debug: Print prompt if enabled
-        self.debug_print_prompt(final_prompt)
+        dynamic_sections.append("## User Memory:\nNo stored memories")
+        dynamic_sections.append(
+            "Now extract the task from the provided chat history and user memory."
+        )
 
-        return final_prompt
+        return PromptParts("\n\n".join(static_sections), "\n\n".join(dynamic_sections))
@@ -5,7 +5,7 @@ to control systems. It's designed to be used in generated Python code and
 automatically configures itself from execution context.
 
 Usage in generated code:
-    >>> from osprey.runtime import write_channel, read_channel
+    >>> from osprey.runtime import write_channel, read_channel, read_channels
     >>>
     >>> # Write to control system (synchronous, like EPICS caput)
     >>> write_channel("BEAM:CURRENT", 500.0)
@@ -13,6 +13,9 @@ Usage in generated code:
     >>> # Read from control system (synchronous, like EPICS caget)
     >>> value = read_channel("BEAM:CURRENT")
     >>> print(f"Current: {value}")
+    >>>
+    >>> # Read many channels in one bulk request
+    >>> values = read_channels(["BEAM:CURRENT", "BEAM:ENERGY"])
 
 Configuration:
     The runtime automatically uses the control system configuration that was
@@ -28,10 +31,21 @@ Limits Validation:
        net in subprocess execution where the connector may not be fully configured.
     2. Connector-level: The control system connector validates writes against its
        own configured limits database as a secondary check.
+
+Event Loop:
+    All synchronous functions run on one background event loop thread owned by
+    this module. The runtime connector is created on that loop and stays bound
+    to it, so each call costs a hand-off to the loop thread rather than a new
+    event loop, and connector state (PV caches, subscriptions) survives between
+    calls. The loop is started lazily and stopped at interpreter exit.
 """
 
 import asyncio
 import atexit
+import threading
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from osprey.utils.logger import get_logger
@@ -45,7 +59,10 @@ __all__ = [
     "configure_from_context",
     "write_channel",
     "read_channel",
+    "read_channels",
     "write_channels",
+    "monitor",
+    "ChannelMonitor",
     "cleanup_runtime",
 ]
 
@@ -57,6 +74,12 @@ _limits_validator: "LimitsValidator | None" = (
     None  # Injected by execution wrapper for subprocess safety
 )
 
+# Background event loop that owns the connector
+_runtime_loop: asyncio.AbstractEventLoop | None = None
+_runtime_loop_thread: threading.Thread | None = None
+_runtime_loop_lock = threading.Lock()
+_active_monitors: "set[ChannelMonitor]" = set()
+
 
 def configure_from_context(context) -> None:
     """Configure runtime environment from execution context.
@@ -114,15 +137,59 @@ def configure_from_context(context) -> None:
         ) from e
 
 
+def _run_loop_forever(loop: asyncio.AbstractEventLoop) -> None:
+    """Thread target for the runtime event loop."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def _ensure_runtime_loop() -> asyncio.AbstractEventLoop:
+    """Return the runtime event loop, starting its thread on first use."""
+    global _runtime_loop, _runtime_loop_thread
+
+    with _runtime_loop_lock:
+        if (
+            _runtime_loop is None
+            or _runtime_loop.is_closed()
+            or _runtime_loop_thread is None
+            or not _runtime_loop_thread.is_alive()
+        ):
+            _runtime_loop = asyncio.new_event_loop()
+            _runtime_loop_thread = threading.Thread(
+                target=_run_loop_forever,
+                args=(_runtime_loop,),
+                name="osprey-runtime-loop",
+                daemon=True,
+            )
+            _runtime_loop_thread.start()
+            logger.debug("Started runtime event loop thread")
+        return _runtime_loop
+
+
+def _on_runtime_loop() -> bool:
+    """True if the caller is running on the runtime loop thread."""
+    return _runtime_loop_thread is not None and threading.current_thread() is _runtime_loop_thread
+
+
 async def _get_connector():
     """Get or create connector using context config or global config.
 
     Internal function called by the runtime utilities.
-    Creates the connector once and reuses it for all operations.
+    Creates the connector once, on the runtime event loop, and reuses it for
+    all operations.
 
     Returns:
         ControlSystemConnector instance
     """
+    if not _on_runtime_loop():
+        # Create the connector on the runtime loop so it is bound to it (EPICS
+        # subscriptions, for example, schedule callbacks on the creating loop)
+        future = asyncio.run_coroutine_threadsafe(_get_connector(), _ensure_runtime_loop())
+        return await asyncio.wrap_future(future)
+
     global _runtime_connector
 
     async with _connector_lock:
@@ -184,29 +251,104 @@ async def _read_channel_async(channel_address: str, **kwargs) -> Any:
     return pv_value.value
 
 
-async def _write_channels_async(channel_values: dict[str, Any], **kwargs) -> None:
-    """Internal async implementation for writing multiple channels."""
-    for channel_address, value in channel_values.items():
-        await _write_channel_async(channel_address, value, **kwargs)
+async def _write_channels_async(
+    channel_values: dict[str, Any] | list[dict[str, Any]],
+    max_concurrent: int | None = None,
+    **kwargs,
+) -> None:
+    """Internal async implementation for writing multiple channels.
+
+    A dict is written as one group; a list of dicts is written group by group,
+    in order. Writes within a group run concurrently through the WriteScheduler.
+    """
+    from osprey.connectors.control_system.write_scheduler import ScheduledWrite, WriteScheduler
+
+    groups = [channel_values] if isinstance(channel_values, dict) else list(channel_values)
+    writes = [
+        ScheduledWrite(
+            channel_address,
+            value,
+            group=group_index,
+            verification_level=kwargs.get("verification_level"),
+            tolerance=kwargs.get("tolerance"),
+        )
+        for group_index, group in enumerate(groups)
+        for channel_address, value in group.items()
+    ]
+
+    # Safety net: validate every write before any hardware is touched
+    if _limits_validator is not None:
+        for write in writes:
+            _limits_validator.validate(write.channel_address, write.value)
+
+    connector = await _get_connector()
+    overrides: dict[str, Any] = {"timeout": kwargs.get("timeout")}
+    if max_concurrent is not None:
+        overrides["max_concurrent_writes"] = max_concurrent
+    scheduler = WriteScheduler.from_config(connector, **overrides)
+    outcome = await scheduler.execute(writes)
+
+    if outcome.exceptions:
+        # Re-raise the first underlying error (e.g. ChannelLimitsViolationError)
+        raise outcome.exceptions[min(outcome.exceptions)]
+
+    failures = [r for r in outcome.results if not r.success]
+    if failures:
+        details = "; ".join(f"{r.channel_address}: {r.error_message}" for r in failures[:5])
+        raise RuntimeError(f"{len(failures)} write(s) failed: {details}")
+
+    logger.debug(
+        f"Wrote {len(writes)} channel(s) in {outcome.groups_total} group(s) "
+        f"({outcome.elapsed_seconds:.3f}s)"
+    )
+
+
+async def _read_channels_async(channel_addresses: list[str], **kwargs) -> dict[str, Any]:
+    """Internal async implementation for reading multiple channels in one request."""
+    connector = await _get_connector()
+    addresses = list(dict.fromkeys(channel_addresses))
+
+    if hasattr(connector, "read_multiple_channels_detailed"):
+        bulk = await connector.read_multiple_channels_detailed(addresses, kwargs.get("timeout"))
+        values, errors = bulk.values, bulk.errors
+    else:
+        # Connectors without bulk support: read concurrently, one call per channel
+        results = await asyncio.gather(
+            *(connector.read_channel(address, **kwargs) for address in addresses),
+            return_exceptions=True,
+        )
+        values, errors = {}, {}
+        for address, result in zip(addresses, results, strict=True):
+            if isinstance(result, BaseException):
+                errors[address] = str(result)
+            else:
+                values[address] = result
+
+    missing = [address for address in addresses if address not in values]
+    if missing:
+        details = "; ".join(
+            f"{address}: {errors.get(address, 'Channel not returned by connector')}"
+            for address in missing[:5]
+        )
+        raise RuntimeError(f"Failed to read {len(missing)} channel(s): {details}")
+
+    return {address: values[address].value for address in channel_addresses}
 
 
 def _run_async(coro) -> Any:
-    """Run async coroutine synchronously.
+    """Run async coroutine synchronously on the runtime event loop.
 
-    Handles both subprocess and Jupyter notebook contexts correctly.
+    Works the same in subprocesses and Jupyter notebooks: the calling thread
+    blocks while the coroutine runs on the background loop thread.
     """
-    try:
-        # Try to get running loop (e.g., in Jupyter with nest_asyncio)
-        asyncio.get_running_loop()
-        # If we have a running loop, we need to run in a new thread
-        import concurrent.futures
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    except RuntimeError:
-        # No running loop - we're in a subprocess, use asyncio.run()
-        return asyncio.run(coro)
+    if _on_runtime_loop():
+        coro.close()
+        raise RuntimeError(
+            "Synchronous osprey.runtime functions cannot be called from the runtime "
+            "event loop (e.g. inside a monitor() callback)"
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, _ensure_runtime_loop())
+    return future.result()
 
 
 # ========================================================
@@ -270,19 +412,58 @@ def read_channel(channel_address: str, **kwargs) -> Any:
     return _run_async(_read_channel_async(channel_address, **kwargs))
 
 
-def write_channels(channel_values: dict[str, Any], **kwargs) -> None:
+def read_channels(channel_addresses: list[str], **kwargs) -> dict[str, Any]:
+    """Read values from multiple channels in one bulk request.
+
+    Prefer this over calling ``read_channel()`` in a loop: the connector reads
+    all channels together (e.g. EPICS connects every PV up front and waits once).
+
+    Synchronous function - no 'await' needed. Works like EPICS caget_many().
+
+    Args:
+        channel_addresses: Channel/PV names to read
+        **kwargs: Additional arguments passed to connector
+                  - timeout: Operation timeout in seconds
+
+    Returns:
+        Dictionary mapping each channel name to its current value, in request order
+
+    Raises:
+        RuntimeError: If any channel cannot be read (lists the failing channels)
+
+    Examples:
+        >>> from osprey.runtime import read_channels
+        >>> values = read_channels(["BPM01:X", "BPM02:X", "BPM03:X"])
+        >>> print(values["BPM01:X"])
+    """
+    if not channel_addresses:
+        return {}
+    return _run_async(_read_channels_async(list(channel_addresses), **kwargs))
+
+
+def write_channels(
+    channel_values: dict[str, Any] | list[dict[str, Any]],
+    max_concurrent: int | None = None,
+    **kwargs,
+) -> None:
     """Write multiple channels.
 
-    Convenience function for writing multiple channels. Writes are performed
-    sequentially but all use the same connector.
+    Writes in the same group are independent and run concurrently (up to
+    ``max_concurrent``, default from ``control_system.write_scheduling``).
+    Pass a list of dicts to impose an order: each dict is a group that starts
+    only after the previous group has finished successfully.
 
     Synchronous function - no 'await' needed.
 
     Args:
-        channel_values: Dictionary mapping channel names to values
+        channel_values: Dictionary mapping channel names to values, or a list of
+            such dictionaries written group by group
+        max_concurrent: Maximum concurrent writes within a group
         **kwargs: Additional arguments passed to each write
 
     Raises:
+        ChannelLimitsViolationError: If any value violates channel safety limits
+            (checked for all writes before any write is sent)
         RuntimeError: If any write operation fails
 
     Examples:
@@ -292,22 +473,141 @@ def write_channels(channel_values: dict[str, Any], **kwargs) -> None:
         ...     "MAGNET:H02": 5.2,
         ...     "MAGNET:H03": 4.8
         ... })
+        >>>
+        >>> # All correctors in parallel, then the RF setpoint
+        >>> write_channels([
+        ...     {"MAGNET:H01": 5.0, "MAGNET:H02": 5.2},
+        ...     {"RF:FREQ:SP": 499.65},
+        ... ])
     """
-    _run_async(_write_channels_async(channel_values, **kwargs))
+    _run_async(_write_channels_async(channel_values, max_concurrent=max_concurrent, **kwargs))
 
 
-async def cleanup_runtime() -> None:
-    """Cleanup runtime resources.
+class ChannelMonitor:
+    """Live subscription to a channel, created by :func:`monitor`.
 
-    Disconnects connector and releases resources. Called automatically
-    at end of execution, but can be called manually if needed.
+    Updates are recorded as ``(timestamp, value)`` pairs (oldest first, up to
+    ``max_samples``) and optionally passed to a callback. Callbacks run on the
+    runtime event loop thread, so they must not call the synchronous runtime
+    functions. Call ``stop()`` or use the monitor as a context manager when done.
+    """
 
-    This is particularly useful for long-running notebook sessions to
-    ensure connections don't become stale.
+    def __init__(
+        self,
+        channel_address: str,
+        callback: Callable[[Any], None] | None = None,
+        max_samples: int = 10000,
+    ):
+        self.channel_address = channel_address
+        self._callback = callback
+        self._samples: deque[tuple[datetime, Any]] = deque(maxlen=max_samples)
+        self._samples_lock = threading.Lock()
+        self._subscription_id: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """True while the subscription is open."""
+        return self._subscription_id is not None
+
+    @property
+    def values(self) -> list[tuple[datetime, Any]]:
+        """Recorded ``(timestamp, value)`` updates, oldest first."""
+        with self._samples_lock:
+            return list(self._samples)
+
+    @property
+    def latest(self) -> Any:
+        """Most recent value, or None if no update has arrived yet."""
+        with self._samples_lock:
+            return self._samples[-1][1] if self._samples else None
+
+    def _on_update(self, channel_value) -> None:
+        """Connector callback (runs on the runtime event loop)."""
+        with self._samples_lock:
+            self._samples.append((channel_value.timestamp, channel_value.value))
+        if self._callback is not None:
+            try:
+                self._callback(channel_value.value)
+            except Exception as e:
+                logger.warning(f"Monitor callback for {self.channel_address} failed: {e}")
+
+    async def _start_async(self) -> None:
+        connector = await _get_connector()
+        self._subscription_id = await connector.subscribe(self.channel_address, self._on_update)
+        _active_monitors.add(self)
+
+    async def _stop_async(self) -> None:
+        subscription_id, self._subscription_id = self._subscription_id, None
+        _active_monitors.discard(self)
+        if subscription_id is not None and _runtime_connector is not None:
+            await _runtime_connector.unsubscribe(subscription_id)
+
+    def stop(self) -> None:
+        """Close the subscription. Recorded values remain available."""
+        if self._subscription_id is not None:
+            _run_async(self._stop_async())
+
+    def __enter__(self) -> "ChannelMonitor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def monitor(
+    channel_address: str,
+    duration: float | None = None,
+    callback: Callable[[Any], None] | None = None,
+    max_samples: int = 10000,
+) -> ChannelMonitor:
+    """Subscribe to value changes on a channel.
+
+    Synchronous function - no 'await' needed. Works like EPICS camonitor().
+
+    Args:
+        channel_address: Channel/PV name to monitor
+        duration: If given, block for this many seconds, then stop the monitor
+            and return it with the recorded values. If None, return immediately
+            with the monitor running in the background.
+        callback: Optional function called with each new value. Runs on the
+            runtime event loop thread - keep it short and do not call
+            read_channel()/write_channel() from it.
+        max_samples: Maximum number of updates kept in ``ChannelMonitor.values``
+
+    Returns:
+        ChannelMonitor handle
+
+    Examples:
+        >>> from osprey.runtime import monitor
+        >>> samples = monitor("BEAM:CURRENT", duration=10.0).values
+        >>>
+        >>> with monitor("BEAM:CURRENT") as mon:
+        ...     write_channel("MAGNET:H01", 5.0)
+        ...     time.sleep(2.0)
+        >>> print(mon.latest)
     """
+    channel_monitor = ChannelMonitor(channel_address, callback=callback, max_samples=max_samples)
+    _run_async(channel_monitor._start_async())
+
+    if duration is not None:
+        try:
+            threading.Event().wait(duration)
+        finally:
+            channel_monitor.stop()
+
+    return channel_monitor
+
+
+async def _cleanup_connector() -> None:
+    """Disconnect the runtime connector (runs on the runtime event loop)."""
     global _runtime_connector
 
     async with _connector_lock:
+        # Disconnecting drops the connector's subscriptions
+        for channel_monitor in list(_active_monitors):
+            channel_monitor._subscription_id = None
+        _active_monitors.clear()
+
         if _runtime_connector is not None:
             try:
                 # Check if connector has cleanup method
@@ -322,14 +622,54 @@ async def cleanup_runtime() -> None:
                 _runtime_connector = None
 
 
+async def cleanup_runtime() -> None:
+    """Cleanup runtime resources.
+
+    Disconnects connector and releases resources. Called automatically
+    at end of execution, but can be called manually if needed.
+
+    This is particularly useful for long-running notebook sessions to
+    ensure connections don't become stale.
+
+    The disconnect runs on the runtime event loop the connector is bound to,
+    whichever loop awaits this function. The loop thread itself keeps running
+    and a new connector is created on the next call.
+    """
+    loop = _runtime_loop
+    if loop is not None and loop.is_running() and not _on_runtime_loop():
+        future = asyncio.run_coroutine_threadsafe(_cleanup_connector(), loop)
+        await asyncio.wrap_future(future)
+    else:
+        await _cleanup_connector()
+
+
+def _shutdown_runtime_loop(timeout: float = 5.0) -> None:
+    """Stop the runtime event loop thread."""
+    global _runtime_loop, _runtime_loop_thread
+
+    with _runtime_loop_lock:
+        loop, thread = _runtime_loop, _runtime_loop_thread
+        _runtime_loop, _runtime_loop_thread = None, None
+
+    if loop is not None and loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout)
+
+
 # Register cleanup on module exit
 def _cleanup_on_exit() -> None:
     """Synchronous cleanup for atexit handler."""
     if _runtime_connector is not None:
         try:
-            asyncio.run(cleanup_runtime())
+            loop = _runtime_loop
+            if loop is not None and loop.is_running():
+                asyncio.run_coroutine_threadsafe(_cleanup_connector(), loop).result(timeout=5.0)
+            else:
+                asyncio.run(cleanup_runtime())
         except Exception:
             pass  # Best effort cleanup
+    _shutdown_runtime_loop()
 
 
 atexit.register(_cleanup_on_exit)
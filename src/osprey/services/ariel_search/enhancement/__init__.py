@@ -9,6 +9,10 @@ from osprey.services.ariel_search.enhancement.factory import (
     create_enhancers_from_config,
     get_enhancer_names,
 )
+from osprey.services.ariel_search.enhancement.runner import (
+    enhance_entries,
+    enhancement_batch_size,
+)
 from osprey.services.ariel_search.enhancement.semantic_processor import (
     SemanticProcessorMigration,
 )
@@ -21,5 +25,7 @@ __all__ = [
     "SemanticProcessorMigration",
     "TextEmbeddingMigration",
     "create_enhancers_from_config",
+    "enhance_entries",
+    "enhancement_batch_size",
     "get_enhancer_names",
 ]
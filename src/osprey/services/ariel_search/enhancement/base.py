@@ -68,6 +68,40 @@ class BaseEnhancementModule(ABC):
         3. Store results to appropriate table/column
         """
 
+    @property
+    def batch_size(self) -> int:
+        """Return how many entries this module prefers per :meth:`enhance_batch` call.
+
+        Returns:
+            Preferred batch size (1 for modules that gain nothing from batching)
+        """
+        return 1
+
+    async def enhance_batch(
+        self,
+        entries: "list[EnhancedLogbookEntry]",
+        conn: "AsyncConnection",
+    ) -> "dict[str, Exception]":
+        """Enhance several entries and store results.
+
+        The default enhances one entry at a time. Override in modules that can
+        share work across entries (e.g. one embedding request per batch).
+
+        Args:
+            entries: The entries to enhance
+            conn: Database connection from pool
+
+        Returns:
+            Errors of the entries that failed, keyed by entry ID
+        """
+        failures: dict[str, Exception] = {}
+        for entry in entries:
+            try:
+                await self.enhance(entry, conn)
+            except Exception as e:
+                failures[entry["entry_id"]] = e
+        return failures
+
     async def health_check(self) -> tuple[bool, str]:
         """Check if module is ready.
 
@@ -0,0 +1,66 @@
+"""ARIEL enhancement runner.
+
+Runs enhancement modules over batches of ingested entries and records the
+per-entry outcome in the repository.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from psycopg import AsyncConnection
+
+    from osprey.services.ariel_search.database.repository import ARIELRepository
+    from osprey.services.ariel_search.enhancement.base import BaseEnhancementModule
+    from osprey.services.ariel_search.models import EnhancedLogbookEntry
+
+
+def enhancement_batch_size(enhancers: list[BaseEnhancementModule]) -> int:
+    """Return how many entries to collect before running the enhancers.
+
+    Args:
+        enhancers: Enabled enhancement modules
+
+    Returns:
+        Largest preferred batch size of the modules (1 without modules)
+    """
+    return max((enhancer.batch_size for enhancer in enhancers), default=1)
+
+
+async def enhance_entries(
+    enhancers: list[BaseEnhancementModule],
+    entries: list[EnhancedLogbookEntry],
+    conn: AsyncConnection,
+    repository: ARIELRepository,
+) -> tuple[int, int]:
+    """Run each enhancer over a batch of entries and mark every entry's outcome.
+
+    Args:
+        enhancers: Enhancement modules, in execution order
+        entries: Entries already stored in the repository
+        conn: Database connection from pool
+        repository: Repository to record enhancement status in
+
+    Returns:
+        Tuple of (applied, failed) enhancement counts
+    """
+    applied = 0
+    failed = 0
+    for enhancer in enhancers:
+        try:
+            failures = await enhancer.enhance_batch(entries, conn)
+        except Exception as e:
+            failures = {entry["entry_id"]: e for entry in entries}
+
+        for entry in entries:
+            error = failures.get(entry["entry_id"])
+            if error is None:
+                await repository.mark_enhancement_complete(entry["entry_id"], enhancer.name)
+                applied += 1
+            else:
+                await repository.mark_enhancement_failed(
+                    entry["entry_id"], enhancer.name, str(error)
+                )
+                failed += 1
+    return applied, failed
@@ -32,6 +32,8 @@ class TextEmbeddingModule(BaseEnhancementModule):
 
     Supports multiple embedding models, each with its own dedicated table.
     The provider name references api.providers for api_key and base_url.
+    Entries are embedded in batches of ``batch_size`` texts per request
+    (default: the provider's ``max_batch_size``).
     """
 
     def __init__(self) -> None:
@@ -41,12 +43,18 @@ class TextEmbeddingModule(BaseEnhancementModule):
         self._provider_name: str = "ollama"
         self._resolved_provider_config: dict[str, Any] = {}
         self._tables_exist: bool | None = None  # Cached result of table existence check
+        self._batch_size: int | None = None
 
     @property
     def name(self) -> str:
         """Return module identifier."""
         return "text_embedding"
 
+    @property
+    def batch_size(self) -> int:
+        """Return the number of entries embedded per request."""
+        return self._batch_size or self._get_provider().max_batch_size
+
     @property
     def migration(self) -> type[BaseMigration]:
         """Return migration class for this module."""
@@ -57,10 +65,11 @@ class TextEmbeddingModule(BaseEnhancementModule):
 
         Args:
             config: The enhancement_modules.text_embedding config dict
-                   containing 'provider' (provider name string or inline config dict)
-                   and 'models' list.
+                   containing 'provider' (provider name string or inline config dict),
+                   'models' list and optional 'batch_size'.
         """
         self._models = config.get("models", [])
+        self._batch_size = config.get("batch_size")
         provider_config = config.get("provider", "ollama")
 
         # Handle both provider name (string) and inline config (dict)
@@ -140,62 +149,89 @@ class TextEmbeddingModule(BaseEnhancementModule):
     ) -> None:
         """Generate embeddings for entry and store in database.
 
-        Lazy-loads the embedding provider on first call.
-        Truncates text to model's max input tokens to prevent API failures.
-
         Args:
             entry: The entry to enhance
             conn: Database connection from pool
         """
+        await self.enhance_batch([entry], conn)
+
+    async def enhance_batch(
+        self,
+        entries: list[EnhancedLogbookEntry],
+        conn: AsyncConnection,
+    ) -> dict[str, Exception]:
+        """Generate embeddings for several entries and store them in database.
+
+        Lazy-loads the embedding provider on first call. Each model embeds all
+        entries with one ``aembed_texts`` call, which sends ``batch_size`` texts
+        per request. Truncates text to model's max input tokens to prevent API
+        failures. Embedding failures are logged, not raised.
+
+        Args:
+            entries: The entries to enhance
+            conn: Database connection from pool
+
+        Returns:
+            Always empty; missing embeddings are logged instead
+        """
         if not self._models:
             logger.warning("No embedding models configured, skipping text embedding")
-            return
+            return {}
 
         if not await self._check_tables_exist(conn):
-            return
+            return {}
 
-        provider = self._get_provider()
-        raw_text = entry.get("raw_text", "")
+        pending = []
+        for entry in entries:
+            if entry.get("raw_text", "").strip():
+                pending.append(entry)
+            else:
+                logger.debug(f"Skipping empty entry {entry.get('entry_id')}")
+        if not pending:
+            return {}
 
-        if not raw_text.strip():
-            logger.debug(f"Skipping empty entry {entry.get('entry_id')}")
-            return
+        provider = self._get_provider()
+        base_url = self._resolved_provider_config.get(
+            "base_url",
+            provider.default_base_url,
+        )
+        api_key = self._resolved_provider_config.get("api_key")
 
         for model_config in self._models:
-            try:
-                model_name = model_config["name"]
-
-                max_tokens = model_config.get("max_input_tokens") or 8192
-                max_chars = max_tokens * CHARS_PER_TOKEN
-                text = raw_text[:max_chars]
+            model_name = model_config.get("name")
+            max_tokens = model_config.get("max_input_tokens") or 8192
+            max_chars = max_tokens * CHARS_PER_TOKEN
 
-                base_url = self._resolved_provider_config.get(
-                    "base_url",
-                    provider.default_base_url,
-                )
-                api_key = self._resolved_provider_config.get("api_key")
-
-                embeddings = provider.execute_embedding(
-                    texts=[text],
+            try:
+                embeddings = await provider.aembed_texts(
+                    texts=[entry["raw_text"][:max_chars] for entry in pending],
                     model_id=model_name,
                     base_url=base_url,
+                    batch_size=self.batch_size,
                     api_key=api_key,
                 )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to generate embeddings for {len(pending)} entries "
+                    f"with model {model_name}: {e}"
+                )
+                continue
 
-                if embeddings and len(embeddings) > 0:
+            for entry, embedding in zip(pending, embeddings, strict=True):
+                try:
                     await self._store_embedding(
                         entry_id=entry["entry_id"],
                         model_name=model_name,
-                        embedding=embeddings[0],
+                        embedding=embedding,
                         conn=conn,
                     )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to store embedding for entry {entry.get('entry_id')} "
+                        f"with model {model_name}: {e}"
+                    )
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to generate embedding for entry {entry.get('entry_id')} "
-                    f"with model {model_config.get('name')}: {e}"
-                )
-                continue
+        return {}
 
     async def _store_embedding(
         self,
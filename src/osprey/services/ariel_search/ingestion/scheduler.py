@@ -18,6 +18,8 @@ from osprey.utils.logger import get_logger
 if TYPE_CHECKING:
     from osprey.services.ariel_search.config import ARIELConfig
     from osprey.services.ariel_search.database.repository import ARIELRepository
+    from osprey.services.ariel_search.enhancement.base import BaseEnhancementModule
+    from osprey.services.ariel_search.models import EnhancedLogbookEntry
 
 logger = get_logger("ariel.scheduler")
 
@@ -120,7 +122,10 @@ class IngestionScheduler:
         Returns:
             IngestionPollResult with counts and timing
         """
-        from osprey.services.ariel_search.enhancement import create_enhancers_from_config
+        from osprey.services.ariel_search.enhancement import (
+            create_enhancers_from_config,
+            enhancement_batch_size,
+        )
         from osprey.services.ariel_search.ingestion import get_adapter
 
         start_time = time.monotonic()
@@ -166,32 +171,25 @@ class IngestionScheduler:
 
         entries_added = 0
         entries_failed = 0
+        batch_size = enhancement_batch_size(enhancers)
+        batch = []
 
         try:
             async for entry in adapter.fetch_entries(since=since):
                 try:
                     await self.repository.upsert_entry(entry)
                     entries_added += 1
-
-                    for enhancer in enhancers:
-                        try:
-                            async with self.repository.pool.connection() as conn:
-                                await enhancer.enhance(entry, conn)
-                            await self.repository.mark_enhancement_complete(
-                                entry["entry_id"],
-                                enhancer.name,
-                            )
-                        except Exception as e:
-                            await self.repository.mark_enhancement_failed(
-                                entry["entry_id"],
-                                enhancer.name,
-                                str(e),
-                            )
-                            entries_failed += 1
+                    batch.append(entry)
                 except Exception:
                     entries_failed += 1
                     logger.exception("Failed to process entry")
 
+                if len(batch) >= batch_size:
+                    entries_failed += await self._enhance_batch(enhancers, batch)
+                    batch = []
+            if batch:
+                entries_failed += await self._enhance_batch(enhancers, batch)
+
             await self.repository.complete_ingestion_run(
                 run_id,
                 entries_added=entries_added,
@@ -210,6 +208,28 @@ class IngestionScheduler:
             since=since,
         )
 
+    async def _enhance_batch(
+        self,
+        enhancers: list[BaseEnhancementModule],
+        entries: list[EnhancedLogbookEntry],
+    ) -> int:
+        """Run the enhancers over stored entries.
+
+        Returns:
+            Number of failed enhancements
+        """
+        from osprey.services.ariel_search.enhancement import enhance_entries
+
+        if not enhancers:
+            return 0
+        try:
+            async with self.repository.pool.connection() as conn:
+                _, failed = await enhance_entries(enhancers, entries, conn, self.repository)
+            return failed
+        except Exception:
+            logger.exception("Failed to enhance entries")
+            return len(entries)
+
     async def stop(self) -> None:
         """Signal the scheduler to stop after the current poll cycle."""
         self._stop_event.set()
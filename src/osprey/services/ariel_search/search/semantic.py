@@ -5,6 +5,7 @@ This module provides embedding-based similarity search using pgvector.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -105,7 +106,9 @@ async def semantic_search(
     api_key = provider_config.get("api_key")
 
     try:
-        embeddings = embedder.execute_embedding(
+        # Run off the event loop; the provider caches its resolved endpoint
+        embeddings = await asyncio.to_thread(
+            embedder.execute_embedding,
             texts=[query],
             model_id=model_name,
             base_url=base_url,
@@ -33,13 +33,21 @@ LegacyChannelDatabase = FlatChannelDatabase
 from .pipelines.in_context import InContextPipeline
 
 # Service (high-level interface)
-from .service import ChannelFinderService
+from .service import (
+    ChannelFinderService,
+    clear_channel_finder_service_cache,
+    get_channel_finder_service,
+    refresh_channel_finder_services,
+)
 
 __version__ = "2.0.0"
 
 __all__ = [
     # Service (high-level interface)
     "ChannelFinderService",
+    "get_channel_finder_service",
+    "refresh_channel_finder_services",
+    "clear_channel_finder_service_cache",
     # Pipelines
     "InContextPipeline",
     # Database classes
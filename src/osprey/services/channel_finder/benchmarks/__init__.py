@@ -17,7 +17,14 @@ Usage:
     await runner.run_all_enabled_benchmarks()
 """
 
-from .models import BenchmarkResults, QueryBenchmarkEntry, QueryEvaluation, QueryRunResult
+from .models import (
+    BenchmarkResults,
+    QueryBenchmarkEntry,
+    QueryEvaluation,
+    QueryRunResult,
+    RetrievalRecallResult,
+)
+from .retrieval import evaluate_retrieval_recall
 from .runner import BenchmarkRunner
 
 __all__ = [
@@ -26,6 +33,8 @@ __all__ = [
     "QueryEvaluation",
     "BenchmarkResults",
     "BenchmarkRunner",
+    "RetrievalRecallResult",
+    "evaluate_retrieval_recall",
 ]
 
 __version__ = "1.0.0"
@@ -93,3 +93,19 @@ class BenchmarkResults:
     # Summary statistics
     avg_consistency_score: float
     avg_execution_time: float
+
+
+@dataclass
+class RetrievalRecallResult:
+    """Recall of the pre-retrieval stage (no LLM calls) on a benchmark dataset."""
+
+    top_k: int
+    total_queries: int
+    expected_pvs: int
+    retrieved_pvs: int  # Expected PVs found among the top-K candidates
+    recall: float
+    perfect_queries: int  # Queries with all expected PVs retrieved
+    avg_latency_ms: float
+
+    # Query index -> expected PVs that were not retrieved
+    missed: dict[int, list[str]]
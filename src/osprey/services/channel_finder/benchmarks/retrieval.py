@@ -0,0 +1,66 @@
+"""
+Recall benchmark for the channel finder pre-retrieval index.
+
+Measures how many expected PVs of a benchmark dataset are among the top-K
+candidates selected by :class:`ChannelRetrievalIndex`. Runs without any LLM
+calls, so it is a cheap way to choose ``retrieval.top_k`` for a database:
+channels missed here can never be found by the LLM stages.
+"""
+
+import time
+
+from ..core.retrieval import ChannelRetrievalIndex
+from .models import QueryBenchmarkEntry, RetrievalRecallResult
+
+
+def evaluate_retrieval_recall(
+    index: ChannelRetrievalIndex, entries: list[QueryBenchmarkEntry], top_k: int = 40
+) -> RetrievalRecallResult:
+    """Evaluate recall@K of the retrieval index on benchmark entries.
+
+    Expected PVs are matched against both channel names and addresses, since
+    datasets list addresses while in-context databases are keyed by name.
+
+    Args:
+        index: Retrieval index over the channel database
+        entries: Benchmark entries (query and expected PVs)
+        top_k: Number of candidates retrieved per query
+
+    Returns:
+        RetrievalRecallResult with aggregate recall and missed PVs per query
+    """
+    expected_total = 0
+    retrieved_total = 0
+    perfect = 0
+    missed: dict[int, list[str]] = {}
+    elapsed = 0.0
+
+    for i, entry in enumerate(entries):
+        start = time.perf_counter()
+        hits = index.search(entry.user_query, top_k)
+        elapsed += time.perf_counter() - start
+
+        candidates = set()
+        for hit in hits:
+            candidates.add(hit.channel["channel"])
+            if hit.channel.get("address"):
+                candidates.add(hit.channel["address"])
+
+        not_found = [pv for pv in entry.targeted_pv if pv not in candidates]
+        expected_total += len(entry.targeted_pv)
+        retrieved_total += len(entry.targeted_pv) - len(not_found)
+        if not_found:
+            missed[i] = not_found
+        else:
+            perfect += 1
+
+    return RetrievalRecallResult(
+        top_k=top_k,
+        total_queries=len(entries),
+        expected_pvs=expected_total,
+        retrieved_pvs=retrieved_total,
+        recall=retrieved_total / expected_total if expected_total else 1.0,
+        perfect_queries=perfect,
+        avg_latency_ms=1000 * elapsed / len(entries) if entries else 0.0,
+        missed=missed,
+    )
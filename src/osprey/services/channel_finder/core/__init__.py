@@ -22,6 +22,7 @@ from .models import (
     ChannelMatchOutput,
     QuerySplitterOutput,
 )
+from .retrieval import ChannelRetrievalIndex, RetrievalHit
 
 __all__ = [
     # Exceptions
@@ -40,4 +41,7 @@ __all__ = [
     "ChannelCorrectionOutput",
     "ChannelInfo",
     "ChannelFinderResult",
+    # Retrieval
+    "ChannelRetrievalIndex",
+    "RetrievalHit",
 ]
@@ -2,7 +2,6 @@
 Abstract base class for all channel finder pipelines.
 """
 
-import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any
@@ -79,7 +78,7 @@ class BasePipeline(ABC):
             ExplicitChannelDetectionOutput with detected addresses and search decision
         """
         # Import here to avoid circular dependency
-        from ..llm import get_chat_completion
+        from ..llm import aget_chat_completion
         from ..prompts import explicit_detection
 
         # Get prompt from prompts module
@@ -96,8 +95,7 @@ class BasePipeline(ABC):
         )
 
         # Get LLM response
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=prompt,
             model_config=self.model_config,
             output_model=ExplicitChannelDetectionOutput,
@@ -79,3 +79,7 @@ class ChannelFinderResult(BaseModel):
     channels: list[ChannelInfo] = Field(description="Found channels with addresses")
     total_channels: int = Field(description="Total number of unique channels found")
     processing_notes: str = Field(description="Notes about query processing and results")
+    timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall-clock seconds per pipeline stage (e.g. query_split, total), if recorded",
+    )
@@ -0,0 +1,388 @@
+"""
+Pre-retrieval index for channel databases.
+
+Selects a small set of candidate channels per query before any LLM stage, so the
+prompt size of the in-context pipeline stays flat as the database grows.
+
+Two retrievers are combined:
+- BM25 over an inverted index of channel names and descriptions (always available)
+- Optional embedding similarity, with vectors persisted next to the database JSON
+
+When both are available their rankings are merged with reciprocal rank fusion.
+Channel embeddings are computed in a background thread, so queries never wait on
+embedding the database; until the vectors are ready, or while the embedding
+provider is unavailable, retrieval uses BM25 only and retries after a backoff.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from heapq import nlargest
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no information for channel lookup
+STOPWORDS = frozenset(
+    """
+    a all an and any are at be by can do does for from get give how i in is it its
+    me my now of on or please show the their there these this to what whats which
+    with you
+    """.split()
+)
+
+# Splits "SteeringCoil01XSetPoint" / "IP41Pressure" / "beam_current" into words
+_WORD_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+# Rank offset of reciprocal rank fusion (standard value from the literature)
+_RRF_K = 60
+
+# Backoff before retrying an unavailable embedding provider (doubles per failure)
+EMBEDDING_RETRY_SECONDS = 30.0
+EMBEDDING_MAX_RETRY_SECONDS = 600.0
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized search terms.
+
+    CamelCase and PascalCase names are split into words, numbers lose leading
+    zeros (``01`` matches ``1``), plural ``s`` is stripped and stopwords are dropped.
+
+    Args:
+        text: Channel name, description or query
+
+    Returns:
+        List of lowercase terms
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(text or ""):
+        word = word.lower()
+        if word.isdigit():
+            word = word.lstrip("0") or "0"
+        elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        if word not in STOPWORDS:
+            terms.append(word)
+    return terms
+
+
+def channel_text(channel: dict) -> str:
+    """Text of a channel used for embedding (name and description)."""
+    description = channel.get("description") or ""
+    return f"{channel['channel']}: {description}" if description else channel["channel"]
+
+
+def default_embedding_cache_path(db_path: str | Path) -> Path:
+    """Embedding cache file stored next to a database JSON file."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.embeddings.npz")
+
+
+@dataclass
+class RetrievalHit:
+    """A candidate channel selected by the retrieval index."""
+
+    channel: dict
+    score: float
+
+
+class ChannelRetrievalIndex:
+    """BM25 inverted index over channel names and descriptions, with optional embeddings."""
+
+    def __init__(
+        self,
+        channels: list[dict],
+        k1: float = 1.2,
+        b: float = 0.75,
+        name_weight: int = 2,
+        embedder=None,
+        embedding_model: str | None = None,
+        embedding_base_url: str | None = None,
+        embedding_cache_path: str | Path | None = None,
+        embedding_retry_seconds: float = EMBEDDING_RETRY_SECONDS,
+    ):
+        """
+        Build the inverted index.
+
+        Args:
+            channels: Channel dictionaries (``channel`` and optional ``description``)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            name_weight: How many times channel name terms count relative to description terms
+            embedder: Optional embedding provider (``BaseEmbeddingProvider``); enables
+                hybrid retrieval once embeddings are loaded
+            embedding_model: Embedding model ID (defaults to the provider default)
+            embedding_base_url: Embedding endpoint (defaults to the provider default)
+            embedding_cache_path: File to persist channel vectors in (not persisted if None)
+            embedding_retry_seconds: Initial backoff after the embedding provider fails
+        """
+        self.channels = channels
+        self.k1 = k1
+        self.b = b
+
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.doc_lengths: list[int] = []
+        for doc_id, channel in enumerate(channels):
+            terms = tokenize(channel["channel"]) * name_weight
+            terms += tokenize(channel.get("description") or "")
+            self.doc_lengths.append(len(terms))
+            for term, freq in Counter(terms).items():
+                self.postings.setdefault(term, []).append((doc_id, freq))
+
+        self.avg_doc_length = (sum(self.doc_lengths) / len(channels)) if channels else 0.0
+        self.idf = {
+            term: math.log(1 + (len(channels) - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+        self.embedder = embedder
+        self.embedding_model = embedding_model
+        self.embedding_base_url = embedding_base_url
+        self.embedding_cache_path = Path(embedding_cache_path) if embedding_cache_path else None
+        self.embedding_retry_seconds = embedding_retry_seconds
+        self._vectors: np.ndarray | None = None
+        self._embedding_lock = threading.Lock()
+        self._embedding_build: threading.Thread | None = None
+        self._embedding_failures = 0
+        self._embedding_retry_at = 0.0
+
+    @classmethod
+    def from_database(cls, database, **kwargs) -> "ChannelRetrievalIndex":
+        """Build an index over all channels of a database.
+
+        Args:
+            database: Any database implementing ``get_all_channels()``
+            **kwargs: Passed to the constructor
+
+        Returns:
+            ChannelRetrievalIndex over the database channels
+        """
+        return cls(database.get_all_channels(), **kwargs)
+
+    @property
+    def has_embeddings(self) -> bool:
+        """Whether channel embedding vectors are loaded."""
+        return self._vectors is not None
+
+    def bm25_scores(self, query: str) -> dict[int, float]:
+        """Score all channels sharing at least one term with the query.
+
+        Args:
+            query: Natural language query
+
+        Returns:
+            Mapping of channel position to BM25 score
+        """
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, freq in self.postings[term]:
+                norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1) / (
+                    freq + self.k1 * norm
+                )
+        return scores
+
+    def search(
+        self, query: str, top_k: int = 40, query_vector: list[float] | None = None
+    ) -> list[RetrievalHit]:
+        """Select the top-K candidate channels for a query.
+
+        Args:
+            query: Natural language (atomic) query
+            top_k: Maximum number of candidates
+            query_vector: Query embedding; combined with BM25 when channel
+                embeddings are loaded
+
+        Returns:
+            Candidates ordered by decreasing score (ties keep database order)
+        """
+        scores = self.bm25_scores(query)
+
+        if query_vector is not None and self._vectors is not None:
+            scores = self._fuse(scores, self._similarities(query_vector), top_k)
+
+        best = nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [RetrievalHit(channel=self.channels[doc_id], score=score) for doc_id, score in best]
+
+    async def asearch(self, query: str, top_k: int = 40) -> list[RetrievalHit]:
+        """Select candidates, using embeddings when an embedder is configured.
+
+        Uses BM25 only while channel embeddings are not loaded (starting their
+        background build if none is running) and while the embedding provider is
+        backing off after a failure.
+
+        Args:
+            query: Natural language (atomic) query
+            top_k: Maximum number of candidates
+
+        Returns:
+            Candidates ordered by decreasing score
+        """
+        query_vector = None
+        if self.embedder is not None:
+            if self._vectors is None:
+                self.start_embedding_build()
+            elif time.monotonic() >= self._embedding_retry_at:
+                try:
+                    query_vector = await self.embedder.aembed_text(
+                        query, model_id=self.embedding_model, base_url=self.embedding_base_url
+                    )
+                    self._embedding_failures = 0
+                except Exception as e:
+                    self._embeddings_unavailable(e)
+        return self.search(query, top_k, query_vector)
+
+    def start_embedding_build(self) -> bool:
+        """Compute channel embeddings in a background thread.
+
+        Does nothing if the embeddings are loaded, a build is running or the
+        embedding provider is backing off after a failure.
+
+        Returns:
+            Whether a build was started
+        """
+        if self.embedder is None or self._vectors is not None:
+            return False
+        with self._embedding_lock:
+            if self._embedding_build is not None and self._embedding_build.is_alive():
+                return False
+            if time.monotonic() < self._embedding_retry_at:
+                return False
+            self._embedding_build = threading.Thread(
+                target=self._build_embeddings, name="channel-embeddings", daemon=True
+            )
+            self._embedding_build.start()
+        return True
+
+    def _build_embeddings(self) -> None:
+        """Background thread target: embed the channels with the sync provider API."""
+        try:
+            model, hashes, cached, missing = self._embedding_plan()
+            if missing:
+                texts = [channel_text(self.channels[i]) for i in missing]
+                vectors = self.embedder.embed_texts(
+                    texts, model_id=model, base_url=self.embedding_base_url
+                )
+                cached.update(
+                    {hashes[i]: vector for i, vector in zip(missing, vectors, strict=True)}
+                )
+            self._set_vectors(model, hashes, cached, bool(missing))
+            logger.info(f"Channel embeddings ready for {len(hashes)} channel(s)")
+        except Exception as e:
+            self._embeddings_unavailable(e)
+
+    def _embeddings_unavailable(self, error: Exception) -> None:
+        with self._embedding_lock:
+            self._embedding_failures += 1
+            delay = min(
+                self.embedding_retry_seconds * 2 ** (self._embedding_failures - 1),
+                EMBEDDING_MAX_RETRY_SECONDS,
+            )
+            self._embedding_retry_at = time.monotonic() + delay
+        logger.warning(
+            f"Embedding retrieval unavailable, using BM25 only (retry in {delay:.0f}s): {error}"
+        )
+
+    async def load_embeddings(self) -> int:
+        """Load channel embeddings, computing only those missing from the cache file.
+
+        Vectors are keyed by a hash of the embedded text, so edited channels are
+        re-embedded and removed channels are dropped on the next save.
+
+        Returns:
+            Number of channels that had to be embedded
+        """
+        if self._vectors is not None:
+            return 0
+        if self.embedder is None:
+            raise ValueError("No embedding provider configured for the retrieval index")
+
+        model, hashes, cached, missing = self._embedding_plan()
+        if missing:
+            vectors = await self.embedder.aembed_texts(
+                [channel_text(self.channels[i]) for i in missing],
+                model_id=model,
+                base_url=self.embedding_base_url,
+            )
+            cached.update({hashes[i]: vector for i, vector in zip(missing, vectors, strict=True)})
+
+        self._set_vectors(model, hashes, cached, bool(missing))
+        return len(missing)
+
+    def _embedding_plan(self) -> tuple[str, list[str], dict[str, Any], list[int]]:
+        """Return model, text hashes, cached vectors and positions still to embed."""
+        model = self.embedding_model or self.embedder.default_model_id
+        hashes = [
+            hashlib.sha1(channel_text(ch).encode("utf-8")).hexdigest()[:16] for ch in self.channels
+        ]
+        cached = self._read_cache(model)
+        missing = [i for i, h in enumerate(hashes) if h not in cached]
+        if missing:
+            logger.info(f"Embedding {len(missing)} of {len(hashes)} channel(s) for retrieval...")
+        return model, hashes, cached, missing
+
+    def _set_vectors(
+        self, model: str, hashes: list[str], cached: dict[str, Any], changed: bool
+    ) -> None:
+        matrix = np.asarray([cached[h] for h in hashes], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._vectors = matrix / np.where(norms == 0, 1, norms)
+        self._embedding_failures = 0
+        self._embedding_retry_at = 0.0
+
+        if changed:
+            self._write_cache(model, hashes, matrix)
+
+    def _read_cache(self, model: str) -> dict[str, Any]:
+        if not self.embedding_cache_path or not self.embedding_cache_path.exists():
+            return {}
+        try:
+            with np.load(self.embedding_cache_path, allow_pickle=False) as data:
+                if str(data["model"]) != model:
+                    return {}
+                return dict(zip(data["hashes"].tolist(), data["vectors"], strict=True))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache {self.embedding_cache_path}: {e}")
+            return {}
+
+    def _write_cache(self, model: str, hashes: list[str], matrix: np.ndarray):
+        if not self.embedding_cache_path:
+            return
+        try:
+            # np.savez appends ".npz" unless the name already ends with it
+            with open(self.embedding_cache_path, "wb") as f:
+                np.savez_compressed(
+                    f, model=np.str_(model), hashes=np.array(hashes), vectors=matrix
+                )
+            logger.debug(f"Saved channel embeddings to {self.embedding_cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not save embedding cache {self.embedding_cache_path}: {e}")
+
+    def _similarities(self, query_vector: list[float]) -> np.ndarray:
+        vector = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return self._vectors @ (vector / norm if norm else vector)
+
+    @staticmethod
+    def _fuse(bm25: dict[int, float], similarities: np.ndarray, top_k: int) -> dict[int, float]:
+        """Merge BM25 and embedding rankings with reciprocal rank fusion."""
+        depth = min(len(similarities), max(top_k * 4, 100))
+        nearest = np.argsort(-similarities, kind="stable")[:depth]
+        lexical = sorted(bm25, key=lambda doc_id: (-bm25[doc_id], doc_id))[:depth]
+
+        fused: dict[int, float] = {}
+        for ranking in (lexical, nearest.tolist()):
+            for rank, doc_id in enumerate(ranking):
+                fused[doc_id] = fused.get(doc_id, 0.0) + 1 / (_RRF_K + rank + 1)
+        return fused
@@ -13,6 +13,8 @@ import logging
 from typing import Any
 
 from ..core.base_database import BaseDatabase
+from ..core.exceptions import DatabaseLoadError
+from .hierarchical_snapshot import ChannelSnapshot, default_snapshot_path
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +28,64 @@ class HierarchicalChannelDatabase(BaseDatabase):
     - Instance levels (numbered/patterned expansions)
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, use_snapshot: bool = True):
         """
         Initialize hierarchical database.
 
         Args:
             db_path: Path to hierarchical database JSON file
+            use_snapshot: Load from a compiled snapshot next to the JSON when it is
+                up to date (see ``osprey channel-finder compile``)
         """
+        self.use_snapshot = use_snapshot
+        self.snapshot_path = None
         super().__init__(db_path)
 
     def load_database(self):
+        """Load hierarchical database, from its compiled snapshot if one is current."""
+        if self.use_snapshot and self._load_snapshot():
+            return
+        self._load_json()
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load the expanded database from a compiled snapshot.
+
+        Returns:
+            True if loaded, False if no current snapshot exists (load the JSON instead)
+        """
+        snapshot_path = default_snapshot_path(self.db_path)
+        if not snapshot_path.is_file():
+            return False
+
+        try:
+            snapshot = ChannelSnapshot(snapshot_path)
+        except DatabaseLoadError as e:
+            logger.warning(f"{e}; loading {self.db_path} instead")
+            return False
+
+        if not snapshot.matches_source(self.db_path):
+            logger.warning(
+                f"Snapshot {snapshot_path} is out of date, loading {self.db_path} instead. "
+                "Run 'osprey channel-finder compile' to refresh it."
+            )
+            return False
+
+        metadata = snapshot.metadata
+        self.tree = metadata["tree"]
+        self.hierarchy_levels = metadata["hierarchy_levels"]
+        self.naming_pattern = metadata["naming_pattern"]
+        self.hierarchy_config = metadata["hierarchy_config"]
+        self.default_separators = {
+            (level, next_level): separator
+            for level, next_level, separator in metadata["default_separators"]
+        }
+        self.channel_map = snapshot.channel_map
+        self.snapshot_path = snapshot_path
+        logger.debug(f"Loaded {len(self.channel_map)} channels from snapshot {snapshot_path}")
+        return True
+
+    def _load_json(self):
         """Load hierarchical database from JSON with flexible configuration."""
         import warnings
 
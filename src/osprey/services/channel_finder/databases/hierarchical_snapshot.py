@@ -0,0 +1,295 @@
+"""
+Compiled Snapshots of Hierarchical Channel Databases
+
+Expanding a large hierarchical tree into its channel map dominates database load
+time and memory. A snapshot stores the expanded, validated result in a compact
+binary file next to the database JSON, which stays the source of truth:
+
+- Path segments are interned in a string pool; each channel stores one index per
+  hierarchy level instead of a dict of strings
+- Channel names live in one UTF-8 blob with an offset table, plus a sorted index
+  for binary-search lookup
+- The tree and hierarchy definition (whose size does not grow with instance
+  expansions) are kept for navigation
+
+Snapshots are memory-mapped, so loading does not read or copy the channel table.
+A snapshot is only used while the size, modification time or content hash of its
+source JSON still match.
+
+File layout::
+
+    MAGIC (8 bytes) | header length (uint64) | JSON header | 8-byte aligned arrays
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import ItemsView, Iterator, Mapping, ValuesView
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..core.exceptions import DatabaseLoadError
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OSPRCFS\x01"
+SNAPSHOT_VERSION = 1
+
+_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+
+def default_snapshot_path(db_path: str | Path) -> Path:
+    """Snapshot file stored next to a database JSON file."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.snapshot")
+
+
+def _file_sha1(path: str | Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenate strings into a UTF-8 blob with an offset table."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def compile_snapshot(database, output_path: str | Path | None = None) -> Path:
+    """
+    Write a snapshot of a loaded hierarchical database.
+
+    Args:
+        database: HierarchicalChannelDatabase loaded from its JSON file
+        output_path: Snapshot file (default: ``<database>.snapshot`` next to the JSON)
+
+    Returns:
+        Path of the written snapshot
+    """
+    source = Path(database.db_path)
+    output_path = Path(output_path) if output_path else default_snapshot_path(source)
+    levels = list(database.hierarchy_levels)
+
+    # Intern path segments; -1 marks levels absent from a channel's path
+    pool: dict[str, int] = {}
+    names = list(database.channel_map)
+    paths = np.full((len(names), len(levels)), -1, dtype=np.int32)
+    for row, name in enumerate(names):
+        path = database.channel_map[name].get("path", {})
+        for col, level in enumerate(levels):
+            if level in path:
+                paths[row, col] = pool.setdefault(path[level], len(pool))
+
+    name_blob, name_offsets = _pack_strings(names)
+    string_blob, string_offsets = _pack_strings(list(pool))
+    sorted_index = np.array(
+        sorted(range(len(names)), key=lambda i: names[i].encode("utf-8")), dtype=np.int32
+    )
+    arrays = {
+        "name_blob": name_blob,
+        "name_offsets": name_offsets,
+        "string_blob": string_blob,
+        "string_offsets": string_offsets,
+        "paths": paths,
+        "sorted_index": sorted_index,
+    }
+
+    stat = source.stat()
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": _file_sha1(source)},
+        "channel_count": len(names),
+        "metadata": {
+            "tree": database.tree,
+            "hierarchy_levels": levels,
+            "naming_pattern": database.naming_pattern,
+            "hierarchy_config": database.hierarchy_config,
+            "default_separators": [
+                [a, b, sep] for (a, b), sep in database.default_separators.items()
+            ],
+        },
+        "arrays": {},
+    }
+
+    # Array offsets are relative to the (aligned) end of the header
+    offset = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + _LENGTH.size + len(header_bytes)) % _ALIGNMENT)
+
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for array in arrays.values():
+            data = np.ascontiguousarray(array).tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % _ALIGNMENT))
+    # Atomic replace so running processes never map a half-written file
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Compiled {len(names)} channels into snapshot {output_path}")
+    return output_path
+
+
+class ChannelSnapshot:
+    """Memory-mapped snapshot of an expanded hierarchical database."""
+
+    def __init__(self, path: str | Path):
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Snapshot file written by :func:`compile_snapshot`
+
+        Raises:
+            DatabaseLoadError: If the file is not a readable snapshot of this version
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mmap[: len(MAGIC)] != MAGIC:
+                raise ValueError("not a channel database snapshot")
+            (header_length,) = _LENGTH.unpack_from(self._mmap, len(MAGIC))
+            header_start = len(MAGIC) + _LENGTH.size
+            header = json.loads(self._mmap[header_start : header_start + header_length])
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {header.get('version')}")
+
+            data_start = header_start + header_length
+            arrays = {}
+            for name, spec in header["arrays"].items():
+                dtype = np.dtype(spec["dtype"])
+                count = int(np.prod(spec["shape"]))
+                arrays[name] = np.frombuffer(
+                    self._mmap, dtype=dtype, count=count, offset=data_start + spec["offset"]
+                ).reshape(spec["shape"])
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            raise DatabaseLoadError(f"Invalid channel database snapshot {self.path}: {e}") from e
+
+        self.source = header["source"]
+        self.metadata = header["metadata"]
+        self.channel_map = SnapshotChannelMap(arrays, self.metadata["hierarchy_levels"])
+
+    def matches_source(self, db_path: str | Path) -> bool:
+        """Return whether the snapshot was compiled from the current database file.
+
+        Only a ``stat`` is needed while the modification time is unchanged;
+        otherwise the content hash decides.
+        """
+        try:
+            stat = os.stat(db_path)
+        except OSError:
+            return False
+        if stat.st_size != self.source["size"]:
+            return False
+        if stat.st_mtime_ns == self.source["mtime_ns"]:
+            return True
+        return _file_sha1(db_path) == self.source["sha1"]
+
+
+class SnapshotChannelMap(Mapping):
+    """Read-only channel map backed by snapshot arrays.
+
+    Behaves like the ``{name: {"channel": name, "path": {...}}}`` dict built by
+    ``HierarchicalChannelDatabase._build_channel_map``; entries are created on access.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray], levels: list[str]):
+        # Memoryviews index to plain ints/bytes, much faster than numpy scalars
+        # in the per-lookup binary search
+        self._name_blob = arrays["name_blob"].data
+        self._name_offsets = arrays["name_offsets"].data
+        self._paths = arrays["paths"]
+        self._sorted_index = arrays["sorted_index"].data
+        self._levels = levels
+
+        # The string pool is small (unique path segments), decode it once
+        blob = arrays["string_blob"].tobytes()
+        offsets = arrays["string_offsets"].tolist()
+        self._strings = [
+            blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)
+        ]
+
+    def _name_bytes(self, index: int) -> bytes:
+        start, end = self._name_offsets[index], self._name_offsets[index + 1]
+        return bytes(self._name_blob[start:end])
+
+    def _find(self, name: str) -> int | None:
+        """Binary search the sorted name index."""
+        target = name.encode("utf-8")
+        low, high = 0, len(self._sorted_index)
+        while low < high:
+            mid = (low + high) // 2
+            if self._name_bytes(self._sorted_index[mid]) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self._sorted_index):
+            index = self._sorted_index[low]
+            if self._name_bytes(index) == target:
+                return index
+        return None
+
+    def _entry(self, index: int, name: str) -> dict[str, Any]:
+        path = {
+            level: self._strings[string_id]
+            for level, string_id in zip(self._levels, self._paths[index].tolist(), strict=True)
+            if string_id >= 0
+        }
+        return {"channel": name, "path": path}
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        index = self._find(name) if isinstance(name, str) else None
+        if index is None:
+            raise KeyError(name)
+        return self._entry(index, name)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self._name_bytes(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._name_offsets) - 1
+
+    def items(self):
+        return _SnapshotItemsView(self)
+
+    def values(self):
+        return _SnapshotValuesView(self)
+
+
+class _SnapshotItemsView(ItemsView):
+    # Iterate the table in order instead of looking up every name again
+    def __iter__(self):
+        for index, name in enumerate(self._mapping):
+            yield name, self._mapping._entry(index, name)
+
+
+class _SnapshotValuesView(ValuesView):
+    def __iter__(self):
+        for index, name in enumerate(self._mapping):
+            yield self._mapping._entry(index, name)
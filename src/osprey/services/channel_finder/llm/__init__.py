@@ -4,6 +4,6 @@ This module re-exports Osprey's completion interface for backward compatibility.
 New code should import directly from osprey.models.completion.
 """
 
-from osprey.models.completion import get_chat_completion
+from osprey.models.completion import aget_chat_completion, get_chat_completion
 
-__all__ = ["get_chat_completion"]
+__all__ = ["aget_chat_completion", "get_chat_completion"]
@@ -6,6 +6,7 @@ Iterative navigation through structured channel hierarchy.
 
 import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,7 +17,7 @@ from osprey.utils.config import get_config_builder
 from ...core.base_pipeline import BasePipeline
 from ...core.exceptions import HierarchicalNavigationError
 from ...core.models import ChannelFinderResult, ChannelInfo, QuerySplitterOutput
-from ...llm import get_chat_completion
+from ...llm import aget_chat_completion
 from ...utils.prompt_loader import load_prompts
 from .models import NOTHING_FOUND_MARKER, create_selection_model
 
@@ -78,6 +79,21 @@ def _save_prompt_to_file(prompt: str, stage: str, level: str = "", query: str =
     logger.debug(f"  [dim]Saved prompt to: {filepath}[/dim]")
 
 
+@dataclass
+class _NavigationBudget:
+    """Shared state of all navigation branches for one query.
+
+    Limits concurrent level-selection calls, memoizes selections by
+    (query, level, previous selections) and caps the total number of calls.
+    """
+
+    semaphore: asyncio.Semaphore
+    max_calls: int | None = None
+    calls: int = 0
+    skipped: int = 0  # Selections not made because the call budget was exhausted
+    memo: dict[tuple, asyncio.Task] = field(default_factory=dict)
+
+
 class HierarchicalPipeline(BasePipeline):
     """
     Hierarchical navigation pipeline.
@@ -93,6 +109,8 @@ class HierarchicalPipeline(BasePipeline):
         facility_name: str = "control system",
         facility_description: str = "",
         query_splitting: bool = True,
+        max_concurrency: int = 4,
+        max_llm_calls: int | None = 50,
         **kwargs,
     ):
         """
@@ -104,12 +122,17 @@ class HierarchicalPipeline(BasePipeline):
             facility_name: Name of facility
             facility_description: Facility description for context
             query_splitting: Whether to split multi-part queries (disable for facility-specific lingo)
+            max_concurrency: Maximum number of concurrent level-selection LLM calls
+            max_llm_calls: Maximum level-selection LLM calls per query (None for no limit);
+                branches still unexplored when the limit is reached are skipped
             **kwargs: Additional pipeline arguments
         """
         super().__init__(database, model_config, **kwargs)
         self.facility_name = facility_name
         self.facility_description = facility_description
         self.query_splitting = query_splitting
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_llm_calls = max_llm_calls
 
         # Load query splitter from shared prompts (only if query splitting is enabled)
         config_builder = get_config_builder()
@@ -211,9 +234,13 @@ class HierarchicalPipeline(BasePipeline):
                 "[bold cyan]Stage 1:[/bold cyan] Query splitting disabled, using original query"
             )
 
-        # Stage 2: Navigate hierarchy for each atomic query
-        all_channels = []
-        for i, atomic_query in enumerate(atomic_queries, 1):
+        # Stage 2: Navigate hierarchy for all atomic queries concurrently. All branches
+        # share one budget: a concurrency limit, a selection memo and an LLM call cap.
+        budget = _NavigationBudget(
+            semaphore=asyncio.Semaphore(self.max_concurrency), max_calls=self.max_llm_calls
+        )
+
+        async def navigate(i: int, atomic_query: str) -> list[str]:
             # For single query, keep it concise since we already know the task from capability logs
             if len(atomic_queries) == 1:
                 logger.info("[bold cyan]Stage 2:[/bold cyan] Navigating hierarchy...")
@@ -222,22 +249,37 @@ class HierarchicalPipeline(BasePipeline):
                     f"[bold cyan]Stage 2 - Query {i}/{len(atomic_queries)}:[/bold cyan] {atomic_query}"
                 )
             try:
-                channels = await self._navigate_hierarchy(atomic_query)
-                all_channels.extend(channels)
-                logger.info(f"  → Found {len(channels)} channel(s)")
+                channels = await self._navigate_hierarchy(atomic_query, budget)
+                logger.info(f"  → Found {len(channels)} channel(s) for query {i}")
+                return channels
             except HierarchicalNavigationError as e:
                 logger.warning(f"  [yellow]⚠[/yellow] Navigation failed: {e}")
-                continue
             except Exception as e:
                 logger.error(f"  [red]✗[/red] Error processing query: {e}")
-                continue
+            return []
+
+        results = await asyncio.gather(
+            *(navigate(i, atomic_query) for i, atomic_query in enumerate(atomic_queries, 1))
+        )
+        all_channels = [channel for channels in results for channel in channels]
 
-        # Merge explicit channels with search results and deduplicate
+        # Merge explicit channels with search results and deduplicate (keeping query order)
         all_channels.extend(explicit_channels)
-        unique_channels = list(set(all_channels))
+        unique_channels = list(dict.fromkeys(all_channels))
 
         # Build result (detailed display happens in capability layer)
-        return self._build_result(query, unique_channels)
+        result = self._build_result(query, unique_channels)
+        logger.info(f"  → {budget.calls} level selection call(s)")
+        if budget.skipped:
+            logger.warning(
+                f"  [yellow]⚠[/yellow] LLM call limit ({self.max_llm_calls}) reached - "
+                f"{budget.skipped} branch selection(s) skipped, results may be incomplete"
+            )
+            result.processing_notes += (
+                f" Navigation stopped after {budget.calls} LLM calls (limit {self.max_llm_calls});"
+                f" {budget.skipped} branch(es) were not explored, results may be incomplete."
+            )
+        return result
 
     async def _split_query(self, query: str) -> list[str]:
         """Split query into atomic sub-queries (reuse from in-context)."""
@@ -247,7 +289,7 @@ class HierarchicalPipeline(BasePipeline):
         # Save prompt for debugging
         _save_prompt_to_file(message, stage="query_split", query=query)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         from osprey.models import set_api_call_context
 
         set_api_call_context(
@@ -257,8 +299,7 @@ class HierarchicalPipeline(BasePipeline):
             extra={"stage": "query_split"},
         )
 
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=message,
             model_config=self.model_config,
             output_model=QuerySplitterOutput,
@@ -266,16 +307,26 @@ class HierarchicalPipeline(BasePipeline):
 
         return response.queries
 
-    async def _navigate_hierarchy(self, query: str) -> list[str]:
+    async def _navigate_hierarchy(
+        self, query: str, budget: _NavigationBudget | None = None
+    ) -> list[str]:
         """
         Navigate through hierarchy levels for a single atomic query.
 
         Uses recursive branching to handle multiple selections at system/family/field levels.
 
+        Args:
+            query: Atomic query
+            budget: Navigation budget shared with other queries (a new one if None)
+
         Returns:
             List of fully-qualified channel names
         """
         levels = self.database.get_hierarchy_definition()
+        if budget is None:
+            budget = _NavigationBudget(
+                semaphore=asyncio.Semaphore(self.max_concurrency), max_calls=self.max_llm_calls
+            )
 
         # Start recursive navigation from root
         all_channels = await self._navigate_recursive(
@@ -285,6 +336,7 @@ class HierarchicalPipeline(BasePipeline):
             branch_path=[],
             branch_num=1,
             total_branches=1,
+            budget=budget,
         )
 
         # Validate all channels exist
@@ -305,12 +357,14 @@ class HierarchicalPipeline(BasePipeline):
         branch_path: list[str],
         branch_num: int,
         total_branches: int,
+        budget: _NavigationBudget,
     ) -> list[str]:
         """
         Recursively navigate hierarchy with automatic branching.
 
         Branches occur when multiple selections are made at system/family/field levels.
         Devices don't cause branching as they're structurally identical within a family.
+        Sibling branches are explored concurrently; their results keep selection order.
 
         Args:
             query: Original user query
@@ -319,6 +373,7 @@ class HierarchicalPipeline(BasePipeline):
             branch_path: Human-readable path for this branch (for logging)
             branch_num: Current branch number (for visualization)
             total_branches: Total number of branches at this level (for visualization)
+            budget: Navigation budget shared by all branches of the query
 
         Returns:
             List of channel names found in this branch and all sub-branches
@@ -361,6 +416,7 @@ class HierarchicalPipeline(BasePipeline):
                     branch_path=branch_path,
                     branch_num=branch_num,
                     total_branches=total_branches,
+                    budget=budget,
                 )
             else:
                 # Required level has no options - this is an error
@@ -370,8 +426,14 @@ class HierarchicalPipeline(BasePipeline):
         logger.info(f"{indent}Level: {level}")
         logger.info(f"{indent}  Available options: {len(options)}")
 
-        # Make LLM selection
-        selected = await self._select_at_level(query, level, options, selections)
+        # Make LLM selection (memoized and within the call budget)
+        selected = await self._select_with_budget(query, level, options, selections, budget)
+
+        if selected is None:
+            logger.warning(
+                f"{indent}  [yellow]LLM call limit reached - skipping branch at level {level}[/yellow]"
+            )
+            return []
 
         if not selected:
             # OPTIONAL LEVEL HANDLING: If this is an optional level and NOTHING_FOUND was returned,
@@ -386,6 +448,7 @@ class HierarchicalPipeline(BasePipeline):
                     branch_path=branch_path,
                     branch_num=branch_num,
                     total_branches=total_branches,
+                    budget=budget,
                 )
             else:
                 logger.warning(f"{indent}  [yellow]No selection made at level {level}[/yellow]")
@@ -422,6 +485,7 @@ class HierarchicalPipeline(BasePipeline):
                             branch_path=branch_path,
                             branch_num=branch_num,
                             total_branches=total_branches,
+                            budget=budget,
                         )
 
         # Determine if we should branch based on level type
@@ -437,8 +501,7 @@ class HierarchicalPipeline(BasePipeline):
                 f"{indent}  [cyan]⚡ Branching:[/cyan] {num_branches} {level}(s) selected - exploring each separately"
             )
 
-            all_results = []
-            for i, single_selection in enumerate(selected, 1):
+            async def explore_branch(i: int, single_selection: str) -> list[str]:
                 # Create new branch path for visualization
                 new_branch_path = branch_path + [f"{level}={single_selection}"]
                 branch_path_str = " → ".join(new_branch_path)
@@ -448,6 +511,10 @@ class HierarchicalPipeline(BasePipeline):
                     f"{indent}  [bold cyan]Branch {i}/{num_branches}:[/bold cyan] {branch_path_str}"
                 )
 
+                branch_selections = selections.copy()
+                branch_levels = next_levels
+                branch_selections[level] = single_selection
+
                 # OPTIONAL LEVEL LEAF DETECTION IN BRANCHING:
                 # For each branch, check if the selection is a leaf node at an optional level.
                 # If so, skip the optional level and assign to next level instead.
@@ -464,51 +531,34 @@ class HierarchicalPipeline(BasePipeline):
                             logger.info(
                                 f"{indent}    [cyan]→ '{single_selection}' is a direct signal - skipping optional level '{level}'[/cyan]"
                             )
-                            # Create selections that skip this optional level
+                            # Create selections that skip this optional level, and skip
+                            # the next level too (since we just filled it)
                             branch_selections = selections.copy()
-                            next_level = next_levels[0]
-                            branch_selections[next_level] = single_selection
-
-                            # Navigate with next level skipped (since we just filled it)
-                            branch_results = await self._navigate_recursive(
-                                query=query,
-                                remaining_levels=next_levels[1:],
-                                selections=branch_selections,
-                                branch_path=new_branch_path,
-                                branch_num=i,
-                                total_branches=num_branches,
-                            )
-
-                            # Log branch completion
-                            logger.info(
-                                f"{indent}    [green]✓[/green] Branch {i}/{num_branches}: Found {len(branch_results)} channel(s)"
-                            )
-
-                            all_results.extend(branch_results)
-                            continue  # Skip normal branch processing
-
-                # Normal branch processing (not a leaf or not optional)
-                branch_selections = selections.copy()
-                branch_selections[level] = single_selection
+                            branch_selections[next_levels[0]] = single_selection
+                            branch_levels = next_levels[1:]
 
                 # Recursively navigate this branch
                 branch_results = await self._navigate_recursive(
                     query=query,
-                    remaining_levels=next_levels,
+                    remaining_levels=branch_levels,
                     selections=branch_selections,
                     branch_path=new_branch_path,
                     branch_num=i,
                     total_branches=num_branches,
+                    budget=budget,
                 )
 
                 # Log branch completion
                 logger.info(
                     f"{indent}    [green]✓[/green] Branch {i}/{num_branches}: Found {len(branch_results)} channel(s)"
                 )
+                return branch_results
 
-                all_results.extend(branch_results)
-
-            return all_results
+            # Explore sibling branches concurrently, keeping selection order in the results
+            branch_results = await asyncio.gather(
+                *(explore_branch(i, sel) for i, sel in enumerate(selected, 1))
+            )
+            return [channel for results in branch_results for channel in results]
 
         else:
             # NO BRANCHING: Single selection OR device level (homogeneous)
@@ -523,8 +573,60 @@ class HierarchicalPipeline(BasePipeline):
                 branch_path=branch_path,
                 branch_num=branch_num,
                 total_branches=total_branches,
+                budget=budget,
             )
 
+    async def _select_with_budget(
+        self,
+        query: str,
+        level: str,
+        options: list[dict],
+        previous_selections: dict,
+        budget: _NavigationBudget,
+    ) -> list[str] | None:
+        """
+        Select option(s) at a level, sharing identical selections within the query.
+
+        Selections are memoized by (query, level, previous selections), so identical
+        navigation steps reached through different branches or duplicate atomic
+        queries cost a single LLM call, even while the first call is still running.
+
+        Args:
+            query: Original atomic query
+            level: Current level name
+            options: Available options at this level
+            previous_selections: Selections made at previous levels
+            budget: Navigation budget shared by all branches of the query
+
+        Returns:
+            List of selected option names, or None if the LLM call limit was reached
+        """
+        key = (
+            query,
+            level,
+            tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in previous_selections.items()
+            ),
+        )
+        task = budget.memo.get(key)
+        if task is None:
+            if budget.max_calls is not None and budget.calls >= budget.max_calls:
+                budget.skipped += 1
+                return None
+            budget.calls += 1
+
+            async def select() -> list[str]:
+                async with budget.semaphore:
+                    return await self._select_at_level(query, level, options, previous_selections)
+
+            task = budget.memo[key] = asyncio.create_task(select())
+        else:
+            logger.debug(f"    [dim]Reusing selection at level {level}[/dim]")
+
+        # Copy so callers cannot alter the memoized selection
+        return list(await task)
+
     async def _select_at_level(
         self, query: str, level: str, options: list[dict], previous_selections: dict
     ) -> list[str]:
@@ -553,7 +655,7 @@ class HierarchicalPipeline(BasePipeline):
         # Save prompt for debugging
         _save_prompt_to_file(prompt, stage="level_selection", level=level, query=query)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         from osprey.models import set_api_call_context
 
         set_api_call_context(
@@ -564,8 +666,7 @@ class HierarchicalPipeline(BasePipeline):
         )
 
         # Get LLM response with dynamic model
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=prompt,
             model_config=self.model_config,
             output_model=SelectionModel,
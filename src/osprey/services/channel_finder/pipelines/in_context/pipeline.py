@@ -6,6 +6,8 @@ Implements the async multi-stage processing pipeline with chunking support.
 
 import asyncio
 import logging
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,7 +23,8 @@ from ...core.models import (
     ChannelMatchOutput,
     QuerySplitterOutput,
 )
-from ...llm import get_chat_completion
+from ...core.retrieval import ChannelRetrievalIndex
+from ...llm import aget_chat_completion
 from ...utils.prompt_loader import load_prompts
 
 logger = logging.getLogger(__name__)
@@ -92,6 +95,10 @@ class InContextPipeline(BasePipeline):
         max_correction_iterations: int = 2,
         facility_name: str = "control system",
         facility_description: str = "",
+        max_concurrency: int = 4,
+        expected_channels: int | None = None,
+        retrieval_index: ChannelRetrievalIndex | None = None,
+        retrieval_top_k: int = 40,
         **kwargs,
     ):
         """
@@ -105,6 +112,12 @@ class InContextPipeline(BasePipeline):
             max_correction_iterations: Maximum correction attempts for invalid channels
             facility_name: Name of the facility (e.g., "UCSB FEL", "ALS")
             facility_description: Optional facility context for better matching
+            max_concurrency: Maximum number of concurrent LLM calls for matching and correction
+            expected_channels: Stop searching further chunks once this many channels are found
+                (None searches all chunks)
+            retrieval_index: Optional pre-retrieval index; when set, each atomic query is
+                matched only against its top-K retrieved candidates instead of the database
+            retrieval_top_k: Number of candidate channels retrieved per atomic query
             **kwargs: Additional pipeline-specific arguments
         """
         super().__init__(database, model_config, **kwargs)
@@ -113,6 +126,10 @@ class InContextPipeline(BasePipeline):
         self.chunk_size = chunk_size
         self.facility_name = facility_name
         self.facility_description = facility_description
+        self.max_concurrency = max(1, max_concurrency)
+        self.expected_channels = expected_channels
+        self.retrieval_index = retrieval_index
+        self.retrieval_top_k = retrieval_top_k
 
         # Load prompts dynamically based on configuration
         config_builder = get_config_builder()
@@ -136,6 +153,8 @@ class InContextPipeline(BasePipeline):
             "total_channels": db_stats.get("total_channels", 0),
             "chunk_mode": self.chunk_dictionary,
             "chunk_size": self.chunk_size if self.chunk_dictionary else "N/A",
+            "max_concurrency": self.max_concurrency,
+            "retrieval_top_k": self.retrieval_top_k if self.retrieval_index else "N/A",
             "presentation_mode": getattr(self.database, "presentation_mode", "N/A"),
             "database_format": db_stats.get("format", "unknown"),
         }
@@ -143,11 +162,16 @@ class InContextPipeline(BasePipeline):
     async def process_query(self, query: str) -> ChannelFinderResult:
         """Execute the complete pipeline with chunking as outer loop.
 
+        Chunks are searched concurrently: every (chunk, atomic query) match and
+        every per-chunk correction is an LLM call scheduled under a shared
+        ``max_concurrency`` limit. Results are collected in chunk order, then
+        query order, so the output does not depend on which calls finish first.
+
         Args:
             query: Natural language query string
 
         Returns:
-            ChannelFinderResult with found channels and metadata
+            ChannelFinderResult with found channels, metadata and per-stage timings
         """
         logger.info(f"[cyan]Query:[/cyan] {query}")
 
@@ -157,9 +181,14 @@ class InContextPipeline(BasePipeline):
                 query=query, channels=[], total_channels=0, processing_notes="Empty query provided"
             )
 
+        timings: dict[str, float] = {}
+        query_start = time.perf_counter()
+
         # Stage 0: Check for explicit channel addresses (optimization)
         logger.info("[bold cyan]Pre-check:[/bold cyan] Detecting explicit channel addresses...")
+        stage_start = time.perf_counter()
         detection_result = await self._detect_explicit_channels(query)
+        timings["explicit_detection"] = time.perf_counter() - stage_start
 
         # Track explicit channels separately
         explicit_channels = []
@@ -184,7 +213,10 @@ class InContextPipeline(BasePipeline):
                     f"[green]✓[/green] Found {len(valid_channels)} channel(s) from explicit addresses "
                     f"(skipped semantic search)"
                 )
-                return self._build_result(query, valid_channels)
+                result = self._build_result(query, valid_channels)
+                timings["total"] = time.perf_counter() - query_start
+                result.timings = timings
+                return result
             elif valid_channels and detection_result.needs_additional_search:
                 # Have some explicit channels but need to search for more
                 logger.info(
@@ -201,47 +233,166 @@ class InContextPipeline(BasePipeline):
             logger.info("  → Proceeding with semantic search")
 
         # Stage 1: Split query into atomic queries
+        stage_start = time.perf_counter()
         atomic_queries = await self._split_query(query)
+        timings["query_split"] = time.perf_counter() - stage_start
         logger.info(
             f"[bold cyan]Stage 1:[/bold cyan] Split into {len(atomic_queries)} atomic quer{'y' if len(atomic_queries) == 1 else 'ies'}"
         )
         for i, aq in enumerate(atomic_queries, 1):
             logger.debug(f"  → Query {i}: {aq}")
 
-        # Prepare chunks (single chunk if not chunked mode)
-        if self.chunk_dictionary:
-            chunks = self.database.chunk_database(self.chunk_size)
+        # Prepare (queries, channels) work items: retrieved candidates per query,
+        # database chunks, or the full database as a single chunk
+        if self.retrieval_index is not None:
+            stage_start = time.perf_counter()
+            work = await self._retrieve_candidates(atomic_queries)
+            timings["retrieval"] = time.perf_counter() - stage_start
             logger.info(
-                f"[bold cyan]Stage 2:[/bold cyan] Chunked mode - {len(chunks)} chunks × {self.chunk_size} channels"
+                f"[bold cyan]Stage 2:[/bold cyan] Retrieval mode - top {self.retrieval_top_k} "
+                f"candidate(s) per query from {len(self.retrieval_index.channels)} channels"
+            )
+        elif self.chunk_dictionary:
+            work = self._scan_work(atomic_queries)
+            logger.info(
+                f"[bold cyan]Stage 2:[/bold cyan] Chunked mode - {len(work)} chunks × {self.chunk_size} channels"
             )
         else:
-            chunks = [self.database.get_all_channels()]  # Full DB as single chunk
+            work = self._scan_work(atomic_queries)  # Full DB as single chunk
             logger.info(
-                f"[bold cyan]Stage 2:[/bold cyan] Full database mode - {len(chunks[0])} channels"
+                f"[bold cyan]Stage 2:[/bold cyan] Full database mode - {len(work[0][1])} channels"
             )
 
-        # Process each chunk through complete pipeline
-        all_valid_channels = []
-        for chunk_idx, chunk in enumerate(chunks, 1):
-            logger.debug(f"  Processing chunk {chunk_idx}/{len(chunks)}...")
-            chunk_valid_channels = await self._process_chunk(atomic_queries, chunk, chunk_idx)
-            all_valid_channels.extend(chunk_valid_channels)
-            logger.debug(
-                f"  → Found {len(chunk_valid_channels)} valid channel(s) in chunk {chunk_idx}"
-            )
+        # Stages 2-3: Match and correct all chunks concurrently
+        stage_start = time.perf_counter()
+        chunk_results = await self._search_chunks(work)
+        timings["channel_search"] = time.perf_counter() - stage_start
 
         # Stage 4: Merge explicit channels with search results and aggregate
+        stage_start = time.perf_counter()
+        all_valid_channels = [ch for chunk_channels in chunk_results for ch in chunk_channels]
         all_valid_channels.extend(explicit_channels)
-        # Deduplicate in case explicit channels overlap with search results
-        all_valid_channels = list(set(all_valid_channels))
+        # Deduplicate (keeping first occurrence) in case explicit channels overlap with search results
+        all_valid_channels = list(dict.fromkeys(all_valid_channels))
 
         result = self._aggregate_results(query, all_valid_channels)
-        logger.info(f"[bold green]Result:[/bold green] {result.total_channels} channel(s) found")
+        if len(chunk_results) < len(work):
+            result.processing_notes += (
+                f" Stopped after {len(chunk_results)} of {len(work)} chunks "
+                f"(expected {self.expected_channels} channel(s))."
+            )
+        timings["aggregation"] = time.perf_counter() - stage_start
+        timings["total"] = time.perf_counter() - query_start
+        result.timings = timings
+        logger.info(
+            f"[bold green]Result:[/bold green] {result.total_channels} channel(s) found "
+            f"in {timings['total']:.2f}s"
+        )
 
         return result
 
+    async def _retrieve_candidates(
+        self, atomic_queries: list[str]
+    ) -> list[tuple[list[str], list[dict]]]:
+        """Select the top-K candidate channels for each atomic query.
+
+        Queries without any candidate (e.g. no shared BM25 terms while embeddings
+        are still being built) fall back to the chunked or full-database scan, so
+        retrieval never drops a query that the scan could have answered.
+
+        Args:
+            atomic_queries: List of atomic query strings
+
+        Returns:
+            One (query, candidates) work item per atomic query with candidates,
+            followed by scan work items for the queries without any
+        """
+        work = []
+        unmatched = []
+        for query in atomic_queries:
+            hits = await self.retrieval_index.asearch(query, self.retrieval_top_k)
+            logger.debug(f"  Retrieved {len(hits)} candidate(s) for: [dim]{query}[/dim]")
+            if hits:
+                work.append(([query], [hit.channel for hit in hits]))
+            else:
+                unmatched.append(query)
+
+        if unmatched:
+            logger.info(
+                f"  → No retrieval candidates for {len(unmatched)} quer"
+                f"{'y' if len(unmatched) == 1 else 'ies'}, scanning the database instead"
+            )
+            work.extend(self._scan_work(unmatched))
+        return work
+
+    def _scan_work(self, atomic_queries: list[str]) -> list[tuple[list[str], list[dict]]]:
+        """Build work items that match queries against database chunks or the full database."""
+        if self.chunk_dictionary:
+            chunks = self.database.chunk_database(self.chunk_size)
+        else:
+            chunks = [self.database.get_all_channels()]
+        return [(atomic_queries, chunk) for chunk in chunks]
+
+    async def _search_chunks(self, work: list[tuple[list[str], list[dict]]]) -> list[list[str]]:
+        """Process all chunks concurrently under the pipeline's concurrency limit.
+
+        Chunks are consumed in order as they complete. When ``expected_channels`` is
+        set, the search stops once the leading chunks have produced that many unique
+        channels and the remaining chunk tasks are cancelled. Only a contiguous run of
+        leading chunks is used, so early termination gives the same result regardless
+        of completion order.
+
+        Args:
+            work: (atomic queries, channel chunk) pairs to search
+
+        Returns:
+            Valid channel names per processed chunk, in chunk order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._process_chunk(queries, chunk, chunk_idx, semaphore))
+            for chunk_idx, (queries, chunk) in enumerate(work, 1)
+        ]
+
+        positions = {task: i for i, task in enumerate(tasks)}
+        completed: dict[int, list[str]] = {}
+        ordered: list[list[str]] = []
+        found: set[str] = set()
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    completed[positions[task]] = task.result()
+
+                # Advance through the contiguous prefix of finished chunks
+                while len(ordered) in completed:
+                    chunk_channels = completed[len(ordered)]
+                    ordered.append(chunk_channels)
+                    found.update(chunk_channels)
+                    logger.debug(
+                        f"  → Found {len(chunk_channels)} valid channel(s) in chunk {len(ordered)}"
+                    )
+
+                if self.expected_channels and len(found) >= self.expected_channels and pending:
+                    logger.info(
+                        f"  → Found {len(found)} channel(s) in {len(ordered)}/{len(work)} chunks, "
+                        f"skipping remaining chunks"
+                    )
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return ordered
+
     async def _process_chunk(
-        self, atomic_queries: list[str], chunk: list[dict], chunk_num: int = 1
+        self,
+        atomic_queries: list[str],
+        chunk: list[dict],
+        chunk_num: int = 1,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[str]:
         """Process all atomic queries against a single chunk.
 
@@ -249,16 +400,19 @@ class InContextPipeline(BasePipeline):
             atomic_queries: List of atomic query strings
             chunk: List of channel dictionaries for this chunk
             chunk_num: Chunk number for logging/debugging
+            semaphore: Optional limit on concurrent LLM calls shared across chunks
 
         Returns:
             List of valid channel names from this chunk
         """
         # Stage 2: Match all atomic queries against this chunk
-        chunk_channels = await self._match_queries_in_chunk(atomic_queries, chunk, chunk_num)
+        chunk_channels = await self._match_queries_in_chunk(
+            atomic_queries, chunk, chunk_num, semaphore
+        )
 
         # Stage 3: Validate and correct within this chunk
         valid_channels = await self._validate_and_correct_chunk(
-            atomic_queries, chunk_channels, chunk, chunk_num
+            atomic_queries, chunk_channels, chunk, chunk_num, semaphore
         )
 
         return valid_channels
@@ -278,7 +432,7 @@ class InContextPipeline(BasePipeline):
         # Save prompt for inspection
         _save_prompt_to_file(message, "query_split", query)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         from osprey.models import set_api_call_context
 
         set_api_call_context(
@@ -288,8 +442,7 @@ class InContextPipeline(BasePipeline):
             extra={"stage": "query_split"},
         )
 
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=message,
             model_config=self.model_config,
             output_model=QuerySplitterOutput,
@@ -298,14 +451,21 @@ class InContextPipeline(BasePipeline):
         return response.queries
 
     async def _match_queries_in_chunk(
-        self, atomic_queries: list[str], chunk: list[dict], chunk_num: int = 1
+        self,
+        atomic_queries: list[str],
+        chunk: list[dict],
+        chunk_num: int = 1,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[str]:
         """Stage 2: Match all atomic queries against a single chunk.
 
+        Queries are matched concurrently; matches are combined in query order.
+
         Args:
             atomic_queries: List of atomic query strings
             chunk: List of channel dictionaries for this chunk
             chunk_num: Chunk number for debugging
+            semaphore: Optional limit on concurrent LLM calls
 
         Returns:
             Deduplicated list of channel names found in this chunk
@@ -313,26 +473,38 @@ class InContextPipeline(BasePipeline):
         # Format chunk once for all queries
         chunk_formatted = self.database.format_chunk_for_prompt(chunk, include_addresses=False)
 
-        # Process each atomic query sequentially
-        all_channels = []
-        for i, query in enumerate(atomic_queries, 1):
+        async def match(i: int, query: str) -> list[str]:
             try:
-                logger.debug(f"  Matching query {i}/{len(atomic_queries)}: [dim]{query}[/dim]")
-                result = await self._match_single_query_in_chunk(query, chunk_formatted, chunk_num)
-                if result.channels_found:
-                    preview = ", ".join(result.channels[:3])
-                    if len(result.channels) > 3:
-                        preview += f" +{len(result.channels) - 3} more"
+                async with semaphore or nullcontext():
                     logger.debug(
-                        f"    [green]✓[/green] {len(result.channels)} match(es): [dim]{preview}[/dim]"
+                        f"  Matching query {i}/{len(atomic_queries)} in chunk {chunk_num}: "
+                        f"[dim]{query}[/dim]"
+                    )
+                    result = await self._match_single_query_in_chunk(
+                        query, chunk_formatted, chunk_num
                     )
-                    all_channels.extend(result.channels)
-                else:
-                    logger.debug("    [dim]No matches[/dim]")
             except Exception as e:
                 # Log error but continue processing other queries
                 logger.warning(f"[yellow]⚠[/yellow] Query failed: {query} - {e}")
-                continue
+                return []
+
+            if not result.channels_found:
+                logger.debug("    [dim]No matches[/dim]")
+                return []
+
+            preview = ", ".join(result.channels[:3])
+            if len(result.channels) > 3:
+                preview += f" +{len(result.channels) - 3} more"
+            logger.debug(
+                f"    [green]✓[/green] {len(result.channels)} match(es): [dim]{preview}[/dim]"
+            )
+            return result.channels
+
+        # Process all atomic queries concurrently, keeping query order in the results
+        matches = await asyncio.gather(
+            *(match(i, query) for i, query in enumerate(atomic_queries, 1))
+        )
+        all_channels = [channel for channels in matches for channel in channels]
 
         # Deduplicate channels (same query might match same channel)
         unique_channels = []
@@ -372,7 +544,7 @@ class InContextPipeline(BasePipeline):
         # Save prompt for inspection
         _save_prompt_to_file(prompt, "channel_match", atomic_query, chunk_num)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         from osprey.models import set_api_call_context
 
         set_api_call_context(
@@ -382,8 +554,7 @@ class InContextPipeline(BasePipeline):
             extra={"stage": "channel_match", "chunk": chunk_num},
         )
 
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=prompt,
             model_config=self.model_config,
             output_model=ChannelMatchOutput,
@@ -392,7 +563,12 @@ class InContextPipeline(BasePipeline):
         return response
 
     async def _validate_and_correct_chunk(
-        self, atomic_queries: list[str], channels: list[str], chunk: list[dict], chunk_num: int = 1
+        self,
+        atomic_queries: list[str],
+        channels: list[str],
+        chunk: list[dict],
+        chunk_num: int = 1,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> list[str]:
         """Stage 3: Validate channels against chunk and correct if needed.
 
@@ -401,6 +577,7 @@ class InContextPipeline(BasePipeline):
             channels: Channel names to validate
             chunk: Current database chunk
             chunk_num: Chunk number for debugging
+            semaphore: Optional limit on concurrent LLM calls
 
         Returns:
             List of valid channel names only
@@ -438,9 +615,10 @@ class InContextPipeline(BasePipeline):
         # Attempt correction with full context
         for iteration in range(self.max_correction_iterations):
             logger.debug(f"    Correction attempt {iteration + 1}/{self.max_correction_iterations}")
-            corrected = await self._correct_channels_with_context(
-                atomic_queries, validation_results, chunk, chunk_num
-            )
+            async with semaphore or nullcontext():
+                corrected = await self._correct_channels_with_context(
+                    atomic_queries, validation_results, chunk, chunk_num
+                )
 
             # Re-validate corrected channels
             validation_results = []
@@ -501,7 +679,7 @@ class InContextPipeline(BasePipeline):
         query_str = ", ".join(atomic_queries[:2])  # First 2 queries for filename
         _save_prompt_to_file(prompt, "correction", query_str, chunk_num)
 
-        # Set caller context for API call logging (propagates through asyncio.to_thread)
+        # Set caller context for API call logging (propagates across awaits)
         from osprey.models import set_api_call_context
 
         set_api_call_context(
@@ -511,8 +689,7 @@ class InContextPipeline(BasePipeline):
             extra={"stage": "correction", "chunk": chunk_num},
         )
 
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=prompt,
             model_config=self.model_config,
             output_model=ChannelCorrectionOutput,
@@ -547,7 +724,10 @@ class InContextPipeline(BasePipeline):
                 )
 
         # Enhanced processing notes
-        mode = "chunked" if self.chunk_dictionary else "full dictionary"
+        if self.retrieval_index is not None:
+            mode = f"retrieval (top {self.retrieval_top_k})"
+        else:
+            mode = "chunked" if self.chunk_dictionary else "full dictionary"
         notes = (
             f"Processed query in {mode} mode. "
             f"Found {len(channel_infos)} channels matching the query."
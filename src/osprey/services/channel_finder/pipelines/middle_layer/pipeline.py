@@ -17,7 +17,6 @@ This pipeline is based on the MATLAB Middle Layer (MML) pattern used in
 production at facilities like ALS, ESRF, and others.
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -25,7 +24,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from osprey.models import get_chat_completion
+from osprey.models import aget_chat_completion
 from osprey.utils.config import get_config_builder
 
 # LangGraph and LangChain imports
@@ -552,8 +551,7 @@ Example workflow:
             extra={"stage": "query_split"},
         )
 
-        response = await asyncio.to_thread(
-            get_chat_completion,
+        response = await aget_chat_completion(
             message=message,
             model_config=self.model_config,
             output_model=QuerySplitterOutput,
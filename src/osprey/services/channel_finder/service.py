@@ -3,10 +3,20 @@ Service Interface for Generic Channel Finder
 
 Provides a high-level service interface supporting multiple pipeline modes.
 Supports pluggable custom pipelines and databases via registration.
+
+Long-running agents should obtain the service through
+:func:`get_channel_finder_service`, which caches one instance per configuration
+and reloads it when the database file changes.
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 # Use Osprey's config system
 from osprey.utils.config import get_config_builder, get_provider_config
@@ -15,6 +25,7 @@ from .core.base_database import BaseDatabase
 from .core.base_pipeline import BasePipeline
 from .core.exceptions import ConfigurationError, DatabaseLoadError, PipelineModeError
 from .core.models import ChannelFinderResult
+from .core.retrieval import ChannelRetrievalIndex, default_embedding_cache_path
 from .databases import (
     FlatChannelDatabase,
     HierarchicalChannelDatabase,
@@ -402,6 +413,14 @@ class ChannelFinderService:
                     f"[dim]✓ Loaded facility context from prompts ({len(facility_description)} chars)[/dim]"
                 )
 
+        # Optional pre-retrieval index (BM25, plus embeddings if configured)
+        retrieval_config = processing_config.get("retrieval", {}) or {}
+        retrieval_index = None
+        if retrieval_config.get("enabled", False):
+            retrieval_index = self._build_retrieval_index(
+                database, retrieval_config, getattr(database, "db_path", None)
+            )
+
         # Initialize pipeline
         return InContextPipeline(
             database=database,
@@ -409,11 +428,52 @@ class ChannelFinderService:
             chunk_dictionary=processing_config.get("chunk_dictionary", False),
             chunk_size=processing_config.get("chunk_size", 50),
             max_correction_iterations=processing_config.get("max_correction_iterations", 2),
+            max_concurrency=processing_config.get("max_concurrency", 4),
+            expected_channels=processing_config.get("expected_channels"),
+            retrieval_index=retrieval_index,
+            retrieval_top_k=retrieval_config.get("top_k", 40),
             facility_name=facility_name,
             facility_description=facility_description,
             **kwargs,
         )
 
+    def _build_retrieval_index(
+        self, database, retrieval_config: dict, db_path: str | None
+    ) -> ChannelRetrievalIndex:
+        """Build the pre-retrieval index for the in-context pipeline."""
+        embedding_config = retrieval_config.get("embeddings", {}) or {}
+        embedder_kwargs = {}
+        if embedding_config.get("enabled", False):
+            provider_name = embedding_config.get("provider", "ollama")
+            if provider_name != "ollama":
+                logger.warning(
+                    f"Embedding provider '{provider_name}' not yet supported, "
+                    f"falling back to 'ollama'"
+                )
+            from osprey.models.embeddings.ollama import OllamaEmbeddingProvider
+
+            cache_path = embedding_config.get("cache_path")
+            if cache_path:
+                cache_path = self._resolve_path(cache_path)
+            elif db_path and Path(db_path).is_file():
+                cache_path = default_embedding_cache_path(db_path)
+            embedder_kwargs = {
+                "embedder": OllamaEmbeddingProvider(),
+                "embedding_model": embedding_config.get("model_id"),
+                "embedding_base_url": embedding_config.get("base_url"),
+                "embedding_cache_path": cache_path,
+                "embedding_retry_seconds": embedding_config.get("retry_seconds", 30),
+            }
+
+        index = ChannelRetrievalIndex.from_database(database, **embedder_kwargs)
+        # Embed channels now rather than making the first query wait for it
+        index.start_embedding_build()
+        logger.info(
+            f"[dim]✓ Built retrieval index over {len(index.channels)} channels "
+            f"({'BM25 + embeddings' if embedder_kwargs else 'BM25'})[/dim]"
+        )
+        return index
+
     def _init_hierarchical_pipeline(self, config: dict, db_path: str, model_config: dict, **kwargs):
         """Initialize hierarchical pipeline."""
         # Get hierarchical specific config
@@ -421,7 +481,7 @@ class ChannelFinderService:
             config.get("channel_finder", {}).get("pipelines", {}).get("hierarchical", {})
         )
         db_config = hierarchical_config.get("database", {})
-        hierarchical_config.get("processing", {})
+        processing_config = hierarchical_config.get("processing", {})
 
         # Determine database path
         if db_path is None:
@@ -486,6 +546,8 @@ class ChannelFinderService:
             model_config=model_config,
             facility_name=facility_name,
             facility_description=facility_description,
+            max_concurrency=processing_config.get("max_concurrency", 4),
+            max_llm_calls=processing_config.get("max_llm_calls", 50),
             **kwargs,
         )
 
@@ -669,3 +731,229 @@ class ChannelFinderService:
             "pipeline_name": self.pipeline.pipeline_name,
             "statistics": self.pipeline.get_statistics(),
         }
+
+
+# ============================================================================
+# Process-wide service cache
+# ============================================================================
+
+DEFAULT_WATCH_INTERVAL_SECONDS = 5.0
+
+
+@dataclass
+class _FileFingerprint:
+    """Change marker of a database file (stat first, content hash on stat change)."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass
+class _CachedService:
+    service: ChannelFinderService
+    init_kwargs: dict[str, Any]
+    files: dict[str, _FileFingerprint] = field(default_factory=dict)
+
+
+_service_cache: dict[str, _CachedService] = {}
+_service_cache_lock = threading.RLock()
+_watcher: threading.Thread | None = None
+_watcher_stop = threading.Event()
+
+
+def _fingerprint(path: str, stat: os.stat_result | None = None) -> _FileFingerprint:
+    stat = stat or os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return _FileFingerprint(stat.st_mtime_ns, stat.st_size, digest)
+
+
+def _database_files(service: ChannelFinderService) -> dict[str, _FileFingerprint]:
+    """Fingerprint the database file backing a service (none for remote databases)."""
+    db_path = getattr(getattr(service.pipeline, "database", None), "db_path", None)
+    if not isinstance(db_path, (str, Path)) or not os.path.isfile(db_path):
+        return {}
+    return {str(db_path): _fingerprint(str(db_path))}
+
+
+def _is_stale(entry: _CachedService) -> bool:
+    """Return whether a database file of a cached service changed on disk.
+
+    Only a ``stat`` is needed while the modification time and size are unchanged.
+    A touched file with identical content keeps the cached service.
+    """
+    for path, known in entry.files.items():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Missing while an editor replaces it; keep serving the loaded copy
+            continue
+        if (stat.st_mtime_ns, stat.st_size) == (known.mtime_ns, known.size):
+            continue
+        try:
+            current = _fingerprint(path, stat)
+        except OSError:
+            continue
+        if current.digest != known.digest:
+            return True
+        entry.files[path] = current
+    return False
+
+
+def _service_cache_key(init_kwargs: dict[str, Any]) -> str:
+    """Key a service by the configuration sections it is built from."""
+    config_builder = get_config_builder()
+    config = config_builder.raw_config
+    relevant = {
+        "args": init_kwargs,
+        "channel_finder": config.get("channel_finder"),
+        "facility": config.get("facility"),
+        "model": config.get("models", {}).get("channel_finder"),
+        "project_root": config_builder.get("project_root"),
+        "custom_pipelines": {
+            name: cls.__qualname__ for name, cls in ChannelFinderService._custom_pipelines.items()
+        },
+        "custom_databases": {
+            name: cls.__qualname__ for name, cls in ChannelFinderService._custom_databases.items()
+        },
+    }
+    return json.dumps(relevant, sort_keys=True, default=repr)
+
+
+def _build_cached_service(init_kwargs: dict[str, Any]) -> _CachedService:
+    service = ChannelFinderService(**init_kwargs)
+    return _CachedService(service, init_kwargs, _database_files(service))
+
+
+def get_channel_finder_service(
+    db_path: str = None, model_config: dict = None, pipeline_mode: str = None, **kwargs
+) -> ChannelFinderService:
+    """
+    Get the process-wide Channel Finder service for the current configuration.
+
+    Creating a :class:`ChannelFinderService` loads and expands the channel database
+    and the facility prompts. This function pays that cost once per process: the
+    service is cached by its arguments and the ``channel_finder``, ``facility`` and
+    channel finder model configuration, and rebuilt when the database file content
+    changes (checked by modification time, confirmed by hash).
+
+    Configuration (``channel_finder.service_cache`` in config.yml)::
+
+        channel_finder:
+          service_cache:
+            enabled: true                # false = new service per call
+            watch: false                 # Reload changed databases in a background thread
+            watch_interval_seconds: 5
+
+    Args:
+        db_path: Path to database file (None = use config.yml)
+        model_config: Model configuration dict (None = use config.yml)
+        pipeline_mode: Override pipeline mode from config
+        **kwargs: Pipeline-specific configuration
+
+    A failed reload (e.g. a half-written database) keeps returning the previous
+    service, like :func:`refresh_channel_finder_services`. Building a service is
+    blocking; async callers should run this function with ``asyncio.to_thread``.
+
+    Returns:
+        Shared ChannelFinderService instance
+
+    Raises:
+        PipelineModeError: If invalid pipeline mode specified
+        DatabaseLoadError: If database cannot be loaded
+        ConfigurationError: If configuration is invalid
+    """
+    init_kwargs = {
+        "db_path": db_path,
+        "model_config": model_config,
+        "pipeline_mode": pipeline_mode,
+        **kwargs,
+    }
+    cache_config = get_config_builder().get("channel_finder.service_cache", {}) or {}
+    if not cache_config.get("enabled", True):
+        return ChannelFinderService(**init_kwargs)
+
+    key = _service_cache_key(init_kwargs)
+    with _service_cache_lock:
+        entry = _service_cache.get(key)
+        if entry is None:
+            entry = _build_cached_service(init_kwargs)
+            _service_cache[key] = entry
+        stale = _is_stale(entry)
+
+    if stale:
+        logger.info("Channel database changed on disk, reloading channel finder service")
+        fresh = _reload_cached_service(key, entry)
+        with _service_cache_lock:
+            entry = fresh or _service_cache.get(key, entry)
+
+    if cache_config.get("watch", False):
+        _start_watcher(cache_config.get("watch_interval_seconds", DEFAULT_WATCH_INTERVAL_SECONDS))
+    return entry.service
+
+
+def refresh_channel_finder_services() -> int:
+    """
+    Rebuild every cached service whose database file changed.
+
+    A failed reload (e.g. a half-written database) keeps the previous service and
+    is retried on the next refresh.
+
+    Returns:
+        Number of services that were rebuilt
+    """
+    with _service_cache_lock:
+        stale = [(key, entry) for key, entry in _service_cache.items() if _is_stale(entry)]
+
+    return sum(_reload_cached_service(key, entry) is not None for key, entry in stale)
+
+
+def _reload_cached_service(key: str, entry: _CachedService) -> _CachedService | None:
+    """Rebuild a stale service, keeping the previous one if the rebuild fails.
+
+    Builds outside the lock so other callers keep using the previous service
+    meanwhile. Returns the new entry, or None if the rebuild failed or another
+    caller replaced the entry first.
+    """
+    try:
+        fresh = _build_cached_service(entry.init_kwargs)
+    except Exception as e:
+        logger.warning(f"Could not reload channel finder service, keeping previous: {e}")
+        return None
+    with _service_cache_lock:
+        if _service_cache.get(key) is not entry:
+            return None
+        _service_cache[key] = fresh
+    logger.info("Reloaded channel finder service after database change")
+    return fresh
+
+
+def _watch(interval: float) -> None:
+    while not _watcher_stop.wait(interval):
+        refresh_channel_finder_services()
+
+
+def _start_watcher(interval: float) -> None:
+    """Start the background database watcher once per process."""
+    global _watcher
+    with _service_cache_lock:
+        if _watcher is not None and _watcher.is_alive():
+            return
+        _watcher_stop.clear()
+        _watcher = threading.Thread(
+            target=_watch, args=(interval,), name="channel-finder-watcher", daemon=True
+        )
+        _watcher.start()
+        logger.debug(f"Watching channel databases for changes every {interval}s")
+
+
+def clear_channel_finder_service_cache() -> None:
+    """Drop all cached services and stop the watcher (for tests and configuration reloads)."""
+    global _watcher
+    _watcher_stop.set()
+    with _service_cache_lock:
+        watcher, _watcher = _watcher, None
+        _service_cache.clear()
+    if watcher is not None:
+        watcher.join(timeout=1)
@@ -0,0 +1,110 @@
+"""
+Database Compile Tool
+
+Compiles a hierarchical channel database JSON file into a binary snapshot that
+loads in milliseconds. The JSON stays the source of truth: the snapshot is only
+used while it matches the JSON, so recompile after editing the database.
+"""
+
+import time
+from pathlib import Path
+
+from rich import box
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from osprey.services.channel_finder.databases import HierarchicalChannelDatabase
+from osprey.services.channel_finder.databases.hierarchical_snapshot import (
+    ChannelSnapshot,
+    compile_snapshot,
+)
+
+try:
+    from osprey.cli.styles import console as osprey_console
+
+    console = osprey_console
+except ImportError:
+    console = Console()
+
+
+def _configured_database_path() -> Path | None:
+    """Resolve the hierarchical database path from config.yml."""
+    from osprey.services.channel_finder.utils.config import get_config, resolve_path
+
+    config = get_config()
+    db_config = (
+        config.get("channel_finder", {})
+        .get("pipelines", {})
+        .get("hierarchical", {})
+        .get("database", {})
+    )
+    db_path = db_config.get("path")
+    return Path(resolve_path(db_path)) if db_path else None
+
+
+def run_compile(database: str | None = None) -> int:
+    """Compile a hierarchical database into ``<database>.snapshot`` next to the JSON.
+
+    Args:
+        database: Path to database JSON file (default: hierarchical database from config).
+
+    Returns:
+        0 on success, 1 on failure.
+    """
+    try:
+        db_path = Path(database) if database else _configured_database_path()
+    except Exception as e:
+        console.print(
+            Panel(
+                f"[bold error]Error reading config:[/bold error] {e}",
+                border_style="error",
+                title="❌ Configuration Error",
+            )
+        )
+        return 1
+
+    if db_path is None:
+        console.print(
+            Panel(
+                "[bold error]Error:[/bold error] No hierarchical database configured\n\n"
+                "[warning]Check config.yml:[/warning] "
+                "channel_finder.pipelines.hierarchical.database.path",
+                border_style="error",
+                title="❌ Configuration Error",
+            )
+        )
+        return 1
+
+    try:
+        # Always load (and validate) the JSON, never an existing snapshot
+        start = time.perf_counter()
+        db = HierarchicalChannelDatabase(str(db_path), use_snapshot=False)
+        json_seconds = time.perf_counter() - start
+
+        snapshot_path = compile_snapshot(db)
+
+        start = time.perf_counter()
+        ChannelSnapshot(snapshot_path)
+        snapshot_seconds = time.perf_counter() - start
+    except Exception as e:
+        console.print(
+            Panel(
+                f"[bold error]Failed to compile {db_path}:[/bold error] {e}",
+                border_style="error",
+                title="❌ Compile Error",
+            )
+        )
+        return 1
+
+    table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
+    table.add_column("Property", style="label")
+    table.add_column("Value", style="value")
+    table.add_row("Database", str(db_path))
+    table.add_row("Snapshot", str(snapshot_path))
+    table.add_row("Channels", f"{len(db.channel_map):,}")
+    table.add_row("Snapshot size", f"{snapshot_path.stat().st_size / 1024:,.1f} KiB")
+    table.add_row("Load time (JSON)", f"{json_seconds * 1000:,.1f} ms")
+    table.add_row("Load time (snapshot)", f"{snapshot_seconds * 1000:,.1f} ms")
+    console.print(Panel(table, title="[bold]✓ Snapshot compiled[/bold]", border_style="success"))
+    return 0
@@ -178,7 +178,8 @@ def validate_database_loading(db_path: Path, pipeline_type: str) -> tuple[bool,
 
     try:
         if pipeline_type == "hierarchical":
-            db = HierarchicalChannelDatabase(str(db_path))
+            # Validate the JSON itself, not a compiled snapshot of it
+            db = HierarchicalChannelDatabase(str(db_path), use_snapshot=False)
         else:
             db = TemplateChannelDatabase(str(db_path), presentation_mode="explicit")
 
@@ -37,6 +37,8 @@ class MachineStateSnapshot:
     channels_read: int = 0
     channels_failed: int = 0
     warnings: list[str] = field(default_factory=list)
+    read_seconds: float | None = None  # Wall time of the bulk read
+    read_stats: dict[str, Any] = field(default_factory=dict)  # Connector timing breakdown
 
     @property
     def success_rate(self) -> float:
@@ -84,7 +84,7 @@ class MachineStateReader:
         addresses = list(channel_defs.keys())
 
         try:
-            results = await self._connector.read_multiple_channels(addresses)
+            bulk = await self._connector.read_multiple_channels_detailed(addresses)
         except Exception as exc:
             logger.error(f"Bulk channel read failed: {exc}")
             # Every channel is treated as failed
@@ -111,7 +111,7 @@ class MachineStateReader:
         fail_count = 0
 
         for addr, defn in channel_defs.items():
-            cv = results.get(addr)
+            cv = bulk.values.get(addr)
             if cv is not None:
                 value = _normalize_value(cv.value)
                 channels[addr] = ChannelResult(
@@ -131,16 +131,23 @@ class MachineStateReader:
                     value=None,
                     label=defn.label,
                     group=defn.group,
-                    error="Channel not returned by connector",
+                    error=bulk.errors.get(addr, "Channel not returned by connector"),
                 )
                 fail_count += 1
 
+        logger.info(
+            f"Machine state read: {ok_count}/{len(channel_defs)} channels "
+            f"in {bulk.elapsed_seconds:.3f}s"
+        )
+
         return MachineStateSnapshot(
             snapshot_time=datetime.now(tz=UTC),
             channels=channels,
             channels_read=ok_count,
             channels_failed=fail_count,
             warnings=warnings,
+            read_seconds=bulk.elapsed_seconds,
+            read_stats=dict(bulk.stats),
         )
 
     # ------------------------------------------------------------------
@@ -86,6 +86,8 @@ def get_framework_standard_patterns() -> dict[str, list[str]]:
             # APPROVED: osprey.runtime unified API (has all safety features)
             # ============================================================
             r"\bread_channel\s*\(",  # read_channel('PV')
+            r"\bread_channels\s*\(",  # read_channels(['PV1', 'PV2'])
+            r"\bmonitor\s*\(",  # monitor('PV', duration=10.0)
             # ============================================================
             # CIRCUMVENTION DETECTION: EPICS (PyEPICS library)
             # ============================================================
@@ -33,6 +33,14 @@ class PythonExecutorConfig:
             "execution_timeout_seconds", 600
         )  # 10 minutes
 
+        # Warm worker pool for local execution (see execution/worker_pool.py)
+        worker_pool_config = executor_config.get("worker_pool", {})
+        self.worker_pool_enabled = worker_pool_config.get("enabled", True)
+        self.worker_pool_size = worker_pool_config.get("size", 2)
+        self.worker_max_runs = worker_pool_config.get("max_runs_per_worker", 100)
+        self.worker_startup_timeout_seconds = worker_pool_config.get("startup_timeout_seconds", 120)
+        self.worker_acquire_timeout_seconds = worker_pool_config.get("acquire_timeout_seconds", 10)
+
         # Limits validator - lazy-loaded from config
         self._limits_validator = None
 
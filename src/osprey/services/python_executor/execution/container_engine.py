@@ -9,12 +9,13 @@ The module is architected around several specialized components that work togeth
 to provide reliable, scalable Python code execution:
 
 **JupyterSessionManager**: Manages Jupyter kernel sessions, connection lifecycle,
-and session cleanup. Handles the complex WebSocket communication patterns required
-for reliable Jupyter integration.
+and session cleanup. Uses asyncio-native HTTP and WebSocket clients (aiohttp) and
+keeps one kernel WebSocket open per session, so container I/O never blocks the
+event loop and many executions can run concurrently.
 
 **CodeExecutionEngine**: Provides pure code execution logic through WebSocket
 communication with Jupyter kernels. Implements timeout handling, execution monitoring,
-and proper error classification.
+streaming of kernel output to an optional callback, and proper error classification.
 
 **FileBasedResultCollector**: Handles comprehensive result collection through file
 system communication, avoiding the complexity and reliability issues of WebSocket
@@ -76,16 +77,20 @@ Examples:
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
 import json
+import socket
+import threading
 import time
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import requests
-import websocket
+import aiohttp
 
 from osprey.utils.logger import get_logger
 
@@ -95,6 +100,9 @@ from ..models import PythonExecutionEngineResult
 
 logger = get_logger("python_executor")
 
+# Receives kernel output as it streams: (name, text), name is "stdout", "stderr" or "display"
+OutputCallback = Callable[[str, str], None]
+
 
 @dataclass
 class ContainerEndpoint:
@@ -225,11 +233,31 @@ class SessionInfo:
 
 
 class JupyterSessionManager:
-    """Manages Jupyter session and kernel lifecycle"""
+    """Manages Jupyter session and kernel lifecycle.
+
+    All HTTP and WebSocket traffic goes through one aiohttp client session, so
+    health checks, session creation and kernel polling never block the event
+    loop. The kernel WebSocket is opened once per Jupyter session and reused
+    for every execution until the session changes or :meth:`close` is called.
+    """
 
     def __init__(self, endpoint: ContainerEndpoint):
         self.endpoint = endpoint
         self._current_session: SessionInfo | None = None
+        self._http_session: aiohttp.ClientSession | None = None
+        self._channel: aiohttp.ClientWebSocketResponse | None = None
+        self._channel_session_id: str | None = None
+
+        # The kernel WebSocket carries one execution at a time
+        self.execution_lock = asyncio.Lock()
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared aiohttp client session"""
+        if self._http_session is None or self._http_session.closed:
+            # trust_env=False ignores proxy environment variables, which otherwise
+            # cause "failed CONNECT via proxy status: 403" errors for local containers
+            self._http_session = aiohttp.ClientSession(trust_env=False)
+        return self._http_session
 
     async def ensure_session(self) -> SessionInfo:
         """Create or reuse Jupyter session with appropriate kernel - raises exceptions on failure"""
@@ -246,25 +274,116 @@ class JupyterSessionManager:
     async def check_session_health(self, session: SessionInfo) -> bool:
         """Check if session is still healthy"""
         try:
-            response = requests.get(
+            async with self._get_http_session().get(
                 f"{self.endpoint.base_url}/api/sessions/{session.session_id}",
-                timeout=5,
-                proxies={"http": None, "https": None},
-            )
-            is_healthy = response.status_code == 200
-            if not is_healthy:
-                logger.warning(f"Session health check failed: HTTP {response.status_code}")
-            return is_healthy
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as response:
+                is_healthy = response.status == 200
+                if not is_healthy:
+                    logger.warning(f"Session health check failed: HTTP {response.status}")
+                return is_healthy
         except Exception as e:
             logger.warning(f"Session health check failed: {e}")
             return False
 
+    async def get_kernel_channel(self, session: SessionInfo) -> aiohttp.ClientWebSocketResponse:
+        """Get the persistent kernel WebSocket for a session - raises exceptions on failure"""
+        if (
+            self._channel is not None
+            and not self._channel.closed
+            and self._channel_session_id == session.session_id
+        ):
+            return self._channel
+
+        await self._close_channel()
+
+        # Include session ID in WebSocket URL query parameters
+        ws_url = f"{self.endpoint.ws_protocol}://{self.endpoint.host}:{self.endpoint.port}/api/kernels/{session.kernel_id}/channels?session_id={session.session_id}"
+
+        try:
+            logger.debug(f"Creating WebSocket connection to {ws_url}")
+            self._channel = await asyncio.wait_for(
+                self._get_http_session().ws_connect(ws_url, heartbeat=30, max_msg_size=0),
+                timeout=10,
+            )
+        except TimeoutError as e:
+            raise ContainerConnectivityError(
+                f"WebSocket connection timeout: {e}",
+                host=self.endpoint.host,
+                port=self.endpoint.port,
+                technical_details={"websocket_timeout": True},
+            ) from e
+        except aiohttp.ClientError as e:
+            raise ContainerConnectivityError(
+                f"WebSocket connection error: {e}",
+                host=self.endpoint.host,
+                port=self.endpoint.port,
+                technical_details={"websocket_error": str(e)},
+            ) from e
+        except Exception as e:
+            raise ContainerConnectivityError(
+                f"WebSocket connection failed: {e}",
+                host=self.endpoint.host,
+                port=self.endpoint.port,
+                technical_details={"connection_failed": str(e)},
+            ) from e
+
+        self._channel_session_id = session.session_id
+        return self._channel
+
     async def cleanup_session(self) -> None:
         """Clean up current session if needed"""
         # For now, keep sessions alive for reuse
         # In production, you might want to clean up after each execution
         pass
 
+    async def reset_channel(self) -> None:
+        """Drop the kernel WebSocket after a failure so the next execution reconnects"""
+        await self._close_channel()
+
+    async def close(self) -> None:
+        """Close the kernel WebSocket and HTTP client (the Jupyter session stays alive)"""
+        await self._close_channel()
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    def abandon(self) -> None:
+        """Release connections whose event loop no longer runs, without awaiting.
+
+        aiohttp can only close connections gracefully on the loop that owns them,
+        so the underlying sockets are shut down directly instead; Jupyter then
+        sees the kernel WebSocket disconnect.
+        """
+        http_session, self._http_session = self._http_session, None
+        self._channel = None
+        self._channel_session_id = None
+        if http_session is None or http_session.closed:
+            return
+
+        connector = http_session.connector
+        http_session.detach()
+        if connector is None:
+            return
+        protocols = [proto for conns in connector._conns.values() for proto, _ in conns]
+        protocols.extend(connector._acquired)
+        for proto in protocols:
+            transport = getattr(proto, "transport", None)
+            sock = transport.get_extra_info("socket") if transport is not None else None
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+
+    async def _close_channel(self) -> None:
+        """Close the kernel WebSocket if open"""
+        channel, self._channel = self._channel, None
+        self._channel_session_id = None
+        if channel is not None and not channel.closed:
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.debug(f"Error closing kernel WebSocket: {e}")
+
     async def _create_new_session(self) -> SessionInfo:
         """Create a new Jupyter session - raises exceptions on failure"""
         session_data = {
@@ -275,38 +394,40 @@ class JupyterSessionManager:
         }
 
         try:
-            response = requests.post(
+            async with self._get_http_session().post(
                 f"{self.endpoint.base_url}/api/sessions",
                 json=session_data,
-                timeout=30,
-                proxies={"http": None, "https": None},
-            )
-            response.raise_for_status()
-        except requests.exceptions.ConnectTimeout as e:
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status >= 400:
+                    response_text = (await response.text())[:200]
+                    raise ContainerConnectivityError(
+                        f"Jupyter session creation failed: HTTP {response.status} - {response_text}",
+                        host=self.endpoint.host,
+                        port=self.endpoint.port,
+                        technical_details={
+                            "http_error": response.status,
+                            "response": response_text,
+                        },
+                    )
+                session_info = await response.json(content_type=None)
+        except ContainerConnectivityError:
+            raise
+        except TimeoutError as e:
             raise ContainerConnectivityError(
                 f"Jupyter container connection timeout: {e}",
                 host=self.endpoint.host,
                 port=self.endpoint.port,
                 technical_details={"timeout": 30},
             ) from e
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             raise ContainerConnectivityError(
                 f"Jupyter container connection error: {e}",
                 host=self.endpoint.host,
                 port=self.endpoint.port,
                 technical_details={"connection_error": str(e)},
             ) from e
-        except requests.exceptions.HTTPError as e:
-            raise ContainerConnectivityError(
-                f"Jupyter session creation failed: HTTP {response.status_code} - {response.text[:200]}",
-                host=self.endpoint.host,
-                port=self.endpoint.port,
-                technical_details={
-                    "http_error": response.status_code,
-                    "response": response.text[:200],
-                },
-            ) from e
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             raise ContainerConnectivityError(
                 f"Jupyter session creation request failed: {e}",
                 host=self.endpoint.host,
@@ -321,7 +442,6 @@ class JupyterSessionManager:
                 technical_details={"unexpected_error": str(e)},
             ) from e
 
-        session_info = response.json()
         session = SessionInfo(session_id=session_info["id"], kernel_id=session_info["kernel"]["id"])
 
         logger.info(f"Created session {session.session_id} with kernel {session.kernel_id}")
@@ -334,28 +454,27 @@ class JupyterSessionManager:
 
         for attempt in range(max_attempts):
             try:
-                response = requests.get(
+                async with self._get_http_session().get(
                     f"{self.endpoint.base_url}/api/kernels/{session.kernel_id}",
-                    timeout=5,
-                    proxies={"http": None, "https": None},
-                )
-                if response.status_code == 200:
-                    kernel_info = response.json()
-                    state = kernel_info.get("execution_state")
-
-                    if state == "idle":
-                        logger.debug(f"Kernel ready in state: {state}")
-                        return
-                    elif state == "starting":
-                        logger.debug(
-                            f"Kernel still starting (attempt {attempt + 1}/{max_attempts})"
-                        )
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as response:
+                    if response.status == 200:
+                        kernel_info = await response.json(content_type=None)
+                        state = kernel_info.get("execution_state")
+
+                        if state == "idle":
+                            logger.debug(f"Kernel ready in state: {state}")
+                            return
+                        elif state == "starting":
+                            logger.debug(
+                                f"Kernel still starting (attempt {attempt + 1}/{max_attempts})"
+                            )
+                        else:
+                            logger.debug(
+                                f"Kernel not ready, state: {state} (attempt {attempt + 1}/{max_attempts})"
+                            )
                     else:
-                        logger.debug(
-                            f"Kernel not ready, state: {state} (attempt {attempt + 1}/{max_attempts})"
-                        )
-                else:
-                    last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                        last_error = f"HTTP {response.status}: {(await response.text())[:200]}"
             except Exception as e:
                 last_error = str(e)
 
@@ -373,53 +492,32 @@ class JupyterSessionManager:
 
 
 class CodeExecutionEngine:
-    """Handles pure code execution via WebSocket"""
+    """Handles pure code execution over a kernel WebSocket.
+
+    Kernel ``stream``, ``display_data`` and ``execute_result`` messages for the
+    running request are forwarded to ``output_callback`` as they arrive, as
+    ``(name, text)`` where name is ``"stdout"``, ``"stderr"`` or ``"display"``.
+    """
 
-    def __init__(self, endpoint: ContainerEndpoint, timeout: int = 300):
+    def __init__(
+        self,
+        endpoint: ContainerEndpoint,
+        timeout: int = 300,
+        output_callback: OutputCallback | None = None,
+    ):
         self.endpoint = endpoint
         self.timeout = timeout
+        self.output_callback = output_callback
 
-    async def execute_code(self, code: str, session: SessionInfo) -> None:
+    async def execute_code(
+        self, code: str, session: SessionInfo, channel: aiohttp.ClientWebSocketResponse
+    ) -> None:
         """Execute code in kernel via WebSocket - raises exceptions on failure"""
-        # Include session ID in WebSocket URL query parameters
-        ws_url = f"{self.endpoint.ws_protocol}://{self.endpoint.host}:{self.endpoint.port}/api/kernels/{session.kernel_id}/channels?session_id={session.session_id}"
+        msg_id = await self._send_execute_request(channel, code, session)
+        await self._wait_for_completion(channel, msg_id)
 
-        try:
-            logger.debug(f"Creating WebSocket connection to {ws_url}")
-            # Disable proxy to avoid "failed CONNECT via proxy status: 403" errors
-            ws = websocket.create_connection(
-                ws_url, timeout=10, http_proxy_host=None, http_proxy_port=None
-            )
-        except websocket.WebSocketTimeoutException as e:
-            raise ContainerConnectivityError(
-                f"WebSocket connection timeout: {e}",
-                host=self.endpoint.host,
-                port=self.endpoint.port,
-                technical_details={"websocket_timeout": True},
-            ) from e
-        except websocket.WebSocketException as e:
-            raise ContainerConnectivityError(
-                f"WebSocket connection error: {e}",
-                host=self.endpoint.host,
-                port=self.endpoint.port,
-                technical_details={"websocket_error": str(e)},
-            ) from e
-        except Exception as e:
-            raise ContainerConnectivityError(
-                f"WebSocket connection failed: {e}",
-                host=self.endpoint.host,
-                port=self.endpoint.port,
-                technical_details={"connection_failed": str(e)},
-            ) from e
-
-        try:
-            msg_id = self._send_execute_request(ws, code, session)
-            self._wait_for_completion(ws, msg_id)
-        finally:
-            ws.close()
-
-    def _send_execute_request(
-        self, ws: websocket.WebSocket, code: str, session: SessionInfo
+    async def _send_execute_request(
+        self, channel: aiohttp.ClientWebSocketResponse, code: str, session: SessionInfo
     ) -> str:
         """Send execute request and return message ID"""
         msg_id = str(uuid.uuid4())
@@ -439,105 +537,31 @@ class CodeExecutionEngine:
             "channel": "shell",
         }
 
-        ws.send(json.dumps(execute_request))
+        try:
+            await channel.send_str(json.dumps(execute_request))
+        except Exception as e:
+            raise ContainerConnectivityError(
+                f"WebSocket send failed: {e}",
+                host=self.endpoint.host,
+                port=self.endpoint.port,
+                technical_details={"websocket_error": str(e)},
+            ) from e
+
         logger.debug(f"Sent execute request with msg_id: {msg_id}")
         return msg_id
 
-    def _wait_for_completion(self, ws: websocket.WebSocket, expected_msg_id: str) -> None:
+    async def _wait_for_completion(
+        self, channel: aiohttp.ClientWebSocketResponse, expected_msg_id: str
+    ) -> None:
         """Wait for execution completion - raises exceptions on failure"""
-        execution_complete = False
-        start_time = time.time()
-        last_error = None
-
-        # Set WebSocket timeout for recv operations
-        ws.settimeout(5.0)  # 5 second timeout for each recv
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
 
         logger.debug(f"Waiting for completion of msg_id: {expected_msg_id}")
 
-        while not execution_complete and (time.time() - start_time) < self.timeout:
-            try:
-                message_data = ws.recv()
-                message = json.loads(message_data)
-
-                msg_type = message.get("header", {}).get("msg_type")
-                parent_msg_id = message.get("parent_header", {}).get("msg_id")
-
-                logger.debug(f"Received message: {msg_type}, parent_msg_id: {parent_msg_id}")
-
-                # Log important output messages for debugging
-                if msg_type in ["stream", "error"] and parent_msg_id == expected_msg_id:
-                    content = message.get("content", {})
-                    if msg_type == "stream":
-                        stream_name = content.get("name", "unknown")
-                        text = content.get("text", "")
-                        # Log all stderr and any debug/error messages
-                        if (
-                            stream_name == "stderr"
-                            or "DEBUG:" in text
-                            or "CRITICAL ERROR:" in text
-                            or "Failed to save" in text
-                        ):
-                            logger.info(f"Container {stream_name}: {text.strip()}")
-                        # Also log stdout messages that might contain useful info
-                        elif stream_name == "stdout" and (
-                            "ERROR" in text or "✅" in text or "Loaded execution context" in text
-                        ):
-                            logger.debug(f"Container {stream_name}: {text.strip()}")
-                    elif msg_type == "error":
-                        error_name = content.get("ename", "Unknown")
-                        error_value = content.get("evalue", "")
-                        traceback_list = content.get("traceback", [])
-                        logger.error(f"Container error: {error_name}: {error_value}")
-                        if traceback_list:
-                            traceback_text = "\n".join(traceback_list)
-                            logger.error(f"Container traceback: {traceback_text}")
-
-                # Check for execution completion
-                if msg_type == "execute_reply" and parent_msg_id == expected_msg_id:
-                    execution_complete = True
-                    logger.debug("Execution completed successfully")
-
-                    # Check if execution failed
-                    if message.get("content", {}).get("status") == "error":
-                        error_info = message.get("content", {})
-                        error_name = error_info.get("ename", "Unknown error")
-                        error_value = error_info.get("evalue", "")
-                        traceback_info = "\n".join(error_info.get("traceback", []))
-
-                        raise CodeRuntimeError(
-                            f"Code execution failed: {error_name}: {error_value}",
-                            traceback_info=traceback_info,
-                            execution_attempt=1,
-                            technical_details={
-                                "error_name": error_name,
-                                "error_value": error_value,
-                                "traceback": traceback_info,
-                            },
-                        )
-
-            except TimeoutError:
-                # Timeout on recv - continue waiting
-                continue
-            except websocket.WebSocketException as e:
-                logger.warning(f"WebSocket message error: {e}")
-                continue
-            except Exception as e:
-                if "Code execution failed:" in str(e):
-                    raise
-                logger.error(f"Error receiving WebSocket message: {e}")
-                last_error = e
-                break
-
-        if not execution_complete:
-            if last_error:
-                # Keep session alive for potential reuse on retry
-                raise ContainerConnectivityError(
-                    f"WebSocket execution failed: {last_error}",
-                    host=self.endpoint.host,
-                    port=self.endpoint.port,
-                    technical_details={"websocket_error": str(last_error)},
-                )
-            else:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 # Keep session alive for potential reuse on retry
                 raise ExecutionTimeoutError(
                     timeout_seconds=self.timeout,
@@ -548,6 +572,114 @@ class CodeExecutionEngine:
                     },
                 )
 
+            try:
+                ws_message = await channel.receive(timeout=remaining)
+            except TimeoutError:
+                continue
+            except Exception as e:
+                logger.error(f"Error receiving WebSocket message: {e}")
+                raise ContainerConnectivityError(
+                    f"WebSocket execution failed: {e}",
+                    host=self.endpoint.host,
+                    port=self.endpoint.port,
+                    technical_details={"websocket_error": str(e)},
+                ) from e
+
+            if ws_message.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSING,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                error = channel.exception() or f"WebSocket closed ({ws_message.type.name})"
+                raise ContainerConnectivityError(
+                    f"WebSocket execution failed: {error}",
+                    host=self.endpoint.host,
+                    port=self.endpoint.port,
+                    technical_details={"websocket_error": str(error)},
+                )
+            if ws_message.type != aiohttp.WSMsgType.TEXT:
+                continue
+
+            try:
+                message = json.loads(ws_message.data)
+            except json.JSONDecodeError as e:
+                logger.warning(f"WebSocket message error: {e}")
+                continue
+
+            msg_type = message.get("header", {}).get("msg_type")
+            parent_msg_id = message.get("parent_header", {}).get("msg_id")
+
+            logger.debug(f"Received message: {msg_type}, parent_msg_id: {parent_msg_id}")
+
+            if parent_msg_id != expected_msg_id:
+                # Late output from an earlier (e.g. timed out) request on this session
+                continue
+
+            content = message.get("content", {})
+
+            # Log important output messages for debugging
+            if msg_type == "stream":
+                stream_name = content.get("name", "unknown")
+                text = content.get("text", "")
+                # Log all stderr and any debug/error messages
+                if (
+                    stream_name == "stderr"
+                    or "DEBUG:" in text
+                    or "CRITICAL ERROR:" in text
+                    or "Failed to save" in text
+                ):
+                    logger.info(f"Container {stream_name}: {text.strip()}")
+                # Also log stdout messages that might contain useful info
+                elif stream_name == "stdout" and (
+                    "ERROR" in text or "✅" in text or "Loaded execution context" in text
+                ):
+                    logger.debug(f"Container {stream_name}: {text.strip()}")
+                self._forward_output(stream_name, text)
+            elif msg_type in ("display_data", "execute_result"):
+                text = content.get("data", {}).get("text/plain")
+                if text:
+                    self._forward_output("display", text)
+            elif msg_type == "error":
+                error_name = content.get("ename", "Unknown")
+                error_value = content.get("evalue", "")
+                traceback_list = content.get("traceback", [])
+                logger.error(f"Container error: {error_name}: {error_value}")
+                if traceback_list:
+                    traceback_text = "\n".join(traceback_list)
+                    logger.error(f"Container traceback: {traceback_text}")
+
+            # Check for execution completion
+            if msg_type == "execute_reply":
+                logger.debug("Execution completed successfully")
+
+                # Check if execution failed
+                if content.get("status") == "error":
+                    error_name = content.get("ename", "Unknown error")
+                    error_value = content.get("evalue", "")
+                    traceback_info = "\n".join(content.get("traceback", []))
+
+                    raise CodeRuntimeError(
+                        f"Code execution failed: {error_name}: {error_value}",
+                        traceback_info=traceback_info,
+                        execution_attempt=1,
+                        technical_details={
+                            "error_name": error_name,
+                            "error_value": error_value,
+                            "traceback": traceback_info,
+                        },
+                    )
+                return
+
+    def _forward_output(self, name: str, text: str) -> None:
+        """Pass kernel output to the output callback, if any"""
+        if self.output_callback is None or not text:
+            return
+        try:
+            self.output_callback(name, text)
+        except Exception as e:
+            logger.debug(f"Output callback failed: {e}")
+
 
 # =============================================================================
 # FILE-BASED RESULT COLLECTOR
@@ -805,14 +937,21 @@ class ContainerExecutor:
     :type execution_folder: Path, optional
     :param timeout: Maximum execution time in seconds before timeout
     :type timeout: int
+    :param output_callback: Called with ``(name, text)`` for kernel output as it streams
+    :type output_callback: Callable[[str, str], None], optional
 
     .. note::
        The execution_folder must be properly mounted in the container for
        file-based result communication to work correctly.
 
+    :param session_manager: Shared session manager to execute through; when given,
+        the executor does not close it (see :func:`get_session_manager`)
+    :type session_manager: JupyterSessionManager, optional
+
     .. warning::
-       Each ContainerExecutor instance manages its own Jupyter session. Ensure
-       proper cleanup by using async context managers or explicit cleanup calls.
+       Without a shared ``session_manager``, each ContainerExecutor instance manages
+       its own Jupyter session and kernel WebSocket. Ensure proper cleanup by using
+       ``async with`` or calling :meth:`close`.
 
     .. seealso::
        :func:`execute_python_code_in_container` : Convenience function wrapper
@@ -851,6 +990,8 @@ class ContainerExecutor:
         execution_folder: Path | None = None,
         timeout: int = 300,
         executor_config: "PythonExecutorConfig | None" = None,
+        output_callback: OutputCallback | None = None,
+        session_manager: JupyterSessionManager | None = None,
     ):
         """Initialize with endpoint and execution parameters."""
         self.endpoint = endpoint
@@ -859,10 +1000,22 @@ class ContainerExecutor:
         self.executor_config = executor_config
 
         # Initialize components directly
-        self.session_manager = JupyterSessionManager(endpoint)
-        self.execution_engine = CodeExecutionEngine(endpoint, timeout)
+        self._owns_session_manager = session_manager is None
+        self.session_manager = session_manager or JupyterSessionManager(endpoint)
+        self.execution_engine = CodeExecutionEngine(endpoint, timeout, output_callback)
         self.result_collector = FileBasedResultCollector(execution_folder)
 
+    async def __aenter__(self) -> "ContainerExecutor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the kernel WebSocket and HTTP client, unless the session manager is shared."""
+        if self._owns_session_manager:
+            await self.session_manager.close()
+
     async def execute_code(self, code: str) -> PythonExecutionEngineResult:
         """
         Execute Python code and return structured results - raises exceptions on failure.
@@ -872,15 +1025,12 @@ class ContainerExecutor:
         start_time = time.time()
 
         try:
-            # 1. Ensure we have a working session
-            session = await self.session_manager.ensure_session()
-
-            # 2. Get limits validator from config
+            # 1. Get limits validator from config
             limits_validator = (
                 self.executor_config.limits_validator if self.executor_config else None
             )
 
-            # 3. Execute the wrapped code using unified wrapper with validator
+            # 2. Wrap the code using unified wrapper with validator
             from .wrapper import ExecutionWrapper
 
             wrapper = ExecutionWrapper(
@@ -888,8 +1038,17 @@ class ContainerExecutor:
             )
             wrapped_code = wrapper.create_wrapper(code, self.execution_folder)
 
-            # 4. Execute the wrapped code using the execution engine
-            await self.execution_engine.execute_code(wrapped_code, session)
+            async with self.session_manager.execution_lock:
+                # 3. Ensure we have a working session and its kernel WebSocket
+                session = await self.session_manager.ensure_session()
+                channel = await self.session_manager.get_kernel_channel(session)
+
+                # 4. Execute the wrapped code using the execution engine
+                try:
+                    await self.execution_engine.execute_code(wrapped_code, session, channel)
+                except ContainerConnectivityError:
+                    await self.session_manager.reset_channel()
+                    raise
 
             # 5. Collect results from files using the result collector
             result = await self.result_collector.collect_results(start_time)
@@ -914,6 +1073,104 @@ class ContainerExecutor:
             await self.session_manager.cleanup_session()
 
 
+# =============================================================================
+# SESSION CACHE
+# =============================================================================
+
+# Session managers are idle-closed after this long without an execution
+SESSION_IDLE_TIMEOUT_SECONDS = 900.0
+
+
+@dataclass
+class _CachedSessionManager:
+    manager: JupyterSessionManager
+    loop: asyncio.AbstractEventLoop
+    last_used: float
+
+
+# Keyed by (Jupyter base URL, kernel name, agent session id)
+_session_managers: dict[tuple[str, str, str | None], _CachedSessionManager] = {}
+_session_managers_lock = threading.Lock()
+
+
+async def get_session_manager(
+    endpoint: ContainerEndpoint, session_id: str | None = None
+) -> JupyterSessionManager:
+    """Get the process-wide session manager for an endpoint and agent session.
+
+    Executions of the same agent session reuse one Jupyter session and kernel
+    WebSocket instead of reconnecting per execution. Managers created on
+    another event loop are closed and replaced, since aiohttp clients are bound
+    to the loop that created them, and managers idle for longer than
+    :data:`SESSION_IDLE_TIMEOUT_SECONDS` are closed.
+
+    Args:
+        endpoint: Container connection configuration
+        session_id: Agent session (conversation) identifier
+
+    Returns:
+        Session manager shared by all executions of the session
+    """
+    await _close_idle_session_managers()
+
+    loop = asyncio.get_running_loop()
+    key = (endpoint.base_url, endpoint.kernel_name, session_id)
+    replaced = None
+    with _session_managers_lock:
+        entry = _session_managers.get(key)
+        if entry is None or entry.loop is not loop:
+            replaced = entry
+            entry = _CachedSessionManager(JupyterSessionManager(endpoint), loop, 0.0)
+            _session_managers[key] = entry
+        entry.last_used = time.monotonic()
+
+    if replaced is not None:
+        await _close_entries([replaced])
+    return entry.manager
+
+
+async def close_container_sessions(session_id: str | None = None) -> None:
+    """Close cached session managers when an agent session ends.
+
+    Args:
+        session_id: Agent session whose managers to close (default: all sessions)
+    """
+    with _session_managers_lock:
+        keys = [key for key in _session_managers if session_id is None or key[2] == session_id]
+        entries = [_session_managers.pop(key) for key in keys]
+    await _close_entries(entries)
+
+
+async def _close_idle_session_managers() -> None:
+    cutoff = time.monotonic() - SESSION_IDLE_TIMEOUT_SECONDS
+    with _session_managers_lock:
+        keys = [
+            key
+            for key, entry in _session_managers.items()
+            if entry.last_used < cutoff and not entry.manager.execution_lock.locked()
+        ]
+        entries = [_session_managers.pop(key) for key in keys]
+    await _close_entries(entries)
+
+
+async def _close_entries(entries: list[_CachedSessionManager]) -> None:
+    loop = asyncio.get_running_loop()
+    for entry in entries:
+        if entry.loop is loop:
+            await entry.manager.close()
+        elif entry.loop.is_running():
+            # aiohttp objects must be closed on the loop that created them
+            future = asyncio.run_coroutine_threadsafe(entry.manager.close(), entry.loop)
+            future.add_done_callback(_log_close_failure)
+        else:
+            entry.manager.abandon()
+
+
+def _log_close_failure(future: concurrent.futures.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug(f"Error closing session manager on its event loop: {future.exception()}")
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
@@ -926,12 +1183,17 @@ async def execute_python_code_in_container(
     timeout: int = 300,
     execution_folder: Path | None = None,
     executor_config: "PythonExecutorConfig | None" = None,
+    output_callback: OutputCallback | None = None,
+    session_id: str | None = None,
 ) -> PythonExecutionEngineResult:
     """
     Execute Python code in container using file-based result communication.
 
     Context is loaded from context.json file in the execution folder for consistency
-    between agent execution and human review.
+    between agent execution and human review. Executions with the same endpoint and
+    session ID share one Jupyter session and kernel WebSocket (see
+    :func:`get_session_manager`); call :func:`close_container_sessions` when the
+    session ends.
 
     Args:
         code: Python code to execute
@@ -940,6 +1202,9 @@ async def execute_python_code_in_container(
         timeout: Execution timeout in seconds
         execution_folder: Host execution folder that maps to container workspace
         executor_config: Executor configuration (for limits validation)
+        output_callback: Optional callable receiving ``(name, text)`` for kernel
+            output (stdout, stderr, display) as it streams
+        session_id: Agent session identifier the kernel connection is cached under
 
     Returns:
         PythonExecutionEngineResult with all captured data from files
@@ -949,10 +1214,13 @@ async def execute_python_code_in_container(
         CodeRuntimeError: When code execution fails
         ExecutionTimeoutError: When execution times out
     """
+    session_manager = await get_session_manager(endpoint, session_id)
     executor = ContainerExecutor(
         endpoint=endpoint,
         execution_folder=execution_folder,
         timeout=timeout,
         executor_config=executor_config,
+        output_callback=output_callback,
+        session_manager=session_manager,
     )
     return await executor.execute_code(code)
@@ -97,27 +97,11 @@ class LocalCodeExecutor:
                 else:
                     env["PYTHONPATH"] = src_path
 
-            # Execute using the specified Python environment asynchronously
-            process = await asyncio.create_subprocess_exec(
-                python_path,
-                temp_script,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(execution_folder or Path.cwd()),
-                env=env,
-            )
-
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=self.executor_config.execution_timeout_seconds,
+                stdout, stderr, returncode, execution_method = await self._run_script(
+                    python_path, temp_script, str(execution_folder or Path.cwd()), env
                 )
-                stdout = stdout_bytes.decode("utf-8", errors="replace")
-                stderr = stderr_bytes.decode("utf-8", errors="replace")
-                returncode = process.returncode
             except TimeoutError as err:
-                process.kill()
-                await process.wait()
                 raise CodeRuntimeError(
                     message=f"Python execution timed out after {self.executor_config.execution_timeout_seconds} seconds",
                     traceback_info="",
@@ -227,7 +211,7 @@ class LocalCodeExecutor:
 
                 # Load actual results if available
                 results_path = (execution_folder or Path.cwd()) / "results.json"
-                results_data = {"execution_method": "local_subprocess", "python_env": python_path}
+                results_data = {"execution_method": execution_method, "python_env": python_path}
                 if await asyncio.to_thread(results_path.exists):
                     try:
                         async with aiofiles.open(results_path, encoding="utf-8") as f:
@@ -278,6 +262,67 @@ class LocalCodeExecutor:
             except Exception as e:
                 logger.debug(f"Failed to clean up temp script {temp_script}: {e}")
 
+    async def _run_script(
+        self, python_path: str, script_path: str, cwd: str, env: dict[str, str]
+    ) -> tuple[str, str, int, str]:
+        """Run the wrapped script, on a warm worker when possible.
+
+        Returns (stdout, stderr, returncode, execution_method). Raises TimeoutError
+        after the process was killed for exceeding the execution timeout.
+        """
+        timeout = self.executor_config.execution_timeout_seconds
+
+        if self.executor_config.worker_pool_enabled:
+            from .worker_pool import WorkerError, WorkerTimeoutError, get_worker_pool
+
+            pool = get_worker_pool(
+                python_path,
+                env,
+                size=self.executor_config.worker_pool_size,
+                max_runs_per_worker=self.executor_config.worker_max_runs,
+                startup_timeout=self.executor_config.worker_startup_timeout_seconds,
+                acquire_timeout=self.executor_config.worker_acquire_timeout_seconds,
+            )
+            if pool is not None:
+                try:
+                    result = await asyncio.to_thread(pool.run, script_path, cwd, env, timeout)
+                    logger.debug(
+                        f"LOCAL EXECUTION: Ran on warm worker in {result.duration_seconds:.2f}s"
+                    )
+                    return result.stdout, result.stderr, result.returncode, "local_worker"
+                except WorkerTimeoutError as err:
+                    raise TimeoutError() from err
+                except WorkerError as e:
+                    logger.warning(
+                        f"LOCAL EXECUTION: Warm worker unavailable ({e}), using subprocess"
+                    )
+
+        # Execute using the specified Python environment asynchronously
+        process = await asyncio.create_subprocess_exec(
+            python_path,
+            script_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                process.communicate(), timeout=timeout
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        return (
+            stdout_bytes.decode("utf-8", errors="replace"),
+            stderr_bytes.decode("utf-8", errors="replace"),
+            process.returncode,
+            "local_subprocess",
+        )
+
     def _detect_python_environment(self) -> str:
         """Detect appropriate Python environment with container-aware logic"""
         import sys
@@ -414,10 +459,12 @@ class LocalCodeExecutor:
 class ContainerCodeExecutor:
     """Container-based execution with proper exception handling"""
 
-    def __init__(self, configurable):
+    def __init__(self, configurable, output_callback=None):
         self.configurable = configurable
         self.executor_config = PythonExecutorConfig(configurable)
         self.file_manager = FileManager(configurable)
+        # Receives (name, text) for kernel output while the code runs
+        self.output_callback = output_callback
 
     async def execute_code(
         self,
@@ -446,6 +493,9 @@ class ContainerCodeExecutor:
                 execution_folder=execution_folder,
                 timeout=self.executor_config.execution_timeout_seconds,
                 executor_config=self.executor_config,
+                output_callback=self.output_callback,
+                session_id=self.configurable.get("session_id")
+                or self.configurable.get("thread_id"),
             )
 
             if not result.success:
@@ -553,12 +603,14 @@ class ContainerCodeExecutor:
     async def _test_connectivity(self, host: str, port: int) -> bool:
         """Test container connectivity"""
         try:
-            import requests
-
-            response = requests.get(
-                f"http://{host}:{port}/api", timeout=5, proxies={"http": None, "https": None}
-            )
-            return response.status_code == 200
+            import aiohttp
+
+            # trust_env=False bypasses proxy environment variables
+            async with aiohttp.ClientSession(trust_env=False) as session:
+                async with session.get(
+                    f"http://{host}:{port}/api", timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    return response.status == 200
         except Exception:
             return False
 
@@ -672,7 +724,14 @@ def create_executor_node():
             executor = LocalCodeExecutor(configurable)
         else:  # Default to container execution
             logger.info("Using container execution method")
-            executor = ContainerCodeExecutor(configurable)
+
+            def forward_output(name: str, text: str) -> None:
+                # Stream kernel output to the UI while the code runs
+                for line in text.splitlines():
+                    if line.strip():
+                        logger.info(f"[{name}] {line}")
+
+            executor = ContainerCodeExecutor(configurable, output_callback=forward_output)
 
         try:
             # Execute with the chosen executor
@@ -0,0 +1,645 @@
+"""
+Pre-warmed Worker Pool for Local Python Execution
+
+Starting a fresh interpreter for every local execution costs several seconds
+before any user code runs, most of it spent importing numpy, pandas,
+matplotlib and the Osprey framework. This module keeps a small pool of warm
+*template* processes that have already imported them. Each execution is run in a child forked from a template (forkserver
+style), so it starts from the preloaded state in milliseconds while still being
+isolated from every other execution - nothing the user code does can leak into
+the template or into later runs.
+
+Protocol:
+    The host talks to each template over its stdin/stdout pipes using one JSON
+    object per line. The host sends a job (script path, working directory,
+    environment and output file paths); the template forks, replies with the
+    child's pid, waits for it and replies with the exit code. The child's
+    stdout and stderr are written to the given files.
+
+Timeouts and recycling:
+    Timeouts are enforced by the host, which kills the child process exactly
+    like the subprocess path kills its interpreter. Each template runs in its
+    own process group, which its children inherit; if the timeout expires before
+    the template reports the child's pid, the host kills the whole group so no
+    child can outlive its template. A template is recycled
+    after ``max_runs_per_worker`` executions, or immediately after a timeout or
+    any protocol failure, and a replacement is started in the background.
+    An execution that finds every worker busy waits at most
+    ``acquire_timeout_seconds`` and then runs in a fresh subprocess instead.
+
+Template state:
+    Templates only import modules; they never read the configuration or
+    initialize the registry, which could leave connections or threads behind
+    in every forked child. Each child initializes the registry from the current
+    configuration itself, so configuration and application changes take effect
+    on the next execution. Upgrading packages in the Python environment is only
+    picked up once templates are recycled (or after :func:`shutdown_worker_pools`).
+
+Forking requires a POSIX platform; elsewhere :func:`get_worker_pool` returns
+None and callers fall back to launching a subprocess per execution.
+
+Configuration (``python_executor.worker_pool``)::
+
+    python_executor:
+      worker_pool:
+        enabled: true             # false = one fresh subprocess per execution
+        size: 2                   # concurrent executions per Python environment
+        max_runs_per_worker: 100  # recycle template after this many executions
+        startup_timeout_seconds: 120
+        acquire_timeout_seconds: 10  # wait for a busy pool before using a subprocess
+"""
+
+import atexit
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from osprey.utils.logger import get_logger
+
+logger = get_logger("python_executor")
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_RUNS_PER_WORKER = 100
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 120.0
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 10.0
+
+# Environment variables that change what a template preloads
+_TEMPLATE_ENV_KEYS = ("PYTHONPATH", "CONFIG_FILE", "PROJECT_ROOT")
+
+
+class WorkerError(Exception):
+    """A warm worker could not run a job (infrastructure failure, not user code)."""
+
+
+class WorkerTimeoutError(Exception):
+    """A job exceeded its timeout and its process was killed."""
+
+
+@dataclass
+class WorkerRunResult:
+    """Outcome of one script run in a forked worker child."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+    duration_seconds: float
+
+
+# =============================================================================
+# HOST SIDE
+# =============================================================================
+
+
+class WarmWorker:
+    """Host-side handle for one template process.
+
+    All methods block; the pool calls them from worker threads.
+    """
+
+    def __init__(self, python_path: str, env: dict[str, str], startup_timeout: float):
+        self.python_path = python_path
+        self.runs = 0
+        self.healthy = False
+        self._buffer = b""
+        self._process = subprocess.Popen(
+            [python_path, "-c", _bootstrap_code()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            start_new_session=True,  # Own process group, shared with forked children
+        )
+        try:
+            ready = self._read_message(time.monotonic() + startup_timeout)
+        except Exception:
+            self.close()
+            raise
+        if ready.get("event") != "ready":
+            self.close()
+            raise WorkerError(f"Worker failed to start: {ready.get('error', ready)}")
+        self.healthy = True
+        logger.debug(
+            f"Warm worker {self._process.pid} ready in {ready.get('startup_seconds', 0):.2f}s "
+            f"(preloaded: {', '.join(ready.get('preloaded', []))})"
+        )
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    def run(
+        self, script_path: str, cwd: str, env: dict[str, str], timeout: float
+    ) -> WorkerRunResult:
+        """Run a script in a fresh forked child - raises WorkerError/WorkerTimeoutError."""
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        self.runs += 1
+
+        with tempfile.TemporaryDirectory(prefix="osprey_worker_") as output_dir:
+            stdout_path = os.path.join(output_dir, "stdout")
+            stderr_path = os.path.join(output_dir, "stderr")
+
+            try:
+                self._send(
+                    {
+                        "op": "run",
+                        "script": script_path,
+                        "cwd": cwd,
+                        "env": env,
+                        "stdout": stdout_path,
+                        "stderr": stderr_path,
+                    }
+                )
+                try:
+                    started = self._read_message(deadline)
+                except WorkerTimeoutError:
+                    # The child may already be forked, but its pid is unknown
+                    self._kill_process_group()
+                    raise
+                if started.get("event") != "started":
+                    raise WorkerError(f"Unexpected worker reply: {started}")
+                child_pid = started["pid"]
+
+                try:
+                    finished = self._read_message(deadline)
+                except WorkerTimeoutError:
+                    self._kill_child(child_pid)
+                    raise
+                if finished.get("event") != "finished":
+                    raise WorkerError(f"Unexpected worker reply: {finished}")
+            except WorkerTimeoutError:
+                self.healthy = False
+                raise
+            except (WorkerError, OSError, ValueError) as e:
+                self.healthy = False
+                if isinstance(e, WorkerError):
+                    raise
+                raise WorkerError(f"Worker communication failed: {e}") from e
+
+            return WorkerRunResult(
+                returncode=finished["returncode"],
+                stdout=_read_text(stdout_path),
+                stderr=_read_text(stderr_path),
+                duration_seconds=time.monotonic() - start_time,
+            )
+
+    def close(self) -> None:
+        """Stop the template process."""
+        self.healthy = False
+        if self._process.poll() is not None:
+            return
+        try:
+            self._send({"op": "shutdown"})
+            self._process.wait(timeout=2)
+        except Exception:
+            self._process.kill()
+            try:
+                self._process.wait(timeout=2)
+            except Exception:
+                pass
+
+    def _kill_process_group(self) -> None:
+        """Kill the template together with any child it has forked."""
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        try:
+            self._process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            pass
+
+    @staticmethod
+    def _kill_child(child_pid: int) -> None:
+        """Kill a timed-out child (the template reaps it)."""
+        try:
+            os.kill(child_pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _send(self, message: dict[str, Any]) -> None:
+        if self._process.poll() is not None:
+            raise WorkerError(f"Worker exited with code {self._process.returncode}")
+        self._process.stdin.write(json.dumps(message).encode() + b"\n")
+        self._process.stdin.flush()
+
+    def _read_message(self, deadline: float) -> dict[str, Any]:
+        """Read one JSON line from the template, waiting until the deadline."""
+        stdout = self._process.stdout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WorkerTimeoutError()
+            readable, _, _ = select.select([stdout], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(stdout.fileno(), 65536)
+            if not chunk:
+                raise WorkerError(f"Worker exited with code {self._process.wait()}")
+            self._buffer += chunk
+
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+
+class WorkerPool:
+    """Pool of warm template processes for one Python environment.
+
+    ``size`` bounds the number of concurrent executions. One template is started
+    in the background when the pool is created and more are started on demand;
+    a recycled template is replaced in the background, so executions rarely
+    wait on startup.
+    """
+
+    def __init__(
+        self,
+        python_path: str,
+        env: dict[str, str],
+        size: int = DEFAULT_POOL_SIZE,
+        max_runs_per_worker: int = DEFAULT_MAX_RUNS_PER_WORKER,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+    ):
+        self.python_path = python_path
+        self.env = env
+        self.size = max(1, size)
+        self.max_runs_per_worker = max(1, max_runs_per_worker)
+        self.startup_timeout = startup_timeout
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: list[WarmWorker] = []
+        self._running = 0  # Workers executing a job
+        self._starting = 0  # Workers being started
+        self._waiters = 0  # Threads waiting in _acquire()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._startup_error: str | None = None
+
+    def prewarm(self) -> None:
+        """Start one template in the background if the pool is empty."""
+        with self._condition:
+            if self._idle or self._running or self._starting:
+                return
+            self._starting += 1
+        threading.Thread(target=self._start_idle_worker, daemon=True).start()
+
+    def run(
+        self, script_path: str, cwd: str, env: dict[str, str], timeout: float
+    ) -> WorkerRunResult:
+        """Run a script on a warm worker - blocks; call via ``asyncio.to_thread``.
+
+        Raises:
+            WorkerTimeoutError: The script exceeded ``timeout`` and was killed
+            WorkerError: No worker could run the script, or none became free within
+                ``acquire_timeout`` (caller should fall back)
+        """
+        worker = self._acquire()
+        try:
+            return worker.run(script_path, cwd, env, timeout)
+        finally:
+            self._release(worker)
+
+    def close(self) -> None:
+        """Stop all idle templates; busy ones stop when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of pool state for diagnostics."""
+        with self._condition:
+            return {
+                "python_path": self.python_path,
+                "size": self.size,
+                "idle": len(self._idle),
+                "running": self._running,
+                "starting": self._starting,
+                "max_runs_per_worker": self.max_runs_per_worker,
+            }
+
+    def _acquire(self) -> WarmWorker:
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            self._waiters += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise WorkerError("Worker pool is closed")
+                    if self._idle:
+                        self._running += 1
+                        return self._idle.pop()
+                    if self._startup_error is not None:
+                        raise WorkerError(self._startup_error)
+                    # Wait for a template that is already starting rather than
+                    # paying for a second concurrent startup
+                    if self._starting < self._waiters and (
+                        self._running + self._starting < self.size
+                    ):
+                        self._starting += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise WorkerError(
+                            f"No warm worker available within {self.acquire_timeout:g}s"
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+        # Pool not full and nothing starting for this caller: start one here
+        try:
+            worker = self._start_worker()
+        except Exception as e:
+            with self._condition:
+                self._starting -= 1
+                self._condition.notify_all()
+            raise WorkerError(f"Failed to start warm worker: {e}") from e
+
+        with self._condition:
+            self._starting -= 1
+            self._running += 1
+        return worker
+
+    def _release(self, worker: WarmWorker) -> None:
+        recycle = not worker.healthy or worker.runs >= self.max_runs_per_worker
+        with self._condition:
+            self._running -= 1
+            keep = not recycle and not self._closed
+            if keep:
+                self._idle.append(worker)
+            replace = recycle and not self._closed
+            if replace:
+                self._starting += 1
+            self._condition.notify_all()
+
+        if not keep:
+            logger.debug(f"Recycling warm worker {worker.pid} after {worker.runs} runs")
+            threading.Thread(target=worker.close, daemon=True).start()
+        if replace:
+            threading.Thread(target=self._start_idle_worker, daemon=True).start()
+
+    def _start_worker(self) -> WarmWorker:
+        return WarmWorker(self.python_path, self.env, self.startup_timeout)
+
+    def _start_idle_worker(self) -> None:
+        """Background thread target: start a template and add it to the idle list."""
+        try:
+            worker = self._start_worker()
+        except Exception as e:
+            logger.warning(f"Warm worker startup failed: {e}")
+            with self._condition:
+                self._starting -= 1
+                # Stop waiting on startups when the environment cannot start workers at all
+                if not self._idle and not self._running and not self._starting:
+                    self._startup_error = f"Warm worker startup failed: {e}"
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self._starting -= 1
+            worker_to_close = worker if self._closed else None
+            if worker_to_close is None:
+                self._idle.append(worker)
+                self._startup_error = None
+            self._condition.notify_all()
+        if worker_to_close is not None:
+            worker_to_close.close()
+
+
+_pools: dict[tuple, WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(
+    python_path: str,
+    env: dict[str, str],
+    size: int = DEFAULT_POOL_SIZE,
+    max_runs_per_worker: int = DEFAULT_MAX_RUNS_PER_WORKER,
+    startup_timeout: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+    acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+) -> WorkerPool | None:
+    """Get the process-wide warm worker pool for a Python environment.
+
+    One pool exists per interpreter path and preload-relevant environment
+    (``PYTHONPATH``, ``CONFIG_FILE``, ``PROJECT_ROOT``); it is created and
+    pre-warmed on first use. Returns None on platforms without ``os.fork``.
+    """
+    if not hasattr(os, "fork"):
+        return None
+
+    key = (python_path, *(env.get(name) for name in _TEMPLATE_ENV_KEYS))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = WorkerPool(
+                python_path,
+                env,
+                size=size,
+                max_runs_per_worker=max_runs_per_worker,
+                startup_timeout=startup_timeout,
+                acquire_timeout=acquire_timeout,
+            )
+            _pools[key] = pool
+            pool.prewarm()
+            logger.info(f"Started warm worker pool for {python_path} (size {pool.size})")
+    return pool
+
+
+def shutdown_worker_pools() -> None:
+    """Stop all warm worker pools (registered to run at interpreter exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(shutdown_worker_pools)
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
+def _bootstrap_code() -> str:
+    """Template entry point, importable even when osprey is only on the host's path."""
+    osprey_parent = str(Path(__file__).resolve().parents[4])
+    return (
+        "import sys\n"
+        "try:\n"
+        "    import osprey\n"
+        "except ImportError:\n"
+        f"    sys.path.append({osprey_parent!r})\n"
+        "from osprey.services.python_executor.execution.worker_pool import serve\n"
+        "serve()\n"
+    )
+
+
+# =============================================================================
+# TEMPLATE SIDE (runs in the warm worker process)
+# =============================================================================
+
+
+def _preload() -> list[str]:
+    """Import what every wrapped script needs, mirroring the local wrapper setup.
+
+    Imports only: the registry is initialized by each forked child, so nothing
+    configuration-dependent or connection-holding is inherited from the template.
+    """
+    preloaded = []
+
+    for module in ("numpy", "pandas"):
+        try:
+            __import__(module)
+            preloaded.append(module)
+        except ImportError:
+            pass
+
+    try:
+        import matplotlib.pyplot as plt
+
+        plt.switch_backend("Agg")
+        preloaded.append("matplotlib")
+    except ImportError:
+        pass
+
+    # Same application path setup the wrapper performs before registry init,
+    # so the child's registry finds the application package
+    config_file = os.environ.get("CONFIG_FILE")
+    if config_file:
+        app_src_dir = Path(config_file).parent / "src"
+        if app_src_dir.exists() and str(app_src_dir) not in sys.path:
+            sys.path.insert(0, str(app_src_dir))
+
+    for module in (
+        "osprey.registry",
+        "osprey.context",
+        "osprey.runtime",
+        "osprey.services.python_executor.services",
+    ):
+        try:
+            __import__(module)
+            preloaded.append(module)
+        except Exception:
+            pass
+
+    return preloaded
+
+
+def _run_child(job: dict[str, Any], protocol_fds: tuple[int, int]) -> None:
+    """Forked child: run the job's script as ``__main__`` and exit."""
+    returncode = 0
+    try:
+        for fd in protocol_fds:
+            os.close(fd)
+
+        stdout_fd = os.open(job["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        stderr_fd = os.open(job["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+
+        os.environ.clear()
+        os.environ.update(job["env"])
+        os.chdir(job["cwd"])
+        sys.argv = [job["script"]]
+
+        # Forked children share the template's numpy RNG state; reseed like a fresh process
+        numpy = sys.modules.get("numpy")
+        if numpy is not None:
+            numpy.random.seed()
+
+        import runpy
+
+        runpy.run_path(job["script"], run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        try:
+            import atexit as child_atexit
+
+            child_atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(returncode)
+
+
+def serve() -> None:
+    """Template main loop: preload, then fork one child per job."""
+    start_time = time.monotonic()
+
+    # Keep the protocol pipes private; stray prints during preload go to stderr
+    protocol_in = os.dup(0)
+    protocol_out = os.dup(1)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+    os.close(devnull)
+
+    reader = os.fdopen(protocol_in, "rb")
+    writer = os.fdopen(protocol_out, "wb")
+
+    def send(message: dict[str, Any]) -> None:
+        writer.write(json.dumps(message).encode() + b"\n")
+        writer.flush()
+
+    try:
+        preloaded = _preload()
+    except BaseException as e:
+        send({"event": "error", "error": str(e)})
+        return
+
+    send(
+        {
+            "event": "ready",
+            "preloaded": preloaded,
+            "startup_seconds": time.monotonic() - start_time,
+        }
+    )
+
+    for line in reader:
+        job = json.loads(line)
+        if job.get("op") != "run":
+            break
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(job, (protocol_in, protocol_out))
+
+        send({"event": "started", "pid": pid})
+        _, status = os.waitpid(pid, 0)
+        send({"event": "finished", "returncode": os.waitstatus_to_exitcode(status)})
+
+    # Nothing to clean up in the template; skip slow interpreter finalization
+    os._exit(0)
@@ -20,6 +20,7 @@ The state management system follows a clear separation of concerns:
 **Message and Session Management:**
 - :class:`MessageUtils`: LangGraph-native message creation and manipulation
 - :class:`ChatHistoryFormatter`: Conversation formatting for LLM consumption
+- :class:`ChatHistoryManager`: Token-budgeted history with a rolling summary of older turns
 - :class:`UserMemories`: Persistent user context across conversations
 - :class:`SessionContext`: Session-specific metadata and configuration
 
@@ -93,6 +94,7 @@ from .artifacts import (
 )
 from .control import AgentControlState, apply_slash_commands_to_agent_control_state
 from .execution import ApprovalRequest  # Keep as dataclass
+from .history import CHAT_HISTORY_SUMMARY_KEY, ChatHistoryManager, HistoryWindow
 from .messages import ChatHistoryFormatter, MessageUtils, UserMemories
 from .session import SessionContext  # Keep as simple utility
 from .state import (
@@ -130,6 +132,10 @@ __all__ = [
     "MessageUtils",
     "ChatHistoryFormatter",
     "UserMemories",
+    # Token-budgeted history
+    "CHAT_HISTORY_SUMMARY_KEY",
+    "ChatHistoryManager",
+    "HistoryWindow",
     # Control state (simplified)
     "AgentControlState",
     "apply_slash_commands_to_agent_control_state",
@@ -0,0 +1,269 @@
+"""Framework State - Token-Budgeted Conversation History.
+
+This module keeps the chat history handed to LLM prompts bounded in long
+conversations. The most recent messages are kept verbatim within a token budget;
+older messages are folded into a rolling summary that is cached in
+``session_state`` and only recomputed when the verbatim window slides.
+
+**Core Components:**
+
+- :class:`ChatHistoryManager`: Selects the verbatim window and maintains the summary
+- :class:`HistoryWindow`: Selected messages plus prompt-size accounting
+- :func:`estimate_tokens`: Cheap, dependency-free token estimate
+
+**Window Sliding:**
+
+The window only slides once the uncovered messages exceed ``max_tokens``. It then
+drops back to roughly half the budget, so the summary is updated once per half
+budget of new conversation instead of on every turn. Each update folds only the
+newly evicted messages into the previous summary.
+
+.. note::
+   The manager does not call any LLM itself. Pass an async ``summarizer`` to use
+   model-generated summaries; the default keeps a truncated transcript of older
+   messages.
+
+.. seealso::
+   :class:`osprey.state.ChatHistoryFormatter` : Formats the selected messages
+   :func:`osprey.state.state.merge_session_state` : Persists the cached summary
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from .messages import MessageUtils
+
+# session_state key holding the cached rolling summary
+CHAT_HISTORY_SUMMARY_KEY = "chat_history_summary"
+
+# Rough characters-per-token ratio for English text and code
+_CHARS_PER_TOKEN = 4
+
+# Per-message overhead of numbering, role and timestamp in formatted history
+_MESSAGE_OVERHEAD_TOKENS = 6
+
+# Characters of each evicted message kept by the extractive summarizer
+_EXTRACT_CHARS = 200
+
+Summarizer = Callable[[str | None, list[BaseMessage], int], Awaitable[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a tokenizer.
+
+    :param text: Text to measure
+    :return: Approximate number of tokens
+    """
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _message_tokens(message: BaseMessage) -> int:
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    return estimate_tokens(content) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def format_summary_source(messages: list[BaseMessage], max_chars: int | None = None) -> str:
+    """Format messages as ``ROLE: content`` lines for summarization.
+
+    :param messages: Messages to format
+    :param max_chars: Optional per-message content limit
+    :return: One line per message
+    """
+    lines = []
+    for message in messages:
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        content = " ".join(content.split())
+        if max_chars and len(content) > max_chars:
+            content = content[: max_chars - 3] + "..."
+        lines.append(f"{MessageUtils.get_role(message).upper()}: {content}")
+    return "\n".join(lines)
+
+
+async def extractive_summary(
+    previous: str | None, messages: list[BaseMessage], max_tokens: int
+) -> str:
+    """Summarize by appending truncated messages to the previous summary.
+
+    Keeps the most recent part when the result exceeds ``max_tokens``.
+
+    :param previous: Summary of the messages evicted earlier
+    :param messages: Newly evicted messages
+    :param max_tokens: Approximate size limit of the summary
+    :return: Updated summary
+    """
+    parts = [previous] if previous else []
+    parts.append(format_summary_source(messages, _EXTRACT_CHARS))
+    summary = "\n".join(parts)
+
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    if len(summary) > max_chars:
+        summary = "..." + summary[-(max_chars - 3) :]
+    return summary
+
+
+@dataclass
+class HistoryWindow:
+    """Chat history selected for a prompt.
+
+    :param messages: Messages to format, starting with a summary message when
+        older messages were folded into the summary
+    :param summary: Rolling summary of messages outside the window, if any
+    :param summarized_count: Number of leading messages covered by the summary
+    :param full_tokens: Estimated tokens of the complete history
+    :param window_tokens: Estimated tokens of ``messages``
+    :param summary_updated: Whether the summary was recomputed for this window
+    :param cache: Summary cache entry to store under :data:`CHAT_HISTORY_SUMMARY_KEY`
+    """
+
+    messages: list[BaseMessage]
+    summary: str | None = None
+    summarized_count: int = 0
+    full_tokens: int = 0
+    window_tokens: int = 0
+    summary_updated: bool = False
+    cache: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated prompt tokens saved compared to the complete history."""
+        return max(self.full_tokens - self.window_tokens, 0)
+
+    def describe(self) -> str:
+        """One-line description of the window for logs."""
+        if not self.summarized_count:
+            return (
+                f"{len(self.messages)} messages (~{self.full_tokens:,} tokens), no summary needed"
+            )
+        return (
+            f"{len(self.messages) - 1} recent messages + summary of {self.summarized_count} "
+            f"(~{self.window_tokens:,} of ~{self.full_tokens:,} tokens, "
+            f"saved ~{self.saved_tokens:,})"
+        )
+
+
+class ChatHistoryManager:
+    """Keep recent messages verbatim within a token budget and summarize the rest.
+
+    The summary state is passed in and returned as a plain dictionary so that it
+    can be stored in ``session_state`` and survive checkpointing.
+
+    :param max_tokens: Token budget for the verbatim window; ``0`` disables windowing
+    :param min_recent_messages: Messages always kept verbatim, regardless of budget
+    :param summary_max_tokens: Approximate size limit of the rolling summary
+    :param summarizer: Async ``(previous_summary, evicted_messages, max_tokens)``
+        callable; defaults to :func:`extractive_summary`
+
+    Examples:
+        Windowing history for a prompt::
+
+            >>> manager = ChatHistoryManager(max_tokens=4000)
+            >>> window = await manager.build_window(
+            ...     state["messages"], state["session_state"].get(CHAT_HISTORY_SUMMARY_KEY)
+            ... )
+            >>> ChatHistoryFormatter.format_for_llm(window.messages)
+    """
+
+    # Fraction of the budget kept verbatim right after the window slides
+    refill_fraction = 0.5
+
+    def __init__(
+        self,
+        max_tokens: int,
+        min_recent_messages: int = 4,
+        summary_max_tokens: int = 500,
+        summarizer: Summarizer | None = None,
+    ):
+        self.max_tokens = max_tokens
+        self.min_recent_messages = min_recent_messages
+        self.summary_max_tokens = summary_max_tokens
+        self.summarizer = summarizer or extractive_summary
+
+    async def build_window(
+        self, messages: list[BaseMessage], cached: dict[str, Any] | None = None
+    ) -> HistoryWindow:
+        """Select the messages to include in a prompt.
+
+        :param messages: Complete conversation history
+        :param cached: Summary cache entry from a previous turn, if any
+        :return: Selected window with the (possibly updated) summary cache
+        """
+        token_counts = [_message_tokens(message) for message in messages]
+        full_tokens = sum(token_counts)
+
+        if self.max_tokens <= 0:
+            return HistoryWindow(
+                messages=list(messages), full_tokens=full_tokens, window_tokens=full_tokens
+            )
+
+        summary, covered = self._validate_cache(messages, cached)
+        boundary = self._slide(messages, token_counts, covered)
+
+        updated = False
+        if boundary > covered:
+            summary = await self.summarizer(
+                summary, list(messages[covered:boundary]), self.summary_max_tokens
+            )
+            covered = boundary
+            updated = True
+
+        recent = list(messages[covered:])
+        window_tokens = sum(token_counts[covered:])
+        if summary:
+            summary_message = SystemMessage(
+                content=f"Summary of the {covered} earlier messages in this conversation:\n{summary}"
+            )
+            recent.insert(0, summary_message)
+            window_tokens += _message_tokens(summary_message)
+
+        return HistoryWindow(
+            messages=recent,
+            summary=summary,
+            summarized_count=covered,
+            full_tokens=full_tokens,
+            window_tokens=window_tokens,
+            summary_updated=updated,
+            cache={
+                "summary": summary,
+                "covered": covered,
+                "last_id": messages[covered - 1].id if covered else None,
+            },
+        )
+
+    @staticmethod
+    def _validate_cache(
+        messages: list[BaseMessage], cached: dict[str, Any] | None
+    ) -> tuple[str | None, int]:
+        """Return the cached summary if it still describes a prefix of ``messages``."""
+        if not cached or not cached.get("summary"):
+            return None, 0
+
+        covered = cached.get("covered", 0)
+        if not isinstance(covered, int) or not 0 < covered <= len(messages):
+            return None, 0
+        if cached.get("last_id") != messages[covered - 1].id:
+            return None, 0
+        return cached["summary"], covered
+
+    def _slide(self, messages: list[BaseMessage], token_counts: list[int], covered: int) -> int:
+        """Return the index of the first verbatim message after sliding the window."""
+        if sum(token_counts[covered:]) <= self.max_tokens:
+            return covered
+
+        limit = len(messages) - self.min_recent_messages
+        target = self.max_tokens * self.refill_fraction
+        boundary = len(messages)
+        kept = 0
+        while boundary > covered and kept + token_counts[boundary - 1] <= target:
+            boundary -= 1
+            kept += token_counts[boundary]
+        boundary = min(boundary, limit)
+
+        # Start the verbatim window at a user message so turns stay intact
+        while boundary < limit and not isinstance(messages[boundary], HumanMessage):
+            boundary += 1
+        return max(boundary, covered)
@@ -50,7 +50,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 # LangGraph native message types for checkpointing compatibility
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 
 
 class MessageUtils:
@@ -105,11 +105,13 @@ class MessageUtils:
 
     @staticmethod
     def get_role(message: BaseMessage) -> str:
-        """Get the role of a message (user or assistant)."""
+        """Get the role of a message (user, assistant or system)."""
         if isinstance(message, HumanMessage):
             return "user"
         elif isinstance(message, AIMessage):
             return "assistant"
+        elif isinstance(message, SystemMessage):
+            return "system"
         return "unknown"
 
 
@@ -70,7 +70,6 @@ maintaining compatibility with LangGraph's checkpointing system.
    :mod:`osprey.base.planning` : Execution planning and step structures
 """
 
-import copy
 from typing import Annotated, Any
 
 # LangGraph native imports
@@ -151,8 +150,14 @@ def merge_capability_context_data(
     :rtype: Dict[str, Dict[str, Dict[str, Any]]]
 
     .. note::
-       The function performs deep copying to prevent mutation of input dictionaries,
-       ensuring state immutability and preventing side effects in LangGraph operations.
+       The merge uses structural sharing instead of deep copying: the result is a
+       new top-level dictionary, and only the context types touched by ``new`` get
+       new per-type dictionaries. Untouched types and all per-key context
+       dictionaries are shared with the inputs, so the cost of a merge depends on
+       the size of the update rather than on the total context accumulated in
+       the conversation. Neither input is mutated. Stored context dictionaries
+       are treated as immutable snapshots; :class:`osprey.context.ContextManager`
+       replaces them (copy-on-write) rather than editing them in place.
 
     .. warning::
        New context data will override existing context data for the same context_type
@@ -181,20 +186,23 @@ def merge_capability_context_data(
        :class:`osprey.context.ContextManager` : Context data management utilities
     """
     if existing is None:
-        # Deep copy to avoid mutation of input
-        return copy.deepcopy(new)
+        # New top-level and per-type containers; context snapshots are shared
+        return {context_type: dict(contexts) for context_type, contexts in new.items()}
 
-    # Deep copy existing data to avoid mutation
-    result = copy.deepcopy(existing)
+    result = dict(existing)
 
     # Merge in new data, which may override existing keys
     for context_type, contexts in new.items():
-        if context_type not in result:
-            result[context_type] = {}
-
-        for context_key, context_data in contexts.items():
-            # Update the entire context data for this key
-            result[context_type][context_key] = copy.deepcopy(context_data)
+        current = result.get(context_type)
+        if contexts is current:
+            # Type untouched by this update (nodes return the full context dict)
+            continue
+
+        if current is None:
+            result[context_type] = dict(contexts)
+        else:
+            # Replace only the per-type container; update the entire data for each key
+            result[context_type] = {**current, **contexts}
 
     return result
 
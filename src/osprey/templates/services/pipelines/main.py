@@ -34,13 +34,19 @@ from osprey.events.types import (
     PhaseStartEvent,
     StatusEvent,
 )
-from osprey.graph import create_graph
+from osprey.graph import SessionCheckpointer, create_graph
 from osprey.infrastructure.gateway import Gateway
+from osprey.models.http_clients import aclose_async_http_client
 
 # NOTE: sys.path manipulation removed - osprey is pip-installed
 # In pip-installable architecture, osprey modules are directly importable
 from osprey.registry import get_registry, initialize_registry
-from osprey.utils.config import get_current_application, get_full_configuration, get_pipeline_config
+from osprey.utils.config import (
+    get_agent_dir,
+    get_current_application,
+    get_full_configuration,
+    get_pipeline_config,
+)
 from osprey.utils.logger import get_logger
 
 logger = get_logger("pipeline")
@@ -396,6 +402,7 @@ class Pipeline:
         # Initialize framework components
         self._graph = None
         self._gateway = None
+        self._checkpointer = None
         self._initialized = False
 
         logger.info(f"Pipeline '{self.name}' initialized with app: {self.valves.app_name}")
@@ -565,7 +572,7 @@ class Pipeline:
         1. Check initialization status to avoid duplicate initialization
         2. Execute application-specific startup hooks with error handling
         3. Initialize framework registry with all capabilities and services
-        4. Create LangGraph instance with memory checkpointer
+        4. Create LangGraph instance with bounded session checkpointer
         5. Initialize Gateway for message processing
         6. Mark pipeline as initialized and log completion
 
@@ -619,8 +626,8 @@ class Pipeline:
         stopped or restarted, allowing for proper resource cleanup and state
         persistence.
 
-        Currently performs basic logging of shutdown events. Future implementations
-        may include database connection cleanup, file handle closure, or external
+        Logs session checkpointer metrics and closes its spill file. Future
+        implementations may include database connection cleanup or external
         service disconnection as needed by specific applications.
 
         .. note::
@@ -635,6 +642,9 @@ class Pipeline:
         .. seealso::
            :meth:`on_startup` : Corresponding startup initialization method
         """
+        if self._checkpointer is not None:
+            logger.info(f"Session checkpointer stats at shutdown: {self._checkpointer.stats()}")
+            self._checkpointer.close()
         logger.info(f"Pipeline '{self.name}' shutdown")
 
     async def _initialize_framework(self):
@@ -647,7 +657,7 @@ class Pipeline:
 
         Initialization Steps:
         1. Initialize capability registry with all available capabilities
-        2. Create memory-based checkpointer for conversation persistence
+        2. Create bounded session checkpointer for conversation persistence
         3. Build LangGraph instance with registry and checkpointer
         4. Initialize Gateway for message preprocessing and routing
         5. Log successful completion of framework setup
@@ -672,7 +682,7 @@ class Pipeline:
            :func:`osprey.registry.initialize_registry` : Registry setup
            :func:`osprey.graph.create_graph` : LangGraph instance creation
            :class:`osprey.infrastructure.gateway.Gateway` : Message processing
-           :class:`langgraph.checkpoint.memory.MemorySaver` : Checkpointing system
+           :class:`osprey.graph.SessionCheckpointer` : Checkpointing system
         """
 
         try:
@@ -681,21 +691,41 @@ class Pipeline:
             initialize_registry()
             registry = get_registry()
 
-            # Initialize graph without checkpointer (will be set per-request for session isolation)
-            # This prevents state contamination between different chat sessions
-            self._graph = create_graph(registry, checkpointer=None)
+            # One checkpointer for all chats: sessions are isolated by thread_id,
+            # bounded in memory, and (optionally) spilled to disk when evicted.
+            # The graph is compiled once and never rebound per request.
+            self._checkpointer = self._create_session_checkpointer()
+            self._graph = create_graph(registry, checkpointer=self._checkpointer)
             self._gateway = Gateway()
 
-            # Map chat_id -> MemorySaver instance for session-scoped checkpoints
-            # Each chat session gets its own isolated checkpoint storage
-            self._checkpointers = {}
-
             logger.info("Framework initialization completed")
 
         except Exception as e:
             logger.exception(f"Failed to initialize framework: {e}")
             raise
 
+    def _create_session_checkpointer(self) -> SessionCheckpointer:
+        """Create the session checkpointer from ``pipeline.checkpointing`` config."""
+        checkpointing = get_pipeline_config().get("checkpointing", {})
+
+        spill_path = None
+        if checkpointing.get("spill_to_disk", self.valves.use_persistent_checkpointing):
+            spill_path = checkpointing.get("spill_path") or os.path.join(
+                get_agent_dir("checkpoints"), "pipeline_sessions.sqlite"
+            )
+
+        checkpointer = SessionCheckpointer(
+            max_sessions=checkpointing.get("max_sessions", 200),
+            idle_ttl_seconds=checkpointing.get("idle_ttl_seconds", 6 * 3600),
+            spill_path=spill_path,
+            spill_retention_seconds=checkpointing.get("spill_retention_seconds", 7 * 24 * 3600),
+        )
+        logger.info(
+            f"Session checkpointer: max_sessions={checkpointer.max_sessions}, "
+            f"idle_ttl={checkpointer.idle_ttl_seconds}s, spill={spill_path or 'disabled'}"
+        )
+        return checkpointer
+
     def _build_config_for_session(self, user_id: str, chat_id: str, session_id: str) -> dict:
         """Build comprehensive configuration for a session using config with valve overrides"""
 
@@ -913,16 +943,6 @@ class Pipeline:
             # Send initial status update for regular message processing
             yield self._create_status_event("Processing message...", False)
 
-            # Create or reuse checkpointer for this chat session
-            # This provides session isolation and prevents state contamination
-            if chat_id not in self._checkpointers:
-                from langgraph.checkpoint.memory import MemorySaver
-
-                self._checkpointers[chat_id] = MemorySaver()
-
-            # Set checkpointer for this request
-            self._graph.checkpointer = self._checkpointers[chat_id]
-
             # Execute async processing in sync context
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -1010,6 +1030,8 @@ class Pipeline:
 
             finally:
                 try:
+                    # Close this loop's pooled HTTP connections before the loop goes away
+                    loop.run_until_complete(aclose_async_http_client())
                     loop.run_until_complete(loop.shutdown_asyncgens())
                 except Exception:
                     pass
@@ -1262,6 +1284,7 @@ class Pipeline:
             finally:
                 # Properly clean up async generators (prevents "Task was destroyed" warnings)
                 try:
+                    thread_loop.run_until_complete(aclose_async_http_client())
                     thread_loop.run_until_complete(thread_loop.shutdown_asyncgens())
                 except Exception:
                     pass
@@ -1649,7 +1672,14 @@ class Pipeline:
             elif len(parts) == 2:
                 arg = parts[1]
 
-                if arg.isdigit():
+                if arg == "sessions":
+                    # Session checkpointer memory metrics
+                    stats = self._checkpointer.stats() if self._checkpointer else {}
+                    lines = "\n".join(f"{key}: {value}" for key, value in stats.items())
+                    yield self._create_status_event("", True)
+                    yield f"**Session Checkpointer:**\n\n```\n{lines}\n```"
+
+                elif arg.isdigit():
                     # Specific number of lines
                     lines = int(arg)
                     logs = self._get_container_logs(lines)
@@ -1662,6 +1692,7 @@ class Pipeline:
                         "**Log Commands:**\n\n"
                         "• `/logs` - Show last 100 lines\n"
                         "• `/logs 50` - Show last 50 lines\n"
+                        "• `/logs sessions` - Show session checkpointer memory usage\n"
                         "• `/logs help` - Show this help"
                     )
             else:
@@ -1670,6 +1701,7 @@ class Pipeline:
                     "**Log Commands:**\n\n"
                     "• `/logs` - Show last 100 lines\n"
                     "• `/logs 50` - Show last 50 lines\n"
+                    "• `/logs sessions` - Show session checkpointer memory usage\n"
                     "• `/logs help` - Show this help"
                 )
 
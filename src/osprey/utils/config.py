@@ -29,6 +29,12 @@ except (RuntimeError, ImportError):
 # The short name 'CONFIG' enables easy filtering: quiet_logger(['registry', 'CONFIG'])
 logger = logging.getLogger("CONFIG")
 
+# Supported values for execution_control.classification.mode
+CLASSIFICATION_MODES = ("per_capability", "batched")
+
+# Supported values for execution_control.chat_history.summary_mode
+CHAT_HISTORY_SUMMARY_MODES = ("llm", "extractive")
+
 
 class ConfigBuilder:
     """
@@ -1004,14 +1010,19 @@ def get_classification_config() -> dict[str, Any]:
     Get classification configuration with sensible defaults.
 
     Controls parallel LLM-based capability classification to prevent API flooding
-    while maintaining reasonable performance during task analysis.
+    while maintaining reasonable performance during task analysis. The ``mode``
+    selects between one classification request per capability (``per_capability``)
+    and a single structured request covering several capabilities (``batched``).
 
     Returns:
-        Dictionary with classification configuration including concurrency limits
+        Dictionary with classification configuration including concurrency limits,
+        classification mode and batch size
 
     Examples:
         >>> config = get_classification_config()
         >>> max_concurrent = config.get('max_concurrent_classifications', 5)
+        >>> if config['mode'] == 'batched':
+        ...     batch_size = config['batch_size']
     """
     configurable = _get_configurable()
 
@@ -1020,7 +1031,74 @@ def get_classification_config() -> dict[str, Any]:
         "max_concurrent_classifications", 5
     )
 
-    return {"max_concurrent_classifications": max_concurrent}
+    classification_settings = get_config_value("execution_control.classification", {}) or {}
+
+    mode = classification_settings.get("mode", "per_capability")
+    if mode not in CLASSIFICATION_MODES:
+        logger.warning(
+            f"Unknown classification mode '{mode}', falling back to 'per_capability' "
+            f"(valid: {', '.join(CLASSIFICATION_MODES)})"
+        )
+        mode = "per_capability"
+
+    batch_size = classification_settings.get("batch_size", 20)
+    if not isinstance(batch_size, int) or batch_size < 1:
+        logger.warning(f"Invalid classification batch_size '{batch_size}', using 20")
+        batch_size = 20
+
+    return {
+        "max_concurrent_classifications": max_concurrent,
+        "mode": mode,
+        "batch_size": batch_size,
+    }
+
+
+def get_chat_history_config() -> dict[str, Any]:
+    """
+    Get token-budgeted chat history configuration with sensible defaults.
+
+    Controls how much conversation history task extraction sends to the LLM.
+    With ``max_tokens`` set, recent messages are kept verbatim within that budget
+    and older messages are folded into a rolling summary (``summary_mode``:
+    ``llm`` or ``extractive``). A budget of 0 sends the complete history.
+
+    Returns:
+        Dictionary with max_tokens, min_recent_messages, summary_max_tokens and
+        summary_mode
+
+    Examples:
+        >>> config = get_chat_history_config()
+        >>> if config['max_tokens']:
+        ...     manager = ChatHistoryManager(config['max_tokens'])
+    """
+    defaults = {
+        "max_tokens": 0,
+        "min_recent_messages": 4,
+        "summary_max_tokens": 500,
+        "summary_mode": "llm",
+    }
+    try:
+        settings = get_config_value("execution_control.chat_history", {}) or {}
+    except Exception:
+        settings = {}
+
+    config = dict(defaults)
+    for key in ("max_tokens", "min_recent_messages", "summary_max_tokens"):
+        value = settings.get(key, defaults[key])
+        if not isinstance(value, int) or value < 0:
+            logger.warning(f"Invalid chat_history {key} '{value}', using {defaults[key]}")
+            value = defaults[key]
+        config[key] = value
+
+    summary_mode = settings.get("summary_mode", defaults["summary_mode"])
+    if summary_mode not in CHAT_HISTORY_SUMMARY_MODES:
+        logger.warning(
+            f"Unknown chat_history summary_mode '{summary_mode}', falling back to 'llm' "
+            f"(valid: {', '.join(CHAT_HISTORY_SUMMARY_MODES)})"
+        )
+        summary_mode = defaults["summary_mode"]
+    config["summary_mode"] = summary_mode
+    return config
 
 
 def get_full_configuration(config_path: str | None = None) -> dict[str, Any]:
@@ -0,0 +1,182 @@
+"""Tests for retry backoff and circuit breakers."""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osprey.base.capability import BaseCapability
+from osprey.base.decorators import capability_node
+from osprey.base.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    compute_retry_delay,
+    get_circuit_breaker,
+    is_circuit_open,
+    is_infrastructure_error,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("osprey.base.resilience.time.monotonic", fake):
+        yield fake
+
+
+class TestComputeRetryDelay:
+    def test_exponential_backoff_without_jitter(self):
+        policy = {"delay_seconds": 1.0, "backoff_factor": 2.0, "jitter": 0}
+
+        delays = [compute_retry_delay(policy, attempt) for attempt in range(4)]
+
+        assert delays == [0.0, 1.0, 2.0, 4.0]
+
+    def test_delay_is_capped(self):
+        policy = {"delay_seconds": 1.0, "backoff_factor": 10.0, "max_delay_seconds": 5.0}
+
+        assert compute_retry_delay(policy, 6, rng=random.Random(0)) <= 5.0 * 1.25
+
+    def test_jitter_spreads_delays(self):
+        policy = {"delay_seconds": 2.0, "backoff_factor": 1.0, "jitter": 0.5}
+        rng = random.Random(42)
+
+        delays = {round(compute_retry_delay(policy, 1, rng=rng), 3) for _ in range(20)}
+
+        assert len(delays) > 10
+        assert all(1.0 <= delay <= 3.0 for delay in delays)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker("archiver:test", failure_threshold=3, reset_timeout=30)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.check()
+        assert excinfo.value.retry_after == pytest.approx(30)
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker("archiver:test", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker("archiver:test", failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        clock.now += 31
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker("archiver:test", failure_threshold=3, reset_timeout=30)
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 31
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.retry_after() == pytest.approx(30)
+
+
+class TestCircuitBreakerRegistry:
+    def test_breakers_are_shared_and_configurable(self):
+        settings = {"failure_threshold": 7, "reset_timeout_seconds": 5}
+        with patch("osprey.base.resilience._get_breaker_settings", return_value=settings):
+            breaker = get_circuit_breaker("capability:channel_read")
+
+        assert get_circuit_breaker("capability:channel_read") is breaker
+        assert breaker.failure_threshold == 7
+        assert not is_circuit_open("capability:never_used")
+
+    def test_disabled_in_config(self):
+        with patch("osprey.base.resilience._get_breaker_settings", return_value={"enabled": False}):
+            assert get_circuit_breaker("capability:channel_read") is None
+
+    def test_infrastructure_errors(self):
+        assert is_infrastructure_error(ConnectionError("refused"))
+        assert is_infrastructure_error(TimeoutError())
+        assert not is_infrastructure_error(ValueError("bad PV"))
+        assert not is_infrastructure_error(CircuitOpenError("archiver:test", 1.0))
+
+    def test_wrapped_infrastructure_errors(self):
+        def wrapped(cause, suppress=False):
+            try:
+                try:
+                    raise cause
+                except Exception as e:
+                    if suppress:
+                        raise RuntimeError("read failed") from None
+                    raise RuntimeError("read failed") from e
+            except RuntimeError as outer:
+                return outer
+
+        assert is_infrastructure_error(wrapped(ConnectionError("refused")))
+        assert is_infrastructure_error(wrapped(TimeoutError()))
+        assert not is_infrastructure_error(wrapped(ValueError("bad PV")))
+        assert not is_infrastructure_error(wrapped(CircuitOpenError("archiver:test", 1.0)))
+        assert not is_infrastructure_error(wrapped(ConnectionError("refused"), suppress=True))
+
+        # Implicit chaining (raised while handling) counts as well
+        try:
+            try:
+                raise ConnectionError("refused")
+            except ConnectionError:
+                raise KeyError("channel")  # noqa: B904
+        except KeyError as e:
+            assert is_infrastructure_error(e)
+
+
+@pytest.mark.asyncio
+async def test_capability_fast_fails_after_repeated_outages(monkeypatch):
+    monkeypatch.setattr("osprey.base.decorators.get_stream_writer", lambda: None)
+    step = {"capability": "flaky_archiver", "context_key": "data", "task_objective": "Fetch"}
+    state_manager = MagicMock()
+    state_manager.get_current_step.return_value = step
+    state_manager.get_current_step_index.return_value = 0
+    monkeypatch.setattr("osprey.state.StateManager", state_manager)
+    calls = []
+
+    @capability_node
+    class FlakyArchiver(BaseCapability):
+        name = "flaky_archiver"
+        description = "Archiver that is down"
+
+        async def execute(self) -> dict:
+            calls.append(1)
+            raise ConnectionError("archiver unreachable")
+
+    state = {"planning_current_step_index": 0, "execution_step_results": {}}
+    with patch(
+        "osprey.base.resilience._get_breaker_settings", return_value={"failure_threshold": 2}
+    ):
+        results = [await FlakyArchiver.langgraph_node(state) for _ in range(3)]
+
+    assert len(calls) == 2
+    assert [r["control_error_info"]["circuit_open"] for r in results] == [False, False, True]
+    assert is_circuit_open("capability:flaky_archiver")
@@ -5,6 +5,10 @@ Tests class attributes, error classification, context class, and guides.
 
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+import pytest
+
 from osprey.base.errors import ErrorSeverity
 from osprey.capabilities.archiver_retrieval import (
     ArchiverConnectionError,
@@ -138,6 +142,78 @@ class TestArchiverDataContext:
         channel_summary = summary["channel_data"]["SR:CURRENT:RB"]
         assert len(channel_summary["sample_values"]) == 3
 
+    def test_artifact_backed_context(self, tmp_path):
+        """Artifact-backed contexts keep only the handle and load data lazily."""
+        from osprey.context.artifacts import (
+            add_artifact_search_path,
+            clear_artifact_search_paths,
+            save_timeseries,
+        )
+
+        index = pd.date_range("2026-01-01", periods=50, freq="s")
+        frame = pd.DataFrame({"SR:CURRENT:RB": np.arange(50, dtype=float)}, index=index)
+        add_artifact_search_path(tmp_path)
+        try:
+            ctx = ArchiverDataContext(
+                artifact=save_timeseries(frame, store_dir=tmp_path),
+                precision_ms=1000,
+                available_channels=["SR:CURRENT:RB"],
+                total_points=50,
+                start_time=index[0].to_pydatetime(),
+                end_time=index[-1].to_pydatetime(),
+            )
+
+            dumped = ctx.model_dump()
+            assert dumped["inline_time_series_data"] is None
+            restored = ArchiverDataContext.model_validate(dumped)
+
+            assert restored.time_series_data["SR:CURRENT:RB"][10] == 10.0
+            assert restored.timestamps[10] == index[10]
+            assert restored.to_dataframe()["SR:CURRENT:RB"].sum() == sum(range(50))
+            summary = restored.get_summary()
+            assert summary["channel_data"]["SR:CURRENT:RB"]["statistics"]["max_value"] == 49.0
+            assert restored.get_access_details("beam")["total_points"] == 50
+        finally:
+            clear_artifact_search_paths()
+
+    def test_missing_artifact_raises_clear_error(self, tmp_path):
+        """A pruned artifact fails data access instead of yielding empty data."""
+        import shutil
+
+        from osprey.context.artifacts import (
+            ArtifactNotFoundError,
+            add_artifact_search_path,
+            clear_artifact_search_paths,
+            save_timeseries,
+        )
+
+        index = pd.date_range("2026-01-01", periods=5, freq="s")
+        frame = pd.DataFrame({"SR:CURRENT:RB": np.arange(5, dtype=float)}, index=index)
+        add_artifact_search_path(tmp_path)
+        try:
+            handle = save_timeseries(frame, store_dir=tmp_path)
+            shutil.rmtree(tmp_path / handle.removeprefix("artifact://"))
+            ctx = ArchiverDataContext(
+                artifact=handle,
+                precision_ms=1000,
+                available_channels=["SR:CURRENT:RB"],
+                total_points=5,
+            )
+
+            assert not ctx.data_available
+            for access in (
+                lambda: ctx.time_series_data,
+                lambda: ctx.timestamps,
+                ctx.to_dataframe,
+            ):
+                with pytest.raises(ArtifactNotFoundError, match="no longer available"):
+                    access()
+            # Descriptions for the LLM state the problem instead of failing
+            assert "no longer available" in ctx.get_summary()["ERROR"]
+            assert "no longer available" in ctx.get_access_details("beam")["ERROR"]
+        finally:
+            clear_artifact_search_paths()
+
 
 class TestArchiverRetrievalGuides:
     """Test orchestrator and classifier guides."""
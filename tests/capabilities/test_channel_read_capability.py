@@ -3,7 +3,11 @@
 Tests class attributes, error classification, context class, and guides.
 """
 
+from contextlib import asynccontextmanager
 from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from osprey.base.errors import ErrorSeverity
 from osprey.capabilities.channel_read import (
@@ -15,6 +19,9 @@ from osprey.capabilities.channel_read import (
     ChannelValue,
     ChannelValuesContext,
 )
+from osprey.connectors.control_system.base import BulkReadResult
+from osprey.connectors.control_system.base import ChannelValue as ConnectorValue
+from osprey.connectors.factory import ConnectorFactory
 
 
 class TestChannelReadCapabilityAttributes:
@@ -136,3 +143,132 @@ class TestChannelReadGuides:
         assert guide is not None
         assert guide.instructions
         assert len(guide.examples) > 0
+
+
+class TestChannelReadBulkExecution:
+    """Test batched bulk reads through the connector bulk API."""
+
+    @staticmethod
+    def _make_connector(failing: set[str] | None = None):
+        failing = failing or set()
+        connector = MagicMock()
+        connector.batches = []
+
+        async def detailed(addresses, timeout=None):
+            connector.batches.append(list(addresses))
+            return BulkReadResult(
+                values={
+                    a: ConnectorValue(value=1.5, timestamp=datetime(2024, 1, 1))
+                    for a in addresses
+                    if a not in failing
+                },
+                errors={a: "timeout" for a in addresses if a in failing},
+            )
+
+        connector.read_multiple_channels_detailed = detailed
+        return connector
+
+    def _make_capability(self, channels, monkeypatch, connector, parameters=None):
+        @asynccontextmanager
+        async def lease(config=None):
+            yield connector
+
+        monkeypatch.setattr(ConnectorFactory, "lease_control_system_connector", lease)
+
+        cap = ChannelReadCapability()
+        cap._state = {}
+        cap._step = {"parameters": parameters or {}}
+        cap.get_logger = MagicMock()
+        cap.get_required_contexts = MagicMock(return_value=(channels,))
+        cap.store_output_context = lambda result: {"result": result}
+        return cap
+
+    async def test_reads_in_batches(self, monkeypatch):
+        channels = [f"BPM:{i}:X" for i in range(250)]
+        connector = self._make_connector()
+        cap = self._make_capability(channels, monkeypatch, connector)
+
+        with patch(
+            "osprey.capabilities.channel_read._get_channel_read_config",
+            return_value={
+                "batch_size": 100,
+                "max_concurrent_batches": 2,
+                "allow_partial_results": False,
+            },
+        ):
+            output = await cap.execute()
+
+        result = output["result"]
+        assert [len(b) for b in connector.batches] == [100, 100, 50]
+        assert list(result.channel_values) == channels
+        assert result.failed_channels == {}
+
+    async def test_failure_aborts_without_partial_results(self, monkeypatch):
+        connector = self._make_connector(failing={"BAD:PV"})
+        cap = self._make_capability(["GOOD:PV", "BAD:PV"], monkeypatch, connector)
+
+        with pytest.raises(ChannelAccessError, match="BAD:PV"):
+            await cap.execute()
+
+    async def test_partial_results_return_failure_map(self, monkeypatch):
+        connector = self._make_connector(failing={"BAD:PV"})
+        cap = self._make_capability(
+            ["GOOD:PV", "BAD:PV"],
+            monkeypatch,
+            connector,
+            parameters={"allow_partial_results": True},
+        )
+
+        result = (await cap.execute())["result"]
+
+        assert list(result.channel_values) == ["GOOD:PV"]
+        assert result.failed_channels == {"BAD:PV": "timeout"}
+        assert result.get_summary()["failed_channels"] == {"BAD:PV": "timeout"}
+        assert result.get_access_details("k")["failed_count"] == 1
+
+
+class TestChannelReadCircuitBreaker:
+    """Connector outages in channel_read open the control system circuit breaker."""
+
+    @pytest.fixture(autouse=True)
+    def mock_connector(self, monkeypatch):
+        import osprey.connectors.factory as factory_module
+        from osprey.connectors.control_system.mock_connector import MockConnector
+
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+        lease = ConnectorFactory.lease_control_system_connector
+
+        async def unreachable(self, addresses, timeout=None):
+            raise ConnectionError("IOC unreachable")
+
+        factory_module._connector_pool = None
+        ConnectorFactory.register_control_system("mock", MockConnector)
+        monkeypatch.setattr(MockConnector, "read_multiple_channels_detailed", unreachable)
+        monkeypatch.setattr(
+            ConnectorFactory, "lease_control_system_connector", lambda config_=None: lease(config)
+        )
+        with patch(
+            "osprey.base.resilience._get_breaker_settings",
+            return_value={"failure_threshold": 2, "reset_timeout_seconds": 60},
+        ):
+            yield
+        ConnectorFactory._control_system_connectors.clear()
+
+    async def test_repeated_connection_errors_open_breaker(self):
+        from osprey.base.resilience import CircuitOpenError, get_circuit_breaker_states
+
+        cap = ChannelReadCapability()
+        cap._state = {}
+        cap._step = {"parameters": {}}
+        cap.get_logger = MagicMock()
+        cap.get_required_contexts = MagicMock(return_value=(["BEAM:CURRENT"],))
+
+        for _ in range(2):
+            with pytest.raises(ChannelAccessError, match="IOC unreachable"):
+                await cap.execute()
+
+        assert get_circuit_breaker_states()["control_system:mock"]["state"] == "open"
+        with pytest.raises(CircuitOpenError):
+            await cap.execute()
+
+        await ConnectorFactory.shutdown_pool()
@@ -1,11 +1,18 @@
-"""Tests for context_tools — read_context and list_available_context.
+"""Tests for context_tools.
 
 Verifies that get_summary() is called without extra positional arguments,
-matching the CapabilityContext.get_summary() signature.
+matching the CapabilityContext.get_summary() signature, and that the tools
+that modify context never mutate dicts shared with earlier state snapshots.
 """
 
+import copy
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from osprey.capabilities.context_tools import create_context_tools
 from osprey.context.base import CapabilityContext
+from osprey.state.state import merge_capability_context_data
 
 
 # Minimal concrete subclass for testing
@@ -73,3 +80,75 @@ class TestListAvailableContext:
 
         result = list_ctx.invoke({})
         assert "No context data" in result
+
+
+class TestContextModificationsDoNotMutateSnapshots:
+    """The context reducer shares per-type dicts between state snapshots."""
+
+    @pytest.fixture
+    def snapshots(self):
+        previous = merge_capability_context_data(
+            None,
+            {
+                "PV_ADDRESSES": {"beam": {"pvs": ["A"]}, "orbit": {"pvs": ["B"]}},
+                "WEATHER": {"today": {"temp": 20}},
+            },
+        )
+        current = merge_capability_context_data(previous, {"WEATHER": {"tomorrow": {"temp": 21}}})
+        # Untouched per-type dicts are shared, not copied
+        assert current["PV_ADDRESSES"] is previous["PV_ADDRESSES"]
+        return previous, copy.deepcopy(previous)
+
+    @staticmethod
+    def _tools(state):
+        return {t.name: t for t in create_context_tools(state, "test_cap")}
+
+    def test_remove_context(self, snapshots):
+        previous, expected = snapshots
+        state = {"capability_context_data": merge_capability_context_data(previous, {})}
+
+        result = self._tools(state)["remove_context"].invoke(
+            {"context_type": "PV_ADDRESSES", "context_key": "beam"}
+        )
+
+        assert result.startswith("✓")
+        assert list(state["capability_context_data"]["PV_ADDRESSES"]) == ["orbit"]
+        assert previous == expected
+
+    def test_remove_last_context_of_type(self, snapshots):
+        previous, expected = snapshots
+        state = {"capability_context_data": merge_capability_context_data(previous, {})}
+
+        self._tools(state)["remove_context"].invoke(
+            {"context_type": "WEATHER", "context_key": "today"}
+        )
+
+        assert "WEATHER" not in state["capability_context_data"]
+        assert previous == expected
+
+    def test_clear_context_type(self, snapshots):
+        previous, expected = snapshots
+        state = {"capability_context_data": merge_capability_context_data(previous, {})}
+
+        self._tools(state)["clear_context_type"].invoke({"context_type": "PV_ADDRESSES"})
+
+        assert "PV_ADDRESSES" not in state["capability_context_data"]
+        assert previous == expected
+
+    def test_save_raw_result(self, snapshots):
+        previous, expected = snapshots
+        state = {
+            "capability_context_data": merge_capability_context_data(previous, {}),
+            "session_state": {
+                "last_direct_chat_result": {"context_type": "WEATHER", "full_response": "sunny"}
+            },
+        }
+        registry = MagicMock()
+        registry.get_context_class.return_value = None
+
+        with patch("osprey.registry.get_registry", return_value=registry):
+            result = self._tools(state)["save_result_to_context"].invoke({"context_key": "now"})
+
+        assert result == "✓ Saved to context as chat:now"
+        assert state["capability_context_data"]["WEATHER"]["chat:now"]["results"] == "sunny"
+        assert previous == expected
@@ -46,11 +46,13 @@ class TestTimeRangeParsingCapabilityMigration:
             found=True,
         )
 
-        async def mock_to_thread(func, *args, **kwargs):
-            """Mock asyncio.to_thread to return our mocked response."""
+        async def mock_completion(*args, **kwargs):
+            """Mock aget_chat_completion to return our mocked response."""
             return mock_time_output
 
-        monkeypatch.setattr("asyncio.to_thread", mock_to_thread)
+        monkeypatch.setattr(
+            "osprey.capabilities.time_range_parsing.aget_chat_completion", mock_completion
+        )
 
         # Create a simple mock context with proper CONTEXT_TYPE as class variable
         class MockTimeRangeContext:
@@ -116,10 +118,12 @@ class TestTimeRangeParsingCapabilityMigration:
             found=True,
         )
 
-        async def mock_to_thread(func, *args, **kwargs):
+        async def mock_completion(*args, **kwargs):
             return mock_time_output
 
-        monkeypatch.setattr("asyncio.to_thread", mock_to_thread)
+        monkeypatch.setattr(
+            "osprey.capabilities.time_range_parsing.aget_chat_completion", mock_completion
+        )
 
         # Create a proper mock context class
         class MockTimeRangeContext:
@@ -180,10 +184,12 @@ class TestTimeRangeParsingCapabilityMigration:
             found=True,
         )
 
-        async def mock_to_thread(func, *args, **kwargs):
+        async def mock_completion(*args, **kwargs):
             return mock_time_output
 
-        monkeypatch.setattr("asyncio.to_thread", mock_to_thread)
+        monkeypatch.setattr(
+            "osprey.capabilities.time_range_parsing.aget_chat_completion", mock_completion
+        )
 
         # Create a proper mock context class
         class MockTimeRangeContext:
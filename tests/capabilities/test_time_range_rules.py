@@ -0,0 +1,136 @@
+"""Tests for the rule-based time range fast path."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from osprey.capabilities.time_range_parsing import (
+    TimeRangeParsingCapability,
+    parse_time_range_rules,
+)
+
+TZ = ZoneInfo("America/Los_Angeles")
+# Saturday 2026-10-17 09:30 local time
+NOW = datetime(2026, 10, 17, 9, 30, tzinfo=TZ)
+
+
+def local(month, day, hour=0, minute=0, second=0):
+    return datetime(2026, month, day, hour, minute, second, tzinfo=TZ)
+
+
+# (expression, expected local start, expected local end)
+CORPUS = [
+    ("Retrieve beam current for the last 24 hours", local(10, 16, 9, 30), NOW),
+    ("plot vacuum pressure over the past 2 weeks", local(10, 3, 9, 30), NOW),
+    ("last 30 min", local(10, 17, 9), NOW),
+    ("past hour", local(10, 17, 8, 30), NOW),
+    ("last 7d", local(10, 10, 9, 30), NOW),
+    ("last three days", local(10, 14, 9, 30), NOW),
+    ("in the last week", local(10, 10, 9, 30), NOW),
+    ("last week", local(10, 5), local(10, 11, 23, 59, 59)),
+    ("last month", local(9, 1), local(9, 30, 23, 59, 59)),
+    ("last 3 months", local(7, 17, 9, 30), NOW),
+    ("show data from yesterday", local(10, 16), local(10, 16, 23, 59, 59)),
+    ("today", local(10, 17), NOW),
+    ("this week", local(10, 12), NOW),
+    ("this month so far", local(10, 1), NOW),
+    ("since 8am", local(10, 17, 8), NOW),
+    ("since 08:15", local(10, 17, 8, 15), NOW),
+    ("since midnight", local(10, 17), NOW),
+    ("since yesterday", local(10, 16), NOW),
+    ("since 2 hours ago", local(10, 17, 7, 30), NOW),
+    ("since last Monday", local(10, 12), NOW),
+    ("on Monday", local(10, 12), local(10, 12, 23, 59, 59)),
+    ("on 2026-10-10", local(10, 10), local(10, 10, 23, 59, 59)),
+    ("from 2026-10-01 to 2026-10-03", local(10, 1), local(10, 3, 23, 59, 59)),
+    ("between 2026-10-01 08:00 and 2026-10-01 12:00", local(10, 1, 8), local(10, 1, 12)),
+    ("2026-10-01T08:00:00Z - 2026-10-01T09:00:00Z", local(10, 1, 1), local(10, 1, 2)),
+]
+
+# Expressions the rules must leave to the LLM
+DECLINED = [
+    "Test task objective",
+    "Get current beam current",
+    "2 hours ago",
+    "since 8",
+    "data from 9am to 11am",
+    "compare last week with the previous week",
+    "last value of BPM since yesterday",
+    "last 24 hours in may 3",
+    "during the last shift",
+    "the morning of March 3rd",
+    "from 2027-01-01 to 2027-01-02",
+    "last hour in 2025",
+    "for the last hour, compare with 2025 values",
+    "not the last 24 hours",
+    "the last week except yesterday",
+    "excluding the past hour",
+    "any day other than today",
+    "don't use the last hour",
+]
+
+
+@pytest.mark.parametrize(("text", "start", "end"), CORPUS)
+def test_corpus_expressions(text, start, end):
+    result = parse_time_range_rules(text, now=NOW, tz=TZ)
+
+    assert result is not None, text
+    assert result.start_date == start
+    assert result.end_date == end
+    assert result.start_date.tzinfo == UTC
+
+
+@pytest.mark.parametrize("text", DECLINED)
+def test_ambiguous_or_unsupported_expressions_decline(text):
+    assert parse_time_range_rules(text, now=NOW, tz=TZ) is None
+
+
+def test_clock_time_in_the_future_means_yesterday_with_low_confidence():
+    result = parse_time_range_rules("since 11pm", now=NOW, tz=TZ)
+
+    assert result.start_date == local(10, 16, 23)
+    assert result.confidence < TimeRangeParsingCapability.rule_confidence_threshold
+
+
+def test_rolling_hours_span_dst_transition():
+    # DST ends 2026-11-01 02:00 local; 24 hours back is 13:00 PDT the previous day
+    now = datetime(2026, 11, 1, 12, 0, tzinfo=TZ)
+
+    result = parse_time_range_rules("last 24 hours", now=now, tz=TZ)
+
+    assert result.end_date - result.start_date == timedelta(hours=24)
+    assert result.start_date.astimezone(TZ).hour == 13
+
+
+def test_corpus_coverage_and_latency():
+    """The fast path resolves the whole corpus and stays well below LLM latency."""
+    texts = [text for text, _, _ in CORPUS]
+    start = time.perf_counter()
+    for _ in range(20):
+        resolved = [parse_time_range_rules(text, now=NOW, tz=TZ) for text in texts]
+    per_call = (time.perf_counter() - start) / (20 * len(texts))
+
+    coverage = sum(r is not None for r in resolved) / len(texts)
+    assert coverage == 1.0
+    assert per_call < 0.001  # typically tens of microseconds
+
+
+@pytest.mark.asyncio
+async def test_capability_skips_llm_for_rule_matches(mock_state, mock_step, monkeypatch):
+    mock_step["task_objective"] = "Parse the time range: last 24 hours"
+    llm = AsyncMock()
+    monkeypatch.setattr("osprey.capabilities.time_range_parsing.aget_chat_completion", llm)
+    store = MagicMock(return_value={"capability_context_data": {}})
+    monkeypatch.setattr(TimeRangeParsingCapability, "store_output_context", store)
+
+    capability = TimeRangeParsingCapability()
+    capability._state = mock_state
+    capability._step = mock_step
+    await capability.execute()
+
+    llm.assert_not_called()
+    context = store.call_args.args[0]
+    assert (context.end_date - context.start_date).total_seconds() == 24 * 3600
@@ -4,7 +4,7 @@ Tests the Click command group including:
 - Command structure and help output
 - Query subcommand with mocked service
 - Benchmark subcommand with mocked run_benchmarks
-- Build-database, validate, preview subcommands
+- Build-database, validate, compile, preview subcommands
 - Interactive REPL with mocked ChannelFinderCLI
 - Config/project resolution
 - Import smoke tests
@@ -43,6 +43,7 @@ class TestCommandStructure:
         assert "benchmark" in result.output
         assert "build-database" in result.output
         assert "validate" in result.output
+        assert "compile" in result.output
         assert "preview" in result.output
 
     def test_help_shows_project_option(self, runner):
@@ -418,6 +419,44 @@ class TestPreviewSubcommand:
         assert "Hierarchy" in result.output or "Preview" in result.output
 
 
+# ============================================================================
+# Compile Subcommand Tests
+# ============================================================================
+
+
+class TestCompileSubcommand:
+    """Test the 'compile' subcommand."""
+
+    def test_compile_writes_snapshot(self, runner, tmp_path):
+        """compile with --database writes <database>.snapshot next to the JSON."""
+        import shutil
+        from pathlib import Path
+
+        source = (
+            Path(__file__).parent.parent.parent
+            / "src/osprey/templates/apps/control_assistant/data/channel_databases/hierarchical.json"
+        )
+        db_path = tmp_path / "hierarchical.json"
+        shutil.copy(source, db_path)
+
+        result = runner.invoke(channel_finder, ["compile", "--database", str(db_path)])
+
+        assert result.exit_code == 0
+        assert "Snapshot compiled" in result.output
+        assert (tmp_path / "hierarchical.snapshot").exists()
+
+    def test_compile_invalid_database_fails(self, runner, tmp_path):
+        """compile with a non-hierarchical database exits with an error."""
+        db_file = tmp_path / "flat.json"
+        db_file.write_text('{"channels": []}')
+
+        result = runner.invoke(channel_finder, ["compile", "--database", str(db_file)])
+
+        assert result.exit_code == 1
+        assert "Failed to compile" in result.output
+        assert not (tmp_path / "flat.snapshot").exists()
+
+
 # ============================================================================
 # Import Smoke Tests
 # ============================================================================
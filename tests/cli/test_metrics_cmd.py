@@ -0,0 +1,61 @@
+"""Tests for metrics CLI command."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from osprey.cli.metrics_cmd import metrics
+from osprey.models.telemetry import LLMTelemetry
+
+
+@pytest.fixture
+def metrics_dir(tmp_path):
+    """Provide a snapshot directory with one recorded process."""
+    store = LLMTelemetry()
+    for node, cost in (("classifier", 0.001), ("orchestrator", 0.01)):
+        store.record(
+            caller=f"{node}_node.run",
+            node=node,
+            provider="anthropic",
+            model="claude-haiku",
+            latency=0.4,
+            usage={"prompt_tokens": 50, "completion_tokens": 5, "cost_usd": cost},
+            session="s1",
+        )
+    (tmp_path / "telemetry_1.json").write_text(json.dumps(store.snapshot()))
+    with patch("osprey.cli.metrics_cmd._metrics_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+def test_table_output(metrics_dir):
+    result = CliRunner().invoke(metrics, [])
+
+    assert result.exit_code == 0
+    assert "orchestrator" in result.output
+    assert "Total" in result.output
+
+
+def test_json_output_by_caller(metrics_dir):
+    result = CliRunner().invoke(metrics, ["--by", "caller", "--format", "json"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["classifier_node.run"]["calls"] == 1
+
+
+def test_prometheus_output_and_reset(metrics_dir):
+    result = CliRunner().invoke(metrics, ["--format", "prometheus", "--reset"])
+
+    assert result.exit_code == 0
+    assert "osprey_llm_calls_total" in result.output
+    assert not list(metrics_dir.glob("telemetry_*.json"))
+
+
+def test_no_snapshots(tmp_path):
+    with patch("osprey.cli.metrics_cmd._metrics_dir", return_value=tmp_path):
+        result = CliRunner().invoke(metrics, [])
+
+    assert result.exit_code == 1
+    assert "No LLM telemetry" in result.output
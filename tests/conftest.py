@@ -4,6 +4,7 @@ Pytest configuration and shared test utilities.
 This module provides shared fixtures and utilities for all Osprey tests.
 """
 
+import sys
 from typing import Any
 
 import pytest
@@ -47,6 +48,16 @@ def reset_state_between_tests():
     except ImportError:
         pass  # Approval manager might not be available in all test environments
 
+    # Drop pooled connectors so connector state does not leak between tests
+    import osprey.connectors.factory as connector_factory_module
+
+    connector_factory_module._connector_pool = None
+
+    # Forget circuit breaker failures recorded by other tests
+    from osprey.base.resilience import reset_circuit_breakers
+
+    reset_circuit_breakers()
+
     yield
 
     # Reset after test
@@ -63,6 +74,11 @@ def reset_state_between_tests():
     except ImportError:
         pass
 
+    # Stop warm local-execution workers so template processes do not pile up
+    worker_pool_module = sys.modules.get("osprey.services.python_executor.execution.worker_pool")
+    if worker_pool_module is not None:
+        worker_pool_module.shutdown_worker_pools()
+
 
 # ===================================================================
 # Unified Event System — Event Capture Fixtures
@@ -179,3 +179,230 @@ class TestConnectorFactory:
 
             # This demonstrates how easy it is to switch connector types
             # Just change the config!
+
+
+class TestConnectorPool:
+    """Test pooled connector leasing."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pool(self):
+        """Give each test its own empty process-wide pool."""
+        import osprey.connectors.factory as factory_module
+
+        factory_module._connector_pool = None
+        yield
+        factory_module._connector_pool = None
+
+    @pytest.mark.asyncio
+    async def test_lease_reuses_connector_for_same_config(self):
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config) as first:
+            pass
+        async with ConnectorFactory.lease_control_system_connector(config) as second:
+            pass
+
+        assert first is second
+        assert first._connected is True
+        assert len(ConnectorFactory.get_pool()) == 1
+
+        await ConnectorFactory.shutdown_pool()
+        assert first._connected is False
+        assert len(ConnectorFactory.get_pool()) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_configs_get_different_connectors(self):
+        config_a = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+        config_b = {"type": "mock", "connector": {"mock": {"response_delay_ms": 1}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config_a) as a:
+            async with ConnectorFactory.lease_control_system_connector(config_b) as b:
+                assert a is not b
+
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_connector_is_replaced(self):
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config) as first:
+            pass
+
+        # Simulate a dropped connection
+        await first.disconnect()
+
+        async with ConnectorFactory.lease_control_system_connector(config) as second:
+            assert second is not first
+            assert second._connected is True
+
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_keeps_active_leases_connected(self):
+        from unittest.mock import AsyncMock
+
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config) as first:
+            first.health_check = AsyncMock(return_value=False)
+
+            async with ConnectorFactory.lease_control_system_connector(config) as second:
+                assert second is not first
+                # The failed connector is retired but still in use by the outer lease
+                assert first._connected is True
+                await first.read_channel("TEST:PV")
+
+        assert first._connected is False
+        assert second._connected is True
+        assert len(ConnectorFactory.get_pool()) == 1
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_replace_unhealthy_connector_once(self):
+        import asyncio
+
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+        pool = ConnectorFactory.get_pool()
+
+        async with ConnectorFactory.lease_control_system_connector(config) as stale:
+            pass
+        await stale.disconnect()
+
+        async def lease():
+            async with ConnectorFactory.lease_control_system_connector(config) as connector:
+                await asyncio.sleep(0)
+                return connector
+
+        leased = await asyncio.gather(*(lease() for _ in range(5)))
+
+        assert stale not in leased
+        assert all(connector._connected for connector in leased)
+        assert len(pool) == 1
+        assert pool.stats()["connectors"][0]["leases"] == 0
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_limits_file_changes_apply_to_next_lease(self, tmp_path, monkeypatch):
+        import json
+        import os
+
+        from osprey.services.python_executor.exceptions import ChannelLimitsViolationError
+
+        limits_file = tmp_path / "limits.json"
+        limits_file.write_text(json.dumps({"MAG:SP": {"min_value": 0.0, "max_value": 10.0}}))
+
+        def mock_get_config_value(key, default=None):
+            config_map = {
+                "control_system.writes_enabled": True,
+                "control_system.limits_checking.enabled": True,
+                "control_system.limits_checking.database_path": str(limits_file),
+            }
+            return config_map.get(key, default)
+
+        monkeypatch.setattr("osprey.utils.config.get_config_value", mock_get_config_value)
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config) as connector:
+            result = await connector.write_channel("MAG:SP", 8.0, verification_level="none")
+        assert result.success is True
+
+        limits_file.write_text(json.dumps({"MAG:SP": {"min_value": 0.0, "max_value": 5.0}}))
+        stat = limits_file.stat()
+        os.utime(limits_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        async with ConnectorFactory.lease_control_system_connector(config) as connector:
+            with pytest.raises(ChannelLimitsViolationError):
+                await connector.write_channel("MAG:SP", 8.0, verification_level="none")
+
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_idle_connectors_are_evicted(self):
+        import time
+
+        config = {"type": "mock_archiver", "mock_archiver": {"sample_rate_hz": 1.0}}
+        pool = ConnectorFactory.get_pool()
+        pool.idle_timeout = 10.0
+
+        async with ConnectorFactory.lease_archiver_connector(config) as connector:
+            # Leased connectors are never evicted
+            assert await pool.evict_idle(now=time.monotonic() + 60) == 0
+
+        assert await pool.evict_idle(now=time.monotonic() + 60) == 1
+        assert connector._connected is False
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_lease_without_pooling_disconnects(self):
+        from unittest.mock import patch
+
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        with patch.object(ConnectorFactory, "_pooling_enabled", return_value=False):
+            async with ConnectorFactory.lease_control_system_connector(config) as connector:
+                assert connector._connected is True
+
+        assert connector._connected is False
+        assert len(ConnectorFactory.get_pool()) == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_reports_leases(self):
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+
+        async with ConnectorFactory.lease_control_system_connector(config):
+            stats = ConnectorFactory.get_pool().stats()
+            assert stats["size"] == 1
+            assert stats["connectors"][0]["leases"] == 1
+
+        assert ConnectorFactory.get_pool().stats()["connectors"][0]["leases"] == 0
+        await ConnectorFactory.shutdown_pool()
+
+
+class TestConnectorCircuitBreaker:
+    """Test per-connector circuit breakers around leases."""
+
+    @pytest.fixture(autouse=True)
+    def breaker_settings(self):
+        from unittest.mock import patch
+
+        import osprey.connectors.factory as factory_module
+
+        factory_module._connector_pool = None
+        with patch(
+            "osprey.base.resilience._get_breaker_settings",
+            return_value={"failure_threshold": 2, "reset_timeout_seconds": 60},
+        ):
+            yield
+        factory_module._connector_pool = None
+
+    @pytest.mark.asyncio
+    async def test_repeated_connection_errors_open_circuit(self):
+        from osprey.base.resilience import CircuitOpenError, get_circuit_breaker_states
+
+        config = {"type": "mock_archiver", "mock_archiver": {}}
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                async with ConnectorFactory.lease_archiver_connector(config):
+                    raise ConnectionError("archiver unreachable")
+
+        with pytest.raises(CircuitOpenError):
+            async with ConnectorFactory.lease_archiver_connector(config):
+                pytest.fail("lease must not be granted while the circuit is open")
+
+        assert get_circuit_breaker_states()["archiver:mock_archiver"]["state"] == "open"
+        await ConnectorFactory.shutdown_pool()
+
+    @pytest.mark.asyncio
+    async def test_other_errors_and_successes_keep_circuit_closed(self):
+        config = {"type": "mock", "connector": {"mock": {"response_delay_ms": 0}}}
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                async with ConnectorFactory.lease_control_system_connector(config):
+                    raise ValueError("unknown channel")
+            with pytest.raises(TimeoutError):
+                async with ConnectorFactory.lease_control_system_connector(config):
+                    raise TimeoutError("read timed out")
+            async with ConnectorFactory.lease_control_system_connector(config):
+                pass
+
+        await ConnectorFactory.shutdown_pool()
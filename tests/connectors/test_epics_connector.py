@@ -0,0 +1,148 @@
+"""Tests for EPICSConnector bulk reads using a fake pyepics module."""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from osprey.connectors.control_system.epics_connector import EPICSConnector
+
+
+class FakePV:
+    """Minimal stand-in for ``epics.PV`` that connects unless the name says otherwise."""
+
+    created: list[str] = []
+
+    def __init__(self, pvname):
+        self.pvname = pvname
+        self.chid = pvname
+        self.connected = "OFFLINE" not in pvname
+        self.timestamp = time.time()
+        self.units = "mA"
+        self.precision = 3
+        self.status = 0
+        self.severity = 0
+        self.type = "double"
+        self.count = 1
+        FakePV.created.append(pvname)
+
+    @property
+    def value(self):
+        return self.get()
+
+    def get(self, timeout=None):
+        if "NOVALUE" in self.pvname:
+            return None
+        return 42.0
+
+    def wait_for_connection(self, timeout=None):
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+
+
+class FakeCA:
+    """Stand-in for ``epics.ca`` recording the order of get requests and replies."""
+
+    TIME_DOUBLE = 20
+
+    def __init__(self):
+        self.poll_calls = []
+        self.events = []
+
+    def poll(self, evt=None, iot=None):
+        self.poll_calls.append(evt)
+
+    def promote_type(self, chid, use_time=False, use_ctrl=False):
+        return self.TIME_DOUBLE
+
+    def get_with_metadata(self, chid, ftype=None, wait=True, **kwargs):
+        assert not wait
+        self.events.append(("request", chid))
+
+    def get_complete_with_metadata(self, chid, ftype=None, timeout=None, **kwargs):
+        self.events.append(("complete", chid))
+        if "NOVALUE" in chid:
+            return None
+        return {"value": 42.0, "timestamp": 1_700_000_000.0, "status": 0, "severity": 1}
+
+
+@pytest.fixture
+def connector():
+    """EPICS connector wired to the fake epics module without calling connect()."""
+    FakePV.created = []
+    fake_ca = FakeCA()
+    fake_epics = SimpleNamespace(PV=FakePV, ca=fake_ca)
+    conn = EPICSConnector()
+    conn._epics = fake_epics
+    conn._timeout = 0.05
+    conn._connected = True
+    conn.poll_calls = fake_ca.poll_calls
+    conn.fake_ca = fake_ca
+    return conn
+
+
+class TestEPICSBulkRead:
+    """Test the batched read_multiple_channels path."""
+
+    @pytest.mark.asyncio
+    async def test_reports_per_channel_errors(self, connector):
+        result = await connector.read_multiple_channels_detailed(
+            ["SR:CURRENT", "SR:OFFLINE", "SR:NOVALUE"]
+        )
+
+        assert set(result.values) == {"SR:CURRENT"}
+        assert result.values["SR:CURRENT"].value == 42.0
+        assert result.values["SR:CURRENT"].metadata.units == "mA"
+        assert "timeout" in result.errors["SR:OFFLINE"]
+        assert "No value" in result.errors["SR:NOVALUE"]
+        assert result.stats["connected"] == 2
+        assert result.elapsed_seconds >= result.stats["connect_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_single_shared_wait_for_all_channels(self, connector):
+        """Unconnected PVs share one deadline instead of waiting sequentially."""
+        addresses = [f"SR:OFFLINE:{i}" for i in range(20)]
+
+        start = time.perf_counter()
+        result = await connector.read_multiple_channels_detailed(addresses, timeout=0.05)
+        elapsed = time.perf_counter() - start
+
+        assert result.failure_count == 20
+        assert elapsed < 0.5  # 20 sequential waits would take >= 1s
+
+    @pytest.mark.asyncio
+    async def test_all_gets_are_issued_before_waiting_for_replies(self, connector):
+        addresses = ["A:PV", "B:PV", "C:PV"]
+
+        result = await connector.read_multiple_channels_detailed(addresses)
+
+        events = connector.fake_ca.events
+        assert events[:3] == [("request", address) for address in addresses]
+        assert events[3:] == [("complete", address) for address in addresses]
+        # Timestamp and alarm fields come from the get reply
+        value = result.values["A:PV"]
+        assert value.timestamp == datetime.fromtimestamp(1_700_000_000.0)
+        assert value.metadata.raw_metadata["severity"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reuses_pv_cache_and_deduplicates(self, connector):
+        await connector.read_multiple_channels_detailed(["A:PV", "B:PV", "A:PV"])
+        await connector.read_multiple_channels_detailed(["A:PV"])
+
+        assert FakePV.created == ["A:PV", "B:PV"]
+
+    @pytest.mark.asyncio
+    async def test_read_multiple_channels_returns_values_only(self, connector):
+        values = await connector.read_multiple_channels(["SR:CURRENT", "SR:OFFLINE"])
+
+        assert list(values) == ["SR:CURRENT"]
+
+    @pytest.mark.asyncio
+    async def test_empty_request(self, connector):
+        result = await connector.read_multiple_channels_detailed([])
+
+        assert result.values == {}
+        assert result.errors == {}
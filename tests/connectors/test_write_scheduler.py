@@ -0,0 +1,182 @@
+"""Tests for grouped, concurrent channel write scheduling."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from osprey.connectors.control_system.base import (
+    BulkReadResult,
+    ChannelValue,
+    ChannelWriteResult,
+    WriteVerification,
+)
+from osprey.connectors.control_system.write_scheduler import ScheduledWrite, WriteScheduler
+
+
+class RecordingConnector:
+    """Fake connector that records write order, concurrency and readback calls."""
+
+    def __init__(self, failing=(), readback_offset=0.0, verification_level="callback"):
+        self.failing = set(failing)
+        self.readback_offset = readback_offset
+        self.verification_level = verification_level
+        self.state: dict[str, float] = {}
+        self.events: list[tuple[str, str]] = []
+        self.write_kwargs: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bulk_reads: list[list[str]] = []
+
+    def get_verification_config(self, channel_address, value):
+        return self.verification_level, 0.01
+
+    async def write_channel(self, channel_address, value, **kwargs):
+        self.write_kwargs.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.events.append(("start", channel_address))
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.events.append(("end", channel_address))
+        if channel_address in self.failing:
+            raise ValueError(f"limits violation for {channel_address}")
+        self.state[channel_address] = value + self.readback_offset
+        return ChannelWriteResult(
+            channel_address=channel_address,
+            value_written=value,
+            success=True,
+            verification=WriteVerification(level="callback", verified=True),
+        )
+
+    async def read_multiple_channels_detailed(self, channel_addresses, timeout=None):
+        self.bulk_reads.append(list(channel_addresses))
+        return BulkReadResult(
+            values={
+                ch: ChannelValue(value=self.state[ch], timestamp=datetime.now())
+                for ch in channel_addresses
+                if ch in self.state
+            }
+        )
+
+
+class TestWriteScheduler:
+    """Test WriteScheduler ordering, concurrency and verification."""
+
+    @pytest.mark.asyncio
+    async def test_same_group_runs_concurrently_up_to_cap(self):
+        connector = RecordingConnector()
+        scheduler = WriteScheduler(connector, max_concurrent_writes=3)
+
+        outcome = await scheduler.execute([ScheduledWrite(f"HCM{i}", 1.0) for i in range(9)])
+
+        assert outcome.all_succeeded
+        assert connector.max_in_flight == 3
+        assert [r.channel_address for r in outcome.results] == [f"HCM{i}" for i in range(9)]
+
+    @pytest.mark.asyncio
+    async def test_groups_run_in_order(self):
+        connector = RecordingConnector()
+        scheduler = WriteScheduler(connector, max_concurrent_writes=10)
+
+        outcome = await scheduler.execute(
+            [
+                ScheduledWrite("RF:FREQ", 499.6, group=1),
+                ScheduledWrite("HCM1", 1.0, group=0),
+                ScheduledWrite("HCM2", 2.0, group=0),
+            ]
+        )
+
+        rf_start = connector.events.index(("start", "RF:FREQ"))
+        assert connector.events.index(("end", "HCM1")) < rf_start
+        assert connector.events.index(("end", "HCM2")) < rf_start
+        assert outcome.groups_completed == 2
+        # Results keep input order
+        assert outcome.results[0].channel_address == "RF:FREQ"
+
+    @pytest.mark.asyncio
+    async def test_failed_group_skips_later_groups(self):
+        connector = RecordingConnector(failing={"HCM2"})
+        scheduler = WriteScheduler(connector)
+
+        outcome = await scheduler.execute(
+            [
+                ScheduledWrite("HCM1", 1.0, group=0),
+                ScheduledWrite("HCM2", 2.0, group=0),
+                ScheduledWrite("RF:FREQ", 499.6, group=1),
+            ]
+        )
+
+        assert outcome.results[0].success is True
+        assert "limits violation" in outcome.results[1].error_message
+        assert outcome.results[2].success is False
+        assert "Skipped" in outcome.results[2].error_message
+        assert ("start", "RF:FREQ") not in connector.events
+        assert isinstance(outcome.exceptions[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_continue_after_failure_when_configured(self):
+        connector = RecordingConnector(failing={"HCM1"})
+        scheduler = WriteScheduler(connector, stop_on_group_failure=False)
+
+        outcome = await scheduler.execute(
+            [ScheduledWrite("HCM1", 1.0, group=0), ScheduledWrite("RF", 2.0, group=1)]
+        )
+
+        assert outcome.results[1].success is True
+
+    @pytest.mark.asyncio
+    async def test_readback_verified_in_one_batch_per_group(self):
+        connector = RecordingConnector(verification_level="readback")
+        scheduler = WriteScheduler(connector)
+
+        outcome = await scheduler.execute([ScheduledWrite(f"Q{i}", float(i)) for i in range(5)])
+
+        assert connector.bulk_reads == [[f"Q{i}" for i in range(5)]]
+        assert all(kw["verification_level"] == "callback" for kw in connector.write_kwargs)
+        assert all(r.verification.level == "readback" for r in outcome.results)
+        assert all(r.verification.verified for r in outcome.results)
+
+    @pytest.mark.asyncio
+    async def test_readback_mismatch_reported(self):
+        connector = RecordingConnector(verification_level="readback", readback_offset=1.0)
+        scheduler = WriteScheduler(connector)
+
+        outcome = await scheduler.execute([ScheduledWrite("Q1", 5.0)])
+
+        verification = outcome.results[0].verification
+        assert verification.verified is False
+        assert verification.readback_value == 6.0
+        assert "mismatch" in verification.notes
+
+    @pytest.mark.asyncio
+    async def test_readback_mismatch_skips_later_groups(self):
+        connector = RecordingConnector(verification_level="readback", readback_offset=1.0)
+        scheduler = WriteScheduler(connector)
+
+        outcome = await scheduler.execute(
+            [
+                ScheduledWrite("HCM1", 1.0, group=0),
+                ScheduledWrite("RF:FREQ", 499.6, group=1, verification_level="callback"),
+            ]
+        )
+
+        assert outcome.results[0].success is True
+        assert outcome.results[0].verification.verified is False
+        assert outcome.results[1].success is False
+        assert "Skipped" in outcome.results[1].error_message
+        assert ("start", "RF:FREQ") not in connector.events
+
+    @pytest.mark.asyncio
+    async def test_default_readback_tolerance_is_reported(self):
+        connector = RecordingConnector()
+        scheduler = WriteScheduler(connector)
+
+        outcome = await scheduler.execute(
+            [ScheduledWrite("Q1", 5.0, verification_level="readback")]
+        )
+
+        verification = outcome.results[0].verification
+        assert verification.verified is True
+        assert verification.tolerance_used == 0.001
+        assert "None" not in verification.notes
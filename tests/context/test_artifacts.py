@@ -0,0 +1,156 @@
+"""Tests for out-of-band context artifacts (memory-mapped time series)."""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from osprey.context import artifacts as artifacts_module
+from osprey.context import load_timeseries, save_timeseries
+from osprey.context.artifacts import (
+    ArtifactNotFoundError,
+    add_artifact_search_path,
+    clear_artifact_search_paths,
+    export_artifacts,
+    iter_artifact_handles,
+    prune_artifact_store,
+)
+from osprey.context.context_manager import ContextManager
+
+
+@pytest.fixture
+def store(tmp_path):
+    directory = tmp_path / "store"
+    add_artifact_search_path(directory)
+    yield directory
+    clear_artifact_search_paths()
+
+
+@pytest.fixture
+def frame():
+    index = pd.date_range("2026-01-01 00:00", periods=50, freq="s").as_unit("ns")
+    return pd.DataFrame(
+        {"SR:CURRENT:RB": np.linspace(400.0, 401.0, 50), "SR:LIFETIME": np.arange(50)},
+        index=index,
+    )
+
+
+def test_round_trip_is_memory_mapped(store, frame):
+    handle = save_timeseries(frame, store_dir=store)
+
+    assert handle.startswith("artifact://")
+    series = load_timeseries(handle)
+
+    assert len(series) == 50
+    assert series.column_names == ["SR:CURRENT:RB", "SR:LIFETIME"]
+    assert isinstance(series.column("SR:CURRENT:RB"), np.memmap)
+    assert series.index.equals(frame.index)
+    df = series.to_dataframe()
+    assert list(df.columns) == list(frame.columns)
+    for name in frame.columns:
+        np.testing.assert_array_equal(df[name].to_numpy(), frame[name].to_numpy())
+
+
+def test_dataframe_shares_memory_with_mapped_columns(store, frame):
+    series = load_timeseries(save_timeseries(frame, store_dir=store))
+
+    df = series.to_dataframe()
+
+    assert np.shares_memory(df["SR:CURRENT:RB"].to_numpy(), series.column("SR:CURRENT:RB"))
+
+
+def test_timezone_is_preserved(store, frame):
+    frame.index = frame.index.tz_localize("America/Los_Angeles")
+
+    series = load_timeseries(save_timeseries(frame, store_dir=store))
+
+    assert str(series.index.tz) == "America/Los_Angeles"
+    assert series.index.equals(frame.index)
+
+
+def test_unknown_and_malformed_handles(store):
+    with pytest.raises(ArtifactNotFoundError):
+        load_timeseries("artifact://does-not-exist")
+    with pytest.raises(ValueError):
+        load_timeseries("artifact://../escape")
+
+
+def test_save_context_exports_referenced_artifacts(store, frame, tmp_path):
+    handle = save_timeseries(frame, store_dir=store)
+    data = {"ARCHIVER_DATA": {"beam": {"artifact": handle, "available_channels": ["a"]}}}
+    assert list(iter_artifact_handles(data)) == [handle]
+
+    execution_folder = tmp_path / "execution"
+    ContextManager({"capability_context_data": data}).save_context_to_file(execution_folder)
+
+    artifact_id = handle.removeprefix("artifact://")
+    exported = execution_folder / "artifacts" / artifact_id
+    assert (exported / "manifest.json").exists()
+    assert json.loads((execution_folder / "context.json").read_text()) == data
+
+    # The exported copy resolves without the original store
+    clear_artifact_search_paths()
+    add_artifact_search_path(execution_folder / "artifacts")
+    assert load_timeseries(handle).path == exported.resolve()
+
+
+def test_export_skips_missing_artifacts(store, tmp_path):
+    data = {"ARCHIVER_DATA": {"beam": {"artifact": "artifact://missing"}}}
+
+    assert export_artifacts(data, tmp_path) == []
+
+
+def _age(store, handle, seconds):
+    """Backdate an artifact's files by ``seconds``."""
+    folder = store / handle.removeprefix("artifact://")
+    past = time.time() - seconds
+    for file in folder.iterdir():
+        os.utime(file, (past, past))
+
+
+def test_prune_by_age(store, frame):
+    old = save_timeseries(frame, store_dir=store)
+    new = save_timeseries(frame, store_dir=store)
+    _age(store, old, 3 * 3600)
+
+    assert prune_artifact_store(max_age_seconds=3600, store_dir=store) == [old]
+
+    with pytest.raises(ArtifactNotFoundError):
+        load_timeseries(old)
+    assert len(load_timeseries(new)) == 50
+
+
+def test_prune_by_size_removes_oldest_first(store, frame):
+    handles = [save_timeseries(frame, store_dir=store) for _ in range(3)]
+    for age, handle in zip((300, 200, 100), handles, strict=True):
+        _age(store, handle, age)
+    size = sum(f.stat().st_size for f in (store / handles[0].removeprefix("artifact://")).iterdir())
+
+    assert prune_artifact_store(max_total_bytes=2 * size, store_dir=store) == handles[:1]
+    # The newest artifact is kept even when it alone exceeds the limit
+    assert prune_artifact_store(max_total_bytes=1, store_dir=store) == handles[1:2]
+    assert len(load_timeseries(handles[2])) == 50
+
+
+def test_save_prunes_with_configured_limits(store, frame, monkeypatch):
+    monkeypatch.setattr(artifacts_module, "_last_prune", {})
+    monkeypatch.setattr(
+        artifacts_module,
+        "_get_artifact_settings",
+        lambda: {"max_age_hours": 1, "prune_interval_seconds": 3600},
+    )
+    old = save_timeseries(frame, store_dir=store)
+    _age(store, old, 2 * 3600)
+    monkeypatch.setattr(artifacts_module, "_last_prune", {})
+
+    save_timeseries(frame, store_dir=store)
+    assert not (store / old.removeprefix("artifact://")).exists()
+
+    # Within the prune interval, saving does not scan the store again
+    another_old = save_timeseries(frame, store_dir=store)
+    _age(store, another_old, 2 * 3600)
+    save_timeseries(frame, store_dir=store)
+    assert (store / another_old.removeprefix("artifact://")).exists()
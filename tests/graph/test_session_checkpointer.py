@@ -0,0 +1,136 @@
+"""Tests for the bounded, evicting session checkpointer."""
+
+import operator
+import threading
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, interrupt
+
+from osprey.graph.session_checkpointer import SessionCheckpointer
+
+
+class CounterState(TypedDict):
+    items: Annotated[list[str], operator.add]
+
+
+def _build_graph(checkpointer):
+    def add(state: CounterState):
+        return {"items": ["step"]}
+
+    def approve(state: CounterState):
+        answer = interrupt({"user_message": "approve?"})
+        return {"items": [f"approved:{answer}"]}
+
+    builder = StateGraph(CounterState)
+    builder.add_node("add", add)
+    builder.add_node("approve", approve)
+    builder.add_edge(START, "add")
+    builder.add_edge("add", "approve")
+    builder.add_edge("approve", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_sessions_are_isolated_by_thread():
+    checkpointer = SessionCheckpointer(max_sessions=10)
+    graph = _build_graph(checkpointer)
+
+    graph.invoke({"items": ["a"]}, _config("chat-a"))
+    graph.invoke({"items": ["b"]}, _config("chat-b"))
+
+    assert graph.get_state(_config("chat-a")).values["items"] == ["a", "step"]
+    assert graph.get_state(_config("chat-b")).values["items"] == ["b", "step"]
+    assert checkpointer.stats()["sessions_in_memory"] == 2
+
+
+def test_lru_eviction_without_spill_drops_oldest_session():
+    checkpointer = SessionCheckpointer(max_sessions=2)
+    graph = _build_graph(checkpointer)
+
+    for thread_id in ("one", "two", "three"):
+        graph.invoke({"items": [thread_id]}, _config(thread_id))
+
+    stats = checkpointer.stats()
+    assert stats["sessions_in_memory"] == 2
+    assert stats["evictions"] == 1
+    assert stats["memory_bytes"] > 0
+    assert graph.get_state(_config("one")).values == {}
+    assert graph.get_state(_config("three")).values["items"] == ["three", "step"]
+
+
+@pytest.mark.asyncio
+async def test_spilled_session_resumes_pending_interrupt(tmp_path):
+    checkpointer = SessionCheckpointer(max_sessions=1, spill_path=tmp_path / "sessions.sqlite")
+    graph = _build_graph(checkpointer)
+
+    await graph.ainvoke({"items": ["first"]}, _config("first"))
+    assert graph.get_state(_config("first")).interrupts
+
+    # A second session pushes the first one out to disk
+    await graph.ainvoke({"items": ["second"]}, _config("second"))
+    stats = checkpointer.stats()
+    assert stats["sessions_in_memory"] == 1
+    assert stats["sessions_spilled"] == 1
+
+    # Resuming the first session restores it (including the pending interrupt)
+    result = await graph.ainvoke(Command(resume="yes"), _config("first"))
+
+    assert result["items"] == ["first", "step", "approved:yes"]
+    assert checkpointer.stats()["restores"] == 1
+    checkpointer.close()
+
+
+@pytest.mark.asyncio
+async def test_async_methods_do_not_block_the_event_loop(tmp_path, monkeypatch):
+    checkpointer = SessionCheckpointer(max_sessions=1, spill_path=tmp_path / "sessions.sqlite")
+    graph = _build_graph(checkpointer)
+    threads = set()
+    session = checkpointer._session
+
+    def recording_session(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return session(*args, **kwargs)
+
+    monkeypatch.setattr(checkpointer, "_session", recording_session)
+
+    await graph.ainvoke({"items": ["first"]}, _config("first"))
+    await graph.ainvoke({"items": ["second"]}, _config("second"))
+    history = [state async for state in graph.aget_state_history(_config("first"))]
+
+    assert history
+    assert threads and threading.get_ident() not in threads
+    checkpointer.close()
+
+
+def test_idle_sessions_expire():
+    checkpointer = SessionCheckpointer(max_sessions=10, idle_ttl_seconds=60)
+    graph = _build_graph(checkpointer)
+    graph.invoke({"items": ["old"]}, _config("old"))
+
+    # Pretend the session has been idle for two minutes
+    checkpointer._sessions["old"].last_access -= 120
+
+    graph.invoke({"items": ["new"]}, _config("new"))
+
+    assert "old" not in checkpointer._sessions
+    assert checkpointer.stats()["evictions"] == 1
+
+
+def test_delete_thread_removes_memory_and_spill(tmp_path):
+    checkpointer = SessionCheckpointer(max_sessions=1, spill_path=tmp_path / "sessions.sqlite")
+    graph = _build_graph(checkpointer)
+    graph.invoke({"items": ["a"]}, _config("a"))
+    graph.invoke({"items": ["b"]}, _config("b"))
+
+    checkpointer.delete_thread("a")
+    checkpointer.delete_thread("b")
+
+    stats = checkpointer.stats()
+    assert stats["sessions_in_memory"] == 0
+    assert stats["sessions_spilled"] == 0
+    checkpointer.close()
@@ -1,13 +1,16 @@
 """Tests for classification node - task classification and capability selection."""
 
 import inspect
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from osprey.base import CapabilityDecision, CapabilityDecisions
 from osprey.infrastructure.classification_node import (
+    CapabilityClassifier,
     ClassificationNode,
     _create_classification_result,
     _detect_reclassification_scenario,
     _expand_capability_dependencies,
+    select_capabilities,
 )
 
 # =============================================================================
@@ -418,3 +421,116 @@ class TestExpandCapabilityDependencies:
             result = _expand_capability_dependencies(["channel_write"], state, logger)
 
         assert result == ["channel_write"]
+
+
+# =============================================================================
+# Test Batched Classification
+# =============================================================================
+
+
+def _make_classified_cap(name):
+    """Create a mock capability with a classifier guide."""
+    cap = _make_mock_cap(name)
+    cap.classifier_guide = MagicMock(instructions=f"Use {name}", examples=[])
+    return cap
+
+
+def _decisions(*entries):
+    return CapabilityDecisions(
+        decisions=[
+            CapabilityDecision(capability=name, is_match=match, certain=certain)
+            for name, match, certain in entries
+        ]
+    )
+
+
+async def _select_batched(caps, batch_response, per_capability=True, batch_size=20):
+    """Run select_capabilities in batched mode with mocked LLM calls."""
+    registry = _mock_registry_for_expansion(caps)
+    registry.get_always_active_capability_names.return_value = []
+    config = {"max_concurrent_classifications": 5, "mode": "batched", "batch_size": batch_size}
+    fallback = AsyncMock(return_value=per_capability)
+
+    with (
+        patch("osprey.infrastructure.classification_node.get_registry", return_value=registry),
+        patch(
+            "osprey.infrastructure.classification_node.get_classification_config",
+            return_value=config,
+        ),
+        patch("osprey.infrastructure.classification_node.get_model_config", return_value={}),
+        patch(
+            "osprey.infrastructure.classification_node.aget_chat_completion",
+            side_effect=batch_response,
+        ) as completion,
+        patch.object(
+            CapabilityClassifier, "_build_batch_classification_prompt", return_value="prompt"
+        ),
+        patch.object(CapabilityClassifier, "_perform_classification", fallback),
+    ):
+        result = await select_capabilities("task", caps, {}, MagicMock())
+
+    return result, completion, fallback
+
+
+class TestBatchedClassification:
+    """Test single-call batched classification with per-capability fallback."""
+
+    async def test_batch_decisions_used_without_fallback(self):
+        caps = [_make_classified_cap("a"), _make_classified_cap("b")]
+        response = [_decisions(("a", True, True), ("b", False, True))]
+
+        result, completion, fallback = await _select_batched(caps, response)
+
+        assert result == ["a"]
+        assert completion.await_count == 1
+        assert completion.call_args.kwargs["output_model"] is CapabilityDecisions
+        fallback.assert_not_awaited()
+
+    async def test_uncertain_and_missing_entries_fall_back(self):
+        caps = [_make_classified_cap(n) for n in ("a", "b", "c")]
+        response = [_decisions(("a", False, True), ("b", True, False))]
+
+        result, _, fallback = await _select_batched(caps, response, per_capability=True)
+
+        assert result == ["b", "c"]
+        fallback_names = sorted(call.args[0].name for call in fallback.await_args_list)
+        assert fallback_names == ["b", "c"]
+
+    async def test_conflicting_duplicates_fall_back(self):
+        caps = [_make_classified_cap("a")]
+        response = [_decisions(("a", True, True), ("a", False, True))]
+
+        _, _, fallback = await _select_batched(caps, response, per_capability=False)
+
+        assert fallback.await_count == 1
+
+    async def test_failed_batch_call_falls_back_for_all(self):
+        caps = [_make_classified_cap("a"), _make_classified_cap("b")]
+
+        result, _, fallback = await _select_batched(caps, TimeoutError("slow"))
+
+        assert result == ["a", "b"]
+        assert fallback.await_count == 2
+
+    async def test_capabilities_split_by_batch_size(self):
+        caps = [_make_classified_cap(n) for n in ("a", "b", "c")]
+        response = [
+            _decisions(("a", True, True), ("b", True, True)),
+            _decisions(("c", False, True)),
+        ]
+
+        result, completion, fallback = await _select_batched(caps, response, batch_size=2)
+
+        assert result == ["a", "b"]
+        assert completion.await_count == 2
+        fallback.assert_not_awaited()
+
+    async def test_capability_without_classifier_is_not_sent(self):
+        no_guide = _make_mock_cap("respond")
+        no_guide.classifier_guide = None
+        caps = [no_guide, _make_classified_cap("a")]
+
+        result, _, fallback = await _select_batched(caps, [_decisions(("a", True, True))])
+
+        assert result == ["a"]
+        fallback.assert_not_awaited()
@@ -1,6 +1,6 @@
 """Tests for ReactiveOrchestratorNode.
 
-Tests mock get_chat_completion to avoid LLM calls. Tests verify
+Tests mock aget_chat_completion to avoid LLM calls. Tests verify
 the node produces correct state updates based on LLM decisions.
 
 The reactive orchestrator uses two response formats:
@@ -9,7 +9,7 @@ The reactive orchestrator uses two response formats:
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -146,7 +146,7 @@ class TestReactiveOrchestratorFirstStep:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -189,7 +189,7 @@ class TestReactiveOrchestratorSecondStep:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -219,7 +219,7 @@ class TestReactiveOrchestratorRespond:
 
         # First call: orchestrator LLM returns respond tool call
         # Second call: response LLM generates text
-        mock_completion = MagicMock(side_effect=[orchestrator_call, response_text])
+        mock_completion = AsyncMock(side_effect=[orchestrator_call, response_text])
 
         # Add format_reactive_response_context mock
         orch_builder = mock_prompt_builder.get_orchestrator_prompt_builder()
@@ -238,7 +238,7 @@ class TestReactiveOrchestratorRespond:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ):
                 node = ReactiveOrchestratorNode()
@@ -280,7 +280,7 @@ class TestReactiveOrchestratorMessageAccumulation:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -313,7 +313,7 @@ class TestReactiveOrchestratorErrorScenarios:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -338,7 +338,7 @@ class TestReactiveOrchestratorOnlyActiveCapabilities:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -470,7 +470,7 @@ class TestLightweightToolExecution:
                 "call_cap",
             )
         ]
-        mock_completion = MagicMock(side_effect=[lw_call, cap_call])
+        mock_completion = AsyncMock(side_effect=[lw_call, cap_call])
         state = _create_react_node_state()
 
         mock_lw_tool = MagicMock()
@@ -492,7 +492,7 @@ class TestLightweightToolExecution:
             patches["validate_registry"],
             patches["prompts"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ),
         ):
@@ -517,7 +517,7 @@ class TestLightweightToolExecution:
                 {"task_objective": "Find channels", "context_key": "beam_channels"},
             )
         ]
-        mock_completion = MagicMock(side_effect=[lw_calls, cap_call])
+        mock_completion = AsyncMock(side_effect=[lw_calls, cap_call])
         state = _create_react_node_state()
 
         tools = []
@@ -540,7 +540,7 @@ class TestLightweightToolExecution:
             patches["validate_registry"],
             patches["prompts"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ),
         ):
@@ -554,7 +554,7 @@ class TestLightweightToolExecution:
     @pytest.mark.asyncio
     async def test_lightweight_tool_limit_raises(self, mock_registry, mock_prompt_builder):
         lw_call = [_make_tool_call("get_context_summary", {}, "call_lw")]
-        mock_completion = MagicMock(return_value=lw_call)
+        mock_completion = AsyncMock(return_value=lw_call)
         state = _create_react_node_state()
 
         mock_lw = MagicMock(name="get_context_summary", description="Get summary", args_schema=None)
@@ -571,7 +571,7 @@ class TestLightweightToolExecution:
             patches["validate_registry"],
             patches["prompts"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ),
         ):
@@ -600,7 +600,7 @@ class TestLightweightToolExecution:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -629,13 +629,13 @@ class TestLightweightToolExecution:
                 {"task_objective": "Find channels", "context_key": "beam_channels"},
             )
         ]
-        mock_completion = MagicMock(side_effect=[unknown_call, valid_call])
+        mock_completion = AsyncMock(side_effect=[unknown_call, valid_call])
         state = _create_react_node_state()
         patches = _common_patches(mock_registry, mock_prompt_builder)
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ):
                 node = ReactiveOrchestratorNode()
@@ -672,7 +672,7 @@ class TestLightweightToolExecution:
             patches["validate_registry"],
             patches["prompts"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=mixed_calls,
             ),
         ):
@@ -703,7 +703,7 @@ class TestLightweightToolExecution:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=text_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -733,7 +733,7 @@ class TestDirectResponseGeneration:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -761,7 +761,7 @@ class TestDirectResponseGeneration:
         )
         response_text = "Here is the summary."
 
-        mock_completion = MagicMock(side_effect=[orchestrator_response, response_text])
+        mock_completion = AsyncMock(side_effect=[orchestrator_response, response_text])
 
         orch_builder = mock_prompt_builder.get_orchestrator_prompt_builder()
         orch_builder.format_reactive_response_context.return_value = "[Decision] Respond"
@@ -777,7 +777,7 @@ class TestDirectResponseGeneration:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ):
                 node = ReactiveOrchestratorNode()
@@ -815,7 +815,7 @@ class TestRejectionLoopLimit:
         try:
             with (
                 patch(
-                    "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                    "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                     return_value=llm_response,
                 ),
                 patch(
@@ -872,7 +872,7 @@ class TestRejectionLoopLimit:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -1021,7 +1021,7 @@ class TestHandleTextResponseErrors:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value="not valid json {",
             ):
                 node = ReactiveOrchestratorNode()
@@ -1039,7 +1039,7 @@ class TestHandleTextResponseErrors:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value='{"steps": []}',
             ):
                 node = ReactiveOrchestratorNode()
@@ -1073,7 +1073,7 @@ class TestHandleTextResponseErrors:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=text_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -1177,7 +1177,7 @@ class TestMultipleCapabilityToolCalls:
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ):
                 node = ReactiveOrchestratorNode()
@@ -1206,14 +1206,14 @@ class TestUnknownToolFeedback:
                 {"task_objective": "Find channels", "context_key": "beam_channels"},
             )
         ]
-        mock_completion = MagicMock(side_effect=[unknown_call, valid_call])
+        mock_completion = AsyncMock(side_effect=[unknown_call, valid_call])
 
         state = _create_react_node_state()
         patches = _common_patches(mock_registry, mock_prompt_builder)
         _enter(patches)
         try:
             with patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 mock_completion,
             ):
                 node = ReactiveOrchestratorNode()
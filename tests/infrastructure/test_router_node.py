@@ -1,10 +1,13 @@
 """Test RouterNode instance method pattern."""
 
 import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from osprey.infrastructure.router_node import RouterNode
+from osprey.base.errors import ErrorClassification, ErrorSeverity
+from osprey.base.resilience import get_circuit_breaker
+from osprey.infrastructure.router_node import RouterNode, router_conditional_edge
 
 
 class TestRouterNodeMigration:
@@ -72,3 +75,83 @@ class TestRouterNodeMigration:
         assert "control_routing_timestamp" in result
         assert "control_routing_count" in result
         assert isinstance(result["control_routing_timestamp"], float)
+
+
+def _retriable_error_state(base_state, retry_count=1, **error_info):
+    base_state.update(
+        control_has_error=True,
+        control_retry_count=retry_count,
+        control_error_info={
+            "classification": ErrorClassification(
+                severity=ErrorSeverity.RETRIABLE, user_message="Archiver timeout"
+            ),
+            "capability_name": "archiver_retrieval",
+            "retry_policy": {
+                "max_attempts": 3,
+                "delay_seconds": 1.0,
+                "backoff_factor": 2.0,
+                "jitter": 0,
+            },
+            **error_info,
+        },
+    )
+    return base_state
+
+
+class TestRetryScheduling:
+    """Test non-blocking retry delays and circuit breaker fast-fail."""
+
+    @pytest.fixture
+    def plan_first_routing(self):
+        with (
+            patch("osprey.infrastructure.router_node.get_config_value", return_value="plan_first"),
+            patch("osprey.infrastructure.router_node.get_registry", return_value=MagicMock()),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_awaited_in_router_node(self, base_state):
+        node = RouterNode()
+        node._state = _retriable_error_state(base_state, retry_count=2)
+
+        with patch("osprey.infrastructure.router_node.asyncio.sleep", new=AsyncMock()) as sleep:
+            await node.execute()
+
+        sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_no_delay_when_retries_exhausted(self, base_state):
+        node = RouterNode()
+        node._state = _retriable_error_state(base_state, retry_count=3)
+
+        with patch("osprey.infrastructure.router_node.asyncio.sleep", new=AsyncMock()) as sleep:
+            await node.execute()
+
+        sleep.assert_not_awaited()
+
+    def test_conditional_edge_does_not_sleep(self, base_state, plan_first_routing):
+        state = _retriable_error_state(base_state, retry_count=2)
+
+        with patch("time.sleep") as blocking_sleep:
+            assert router_conditional_edge(state) == "archiver_retrieval"
+
+        blocking_sleep.assert_not_called()
+
+    def test_circuit_open_error_skips_retries(self, base_state, plan_first_routing):
+        state = _retriable_error_state(base_state, circuit_open=True)
+
+        assert router_conditional_edge(state) == "error"
+
+    @pytest.mark.asyncio
+    async def test_open_capability_circuit_skips_retry_delay(self, base_state, plan_first_routing):
+        breaker = get_circuit_breaker("capability:archiver_retrieval")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        node = RouterNode()
+        node._state = _retriable_error_state(base_state)
+
+        with patch("osprey.infrastructure.router_node.asyncio.sleep", new=AsyncMock()) as sleep:
+            await node.execute()
+
+        sleep.assert_not_awaited()
+        assert router_conditional_edge(node._state) == "error"
@@ -10,8 +10,11 @@ from osprey.infrastructure.task_extraction_node import (
     _build_task_extraction_prompt,
     _extract_task,
     _format_task_context,
+    _select_history,
+    _summarize_history,
 )
 from osprey.prompts.defaults.task_extraction import ExtractedTask
+from osprey.state import CHAT_HISTORY_SUMMARY_KEY
 
 
 class TestTaskExtractionNode:
@@ -270,7 +273,7 @@ class TestBuildTaskExtractionPrompt:
 class TestExtractTask:
     """Test _extract_task helper function."""
 
-    def test_extract_task_without_data(self):
+    async def test_extract_task_without_data(self):
         """Test extracting task without retrieval data."""
         messages = [HumanMessage(content="Turn on the lights")]
         logger = Mock()
@@ -283,17 +286,17 @@ class TestExtractTask:
         with (
             patch("osprey.infrastructure.task_extraction_node.get_framework_prompts"),
             patch("osprey.infrastructure.task_extraction_node.get_model_config") as mock_config,
-            patch("osprey.infrastructure.task_extraction_node.get_chat_completion") as mock_llm,
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
         ):
             mock_config.return_value = {"model": "gpt-4"}
             mock_llm.return_value = expected_task
 
-            result = _extract_task(messages, None, logger)
+            result = await _extract_task(messages, None, logger)
 
         assert result == expected_task
         mock_llm.assert_called_once()
 
-    def test_extract_task_with_retrieval_data(self):
+    async def test_extract_task_with_retrieval_data(self):
         """Test extracting task with retrieval data."""
         messages = [HumanMessage(content="Test")]
         logger = Mock()
@@ -310,16 +313,16 @@ class TestExtractTask:
         with (
             patch("osprey.infrastructure.task_extraction_node.get_framework_prompts"),
             patch("osprey.infrastructure.task_extraction_node.get_model_config"),
-            patch("osprey.infrastructure.task_extraction_node.get_chat_completion") as mock_llm,
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
         ):
             mock_llm.return_value = expected_task
 
-            result = _extract_task(messages, mock_result, logger)
+            result = await _extract_task(messages, mock_result, logger)
 
         assert result == expected_task
         logger.debug.assert_called_with("Injecting data sources into task extraction: Data summary")
 
-    def test_extract_task_uses_correct_model_config(self):
+    async def test_extract_task_uses_correct_model_config(self):
         """Test that task extraction uses correct model configuration."""
         messages = [HumanMessage(content="Test")]
         logger = Mock()
@@ -327,18 +330,18 @@ class TestExtractTask:
         with (
             patch("osprey.infrastructure.task_extraction_node.get_framework_prompts"),
             patch("osprey.infrastructure.task_extraction_node.get_model_config") as mock_config,
-            patch("osprey.infrastructure.task_extraction_node.get_chat_completion") as mock_llm,
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
         ):
             mock_config.return_value = {"model": "test-model"}
             mock_llm.return_value = ExtractedTask(
                 task="Test", depends_on_chat_history=False, depends_on_user_memory=False
             )
 
-            _extract_task(messages, None, logger)
+            await _extract_task(messages, None, logger)
 
         mock_config.assert_called_once_with("task_extraction")
 
-    def test_extract_task_passes_output_model(self):
+    async def test_extract_task_passes_output_model(self):
         """Test that ExtractedTask is passed as output_model to LLM."""
         messages = [HumanMessage(content="Test")]
         logger = Mock()
@@ -346,15 +349,77 @@ class TestExtractTask:
         with (
             patch("osprey.infrastructure.task_extraction_node.get_framework_prompts"),
             patch("osprey.infrastructure.task_extraction_node.get_model_config"),
-            patch("osprey.infrastructure.task_extraction_node.get_chat_completion") as mock_llm,
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
         ):
             mock_llm.return_value = ExtractedTask(
                 task="Test", depends_on_chat_history=False, depends_on_user_memory=False
             )
 
-            _extract_task(messages, None, logger)
+            await _extract_task(messages, None, logger)
 
         # Verify that output_model=ExtractedTask was passed
         call_args = mock_llm.call_args
         assert "output_model" in call_args.kwargs
         assert call_args.kwargs["output_model"] == ExtractedTask
+
+
+class TestChatHistoryWindow:
+    """Test token-budgeted chat history for task extraction."""
+
+    @staticmethod
+    def _conversation(turns):
+        messages = []
+        for i in range(turns):
+            messages.append(HumanMessage(content=f"question {i} " + "q" * 400, id=f"h{i}"))
+            messages.append(AIMessage(content=f"answer {i} " + "a" * 400, id=f"a{i}"))
+        return messages
+
+    async def test_summarize_history_uses_llm(self):
+        """Test that evicted messages are summarized by the task extraction model."""
+        with (
+            patch("osprey.infrastructure.task_extraction_node.get_model_config"),
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
+        ):
+            mock_llm.return_value = " User asked about BPM 3. "
+
+            summary = await _summarize_history("Earlier summary", self._conversation(1), 200)
+
+        assert summary == "User asked about BPM 3."
+        prompt = mock_llm.call_args.kwargs["message"]
+        assert "Earlier summary" in prompt
+        assert "USER: question 0" in prompt
+
+    async def test_summarize_history_falls_back_to_extractive(self):
+        """Test that a failing summarization call does not block task extraction."""
+        with (
+            patch("osprey.infrastructure.task_extraction_node.get_model_config"),
+            patch("osprey.infrastructure.task_extraction_node.aget_chat_completion") as mock_llm,
+        ):
+            mock_llm.side_effect = ConnectionError("LLM down")
+
+            summary = await _summarize_history(None, self._conversation(1), 200)
+
+        assert summary.startswith("USER: question 0")
+
+    async def test_select_history_applies_configured_budget(self):
+        """Test that the configured budget windows the history and reuses the cache."""
+        messages = self._conversation(40)
+        config = {
+            "max_tokens": 1000,
+            "min_recent_messages": 4,
+            "summary_max_tokens": 300,
+            "summary_mode": "extractive",
+        }
+
+        with patch(
+            "osprey.infrastructure.task_extraction_node.get_chat_history_config",
+            return_value=config,
+        ):
+            window = await _select_history(messages, {}, Mock())
+            session_state = {CHAT_HISTORY_SUMMARY_KEY: window.cache}
+            again = await _select_history(messages, session_state, Mock())
+
+        assert window.summary_updated
+        assert window.window_tokens < window.full_tokens // 5
+        assert not again.summary_updated
+        assert again.messages == window.messages
@@ -301,7 +301,7 @@ def _build_test_graph(
         Mock registry returned by ``_make_mock_registry``.
     llm_responses
         Ordered list of tool-call lists; each call to
-        ``get_chat_completion`` pops the next one.
+        ``aget_chat_completion`` pops the next one.
     extra_nodes
         Optional ``{name: async_callable}`` for additional capability nodes.
 
@@ -325,7 +325,7 @@ def _build_test_graph(
         return next(llm_iter)
 
     llm_patch = patch(
-        "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+        "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
         side_effect=_next_llm_response,
     )
 
@@ -1206,7 +1206,7 @@ def _build_step_approval_graph(
         return next(llm_iter)
 
     llm_patch = patch(
-        "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+        "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
         side_effect=_next_llm_response,
     )
 
@@ -192,7 +192,7 @@ class TestTwoStepChain:
             patches["lw_ctx"],
             patches["lw_state"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response1,
             ),
         ):
@@ -256,7 +256,7 @@ class TestTwoStepChain:
             patches["lw_state"],
             patches["interface_ctx"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 side_effect=lambda *a, **kw: next(llm_responses_iter),
             ),
         ):
@@ -379,7 +379,7 @@ class TestThreeStepChain:
             patches["lw_ctx"],
             patches["lw_state"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_step1,
             ),
         ):
@@ -433,7 +433,7 @@ class TestThreeStepChain:
             patches["lw_ctx"],
             patches["lw_state"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_step2,
             ),
         ):
@@ -499,7 +499,7 @@ class TestThreeStepChain:
             patches["lw_state"],
             patches["interface_ctx"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 side_effect=lambda *a, **kw: next(llm_responses_iter),
             ),
         ):
@@ -593,7 +593,7 @@ class TestErrorThenRespondRecovery:
             patches["lw_state"],
             patches["interface_ctx"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 side_effect=lambda *a, **kw: next(llm_responses_iter),
             ),
         ):
@@ -659,7 +659,7 @@ class TestReactiveInputResolution:
             patches["lw_ctx"],
             patches["lw_state"],
             patch(
-                "osprey.infrastructure.reactive_orchestrator_node.get_chat_completion",
+                "osprey.infrastructure.reactive_orchestrator_node.aget_chat_completion",
                 return_value=llm_response,
             ),
         ):
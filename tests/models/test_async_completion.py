@@ -0,0 +1,167 @@
+"""Tests for the native async completion path and shared HTTP clients."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from osprey.models import http_clients
+from osprey.models.completion import aget_chat_completion, clear_provider_instances
+from osprey.models.providers.base import BaseProvider
+from osprey.models.providers.litellm_adapter import aexecute_litellm_completion
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def _litellm_response(content):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.choices[0].message.tool_calls = None
+    return response
+
+
+class SyncOnlyProvider(BaseProvider):
+    name = "sync_only"
+    description = "Provider without a native async path"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def execute_completion(self, message, model_id, api_key, base_url, **kwargs):
+        return f"sync:{message}"
+
+    def check_health(self, api_key, base_url, timeout=5.0, model_id=None):
+        return True, "ok"
+
+
+@pytest.fixture
+def sync_only_registry():
+    clear_provider_instances()
+    SyncOnlyProvider.instances = 0
+    registry = MagicMock()
+    registry.get_provider.return_value = SyncOnlyProvider
+    with (
+        patch("osprey.registry.get_registry", return_value=registry),
+        patch("osprey.models.completion.get_provider_config", return_value={}),
+        patch("osprey.models.logging.log_api_call"),
+    ):
+        yield
+    clear_provider_instances()
+
+
+class TestAgetChatCompletion:
+    async def test_falls_back_to_thread_and_reuses_provider_instance(self, sync_only_registry):
+        first = await aget_chat_completion(message="a", provider="sync_only", model_id="m")
+        second = await aget_chat_completion(message="b", provider="sync_only", model_id="m")
+
+        assert (first, second) == ("sync:a", "sync:b")
+        assert SyncOnlyProvider.instances == 1
+
+    async def test_validates_arguments_like_sync_version(self):
+        with pytest.raises(ValueError, match="Must pass either"):
+            await aget_chat_completion(provider="openai")
+
+    async def test_concurrent_calls_share_one_instance(self, sync_only_registry):
+        results = await asyncio.gather(
+            *(aget_chat_completion(message=str(i), provider="sync_only") for i in range(8))
+        )
+
+        assert results == [f"sync:{i}" for i in range(8)]
+        assert SyncOnlyProvider.instances == 1
+
+
+class TestAexecuteLitellmCompletion:
+    @patch("osprey.models.providers.litellm_adapter.litellm")
+    async def test_text_completion_uses_acompletion(self, mock_litellm):
+        mock_litellm.acompletion = AsyncMock(return_value=_litellm_response("hello"))
+
+        result = await aexecute_litellm_completion(
+            provider="anthropic",
+            message="hi",
+            model_id="claude-haiku",
+            api_key="key",
+            base_url=None,
+        )
+
+        assert result == "hello"
+        mock_litellm.completion.assert_not_called()
+        call_kwargs = mock_litellm.acompletion.call_args.kwargs
+        assert call_kwargs["model"] == "anthropic/claude-haiku"
+        assert call_kwargs["messages"] == [{"role": "user", "content": "hi"}]
+
+    @patch("osprey.models.providers.litellm_adapter.litellm")
+    async def test_structured_output(self, mock_litellm):
+        mock_litellm.acompletion = AsyncMock(return_value=_litellm_response('{"value": 3}'))
+
+        result = await aexecute_litellm_completion(
+            provider="cborg",
+            message="count",
+            model_id="gpt",
+            api_key="key",
+            base_url="https://api.cborg.lbl.gov",
+            output_format=Answer,
+            is_typed_dict_output=True,
+        )
+
+        assert result == {"value": 3}
+        assert "response_format" in mock_litellm.acompletion.call_args.kwargs
+
+    async def test_ollama_uses_pooled_async_client(self):
+        response = MagicMock()
+        response.json.return_value = {"message": {"content": '{"value": 7}'}}
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+
+        with patch(
+            "osprey.models.providers.litellm_adapter.get_async_http_client", return_value=client
+        ):
+            result = await aexecute_litellm_completion(
+                provider="ollama",
+                message="count",
+                model_id="mistral:7b",
+                api_key="ollama",
+                base_url="http://localhost:11434",
+                output_format=Answer,
+            )
+
+        assert result == Answer(value=7)
+        url = client.post.call_args.args[0]
+        assert url == "http://localhost:11434/api/chat"
+        assert client.post.call_args.kwargs["json"]["format"] == "json"
+
+
+class TestHttpClients:
+    async def test_async_client_is_shared_within_a_loop(self):
+        first = http_clients.get_async_http_client()
+        second = http_clients.get_async_http_client()
+
+        assert first is second
+        await http_clients.aclose_async_http_client()
+        assert first.is_closed
+        assert http_clients.get_async_http_client() is not first
+        await http_clients.aclose_async_http_client()
+
+    def test_async_clients_are_per_event_loop(self):
+        async def grab():
+            client = http_clients.get_async_http_client()
+            await http_clients.aclose_async_http_client()
+            return client
+
+        assert asyncio.run(grab()) is not asyncio.run(grab())
+
+    def test_sync_client_is_shared_and_recreated_after_close(self):
+        client = http_clients.get_http_client()
+        assert http_clients.get_http_client() is client
+
+        http_clients.close_http_clients()
+
+        assert client.is_closed
+        assert http_clients.get_http_client() is not client
@@ -0,0 +1,143 @@
+"""Tests for the embedding provider client behaviour (batching, retries, endpoint cache)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from osprey.models.embeddings import (
+    BaseEmbeddingProvider,
+    OllamaEmbeddingProvider,
+    clear_endpoint_cache,
+)
+
+
+class FakeEmbeddingProvider(BaseEmbeddingProvider):
+    name = "fake"
+    description = "Fake embedding provider"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+    default_model_id = "fake-embed"
+    retry_backoff_seconds = 0.0
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def execute_embedding(self, texts, model_id, api_key=None, base_url=None, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("temporarily unavailable")
+        self.batches.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    async def aexecute_embedding(self, texts, model_id, api_key=None, base_url=None, **kwargs):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self.execute_embedding(texts, model_id)
+        finally:
+            self.in_flight -= 1
+
+    def check_health(self, api_key, base_url, model_id=None, timeout=10.0):
+        return True, "ok"
+
+
+TEXTS = ["a" * n for n in range(1, 11)]
+
+
+class TestBatching:
+    def test_embed_texts_splits_into_batches_in_order(self):
+        provider = FakeEmbeddingProvider()
+
+        embeddings = provider.embed_texts(TEXTS, batch_size=4)
+
+        assert [len(b) for b in provider.batches] == [4, 4, 2]
+        assert embeddings == [[float(n)] for n in range(1, 11)]
+
+    def test_failed_batch_is_retried(self):
+        provider = FakeEmbeddingProvider(failures=2)
+
+        assert provider.embed_text("abc") == [3.0]
+
+    def test_retries_are_bounded(self):
+        provider = FakeEmbeddingProvider(failures=3)
+
+        with pytest.raises(RuntimeError):
+            provider.embed_texts(["abc"])
+
+    async def test_aembed_texts_bounds_concurrency(self):
+        provider = FakeEmbeddingProvider()
+
+        embeddings = await provider.aembed_texts(TEXTS, batch_size=1, max_concurrency=3)
+
+        assert embeddings == [[float(n)] for n in range(1, 11)]
+        assert provider.peak_in_flight == 3
+
+    async def test_default_async_path_uses_worker_thread(self):
+        class SyncOnly(FakeEmbeddingProvider):
+            aexecute_embedding = BaseEmbeddingProvider.aexecute_embedding
+
+        assert await SyncOnly().aembed_text("ab") == [2.0]
+
+
+@pytest.fixture
+def ollama():
+    clear_endpoint_cache()
+    response = SimpleNamespace(data=[{"embedding": [0.1, 0.2]}])
+    with (
+        patch.object(OllamaEmbeddingProvider, "_test_connection", return_value=True) as probe,
+        patch("litellm.embedding", return_value=response) as embedding,
+        patch("litellm.aembedding", new=AsyncMock(return_value=response)) as aembedding,
+    ):
+        yield SimpleNamespace(probe=probe, embedding=embedding, aembedding=aembedding)
+    clear_endpoint_cache()
+
+
+class TestOllamaEndpointCache:
+    def test_endpoint_is_probed_once(self, ollama, monkeypatch):
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+        provider = OllamaEmbeddingProvider()
+
+        for _ in range(3):
+            provider.execute_embedding(["x"], "nomic-embed-text", base_url="http://ollama:11434")
+
+        assert ollama.probe.call_count == 1
+        assert ollama.embedding.call_args.kwargs["api_base"] == "http://ollama:11434"
+
+    def test_endpoint_is_revalidated_after_ttl(self, ollama, monkeypatch):
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+        provider = OllamaEmbeddingProvider()
+        provider.endpoint_ttl_seconds = 0.0
+
+        for _ in range(2):
+            provider.execute_embedding(["x"], "nomic-embed-text", base_url="http://ollama:11434")
+
+        assert ollama.probe.call_count == 2
+
+    def test_failed_request_drops_cached_endpoint(self, ollama, monkeypatch):
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+        provider = OllamaEmbeddingProvider()
+        ollama.embedding.side_effect = [ConnectionError("down"), ollama.embedding.return_value]
+
+        with pytest.raises(RuntimeError):
+            provider.execute_embedding(["x"], "nomic-embed-text", base_url="http://ollama:11434")
+        provider.execute_embedding(["x"], "nomic-embed-text", base_url="http://ollama:11434")
+
+        assert ollama.probe.call_count == 2
+
+    async def test_async_embedding_uses_litellm_aembedding(self, ollama, monkeypatch):
+        monkeypatch.delenv("OLLAMA_HOST", raising=False)
+        provider = OllamaEmbeddingProvider()
+
+        embeddings = await provider.aembed_texts(["x"], base_url="http://ollama:11434")
+
+        assert embeddings == [[0.1, 0.2]]
+        ollama.aembedding.assert_awaited_once()
+        ollama.embedding.assert_not_called()
@@ -1,9 +1,12 @@
 """Tests for models logging module."""
 
 import contextvars
+import json
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 from pydantic import BaseModel
 
 from osprey.models.logging import (
@@ -609,3 +612,120 @@ class TestLogApiCall:
         assert filename.startswith("test_test_")
         assert "_20" in filename  # Should have year starting with 20
         assert filename.endswith(".txt")
+
+
+# =============================================================================
+# Test Buffered JSONL API Call Log
+# =============================================================================
+
+
+@pytest.fixture
+def jsonl_logging(tmp_path, monkeypatch):
+    """Enable JSONL API call logging into tmp_path."""
+    from osprey.models.logging import reset_api_call_log
+
+    config = {"api_calls": {"save_all": True, "format": "jsonl"}}
+    monkeypatch.setattr("osprey.models.logging.get_config_value", MagicMock(return_value=config))
+    monkeypatch.setattr("osprey.models.logging.get_agent_dir", lambda x: tmp_path)
+    reset_api_call_log()
+    yield config["api_calls"]
+    reset_api_call_log()
+
+
+class TestJsonlApiCallLog:
+    """Test the buffered JSONL writer."""
+
+    def test_records_are_written_in_background(self, jsonl_logging, tmp_path):
+        """Records are appended as JSON lines with context-var caller info."""
+        from osprey.models.logging import flush_api_call_log, log_api_call
+
+        class Answer(BaseModel):
+            value: int
+
+        set_api_call_context(function="_extract_task", module="task_extraction_node")
+        try:
+            with patch("osprey.models.logging._get_caller_info") as slow_lookup:
+                log_api_call(
+                    message="input",
+                    result=Answer(value=2),
+                    provider="anthropic",
+                    model_id="claude-haiku",
+                    max_tokens=100,
+                    temperature=0.0,
+                    output_model=Answer,
+                    usage={"prompt_tokens": 5},
+                )
+                log_api_call(
+                    message="second",
+                    result="text",
+                    provider="anthropic",
+                    model_id="claude-haiku",
+                    max_tokens=100,
+                    temperature=0.0,
+                )
+        finally:
+            _api_call_context.set(None)
+
+        assert flush_api_call_log()
+        slow_lookup.assert_not_called()
+        records = [
+            json.loads(line) for line in (tmp_path / "api_calls.jsonl").read_text().splitlines()
+        ]
+        assert [r["message"] for r in records] == ["input", "second"]
+        assert records[0]["caller"]["module"] == "task_extraction_node"
+        assert records[0]["output_model"] == "Answer"
+        assert json.loads(records[0]["response"]) == {"value": 2}
+        assert records[0]["usage"] == {"prompt_tokens": 5}
+        assert not list(tmp_path.glob("*.txt"))
+
+    def test_rotation_bounds_file_count(self, tmp_path):
+        """Files rotate at max_bytes and only backup_count backups are kept."""
+        from osprey.models.logging import _JsonlApiCallWriter
+
+        writer = _JsonlApiCallWriter(
+            tmp_path / "api_calls.jsonl", max_bytes=200, backup_count=2, queue_size=10
+        )
+        try:
+            for i in range(6):
+                writer.submit({"message": "x" * 150, "response": str(i)})
+                assert writer.flush(5)
+        finally:
+            writer.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "api_calls.1.jsonl",
+            "api_calls.2.jsonl",
+            "api_calls.jsonl",
+        ]
+        latest = json.loads((tmp_path / "api_calls.jsonl").read_text())
+        assert latest["response"] == "5"
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        """submit() never blocks; overflow is counted."""
+        from osprey.models.logging import _JsonlApiCallWriter
+
+        writer = _JsonlApiCallWriter(
+            tmp_path / "api_calls.jsonl", max_bytes=10_000, backup_count=1, queue_size=1
+        )
+        release = threading.Event()
+        original_write = writer._write
+        writer._write = lambda records: (release.wait(5), original_write(records))
+        try:
+            results = [writer.submit({"message": "m", "response": str(i)}) for i in range(5)]
+        finally:
+            release.set()
+            writer.close()
+
+        assert results.count(False) == writer.dropped >= 2
+
+    def test_fast_caller_lookup_without_context(self):
+        """Without a context variable the caller comes from a raw frame walk."""
+        from osprey.models.logging import _get_caller_info_fast
+
+        _api_call_context.set(None)
+
+        caller_info = _get_caller_info_fast()
+
+        assert caller_info["function"] == "test_fast_caller_lookup_without_context"
+        assert caller_info["module"] == "test_logging"
+        assert caller_info["class"] == "TestJsonlApiCallLog"
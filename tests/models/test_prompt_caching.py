@@ -0,0 +1,184 @@
+"""Tests for provider prompt-cache markers and per-call cache usage recording."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from osprey.models.completion import clear_provider_instances, get_chat_completion
+from osprey.models.logging import _format_metadata_header, consume_call_usage
+from osprey.models.providers.base import BaseProvider
+from osprey.models.providers.litellm_adapter import execute_litellm_completion
+
+PREFIX = "You are a planner.\n\nEXAMPLES:\n..."
+MESSAGE = f"{PREFIX}\n\nTASK TO PLAN: read the beam current"
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def _response(content, usage=None):
+    message = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+@pytest.fixture
+def mock_litellm():
+    with patch("osprey.models.providers.litellm_adapter.litellm") as mock:
+        mock.completion.return_value = _response("ok")
+        yield mock
+    consume_call_usage()
+
+
+class TestCacheMarkers:
+    def test_anthropic_prefix_gets_cache_control_block(self, mock_litellm):
+        execute_litellm_completion(
+            "anthropic", MESSAGE, "claude-haiku", "key", None, cache_prefix=PREFIX
+        )
+
+        content = mock_litellm.completion.call_args.kwargs["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": PREFIX,
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert content[1] == {"type": "text", "text": MESSAGE[len(PREFIX) :]}
+
+    def test_other_providers_receive_plain_prefix_first_message(self, mock_litellm):
+        execute_litellm_completion("openai", MESSAGE, "gpt-4o", "key", None, cache_prefix=PREFIX)
+
+        messages = mock_litellm.completion.call_args.kwargs["messages"]
+        assert messages == [{"role": "user", "content": MESSAGE}]
+
+    def test_prefix_not_matching_message_is_ignored(self, mock_litellm):
+        execute_litellm_completion(
+            "anthropic", MESSAGE, "claude-haiku", "key", None, cache_prefix="something else"
+        )
+
+        assert mock_litellm.completion.call_args.kwargs["messages"][0]["content"] == MESSAGE
+
+    def test_structured_fallback_keeps_cached_block_unchanged(self, mock_litellm):
+        mock_litellm.supports_response_schema.return_value = False
+        mock_litellm.completion.return_value = _response('{"value": 1}')
+
+        with patch(
+            "osprey.models.providers.litellm_adapter._supports_native_structured_output",
+            return_value=False,
+        ):
+            result = execute_litellm_completion(
+                "anthropic",
+                MESSAGE,
+                "claude-haiku",
+                "key",
+                None,
+                output_format=Answer,
+                cache_prefix=PREFIX,
+            )
+
+        assert result == Answer(value=1)
+        content = mock_litellm.completion.call_args.kwargs["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": PREFIX,
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert "You must respond with valid JSON" in content[1]["text"]
+
+
+class TestUsageRecording:
+    def test_anthropic_cache_read_and_write_tokens(self, mock_litellm):
+        usage = SimpleNamespace(
+            prompt_tokens=1200,
+            completion_tokens=30,
+            cache_read_input_tokens=1000,
+            cache_creation_input_tokens=0,
+        )
+        mock_litellm.completion.return_value = _response("ok", usage)
+
+        execute_litellm_completion("anthropic", "hi", "claude-haiku", "key", None)
+
+        usage = consume_call_usage()
+        assert usage["prompt_tokens"] == 1200
+        assert usage["completion_tokens"] == 30
+        assert usage["cache_read_tokens"] == 1000
+        assert usage["cache_write_tokens"] == 0
+        assert consume_call_usage() is None
+
+    def test_openai_cached_tokens_from_prompt_details(self, mock_litellm):
+        usage = {
+            "prompt_tokens": 2048,
+            "completion_tokens": 10,
+            "prompt_tokens_details": {"cached_tokens": 1920},
+        }
+        mock_litellm.completion.return_value = _response("ok", usage)
+
+        execute_litellm_completion("openai", "hi", "gpt-4o", "key", None)
+
+        usage = consume_call_usage()
+        assert usage["cache_read_tokens"] == 1920
+        assert usage["cache_write_tokens"] == 0
+
+    def test_usage_appears_in_log_header(self):
+        header = _format_metadata_header(
+            caller_info={},
+            provider="anthropic",
+            model_id="claude-haiku",
+            max_tokens=100,
+            temperature=0.0,
+            enable_thinking=False,
+            budget_tokens=None,
+            output_model=None,
+            usage={"prompt_tokens": 5, "cache_read_tokens": 3, "cache_write_tokens": 0},
+        )
+
+        assert "# Cache Read Tokens: 3" in header
+        assert header.rstrip().endswith("# ==========================================")
+
+
+class RecordingProvider(BaseProvider):
+    name = "recording"
+    description = "Provider recording its kwargs"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+    last_kwargs: dict = {}
+
+    def execute_completion(self, message, model_id, api_key, base_url, **kwargs):
+        type(self).last_kwargs = kwargs
+        from osprey.models.logging import record_call_usage
+
+        record_call_usage({"prompt_tokens": 10, "cache_read_tokens": 8, "cache_write_tokens": 0})
+        return "done"
+
+    def check_health(self, api_key, base_url, timeout=5.0, model_id=None):
+        return True, "ok"
+
+
+@pytest.fixture
+def recording_provider():
+    registry = MagicMock()
+    registry.get_provider.return_value = RecordingProvider
+    clear_provider_instances()
+    with (
+        patch("osprey.registry.get_registry", return_value=registry),
+        patch("osprey.models.completion.get_provider_config", return_value={}),
+        patch("osprey.models.logging.log_api_call") as log_api_call,
+    ):
+        yield log_api_call
+    clear_provider_instances()
+
+
+class TestCompletionCachePrefix:
+    def test_prefix_and_usage_are_threaded_through(self, recording_provider):
+        get_chat_completion(message=MESSAGE, provider="recording", cache_prefix=PREFIX)
+
+        assert RecordingProvider.last_kwargs["cache_prefix"] == PREFIX
+        assert recording_provider.call_args.kwargs["usage"]["cache_read_tokens"] == 8
+
+    def test_prefix_not_prefixing_message_is_dropped(self, recording_provider):
+        get_chat_completion(message="different", provider="recording", cache_prefix=PREFIX)
+
+        assert "cache_prefix" not in RecordingProvider.last_kwargs
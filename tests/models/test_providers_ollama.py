@@ -121,11 +121,12 @@ class TestOllamaTestConnection:
 class TestOllamaExecuteCompletion:
     """Test Ollama completion execution via direct API."""
 
-    @patch("httpx.post")
+    @patch("osprey.models.providers.litellm_adapter.get_http_client")
     @patch.object(OllamaProviderAdapter, "_test_connection", return_value=True)
-    def test_execute_text_completion(self, mock_test, mock_post):
-        """Test basic text completion via direct Ollama API."""
+    def test_execute_text_completion(self, mock_test, mock_get_client):
+        """Test basic text completion via direct Ollama API on the pooled client."""
         provider = OllamaProviderAdapter()
+        mock_post = mock_get_client.return_value.post
 
         mock_response = MagicMock()
         mock_response.json.return_value = {"message": {"content": "Test response"}}
@@ -145,15 +146,16 @@ class TestOllamaExecuteCompletion:
         assert call_args[0][0] == "http://localhost:11434/api/chat"
         assert call_args[1]["json"]["model"] == "mistral:7b"
 
-    @patch("httpx.post")
+    @patch("osprey.models.providers.litellm_adapter.get_http_client")
     @patch.object(
         OllamaProviderAdapter,
         "_test_connection",
         side_effect=[False, True],  # First fails, second succeeds
     )
-    def test_execute_completion_with_fallback(self, mock_test, mock_post):
+    def test_execute_completion_with_fallback(self, mock_test, mock_get_client):
         """Test completion execution with fallback."""
         provider = OllamaProviderAdapter()
+        mock_post = mock_get_client.return_value.post
 
         mock_response = MagicMock()
         mock_response.json.return_value = {"message": {"content": "Response"}}
@@ -0,0 +1,235 @@
+"""Tests for the persistent LLM response cache."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from osprey.models import response_cache
+from osprey.models.completion import (
+    aget_chat_completion,
+    clear_provider_instances,
+    get_chat_completion,
+)
+from osprey.models.logging import _api_call_context, set_api_call_context
+from osprey.models.providers.base import BaseProvider
+from osprey.models.response_cache import ResponseCache
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def _kwargs(**overrides):
+    kwargs = {
+        "message": "What is 1+1?",
+        "model_id": "m",
+        "base_url": None,
+        "max_tokens": 1024,
+        "temperature": 0.0,
+        "enable_thinking": False,
+        "output_format": None,
+        "is_typed_dict_output": False,
+        "chat_request": None,
+        "tools": None,
+        "tool_choice": None,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+class TestResponseCache:
+    def test_round_trips_text_and_structured_results(self, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        cache.set("text", "hello")
+        cache.set("model", Answer(value=2))
+        cache.set("tools", [{"id": "1", "function": {"name": "f", "arguments": "{}"}}])
+
+        assert cache.get("text") == (True, "hello")
+        assert cache.get("model", output_model=Answer) == (True, Answer(value=2))
+        assert cache.get("tools")[1][0]["function"]["name"] == "f"
+        assert cache.get("missing") == (False, None)
+        assert cache.counters["hits"] == 3
+        assert cache.counters["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        ResponseCache(tmp_path / "cache.sqlite").set("k", "v")
+
+        assert ResponseCache(tmp_path / "cache.sqlite").get("k") == (True, "v")
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=10)
+        cache.set("k", "v")
+
+        with patch("osprey.models.response_cache.time.time", return_value=1e12):
+            assert cache.get("k") == (False, None)
+
+        assert cache.stats()["entries"] == 0
+        assert cache.counters["expired"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=None, max_entries=2)
+        with patch("osprey.models.response_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", "1")
+            cache.set("b", "2")
+            cache.get("a")
+            cache.set("c", "3")
+
+        assert cache.get("a")[0] is True
+        assert cache.get("b")[0] is False
+        assert cache.get("c")[0] is True
+        assert cache.counters["evictions"] == 1
+
+    def test_unserializable_results_are_not_stored(self, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        assert cache.set("k", [object()]) is False
+        assert cache.get("k") == (False, None)
+
+    def test_schema_drift_is_a_miss(self, tmp_path):
+        class Other(BaseModel):
+            name: str
+
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        cache.set("k", Answer(value=1))
+
+        assert cache.get("k", output_model=Other) == (False, None)
+        assert cache.stats()["entries"] == 0
+
+    def test_key_depends_on_request_inputs(self):
+        base = ResponseCache.make_key("openai", _kwargs())
+
+        assert base == ResponseCache.make_key("openai", _kwargs())
+        assert base != ResponseCache.make_key("anthropic", _kwargs())
+        assert base != ResponseCache.make_key("openai", _kwargs(message="What is 2+2?"))
+        assert base != ResponseCache.make_key("openai", _kwargs(output_format=Answer))
+        assert base != ResponseCache.make_key("openai", _kwargs(tools=[{"name": "t"}]))
+
+
+class CountingProvider(BaseProvider):
+    name = "counting"
+    description = "Provider counting its calls"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+    calls = 0
+
+    def execute_completion(self, message, model_id, api_key, base_url, **kwargs):
+        type(self).calls += 1
+        if kwargs.get("output_format") is not None:
+            return kwargs["output_format"](value=len(message))
+        return f"answer:{message}"
+
+    def check_health(self, api_key, base_url, timeout=5.0, model_id=None):
+        return True, "ok"
+
+
+@pytest.fixture
+def cached_provider(tmp_path):
+    settings = {"enabled": True, "callers": {"disabled_caller": False}}
+    registry = MagicMock()
+    registry.get_provider.return_value = CountingProvider
+    CountingProvider.calls = 0
+    clear_provider_instances()
+    response_cache.reset_response_cache()
+
+    with (
+        patch("osprey.registry.get_registry", return_value=registry),
+        patch("osprey.models.completion.get_provider_config", return_value={}),
+        patch("osprey.models.logging.log_api_call"),
+        patch("osprey.models.response_cache._get_cache_settings", return_value=settings),
+        patch("osprey.models.response_cache.get_agent_dir", return_value=str(tmp_path)),
+    ):
+        yield settings
+
+    response_cache.reset_response_cache()
+    clear_provider_instances()
+
+
+class TestCompletionCaching:
+    def test_repeated_call_is_served_from_cache(self, cached_provider):
+        first = get_chat_completion(message="hi", provider="counting", model_id="m")
+        second = get_chat_completion(message="hi", provider="counting", model_id="m")
+
+        assert first == second == "answer:hi"
+        assert CountingProvider.calls == 1
+        assert response_cache.get_response_cache().counters["hits"] == 1
+
+    async def test_async_structured_call_is_cached(self, cached_provider):
+        first = await aget_chat_completion(
+            message="abc", provider="counting", model_id="m", output_model=Answer
+        )
+        second = await aget_chat_completion(
+            message="abc", provider="counting", model_id="m", output_model=Answer
+        )
+
+        assert first == second == Answer(value=3)
+        assert CountingProvider.calls == 1
+
+    async def test_async_cache_io_runs_off_the_event_loop(self, cached_provider):
+        from osprey.models import completion
+
+        threads = []
+
+        def record(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        with (
+            patch.object(
+                completion,
+                "lookup_cached_completion",
+                record(completion.lookup_cached_completion),
+            ),
+            patch.object(
+                completion, "read_cached_completion", record(completion.read_cached_completion)
+            ),
+            patch.object(
+                completion,
+                "_store_cached_completion",
+                record(completion._store_cached_completion),
+            ),
+        ):
+            for _ in range(2):
+                await aget_chat_completion(message="hi", provider="counting", model_id="m")
+
+        assert CountingProvider.calls <= 1
+        assert len(threads) >= 4  # a lookup plus a read or store per call
+        assert threading.get_ident() not in threads
+
+    def test_nonzero_temperature_bypasses_cache(self, cached_provider):
+        for _ in range(2):
+            get_chat_completion(message="hi", provider="counting", temperature=0.7)
+
+        assert CountingProvider.calls == 2
+
+    def test_disabled_caller_bypasses_cache(self, cached_provider):
+        set_api_call_context(function="f", module="disabled_caller")
+        try:
+            for _ in range(2):
+                get_chat_completion(message="hi", provider="counting")
+        finally:
+            _api_call_context.set(None)
+
+        assert CountingProvider.calls == 2
+
+    async def test_async_disabled_caller_bypasses_cache(self, cached_provider):
+        # No api call context: the caller comes from the stack of the awaiting code
+        cached_provider["callers"]["test_response_cache"] = False
+        for _ in range(2):
+            await aget_chat_completion(message="hi", provider="counting", model_id="m")
+
+        assert CountingProvider.calls == 2
+
+    def test_cache_disabled_by_default(self, cached_provider):
+        cached_provider["enabled"] = False
+        for _ in range(2):
+            get_chat_completion(message="hi", provider="counting")
+
+        assert CountingProvider.calls == 2
@@ -0,0 +1,203 @@
+"""Tests for LLM call telemetry aggregation and export."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from osprey.models import telemetry
+from osprey.models.completion import (
+    aget_chat_completion,
+    clear_provider_instances,
+    get_chat_completion,
+)
+from osprey.models.logging import _api_call_context, set_api_call_context
+from osprey.models.providers.base import BaseProvider
+from osprey.models.telemetry import (
+    LLMTelemetry,
+    load_snapshots,
+    merge_snapshots,
+    render_prometheus,
+    summarize,
+)
+
+USAGE = {
+    "prompt_tokens": 100,
+    "completion_tokens": 20,
+    "thinking_tokens": 5,
+    "cache_read_tokens": 80,
+    "retries": 1,
+    "cost_usd": 0.002,
+}
+
+
+def _record(store, caller="classification_node._perform_classification", **kwargs):
+    defaults = {
+        "caller": caller,
+        "node": "classifier",
+        "provider": "anthropic",
+        "model": "claude-haiku",
+        "latency": 0.5,
+        "usage": USAGE,
+        "session": "s1",
+    }
+    defaults.update(kwargs)
+    store.record(**defaults)
+
+
+class TestLLMTelemetry:
+    def test_aggregates_by_node_caller_and_session(self):
+        store = LLMTelemetry()
+        _record(store)
+        _record(store, latency=1.5, session="s2")
+        _record(store, caller="orchestration_node._create_execution_plan", node="orchestrator")
+
+        by_node = store.summary("node")
+        assert by_node["classifier"].calls == 2
+        assert by_node["classifier"].prompt_tokens == 200
+        assert by_node["classifier"].max_latency_seconds == 1.5
+        assert by_node["classifier"].avg_latency_seconds == 1.0
+        assert by_node["orchestrator"].retries == 1
+        assert set(store.summary("caller")) == {
+            "classification_node._perform_classification",
+            "orchestration_node._create_execution_plan",
+        }
+        assert store.summary("session")["s1"].calls == 2
+
+    def test_errors_and_cache_hits_are_counted(self):
+        store = LLMTelemetry()
+        _record(store, usage=None, cache_hit=True)
+        _record(store, usage=None, error=True)
+
+        stats = store.summary("model")["claude-haiku"]
+        assert (stats.calls, stats.cache_hits, stats.errors) == (2, 1, 1)
+
+    def test_sessions_are_bounded(self):
+        store = LLMTelemetry(max_sessions=2)
+        for session in ("a", "b", "a", "c"):
+            _record(store, session=session)
+
+        assert set(store.summary("session")) == {"a", "c"}
+        assert store.summary("node")["classifier"].calls == 4
+
+    def test_rejects_unknown_grouping(self):
+        with pytest.raises(ValueError, match="group_by"):
+            summarize({}, "capability")
+
+    def test_prometheus_rendering(self):
+        store = LLMTelemetry()
+        _record(store, caller='weird"caller')
+
+        text = store.render_prometheus()
+
+        assert "# TYPE osprey_llm_calls_total counter" in text
+        assert 'osprey_llm_calls_total{caller="weird\\"caller",node="classifier"' in text
+        assert "osprey_llm_cache_read_tokens_total{" in text
+        assert "session" not in text
+
+    def test_snapshots_merge_across_processes(self, tmp_path):
+        for pid in (1, 2):
+            store = LLMTelemetry()
+            _record(store)
+            (tmp_path / f"telemetry_{pid}.json").write_text(json.dumps(store.snapshot()))
+        (tmp_path / "telemetry_3.json").write_text("{not json")
+
+        merged = merge_snapshots(load_snapshots(tmp_path))
+
+        assert summarize(merged, "node")["classifier"].calls == 2
+        assert summarize(merged, "session")["s1"].prompt_tokens == 200
+        assert "osprey_llm_calls_total" in render_prometheus(merged)
+
+    def test_periodic_snapshot_is_written_in_background(self, tmp_path):
+        store = LLMTelemetry()
+        _record(store)
+        threads = []
+        snapshot = store.snapshot
+        store.snapshot = lambda: threads.append(threading.get_ident()) or snapshot()
+        path = tmp_path / "telemetry_1.json"
+        writer = telemetry._SnapshotWriter(store, path, interval=60)
+
+        writer.maybe_write()
+        writer.maybe_write()  # same interval: no second write
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert json.loads(path.read_text())["series"]
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+
+class FlakyProvider(BaseProvider):
+    name = "flaky"
+    description = "Provider failing on demand"
+    requires_api_key = False
+    requires_base_url = False
+    requires_model_id = False
+    supports_proxy = False
+
+    def execute_completion(self, message, model_id, api_key, base_url, **kwargs):
+        if message == "fail":
+            raise RuntimeError("provider down")
+        from osprey.models.logging import record_call_usage
+
+        record_call_usage(dict(USAGE))
+        return "ok"
+
+    def check_health(self, api_key, base_url, timeout=5.0, model_id=None):
+        return True, "ok"
+
+
+@pytest.fixture
+def fresh_telemetry():
+    registry = MagicMock()
+    registry.get_provider.return_value = FlakyProvider
+    clear_provider_instances()
+    telemetry.reset_llm_telemetry()
+    with (
+        patch("osprey.registry.get_registry", return_value=registry),
+        patch("osprey.models.completion.get_provider_config", return_value={}),
+        patch("osprey.models.logging.log_api_call"),
+        patch("osprey.models.telemetry._get_telemetry_settings", return_value={}),
+    ):
+        set_api_call_context(function="_extract_task", module="task_extraction_node")
+        try:
+            yield telemetry.get_llm_telemetry()
+        finally:
+            _api_call_context.set(None)
+    telemetry.reset_llm_telemetry()
+    clear_provider_instances()
+
+
+class TestCompletionTelemetry:
+    def test_successful_and_failed_calls_are_recorded(self, fresh_telemetry):
+        get_chat_completion(message="hi", provider="flaky", model_id="m")
+        with pytest.raises(RuntimeError):
+            get_chat_completion(message="fail", provider="flaky", model_id="m")
+
+        stats = fresh_telemetry.summary("caller")["task_extraction_node._extract_task"]
+        assert stats.calls == 2
+        assert stats.errors == 1
+        assert stats.prompt_tokens == 100
+        assert stats.cost_usd == pytest.approx(0.002)
+        # Outside a LangGraph run the caller module stands in for the node
+        assert "task_extraction_node" in fresh_telemetry.summary("node")
+
+    async def test_usage_survives_default_async_fallback(self, fresh_telemetry):
+        # FlakyProvider has no native async path: BaseProvider runs it in a thread
+        await aget_chat_completion(message="hi", provider="flaky", model_id="m")
+
+        stats = fresh_telemetry.summary("caller")["task_extraction_node._extract_task"]
+        assert stats.calls == 1
+        assert stats.prompt_tokens == 100
+        assert stats.cost_usd == pytest.approx(0.002)
+
+    def test_disabled_in_config(self):
+        telemetry.reset_llm_telemetry()
+        with patch(
+            "osprey.models.telemetry._get_telemetry_settings", return_value={"enabled": False}
+        ):
+            assert telemetry.get_llm_telemetry() is None
+        telemetry.reset_llm_telemetry()
@@ -2,7 +2,7 @@
 
 import warnings
 
-from osprey.prompts.base import FrameworkPromptBuilder
+from osprey.prompts.base import FrameworkPromptBuilder, PromptParts
 
 
 class TestDeprecationBridges:
@@ -187,3 +187,39 @@ class TestGetSystemInstructions:
         assert builder.get_examples() is None
         assert builder.build_dynamic_context() is None
         assert builder.get_task() is None
+
+
+class TestPromptParts:
+    """Test the static/dynamic prompt split used for provider prompt caching."""
+
+    class Builder(FrameworkPromptBuilder):
+        def get_role(self):
+            return "role"
+
+        def get_instructions(self):
+            return "instructions"
+
+        def build_dynamic_context(self, turn=None, **kwargs):
+            return f"turn {turn}" if turn is not None else None
+
+    def test_parts_join_to_build_prompt(self):
+        """PromptParts.text matches build_prompt() exactly."""
+        builder = self.Builder()
+        parts = builder.build_prompt_parts(turn=1)
+
+        assert parts.static == "role\n\ninstructions"
+        assert parts.dynamic == "turn 1"
+        assert parts.text == builder.build_prompt(turn=1)
+
+    def test_static_prefix_is_stable_across_calls(self):
+        """Only the dynamic suffix changes with runtime context."""
+        builder = self.Builder()
+
+        assert (
+            builder.build_prompt_parts(turn=1).static == builder.build_prompt_parts(turn=2).static
+        )
+        assert builder.build_prompt_parts().text == "role\n\ninstructions"
+
+    def test_text_skips_empty_parts(self):
+        assert PromptParts("", "only dynamic").text == "only dynamic"
+        assert PromptParts("only static").text == "only static"
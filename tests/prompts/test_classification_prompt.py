@@ -106,3 +106,33 @@ class TestClassificationSystemInstructions:
         builder = CustomClassifier()
         prompt = builder.build_prompt()
         assert "Return only true or false." in prompt
+
+
+class TestClassificationBatchPrompt:
+    """Test build_batch_prompt composition for batched classification."""
+
+    def test_includes_every_capability_section(self):
+        builder = DefaultClassificationPromptBuilder()
+        prompt = builder.build_batch_prompt(
+            capabilities=[
+                ("channel_finding", "Find channels", "Example A"),
+                ("python", "Run code", ""),
+            ]
+        )
+        assert "### Capability: channel_finding\nFind channels" in prompt
+        assert "Example A" in prompt
+        assert "### Capability: python\nRun code" in prompt
+        assert builder.get_batch_instructions() in prompt
+
+    def test_batch_instructions_require_decisions(self):
+        builder = DefaultClassificationPromptBuilder()
+        instructions = builder.get_batch_instructions()
+        assert '"decisions"' in instructions
+        assert "certain" in instructions
+
+    def test_previous_failure_included(self):
+        builder = DefaultClassificationPromptBuilder()
+        prompt = builder.build_batch_prompt(
+            capabilities=[("python", "Run code", "")], previous_failure="Wrong capability"
+        )
+        assert "Wrong capability" in prompt
@@ -279,6 +279,26 @@ class TestOrchestratorPromptStructure:
             "Chat history should appear before context reuse guidance"
         )
 
+    def test_planning_prompt_parts_keep_dynamic_sections_out_of_prefix(self, sample_messages):
+        """Chat history and error context go in the suffix; parts join to the full prompt."""
+        builder = DefaultOrchestratorPromptBuilder()
+        kwargs = {
+            "active_capabilities": [],
+            "context_manager": None,
+            "task_depends_on_chat_history": True,
+            "error_context": "Step 1 failed: timeout",
+            "messages": sample_messages,
+        }
+
+        parts = builder.build_planning_prompt_parts(**kwargs)
+
+        assert "expert execution planner" in parts.static
+        assert "**CONVERSATION HISTORY**" not in parts.static
+        assert "Step 1 failed" not in parts.static
+        assert "**CONVERSATION HISTORY**" in parts.dynamic
+        assert parts.text == builder.get_planning_instructions(**kwargs)
+        assert parts.static == builder.build_planning_prompt_parts(active_capabilities=[]).static
+
 
 # ===================================================================
 # Tests for Context Section with Task Objective Metadata
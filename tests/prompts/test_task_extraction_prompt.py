@@ -97,3 +97,15 @@ class TestTaskExtractionSectionBuilders:
         assert "## Current Chat History:" in prompt
         assert "## User Memory:" in prompt
         assert "Now extract the task" in prompt
+
+    def test_prompt_parts_split_static_guidelines_from_chat_history(self):
+        """Role, guidelines and examples form a prefix that does not depend on the chat."""
+        builder = DefaultTaskExtractionPromptBuilder()
+        first = builder.build_prompt_parts([MessageUtils.create_user_message("first query")])
+        second = builder.build_prompt_parts([MessageUtils.create_user_message("second query")])
+
+        assert first.static == second.static
+        assert "## Examples:" in first.static
+        assert "## Current Chat History:" in first.dynamic
+        assert "first query" not in first.static
+        assert first.text == builder.build_prompt([MessageUtils.create_user_message("first query")])
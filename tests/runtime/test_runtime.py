@@ -3,6 +3,7 @@
 Tests the runtime utilities for control system operations in generated Python code.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,6 +13,7 @@ from osprey.runtime import (
     cleanup_runtime,
     configure_from_context,
     read_channel,
+    read_channels,
     write_channel,
     write_channels,
 )
@@ -422,3 +424,77 @@ class TestRuntimeLimitsValidation:
 
             assert len(mock_connector.write_calls) == 1
             assert mock_connector.write_calls[0][1] == 50.0
+
+
+class TestRuntimeEventLoop:
+    """Test the persistent runtime event loop and bulk/monitor helpers."""
+
+    def test_sync_calls_share_one_background_loop(
+        self, mock_context_with_config, clear_runtime_state
+    ):
+        import threading
+
+        import osprey.runtime as runtime
+
+        configure_from_context(mock_context_with_config)
+        loops = []
+
+        class LoopRecordingConnector(MockConnector):
+            async def read_channel(self, channel_address, **kwargs):
+                loops.append((asyncio.get_running_loop(), threading.current_thread()))
+                return await super().read_channel(channel_address, **kwargs)
+
+        with patch(
+            "osprey.connectors.factory.ConnectorFactory.create_control_system_connector"
+        ) as mock_factory:
+            mock_factory.return_value = LoopRecordingConnector()
+            for _ in range(5):
+                read_channel("TEST:PV")
+
+        assert len({id(loop) for loop, _ in loops}) == 1
+        loop, thread = loops[0]
+        assert loop is runtime._runtime_loop
+        assert thread is runtime._runtime_loop_thread
+        assert thread is not threading.current_thread()
+
+    def test_read_channels_returns_values_in_order(
+        self, mock_context_with_config, clear_runtime_state
+    ):
+        configure_from_context(mock_context_with_config)
+        mock_connector = MockConnector()
+
+        with patch(
+            "osprey.connectors.factory.ConnectorFactory.create_control_system_connector"
+        ) as mock_factory:
+            mock_factory.return_value = mock_connector
+            values = read_channels(["PV:B", "PV:A", "PV:B"])
+
+        assert values == {"PV:B": 42.0, "PV:A": 42.0}
+        assert [call[0] for call in mock_connector.read_calls] == ["PV:B", "PV:A"]
+
+    def test_read_channels_reports_failures(self, mock_context_with_config, clear_runtime_state):
+        configure_from_context(mock_context_with_config)
+
+        class PartiallyFailingConnector(MockConnector):
+            async def read_channel(self, channel_address, **kwargs):
+                if channel_address == "PV:BAD":
+                    raise ConnectionError("not found")
+                return await super().read_channel(channel_address, **kwargs)
+
+        with patch(
+            "osprey.connectors.factory.ConnectorFactory.create_control_system_connector"
+        ) as mock_factory:
+            mock_factory.return_value = PartiallyFailingConnector()
+            with pytest.raises(RuntimeError, match="PV:BAD: not found"):
+                read_channels(["PV:GOOD", "PV:BAD"])
+
+    def test_sync_call_from_runtime_loop_rejected(
+        self, mock_context_with_config, clear_runtime_state
+    ):
+        import osprey.runtime as runtime
+
+        async def nested_call():
+            read_channel("TEST:PV")
+
+        with pytest.raises(RuntimeError, match="cannot be called from the runtime"):
+            runtime._run_async(nested_call())
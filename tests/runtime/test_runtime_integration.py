@@ -8,7 +8,9 @@ import pytest
 from osprey.runtime import (
     cleanup_runtime,
     configure_from_context,
+    monitor,
     read_channel,
+    read_channels,
     write_channel,
     write_channels,
 )
@@ -323,3 +325,32 @@ def test_fallback_to_global_config(clear_runtime_state):
         write_channel("FALLBACK:TEST", 123.0)
         value = read_channel("FALLBACK:TEST")
         assert value == 123.0
+
+
+def test_read_channels_with_mock(mock_control_system_context, clear_runtime_state):
+    """Test bulk read through the connector's bulk read path."""
+    configure_from_context(mock_control_system_context)
+
+    write_channels({"MAGNET:H01": 5.0, "MAGNET:H02": 5.2})
+
+    assert read_channels(["MAGNET:H02", "MAGNET:H01"]) == {"MAGNET:H02": 5.2, "MAGNET:H01": 5.0}
+
+
+def test_monitor_records_updates(mock_control_system_context, clear_runtime_state):
+    """Test monitor() receives updates triggered by writes (Mock connector)."""
+    configure_from_context(mock_control_system_context)
+    received = []
+
+    with monitor("TEST:MONITORED", callback=received.append) as mon:
+        assert mon.active
+        write_channel("TEST:MONITORED", 1.0)
+        write_channel("TEST:MONITORED", 2.0)
+
+    assert not mon.active
+    assert received == [1.0, 2.0]
+    assert [value for _, value in mon.values] == [1.0, 2.0]
+    assert mon.latest == 2.0
+
+    # No further updates after stop
+    write_channel("TEST:MONITORED", 3.0)
+    assert received == [1.0, 2.0]
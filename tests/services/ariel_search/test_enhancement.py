@@ -547,6 +547,47 @@ class TestTextEmbeddingModuleEnhance:
         for call in mock_conn.execute.call_args_list:
             assert "INSERT" not in str(call)
 
+    @pytest.mark.asyncio
+    async def test_enhance_batch_embeds_entries_together(self, module):
+        """enhance_batch embeds all non-empty entries with one batched call."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        module.configure(
+            {
+                "models": [{"name": "test-model", "dimension": 768, "max_input_tokens": 8192}],
+                "provider": {"base_url": "http://localhost:11434"},
+                "batch_size": 2,
+            }
+        )
+        provider = MagicMock()
+        provider.aembed_texts = AsyncMock(return_value=[[0.1], [0.2], [0.3]])
+        module._provider = provider
+        mock_result = MagicMock()
+        mock_result.fetchone = AsyncMock(return_value=(True,))
+        mock_conn = MagicMock()
+        mock_conn.execute = AsyncMock(return_value=mock_result)
+
+        entries = [
+            {"entry_id": "e1", "raw_text": "Beam current at 500mA."},
+            {"entry_id": "e2", "raw_text": "  "},
+            {"entry_id": "e3", "raw_text": "Vacuum interlock reset."},
+            {"entry_id": "e4", "raw_text": "RF trip in sector 3."},
+        ]
+        failures = await module.enhance_batch(entries, mock_conn)
+
+        assert failures == {}
+        assert module.batch_size == 2
+        provider.aembed_texts.assert_awaited_once()
+        kwargs = provider.aembed_texts.call_args.kwargs
+        assert kwargs["texts"] == [
+            "Beam current at 500mA.",
+            "Vacuum interlock reset.",
+            "RF trip in sector 3.",
+        ]
+        assert kwargs["batch_size"] == 2
+        inserts = [c for c in mock_conn.execute.call_args_list if "INSERT" in str(c)]
+        assert [c.args[1] for c in inserts] == [["e1", [0.1]], ["e3", [0.2]], ["e4", [0.3]]]
+
 
 class TestSemanticProcessorEnhanceWithLLM:
     """Tests for SemanticProcessorModule enhance with mocked LLM."""
@@ -14,6 +14,7 @@ from osprey.services.ariel_search.config import (
     IngestionConfig,
     WatchConfig,
 )
+from osprey.services.ariel_search.enhancement.base import BaseEnhancementModule
 from osprey.services.ariel_search.ingestion.scheduler import (
     IngestionPollResult,
     IngestionScheduler,
@@ -61,6 +62,26 @@ def _make_entry(entry_id: str = "e1") -> dict:
     }
 
 
+class _MockEnhancer(BaseEnhancementModule):
+    """Enhancement module delegating ``enhance`` to an AsyncMock."""
+
+    def __init__(self, name: str, enhance: AsyncMock, batch_size: int = 1):
+        self._name = name
+        self._batch_size = batch_size
+        self.mock = enhance
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    async def enhance(self, entry, conn) -> None:
+        await self.mock(entry, conn)
+
+
 def _mock_adapter(entries: list[dict] | None = None):
     """Create a mock adapter that yields entries."""
     adapter = MagicMock()
@@ -194,9 +215,9 @@ class TestIngestionScheduler:
         repository.get_last_successful_run = AsyncMock(return_value=last_time)
 
         # Create a mock enhancer that raises
-        failing_enhancer = MagicMock()
-        failing_enhancer.name = "text_embedding"
-        failing_enhancer.enhance = AsyncMock(side_effect=RuntimeError("model unavailable"))
+        failing_enhancer = _MockEnhancer(
+            "text_embedding", AsyncMock(side_effect=RuntimeError("model unavailable"))
+        )
 
         # Mock pool.connection as async context manager
         mock_conn = AsyncMock()
@@ -425,9 +446,7 @@ class TestIngestionScheduler:
         )
 
         # Create a succeeding enhancer
-        succeeding_enhancer = MagicMock()
-        succeeding_enhancer.name = "text_embedding"
-        succeeding_enhancer.enhance = AsyncMock(return_value=None)
+        succeeding_enhancer = _MockEnhancer("text_embedding", AsyncMock(return_value=None))
 
         # Mock pool.connection as async context manager
         mock_conn = AsyncMock()
@@ -454,6 +473,48 @@ class TestIngestionScheduler:
         repository.mark_enhancement_complete.assert_called_once_with("e1", "text_embedding")
         repository.mark_enhancement_failed.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_poll_once_enhances_entries_in_batches(self, config, repository) -> None:
+        """poll_once hands entries to enhancers in batches of their batch size."""
+        entries = [_make_entry(f"e{i}") for i in range(5)]
+        adapter = _mock_adapter(entries)
+        repository.get_last_successful_run = AsyncMock(
+            return_value=datetime(2024, 1, 1, tzinfo=UTC)
+        )
+
+        batches = []
+
+        class BatchingEnhancer(_MockEnhancer):
+            async def enhance_batch(self, batch, conn):
+                batches.append([entry["entry_id"] for entry in batch])
+                return {"e3": RuntimeError("model unavailable")} if "e3" in batches[-1] else {}
+
+        conn_cm = AsyncMock()
+        conn_cm.__aenter__ = AsyncMock(return_value=AsyncMock())
+        conn_cm.__aexit__ = AsyncMock(return_value=None)
+        repository.pool.connection = MagicMock(return_value=conn_cm)
+
+        with (
+            patch(
+                "osprey.services.ariel_search.ingestion.get_adapter",
+                return_value=adapter,
+            ),
+            patch(
+                "osprey.services.ariel_search.enhancement.create_enhancers_from_config",
+                return_value=[BatchingEnhancer("text_embedding", AsyncMock(), batch_size=2)],
+            ),
+        ):
+            scheduler = IngestionScheduler(config=config, repository=repository)
+            result = await scheduler.poll_once()
+
+        assert batches == [["e0", "e1"], ["e2", "e3"], ["e4"]]
+        assert result.entries_added == 5
+        assert result.entries_failed == 1
+        assert repository.mark_enhancement_complete.call_count == 4
+        repository.mark_enhancement_failed.assert_called_once_with(
+            "e3", "text_embedding", "model unavailable"
+        )
+
     @pytest.mark.asyncio
     async def test_poll_once_mixed_enhancers(self, config, repository) -> None:
         """poll_once handles mixed success/failure across multiple enhancers."""
@@ -464,13 +525,11 @@ class TestIngestionScheduler:
         )
 
         # First enhancer succeeds, second fails
-        good_enhancer = MagicMock()
-        good_enhancer.name = "text_embedding"
-        good_enhancer.enhance = AsyncMock(return_value=None)
+        good_enhancer = _MockEnhancer("text_embedding", AsyncMock(return_value=None))
 
-        bad_enhancer = MagicMock()
-        bad_enhancer.name = "semantic_processor"
-        bad_enhancer.enhance = AsyncMock(side_effect=RuntimeError("model unavailable"))
+        bad_enhancer = _MockEnhancer(
+            "semantic_processor", AsyncMock(side_effect=RuntimeError("model unavailable"))
+        )
 
         # Mock pool.connection as async context manager
         mock_conn = AsyncMock()
@@ -0,0 +1,124 @@
+"""
+Tests for concurrent branch exploration in the hierarchical pipeline.
+
+Covers bounded concurrency, deterministic result ordering, memoization of
+level selections within a query and the per-query LLM call limit.
+"""
+
+import asyncio
+import random
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from osprey.services.channel_finder.core.models import ExplicitChannelDetectionOutput
+from osprey.services.channel_finder.databases.hierarchical import HierarchicalChannelDatabase
+from osprey.services.channel_finder.pipelines.hierarchical.pipeline import HierarchicalPipeline
+
+DB_PATH = (
+    Path(__file__).parents[3]
+    / "src/osprey/templates/apps/control_assistant/data/channel_databases/hierarchical.json"
+)
+
+# Level selections for "horizontal and vertical corrector currents"
+SELECTIONS = {
+    "system": ["MAG"],
+    "family": ["HCM", "VCM"],
+    "field": ["CURRENT"],
+    "subfield": ["SP", "RB"],
+}
+
+EXPECTED_CHANNELS = [
+    f"MAG:{family}[{device}]:CURRENT:{subfield}"
+    for family, devices in (("HCM", ["H01", "H02"]), ("VCM", ["V01", "V02"]))
+    for subfield in ("SP", "RB")
+    for device in devices
+]
+
+
+class FakeHierarchicalPipeline(HierarchicalPipeline):
+    """Hierarchical pipeline with a scripted LLM level selector."""
+
+    def __init__(self, max_concurrency=4, max_llm_calls=None, seed=0, queries=None):
+        # Skip HierarchicalPipeline.__init__ to avoid config and prompt loading
+        self.database = HierarchicalChannelDatabase(str(DB_PATH))
+        self.model_config = {"provider": "test", "model_id": "test"}
+        self.explicit_validation_mode = "lenient"
+        self.facility_name = "test facility"
+        self.facility_description = ""
+        self.hierarchical_context = {}
+        self.query_splitting = True
+        self.max_concurrency = max_concurrency
+        self.max_llm_calls = max_llm_calls
+
+        self.rng = random.Random(seed)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = []
+
+        self._detect_explicit_channels = AsyncMock(
+            return_value=ExplicitChannelDetectionOutput(
+                has_explicit_addresses=False, needs_additional_search=True, reasoning="none"
+            )
+        )
+        self._split_query = AsyncMock(return_value=queries or ["corrector currents"])
+
+    async def _select_at_level(self, query, level, options, previous_selections):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.calls.append((level, dict(previous_selections)))
+        try:
+            # Random latency so branches finish out of order
+            await asyncio.sleep(self.rng.random() * 0.01)
+        finally:
+            self.in_flight -= 1
+        if level == "device":
+            return [opt["name"] for opt in options[:2]]
+        return list(SELECTIONS[level])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_branches_are_explored_concurrently_in_deterministic_order(seed):
+    pipeline = FakeHierarchicalPipeline(max_concurrency=2, seed=seed)
+
+    result = await pipeline.process_query("horizontal and vertical corrector currents")
+
+    assert [ch.channel for ch in result.channels] == EXPECTED_CHANNELS
+    # system + family, then device/field/subfield in each family branch
+    assert len(pipeline.calls) == 8
+    assert pipeline.peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_atomic_queries_reuse_selections():
+    pipeline = FakeHierarchicalPipeline(queries=["corrector currents", "corrector currents"])
+
+    result = await pipeline.process_query("corrector currents, corrector currents")
+
+    assert len(pipeline.calls) == 8
+    assert [ch.channel for ch in result.channels] == EXPECTED_CHANNELS
+
+
+@pytest.mark.asyncio
+async def test_call_limit_skips_remaining_branches():
+    pipeline = FakeHierarchicalPipeline(max_llm_calls=7)
+
+    result = await pipeline.process_query("horizontal and vertical corrector currents")
+
+    # The subfield selection of one family branch exceeds the limit
+    assert len(pipeline.calls) == 7
+    assert "results may be incomplete" in result.processing_notes
+    assert result.total_channels == 4
+    assert {ch.channel for ch in result.channels} < set(EXPECTED_CHANNELS)
+
+
+@pytest.mark.asyncio
+async def test_no_limit_explores_everything():
+    pipeline = FakeHierarchicalPipeline(max_llm_calls=None)
+
+    result = await pipeline.process_query("horizontal and vertical corrector currents")
+
+    assert result.total_channels == len(EXPECTED_CHANNELS)
+    assert "incomplete" not in result.processing_notes
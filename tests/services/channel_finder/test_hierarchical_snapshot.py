@@ -0,0 +1,153 @@
+"""
+Tests for compiled snapshots of hierarchical channel databases.
+
+Covers equivalence with the JSON load across the example databases, staleness
+detection against the source JSON, invalid snapshot fallback and load time for
+a large expanded tree.
+"""
+
+import json
+import os
+import shutil
+import time
+import warnings
+from pathlib import Path
+
+import pytest
+
+from osprey.services.channel_finder.databases.hierarchical import HierarchicalChannelDatabase
+from osprey.services.channel_finder.databases.hierarchical_snapshot import (
+    compile_snapshot,
+    default_snapshot_path,
+)
+
+DB_DIR = (
+    Path(__file__).parents[3] / "src/osprey/templates/apps/control_assistant/data/channel_databases"
+)
+
+EXAMPLE_DATABASES = [
+    "hierarchical.json",
+    "examples/consecutive_instances.json",
+    "examples/hierarchical_jlab_style.json",
+    "examples/hierarchical_legacy.json",
+    "examples/instance_first.json",
+    "examples/mixed_hierarchy.json",
+    "examples/optional_levels.json",
+]
+
+
+def load_json_database(path) -> HierarchicalChannelDatabase:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)  # legacy example format
+        return HierarchicalChannelDatabase(str(path), use_snapshot=False)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "hierarchical.json"
+    shutil.copy(DB_DIR / "hierarchical.json", path)
+    return path
+
+
+@pytest.mark.parametrize("name", EXAMPLE_DATABASES)
+def test_snapshot_matches_json_load(tmp_path, name):
+    path = tmp_path / Path(name).name
+    shutil.copy(DB_DIR / name, path)
+    expected = load_json_database(path)
+    compile_snapshot(expected)
+
+    database = HierarchicalChannelDatabase(str(path))
+
+    assert database.snapshot_path == default_snapshot_path(path)
+    assert dict(database.channel_map) == expected.channel_map
+    assert database.get_all_channels() == expected.get_all_channels()
+    assert database.get_statistics() == expected.get_statistics()
+
+    first_level = expected.hierarchy_levels[0]
+    assert database.get_options_at_level(first_level, {}) == expected.get_options_at_level(
+        first_level, {}
+    )
+
+    channel = next(iter(expected.channel_map))
+    assert database.validate_channel(channel)
+    assert database.get_channel(channel) == expected.get_channel(channel)
+    assert not database.validate_channel(channel + "_MISSING")
+    assert database.get_channel(channel + "_MISSING") is None
+
+
+def test_edited_json_is_loaded_instead_of_stale_snapshot(db_path):
+    compile_snapshot(load_json_database(db_path))
+
+    data = json.loads(db_path.read_text())
+    data["tree"]["MAG"]["_description"] = "Edited magnets"
+    db_path.write_text(json.dumps(data))
+
+    database = HierarchicalChannelDatabase(str(db_path))
+
+    assert database.snapshot_path is None
+    assert database.tree["MAG"]["_description"] == "Edited magnets"
+
+
+def test_touched_json_keeps_using_snapshot(db_path):
+    compile_snapshot(load_json_database(db_path))
+    stat = db_path.stat()
+    os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    assert HierarchicalChannelDatabase(str(db_path)).snapshot_path is not None
+
+
+def test_invalid_snapshot_falls_back_to_json(db_path):
+    default_snapshot_path(db_path).write_bytes(b"not a snapshot")
+
+    database = HierarchicalChannelDatabase(str(db_path))
+
+    assert database.snapshot_path is None
+    assert len(database.channel_map) > 0
+
+
+def test_snapshot_can_be_disabled(db_path):
+    compile_snapshot(load_json_database(db_path))
+
+    assert HierarchicalChannelDatabase(str(db_path), use_snapshot=False).snapshot_path is None
+
+
+def test_large_database_loads_from_snapshot_in_milliseconds(tmp_path):
+    # 1000 lines x 10 stations x 10 parameters = 100,000 channels
+    stations = {
+        f"ST{s}": {"_description": "Station", **{f"P{p}": {} for p in range(10)}} for s in range(10)
+    }
+    path = tmp_path / "large.json"
+    path.write_text(
+        json.dumps(
+            {
+                "hierarchy": {
+                    "levels": [
+                        {"name": "line", "type": "instances"},
+                        {"name": "station", "type": "tree"},
+                        {"name": "parameter", "type": "tree"},
+                    ],
+                    "naming_pattern": "LINE{line}:{station}:{parameter}",
+                },
+                "tree": {
+                    "LINE": {
+                        "_expansion": {"_type": "range", "_pattern": "{:04d}", "_range": [1, 1000]},
+                        **stations,
+                    }
+                },
+            }
+        )
+    )
+    compile_snapshot(load_json_database(path))
+
+    start = time.perf_counter()
+    database = HierarchicalChannelDatabase(str(path))
+    elapsed = time.perf_counter() - start
+
+    assert database.snapshot_path is not None
+    assert len(database.channel_map) == 100_000
+    assert elapsed < 0.5  # typically a few milliseconds
+    assert database.get_channel("LINE0567:ST5:P6")["path"] == {
+        "line": "0567",
+        "station": "ST5",
+        "parameter": "P6",
+    }
@@ -0,0 +1,145 @@
+"""
+Tests for concurrent chunk × query matching in the in-context pipeline.
+
+Covers bounded concurrency, deterministic result ordering, early termination
+and per-stage timings.
+"""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from osprey.services.channel_finder.core.models import (
+    ChannelMatchOutput,
+    ExplicitChannelDetectionOutput,
+)
+from osprey.services.channel_finder.pipelines.in_context.pipeline import InContextPipeline
+
+CHANNELS = [{"channel": f"CH{i:02d}", "address": f"PV:CH{i:02d}"} for i in range(12)]
+
+
+class FakeInContextPipeline(InContextPipeline):
+    """In-context pipeline with a fake LLM matcher (chunks of 3 channels)."""
+
+    def __init__(self, max_concurrency=4, expected_channels=None, seed=0):
+        # Skip InContextPipeline.__init__ to avoid config and prompt loading
+        database = MagicMock()
+        database.chunk_database = lambda size: [
+            CHANNELS[i : i + size] for i in range(0, len(CHANNELS), size)
+        ]
+        database.format_chunk_for_prompt = lambda chunk, include_addresses=False: chunk
+        database.get_channel = lambda name: next(
+            (ch for ch in CHANNELS if ch["channel"] == name), None
+        )
+        self.database = database
+        self.model_config = {"provider": "test", "model_id": "test"}
+        self.explicit_validation_mode = "lenient"
+        self.chunk_dictionary = True
+        self.chunk_size = 3
+        self.max_correction_iterations = 2
+        self.max_concurrency = max_concurrency
+        self.expected_channels = expected_channels
+        self.retrieval_index = None
+
+        self.rng = random.Random(seed)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = []
+
+        self._detect_explicit_channels = AsyncMock(
+            return_value=ExplicitChannelDetectionOutput(
+                has_explicit_addresses=False,
+                needs_additional_search=True,
+                reasoning="none",
+            )
+        )
+        self._split_query = AsyncMock(return_value=["first", "last"])
+
+    async def _match_single_query_in_chunk(self, atomic_query, chunk_formatted, chunk_num=1):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.calls.append((chunk_num, atomic_query))
+        try:
+            # Random latency so calls finish out of order
+            await asyncio.sleep(self.rng.random() * 0.01)
+        finally:
+            self.in_flight -= 1
+        channel = chunk_formatted[0] if atomic_query == "first" else chunk_formatted[-1]
+        return ChannelMatchOutput(channels_found=True, channels=[channel["channel"]])
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    pipeline = FakeInContextPipeline(max_concurrency=3)
+
+    result = await pipeline.process_query("first and last channels")
+
+    assert len(pipeline.calls) == 8  # 4 chunks × 2 atomic queries
+    assert pipeline.peak_in_flight == 3
+    assert result.total_channels == 8
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(5))
+async def test_result_order_is_deterministic(seed):
+    pipeline = FakeInContextPipeline(max_concurrency=8, seed=seed)
+
+    result = await pipeline.process_query("first and last channels")
+
+    # Chunk order, then atomic query order
+    assert [ch.channel for ch in result.channels] == [
+        "CH00",
+        "CH02",
+        "CH03",
+        "CH05",
+        "CH06",
+        "CH08",
+        "CH09",
+        "CH11",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_early_termination_skips_remaining_chunks():
+    pipeline = FakeInContextPipeline(max_concurrency=1, expected_channels=2)
+
+    result = await pipeline.process_query("first and last channels")
+
+    assert [ch.channel for ch in result.channels] == ["CH00", "CH02"]
+    assert len(pipeline.calls) < 8
+    assert "Stopped after 1 of 4 chunks" in result.processing_notes
+
+
+@pytest.mark.asyncio
+async def test_failed_query_does_not_abort_chunk():
+    pipeline = FakeInContextPipeline()
+    match = pipeline._match_single_query_in_chunk
+
+    async def flaky(atomic_query, chunk_formatted, chunk_num=1):
+        if atomic_query == "first":
+            raise RuntimeError("model unavailable")
+        return await match(atomic_query, chunk_formatted, chunk_num)
+
+    pipeline._match_single_query_in_chunk = flaky
+
+    result = await pipeline.process_query("first and last channels")
+
+    assert [ch.channel for ch in result.channels] == ["CH02", "CH05", "CH08", "CH11"]
+
+
+@pytest.mark.asyncio
+async def test_result_reports_stage_timings():
+    pipeline = FakeInContextPipeline()
+
+    result = await pipeline.process_query("first and last channels")
+
+    assert set(result.timings) == {
+        "explicit_detection",
+        "query_split",
+        "channel_search",
+        "aggregation",
+        "total",
+    }
+    assert result.timings["total"] >= result.timings["channel_search"] > 0
@@ -0,0 +1,262 @@
+"""
+Tests for the channel finder pre-retrieval index.
+
+Covers tokenization, BM25 ranking, hybrid embedding retrieval with a persisted
+vector cache, the recall benchmark on the bundled in-context dataset and the
+in-context pipeline running in retrieval mode.
+"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from osprey.services.channel_finder.benchmarks import (
+    QueryBenchmarkEntry,
+    evaluate_retrieval_recall,
+)
+from osprey.services.channel_finder.core.models import (
+    ChannelMatchOutput,
+    ExplicitChannelDetectionOutput,
+)
+from osprey.services.channel_finder.core.retrieval import (
+    ChannelRetrievalIndex,
+    default_embedding_cache_path,
+    tokenize,
+)
+from osprey.services.channel_finder.databases.template import ChannelDatabase
+from osprey.services.channel_finder.pipelines.in_context.pipeline import InContextPipeline
+
+DATA_DIR = (
+    Path(__file__).parents[3] / "src" / "osprey" / "templates" / "apps" / "control_assistant"
+) / "data"
+
+CHANNELS = [
+    {"channel": "TerminalVoltageReadBack", "description": "Measured terminal voltage"},
+    {"channel": "TerminalVoltageSetPoint", "description": "Terminal voltage set value"},
+    {"channel": "SteeringCoil01XSetPoint", "description": "Horizontal steering coil 1"},
+    {"channel": "IP41Pressure", "description": "Ion pump vacuum reading in beamline 1"},
+    {"channel": "BeamPulseDuration", "description": "Length of the electron beam pulse"},
+]
+
+
+def synthetic_channels(count: int) -> list[dict]:
+    systems = ["Vacuum", "Magnet", "Rf", "Diagnostic", "Cooling"]
+    signals = ["Pressure", "Current", "Voltage", "Temperature", "Flow"]
+    return [
+        {
+            "channel": f"{systems[i % 5]}{signals[i // 5 % 5]}{i:05d}",
+            "description": f"{signals[i // 5 % 5].lower()} of {systems[i % 5].lower()} unit {i}",
+        }
+        for i in range(count)
+    ]
+
+
+class FakeEmbedder:
+    """Embeds texts as keyword indicator vectors."""
+
+    default_model_id = "fake-embed"
+    keywords = ["vacuum", "voltage", "steering", "pulse"]
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.embedded: list[str] = []
+
+    def _vector(self, text: str) -> list[float]:
+        text = text.lower().replace("pressure", "vacuum").replace("gauge", "vacuum")
+        return [float(word in text) for word in self.keywords]
+
+    def embed_texts(self, texts, model_id=None, base_url=None):
+        if self.fail:
+            raise ConnectionError("embedding server down")
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    async def aembed_texts(self, texts, model_id=None, base_url=None):
+        return self.embed_texts(texts, model_id, base_url)
+
+    async def aembed_text(self, text, model_id=None, base_url=None):
+        return (await self.aembed_texts([text], model_id, base_url))[0]
+
+
+def test_tokenize_splits_names_and_normalizes_numbers():
+    assert tokenize("SteeringCoil01XSetPoint") == ["steering", "coil", "1", "x", "set", "point"]
+    assert tokenize("What are the vacuum levels in beamline 1?") == [
+        "vacuum",
+        "level",
+        "beamline",
+        "1",
+    ]
+
+
+def test_search_ranks_matching_channels_first():
+    index = ChannelRetrievalIndex(CHANNELS)
+
+    hits = index.search("terminal voltage readback", top_k=2)
+
+    assert [hit.channel["channel"] for hit in hits] == [
+        "TerminalVoltageReadBack",
+        "TerminalVoltageSetPoint",
+    ]
+    assert hits[0].score > hits[1].score
+
+
+def test_search_returns_nothing_without_shared_terms():
+    assert ChannelRetrievalIndex(CHANNELS).search("klystron", top_k=5) == []
+
+
+def test_candidate_count_and_latency_stay_flat_for_large_databases():
+    index = ChannelRetrievalIndex(synthetic_channels(20_000))
+
+    start = time.perf_counter()
+    hits = index.search("vacuum pressure of unit 4250", top_k=40)
+    elapsed = time.perf_counter() - start
+
+    assert len(hits) == 40
+    assert hits[0].channel["channel"] == "VacuumPressure04250"
+    assert elapsed < 0.5  # typically a few milliseconds
+
+
+async def test_embeddings_add_semantic_matches_and_are_cached(tmp_path):
+    cache_path = default_embedding_cache_path(tmp_path / "db.json")
+    embedder = FakeEmbedder()
+    index = ChannelRetrievalIndex(CHANNELS, embedder=embedder, embedding_cache_path=cache_path)
+
+    # No channel mentions "gauge"; only the embeddings relate it to vacuum
+    assert index.search("gauge", top_k=1) == []
+    await index.load_embeddings()
+    hits = await index.asearch("gauge", top_k=1)
+
+    assert index.has_embeddings
+    assert hits[0].channel["channel"] == "IP41Pressure"
+    assert cache_path.name == "db.embeddings.npz" and cache_path.exists()
+
+    # A new index over the same channels loads all vectors from the cache
+    embedder = FakeEmbedder()
+    index = ChannelRetrievalIndex(CHANNELS, embedder=embedder, embedding_cache_path=cache_path)
+    assert await index.load_embeddings() == 0
+    assert embedder.embedded == []
+
+    # Edited channels are re-embedded
+    edited = [dict(CHANNELS[0], description="Terminal potential"), *CHANNELS[1:]]
+    index = ChannelRetrievalIndex(edited, embedder=embedder, embedding_cache_path=cache_path)
+    assert await index.load_embeddings() == 1
+
+
+async def test_unavailable_embedder_falls_back_to_bm25():
+    index = ChannelRetrievalIndex(CHANNELS, embedder=FakeEmbedder(fail=True))
+
+    hits = await index.asearch("beam pulse length", top_k=1)
+
+    assert hits[0].channel["channel"] == "BeamPulseDuration"
+    assert not index.has_embeddings
+
+
+async def test_first_query_does_not_wait_for_channel_embeddings():
+    index = ChannelRetrievalIndex(CHANNELS, embedder=FakeEmbedder())
+
+    # BM25 only while the background build runs
+    assert await index.asearch("gauge", top_k=1) == []
+    index._embedding_build.join(timeout=5)
+
+    assert index.has_embeddings
+    hits = await index.asearch("gauge", top_k=1)
+    assert hits[0].channel["channel"] == "IP41Pressure"
+
+
+async def test_embeddings_are_retried_after_backoff():
+    embedder = FakeEmbedder(fail=True)
+    index = ChannelRetrievalIndex(CHANNELS, embedder=embedder, embedding_retry_seconds=0.05)
+
+    assert index.start_embedding_build()
+    index._embedding_build.join(timeout=5)
+    assert not index.has_embeddings
+    assert not index.start_embedding_build()  # still backing off
+
+    embedder.fail = False
+    time.sleep(0.1)
+    await index.asearch("gauge", top_k=1)
+    index._embedding_build.join(timeout=5)
+
+    assert index.has_embeddings
+    hits = await index.asearch("gauge", top_k=1)
+    assert hits[0].channel["channel"] == "IP41Pressure"
+
+
+def test_recall_benchmark_on_in_context_dataset():
+    database = ChannelDatabase(str(DATA_DIR / "channel_databases" / "in_context.json"))
+    with open(DATA_DIR / "benchmarks" / "datasets" / "in_context_benchmark.json") as f:
+        entries = [QueryBenchmarkEntry(**item) for item in json.load(f)]
+    index = ChannelRetrievalIndex.from_database(database)
+
+    result = evaluate_retrieval_recall(index, entries, top_k=40)
+
+    assert result.total_queries == len(entries)
+    assert result.recall >= 0.95, result.missed
+    assert result.avg_latency_ms < 10
+
+
+class RetrievalPipeline(InContextPipeline):
+    """In-context pipeline in retrieval mode with a fake LLM matcher."""
+
+    def __init__(self, channels: list[dict]):
+        # Skip InContextPipeline.__init__ to avoid config and prompt loading
+        database = MagicMock()
+        database.format_chunk_for_prompt = lambda chunk, include_addresses=False: chunk
+        database.get_channel = lambda name: next(
+            (dict(ch, address=ch["channel"]) for ch in channels if ch["channel"] == name), None
+        )
+        self.database = database
+        self.model_config = {"provider": "test", "model_id": "test"}
+        self.explicit_validation_mode = "lenient"
+        self.chunk_dictionary = False
+        self.chunk_size = 50
+        self.max_correction_iterations = 2
+        self.max_concurrency = 4
+        self.expected_channels = None
+        self.retrieval_index = ChannelRetrievalIndex(channels)
+        self.retrieval_top_k = 5
+        self.prompts: list[tuple[str, int]] = []
+
+        self._detect_explicit_channels = AsyncMock(
+            return_value=ExplicitChannelDetectionOutput(
+                has_explicit_addresses=False, needs_additional_search=True, reasoning="none"
+            )
+        )
+        self._split_query = AsyncMock(
+            return_value=["vacuum pressure of unit 25", "magnet current of unit 31"]
+        )
+
+    async def _match_single_query_in_chunk(self, atomic_query, chunk_formatted, chunk_num=1):
+        self.prompts.append((atomic_query, len(chunk_formatted)))
+        return ChannelMatchOutput(channels_found=True, channels=[chunk_formatted[0]["channel"]])
+
+
+async def test_pipeline_matches_each_query_against_its_candidates():
+    pipeline = RetrievalPipeline(synthetic_channels(5_000))
+
+    result = await pipeline.process_query("vacuum pressure 25 and magnet current 31")
+
+    assert [ch.channel for ch in result.channels] == [
+        "VacuumPressure00025",
+        "MagnetCurrent00031",
+    ]
+    # One prompt per atomic query, each with top_k candidates instead of 5000 channels
+    assert pipeline.prompts == [
+        ("vacuum pressure of unit 25", 5),
+        ("magnet current of unit 31", 5),
+    ]
+    assert "retrieval" in result.timings
+
+
+async def test_query_without_candidates_falls_back_to_database_scan():
+    channels = synthetic_channels(50)
+    pipeline = RetrievalPipeline(channels)
+    pipeline.database.get_all_channels = lambda: channels
+    pipeline._split_query = AsyncMock(return_value=["vacuum pressure of unit 25", "beam lifetime"])
+
+    result = await pipeline.process_query("vacuum pressure 25 and beam lifetime")
+
+    # "beam lifetime" shares no terms with the database, so it scans all channels
+    assert pipeline.prompts == [("vacuum pressure of unit 25", 5), ("beam lifetime", 50)]
+    assert [ch.channel for ch in result.channels] == ["VacuumPressure00025", "VacuumPressure00000"]
@@ -0,0 +1,180 @@
+"""
+Tests for the process-wide channel finder service cache.
+
+Covers reuse across calls, invalidation by database content and configuration,
+the disabled mode and background reloading.
+"""
+
+import json
+import os
+import time
+from typing import Any
+
+import pytest
+
+import osprey.services.channel_finder.service as service_module
+from osprey.services.channel_finder import (
+    ChannelFinderService,
+    clear_channel_finder_service_cache,
+    get_channel_finder_service,
+    refresh_channel_finder_services,
+)
+from osprey.services.channel_finder.core.base_pipeline import BasePipeline
+from osprey.services.channel_finder.core.models import ChannelFinderResult
+
+MODEL_CONFIG = {"provider": "test", "model_id": "test"}
+
+
+class EchoPipeline(BasePipeline):
+    """Pipeline returning every channel of its database."""
+
+    def __init__(self, database, model_config: dict, **kwargs):
+        # Skip BasePipeline.__init__, which reads the global config
+        self.database = database
+        self.model_config = model_config
+        self.explicit_validation_mode = "lenient"
+
+    @property
+    def pipeline_name(self) -> str:
+        return "Echo"
+
+    async def process_query(self, query: str) -> ChannelFinderResult:
+        return self._build_result(query, [ch["channel"] for ch in self.database.channels])
+
+    def get_statistics(self) -> dict[str, Any]:
+        return {}
+
+
+class FakeConfigBuilder:
+    def __init__(self, config: dict):
+        self.raw_config = config
+
+    def get(self, path: str, default=None):
+        value = self.raw_config
+        for key in path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Config with the echo pipeline over a flat database in tmp_path."""
+    config = {
+        "project_root": str(tmp_path),
+        "channel_finder": {
+            "pipeline_mode": "echo",
+            "pipelines": {"echo": {"database": {"type": "flat"}}},
+            "service_cache": {"enabled": True},
+        },
+    }
+    monkeypatch.setattr(service_module, "get_config_builder", lambda: FakeConfigBuilder(config))
+    monkeypatch.setattr(ChannelFinderService, "_custom_pipelines", {"echo": EchoPipeline})
+    clear_channel_finder_service_cache()
+    yield config
+    clear_channel_finder_service_cache()
+
+
+def write_database(path, names, mtime_offset=0):
+    path.write_text(json.dumps([{"channel": name, "address": name} for name in names]))
+    # Distinct mtimes even on file systems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+
+def get_service(db_path):
+    return get_channel_finder_service(db_path=str(db_path), model_config=MODEL_CONFIG)
+
+
+def test_service_is_reused_across_calls(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+
+    assert get_service(db_path) is get_service(db_path)
+
+
+def test_changed_database_reloads_service(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    write_database(db_path, ["BeamCurrent", "BeamEnergy"], mtime_offset=10)
+    reloaded = get_service(db_path)
+
+    assert reloaded is not service
+    assert len(reloaded.pipeline.database.channels) == 2
+
+
+def test_touched_database_with_same_content_keeps_service(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    write_database(db_path, ["BeamCurrent"], mtime_offset=10)
+
+    assert get_service(db_path) is service
+
+
+def test_config_change_creates_new_service(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    config["channel_finder"]["explicit_validation_mode"] = "strict"
+
+    assert get_service(db_path) is not service
+
+
+def test_disabled_cache_creates_service_per_call(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    config["channel_finder"]["service_cache"]["enabled"] = False
+
+    assert get_service(db_path) is not get_service(db_path)
+
+
+def test_refresh_keeps_previous_service_on_invalid_database(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    db_path.write_text("[{")  # half-written file
+
+    assert refresh_channel_finder_services() == 0
+    assert service_module._service_cache and all(
+        entry.service is service for entry in service_module._service_cache.values()
+    )
+
+
+def test_get_keeps_previous_service_on_invalid_database(config, tmp_path):
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    db_path.write_text("[{")  # half-written file
+
+    assert get_service(db_path) is service
+
+    write_database(db_path, ["BeamCurrent", "BeamEnergy"], mtime_offset=10)
+    assert len(get_service(db_path).pipeline.database.channels) == 2
+
+
+async def test_watcher_reloads_changed_database(config, tmp_path):
+    config["channel_finder"]["service_cache"].update(watch=True, watch_interval_seconds=0.01)
+    db_path = tmp_path / "channels.json"
+    write_database(db_path, ["BeamCurrent"])
+    service = get_service(db_path)
+
+    write_database(db_path, ["BeamCurrent", "BeamEnergy"], mtime_offset=10)
+    deadline = time.monotonic() + 5
+    while (
+        next(iter(service_module._service_cache.values())).service is service
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.01)
+
+    reloaded = next(iter(service_module._service_cache.values())).service
+    assert reloaded is not service
+    result = await reloaded.find_channels("beam")
+    assert result.total_channels == 2
@@ -6,7 +6,12 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from osprey.connectors.control_system.base import ChannelMetadata, ChannelValue
+from osprey.connectors.control_system.base import (
+    BulkReadResult,
+    ChannelMetadata,
+    ChannelValue,
+    ControlSystemConnector,
+)
 from osprey.services.machine_state.models import (
     ChannelDefinition,
     ChannelResult,
@@ -21,8 +26,19 @@ from osprey.services.machine_state.reader import MachineStateReader
 
 @pytest.fixture
 def mock_connector():
-    """Create a mock ControlSystemConnector."""
+    """Create a mock ControlSystemConnector.
+
+    ``read_multiple_channels_detailed`` uses the base-class implementation so
+    tests can drive the reader through ``read_multiple_channels``.
+    """
     connector = AsyncMock()
+
+    async def detailed(addresses, timeout=None):
+        return await ControlSystemConnector.read_multiple_channels_detailed(
+            connector, addresses, timeout
+        )
+
+    connector.read_multiple_channels_detailed.side_effect = detailed
     return connector
 
 
@@ -317,3 +333,37 @@ class TestModels:
             channels_failed=1,
         )
         assert snap.failed_channels() == ["FAIL:CH"]
+
+
+class TestBulkReadErrors:
+    """Tests for per-channel error reporting from the bulk read API."""
+
+    @pytest.mark.asyncio
+    async def test_connector_error_reasons_are_preserved(
+        self, sample_channels_file, mock_connector
+    ):
+        now = datetime.now(tz=UTC)
+        mock_connector.read_multiple_channels_detailed.side_effect = None
+        mock_connector.read_multiple_channels_detailed.return_value = BulkReadResult(
+            values={
+                "SR:CURRENT:RB": ChannelValue(
+                    value=500.0, timestamp=now, metadata=ChannelMetadata(units="mA")
+                ),
+            },
+            errors={
+                "VA:PRESSURE:01": "Failed to connect to PV 'VA:PRESSURE:01' (timeout after 5.0s)",
+                "RF:POWER:01": "No value received for PV 'RF:POWER:01'",
+            },
+            elapsed_seconds=0.25,
+            stats={"connect_seconds": 0.2},
+        )
+
+        reader = MachineStateReader(sample_channels_file, mock_connector)
+        snapshot = await reader.read()
+
+        assert snapshot.channels_read == 1
+        assert snapshot.channels_failed == 2
+        assert "timeout" in snapshot.channels["VA:PRESSURE:01"].error
+        assert "No value" in snapshot.channels["RF:POWER:01"].error
+        assert snapshot.read_seconds == 0.25
+        assert snapshot.read_stats["connect_seconds"] == 0.2
@@ -0,0 +1,331 @@
+"""Tests for the asyncio-native Jupyter kernel client in container_engine.
+
+A small aiohttp application stands in for the Jupyter server REST and kernel
+WebSocket APIs, so the session manager and execution engine are exercised over
+real HTTP/WebSocket connections without a container.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from aiohttp import WSMsgType, web
+
+from osprey.services.python_executor.exceptions import (
+    CodeRuntimeError,
+    ContainerConnectivityError,
+    ExecutionTimeoutError,
+)
+from osprey.services.python_executor.execution import container_engine
+from osprey.services.python_executor.execution.container_engine import (
+    CodeExecutionEngine,
+    ContainerEndpoint,
+    JupyterSessionManager,
+    SessionInfo,
+    close_container_sessions,
+    execute_python_code_in_container,
+    get_session_manager,
+)
+from osprey.services.python_executor.execution.wrapper import ExecutionWrapper
+
+
+def _kernel_message(msg_type, parent_msg_id, content):
+    return json.dumps(
+        {
+            "header": {"msg_type": msg_type},
+            "parent_header": {"msg_id": parent_msg_id},
+            "content": content,
+        }
+    )
+
+
+class FakeJupyterServer:
+    """Minimal Jupyter server: sessions, kernel status and a kernel channel."""
+
+    def __init__(self):
+        self.sessions_created = 0
+        self.ws_connections = 0
+        self.ws_open = 0
+        self.kernel_delay = 0.0
+        self.drop_next_request = False
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/sessions", self.create_session)
+        app.router.add_get("/api/sessions/{session_id}", self.get_session)
+        app.router.add_get("/api/kernels/{kernel_id}", self.get_kernel)
+        app.router.add_get("/api/kernels/{kernel_id}/channels", self.channels)
+        return app
+
+    async def create_session(self, request):
+        self.sessions_created += 1
+        n = self.sessions_created
+        return web.json_response({"id": f"session-{n}", "kernel": {"id": f"kernel-{n}"}})
+
+    async def get_session(self, request):
+        return web.json_response({"id": request.match_info["session_id"]})
+
+    async def get_kernel(self, request):
+        return web.json_response({"execution_state": "idle"})
+
+    async def channels(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws_connections += 1
+        self.ws_open += 1
+        try:
+            await self._serve_channel(ws)
+        finally:
+            self.ws_open -= 1
+        return ws
+
+    async def _serve_channel(self, ws):
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            if self.drop_next_request:
+                self.drop_next_request = False
+                await ws.close()
+                break
+            request_msg = json.loads(msg.data)
+            msg_id = request_msg["header"]["msg_id"]
+            code = request_msg["content"]["code"]
+
+            # Output belonging to another request must be ignored
+            await ws.send_str(_kernel_message("stream", "other", {"name": "stdout", "text": "x"}))
+            await ws.send_str(
+                _kernel_message("stream", msg_id, {"name": "stdout", "text": f"ran {code}\n"})
+            )
+            await ws.send_str(
+                _kernel_message(
+                    "display_data", msg_id, {"data": {"text/plain": "<Figure>"}, "metadata": {}}
+                )
+            )
+            await asyncio.sleep(self.kernel_delay)
+            if code == "fail":
+                reply = {"status": "error", "ename": "ValueError", "evalue": "bad", "traceback": []}
+            else:
+                reply = {"status": "ok"}
+            await ws.send_str(_kernel_message("execute_reply", msg_id, reply))
+
+
+@pytest.fixture
+async def jupyter_server():
+    server = FakeJupyterServer()
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield server, ContainerEndpoint(host="127.0.0.1", port=port, kernel_name="python3")
+    await runner.cleanup()
+
+
+async def test_execution_streams_output_and_reuses_websocket(jupyter_server):
+    server, endpoint = jupyter_server
+    outputs = []
+    manager = JupyterSessionManager(endpoint)
+    engine = CodeExecutionEngine(endpoint, timeout=5, output_callback=lambda *o: outputs.append(o))
+
+    try:
+        for code in ("a", "b"):
+            session = await manager.ensure_session()
+            channel = await manager.get_kernel_channel(session)
+            await engine.execute_code(code, session, channel)
+    finally:
+        await manager.close()
+
+    assert server.sessions_created == 1
+    assert server.ws_connections == 1
+    assert outputs == [
+        ("stdout", "ran a\n"),
+        ("display", "<Figure>"),
+        ("stdout", "ran b\n"),
+        ("display", "<Figure>"),
+    ]
+
+
+async def test_kernel_error_raises_code_runtime_error(jupyter_server):
+    _, endpoint = jupyter_server
+    manager = JupyterSessionManager(endpoint)
+    engine = CodeExecutionEngine(endpoint, timeout=5)
+
+    try:
+        session = await manager.ensure_session()
+        channel = await manager.get_kernel_channel(session)
+        with pytest.raises(CodeRuntimeError, match="ValueError: bad"):
+            await engine.execute_code("fail", session, channel)
+    finally:
+        await manager.close()
+
+
+async def test_execution_timeout_does_not_block_event_loop(jupyter_server):
+    server, endpoint = jupyter_server
+    server.kernel_delay = 2.0
+    manager = JupyterSessionManager(endpoint)
+    engine = CodeExecutionEngine(endpoint, timeout=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        session = await manager.ensure_session()
+        channel = await manager.get_kernel_channel(session)
+        with pytest.raises(ExecutionTimeoutError):
+            await engine.execute_code("slow", session, channel)
+    finally:
+        ticker_task.cancel()
+        await manager.close()
+
+    # The loop kept running other tasks while waiting on the kernel
+    assert ticks >= 10
+
+
+async def test_health_check_reports_unreachable_server():
+    endpoint = ContainerEndpoint(host="127.0.0.1", port=1, kernel_name="python3")
+    manager = JupyterSessionManager(endpoint)
+    try:
+        assert not await manager.check_session_health(SessionInfo("s", "k"))
+    finally:
+        await manager.close()
+
+
+@pytest.fixture
+async def session_cache():
+    yield
+    await close_container_sessions()
+
+
+@pytest.fixture
+def execution_folder(tmp_path, monkeypatch):
+    """Execution folder holding the metadata the (fake) kernel would have written."""
+    (tmp_path / "execution_metadata.json").write_text(json.dumps({"success": True}))
+    monkeypatch.setattr(
+        ExecutionWrapper, "_convert_host_path_to_container_path", lambda self, path: str(path)
+    )
+    return tmp_path
+
+
+async def test_executions_of_a_session_share_one_connection(
+    jupyter_server, session_cache, execution_folder
+):
+    server, endpoint = jupyter_server
+
+    for _ in range(2):
+        result = await execute_python_code_in_container(
+            "x = 1", endpoint, timeout=5, execution_folder=execution_folder, session_id="chat-1"
+        )
+        assert result.success
+
+    assert server.sessions_created == 1
+    assert server.ws_connections == 1
+
+
+async def test_sessions_are_cached_separately_and_closed(jupyter_server, session_cache):
+    _, endpoint = jupyter_server
+
+    first = await get_session_manager(endpoint, "chat-1")
+    assert await get_session_manager(endpoint, "chat-1") is first
+    second = await get_session_manager(endpoint, "chat-2")
+    assert second is not first
+    first._get_http_session()
+
+    await close_container_sessions("chat-1")
+
+    assert first._http_session is None
+    assert await get_session_manager(endpoint, "chat-1") is not first
+    assert await get_session_manager(endpoint, "chat-2") is second
+
+
+async def test_idle_sessions_are_closed(jupyter_server, session_cache, monkeypatch):
+    _, endpoint = jupyter_server
+    manager = await get_session_manager(endpoint, "chat-1")
+
+    monkeypatch.setattr(container_engine, "SESSION_IDLE_TIMEOUT_SECONDS", -1.0)
+
+    assert await get_session_manager(endpoint, "chat-2") is not None
+    assert await get_session_manager(endpoint, "chat-1") is not manager
+
+
+async def _open_manager_on_other_loop(endpoint):
+    """Create a session manager with an open kernel WebSocket on a loop in another thread."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def open_manager():
+        manager = await get_session_manager(endpoint, "chat-1")
+        await manager.get_kernel_channel(await manager.ensure_session())
+        return manager
+
+    manager = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(open_manager(), loop))
+    return manager, loop, thread
+
+
+async def _wait_for(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+async def test_manager_of_running_loop_is_closed_on_that_loop(jupyter_server, session_cache):
+    server, endpoint = jupyter_server
+    old, other_loop, thread = await _open_manager_on_other_loop(endpoint)
+    assert server.ws_open == 1
+
+    try:
+        assert await get_session_manager(endpoint, "chat-1") is not old
+        await _wait_for(lambda: old._http_session is None and server.ws_open == 0)
+    finally:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(old.close(), other_loop))
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+
+
+async def test_manager_of_stopped_loop_is_released(jupyter_server, session_cache):
+    server, endpoint = jupyter_server
+    old, other_loop, thread = await _open_manager_on_other_loop(endpoint)
+    http_session = old._http_session
+    other_loop.call_soon_threadsafe(other_loop.stop)
+    thread.join(timeout=5)
+
+    try:
+        assert await get_session_manager(endpoint, "chat-1") is not old
+
+        assert old._http_session is None
+        assert http_session.closed
+        await _wait_for(lambda: server.ws_open == 0)
+    finally:
+        other_loop.close()
+
+
+async def test_broken_connection_reconnects_on_next_execution(
+    jupyter_server, session_cache, execution_folder
+):
+    server, endpoint = jupyter_server
+    await execute_python_code_in_container(
+        "x = 1", endpoint, timeout=5, execution_folder=execution_folder, session_id="chat-1"
+    )
+
+    server.drop_next_request = True
+    with pytest.raises(ContainerConnectivityError):
+        await execute_python_code_in_container(
+            "x = 2", endpoint, timeout=5, execution_folder=execution_folder, session_id="chat-1"
+        )
+
+    result = await execute_python_code_in_container(
+        "x = 3", endpoint, timeout=5, execution_folder=execution_folder, session_id="chat-1"
+    )
+    assert result.success
+
+    assert server.sessions_created == 1
+    assert server.ws_connections == 2
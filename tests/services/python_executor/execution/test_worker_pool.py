@@ -0,0 +1,166 @@
+"""Tests for the pre-warmed local execution worker pool.
+
+These start real template processes (one shared pool for the module), so they
+cover the fork protocol, output capture, isolation between runs and the
+timeout/recycle path end to end.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from osprey.services.python_executor.execution.worker_pool import (
+    WarmWorker,
+    WorkerError,
+    WorkerPool,
+    WorkerTimeoutError,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Worker pool requires os.fork")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    env = dict(os.environ)
+    env.pop("CONFIG_FILE", None)
+    worker_pool = WorkerPool(sys.executable, env, size=1, max_runs_per_worker=3)
+    yield worker_pool
+    worker_pool.close()
+
+
+def _write_script(directory, name, code):
+    path = directory / name
+    path.write_text(code)
+    return str(path)
+
+
+def test_run_captures_output_and_uses_job_cwd_and_env(pool, tmp_path):
+    script = _write_script(
+        tmp_path,
+        "job.py",
+        "import os, sys\n"
+        "print(os.getcwd(), os.environ['OSPREY_TEST_VALUE'])\n"
+        "print('to stderr', file=sys.stderr)\n",
+    )
+    env = dict(pool.env, OSPREY_TEST_VALUE="42")
+
+    result = pool.run(script, str(tmp_path), env, timeout=120)
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == f"{tmp_path} 42"
+    assert result.stderr.strip() == "to stderr"
+
+
+def test_runs_are_isolated_from_each_other(pool, tmp_path):
+    script = _write_script(
+        tmp_path,
+        "job.py",
+        "import sys\nprint(getattr(sys, '_osprey_leak', 'clean'))\nsys._osprey_leak = 'leaked'\n",
+    )
+
+    first = pool.run(script, str(tmp_path), pool.env, timeout=120)
+    second = pool.run(script, str(tmp_path), pool.env, timeout=120)
+
+    assert first.stdout.strip() == "clean"
+    assert second.stdout.strip() == "clean"
+
+
+def test_uncaught_exception_sets_returncode(pool, tmp_path):
+    script = _write_script(tmp_path, "job.py", "raise ValueError('boom')\n")
+
+    result = pool.run(script, str(tmp_path), pool.env, timeout=120)
+
+    assert result.returncode == 1
+    assert "ValueError: boom" in result.stderr
+
+
+def test_timeout_kills_run_and_recycles_worker(pool, tmp_path):
+    # Make sure a warm worker exists so the timeout only covers the script
+    warmup = _write_script(tmp_path, "warmup.py", "pass\n")
+    pool.run(warmup, str(tmp_path), pool.env, timeout=120)
+
+    script = _write_script(tmp_path, "slow.py", "import time\ntime.sleep(30)\n")
+    start = time.monotonic()
+    with pytest.raises(WorkerTimeoutError):
+        pool.run(script, str(tmp_path), pool.env, timeout=1)
+    assert time.monotonic() - start < 10
+
+    # A replacement worker serves the next run
+    result = pool.run(warmup, str(tmp_path), pool.env, timeout=120)
+    assert result.returncode == 0
+
+
+def _process_exited(pid):
+    """Whether a process is gone or a zombie (killed but not yet reaped by init)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] in ("Z", "X")
+    except FileNotFoundError:
+        return True
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="Needs /proc to inspect processes")
+def test_timeout_before_started_reply_kills_forked_child(pool, tmp_path):
+    pid_file = tmp_path / "child.pid"
+    script = _write_script(
+        tmp_path,
+        "slow.py",
+        f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\ntime.sleep(30)\n",
+    )
+    worker = WarmWorker(sys.executable, pool.env, startup_timeout=120)
+    read_message = worker._read_message
+
+    def time_out_before_started(deadline):
+        # Simulate the deadline passing after the fork but before the "started" reply
+        wait_until = time.monotonic() + 10
+        while not pid_file.exists() or not pid_file.read_text():
+            assert time.monotonic() < wait_until, "child did not start"
+            time.sleep(0.01)
+        worker._read_message = read_message
+        raise WorkerTimeoutError()
+
+    worker._read_message = time_out_before_started
+    try:
+        with pytest.raises(WorkerTimeoutError):
+            worker.run(script, str(tmp_path), pool.env, timeout=60)
+
+        child_pid = int(pid_file.read_text())
+        wait_until = time.monotonic() + 5
+        while not _process_exited(child_pid) and time.monotonic() < wait_until:
+            time.sleep(0.01)
+        assert _process_exited(child_pid)
+        assert not worker.healthy
+    finally:
+        worker.close()
+
+
+def test_template_preloads_imports_without_initializing_registry(pool, tmp_path):
+    script = _write_script(
+        tmp_path,
+        "job.py",
+        "import sys\n"
+        "manager = sys.modules.get('osprey.registry.manager')\n"
+        "print(manager is not None, manager is not None and manager._registry is None)\n",
+    )
+
+    result = pool.run(script, str(tmp_path), pool.env, timeout=120)
+
+    assert result.stdout.strip() == "True True"
+
+
+def test_busy_pool_gives_up_after_acquire_timeout(pool, tmp_path):
+    pool.acquire_timeout = 0.2
+    busy = pool._acquire()
+    try:
+        script = _write_script(tmp_path, "job.py", "pass\n")
+        start = time.monotonic()
+        with pytest.raises(WorkerError, match="No warm worker available"):
+            pool.run(script, str(tmp_path), pool.env, timeout=120)
+        assert time.monotonic() - start < 5
+    finally:
+        pool._release(busy)
+        pool.acquire_timeout = 10.0
+
+    assert pool.run(script, str(tmp_path), pool.env, timeout=120).returncode == 0
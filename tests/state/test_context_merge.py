@@ -0,0 +1,101 @@
+"""Tests for the structural-sharing capability context reducer."""
+
+import pytest
+
+from osprey.context.base import CapabilityContext
+from osprey.context.context_manager import ContextManager
+from osprey.state.state import merge_capability_context_data
+
+
+class NoCopy(list):
+    """Payload that fails loudly if the reducer tries to copy it."""
+
+    def __deepcopy__(self, memo):
+        raise AssertionError("context payload was deep-copied")
+
+    def __copy__(self):
+        raise AssertionError("context payload was copied")
+
+
+class ValueContext(CapabilityContext):
+    CONTEXT_TYPE = "VALUES"
+    value: int
+
+    def get_access_details(self, key: str) -> dict:
+        return {"value": self.value}
+
+
+@pytest.fixture
+def existing():
+    return {
+        "ARCHIVER_DATA": {"beam": {"values": NoCopy(range(1000))}},
+        "PV_ADDRESSES": {"step1": {"pvs": ["SR:C01:MAG:1"]}},
+    }
+
+
+def test_merge_adds_and_overrides_keys(existing):
+    new = {
+        "PV_ADDRESSES": {"step1": {"pvs": ["SR:C03:MAG:1"]}, "step2": {"pvs": ["SR:C02:MAG:1"]}},
+        "TIME_RANGE": {"last_hour": {"start": "a", "end": "b"}},
+    }
+
+    result = merge_capability_context_data(existing, new)
+
+    assert result["PV_ADDRESSES"] == {
+        "step1": {"pvs": ["SR:C03:MAG:1"]},
+        "step2": {"pvs": ["SR:C02:MAG:1"]},
+    }
+    assert result["TIME_RANGE"] == {"last_hour": {"start": "a", "end": "b"}}
+    assert list(result["ARCHIVER_DATA"]["beam"]["values"]) == list(range(1000))
+
+
+def test_merge_does_not_mutate_inputs(existing):
+    existing_types = dict(existing)
+    existing_pvs = dict(existing["PV_ADDRESSES"])
+    new = {"PV_ADDRESSES": {"step2": {"pvs": ["SR:C02:MAG:1"]}}}
+
+    result = merge_capability_context_data(existing, new)
+    result["PV_ADDRESSES"]["step3"] = {"pvs": []}
+    result["NEW_TYPE"] = {}
+
+    assert existing == existing_types
+    assert existing["PV_ADDRESSES"] == existing_pvs
+    assert new == {"PV_ADDRESSES": {"step2": {"pvs": ["SR:C02:MAG:1"]}}}
+
+
+def test_merge_shares_untouched_snapshots_without_copying(existing):
+    new = {"PV_ADDRESSES": {"step2": {"pvs": ["SR:C02:MAG:1"]}}}
+
+    result = merge_capability_context_data(existing, new)
+
+    assert result is not existing
+    assert result["ARCHIVER_DATA"] is existing["ARCHIVER_DATA"]
+    assert result["PV_ADDRESSES"] is not existing["PV_ADDRESSES"]
+    assert result["PV_ADDRESSES"]["step1"] is existing["PV_ADDRESSES"]["step1"]
+    assert result["PV_ADDRESSES"]["step2"] is new["PV_ADDRESSES"]["step2"]
+
+
+def test_merge_from_empty_state_copies_containers_only():
+    new = {"ARCHIVER_DATA": {"beam": {"values": NoCopy([1, 2, 3])}}}
+
+    result = merge_capability_context_data(None, new)
+
+    assert result == new
+    assert result["ARCHIVER_DATA"] is not new["ARCHIVER_DATA"]
+    assert result["ARCHIVER_DATA"]["beam"] is new["ARCHIVER_DATA"]["beam"]
+
+
+def test_context_manager_updates_do_not_leak_into_earlier_snapshots(existing):
+    snapshot = merge_capability_context_data(None, existing)
+    state = {"capability_context_data": merge_capability_context_data(snapshot, {})}
+
+    manager = ContextManager(state)
+    manager.set_context("VALUES", "a", ValueContext(value=1), skip_validation=True)
+    manager.set_context("PV_ADDRESSES", "step2", ValueContext(value=2), skip_validation=True)
+    merged = merge_capability_context_data(snapshot, manager.get_raw_data())
+
+    assert "step2" not in snapshot["PV_ADDRESSES"]
+    assert "VALUES" not in snapshot
+    assert merged["VALUES"]["a"]["value"] == 1
+    assert merged["PV_ADDRESSES"]["step2"]["value"] == 2
+    assert merged["ARCHIVER_DATA"] is snapshot["ARCHIVER_DATA"]
@@ -0,0 +1,119 @@
+"""Tests for token-budgeted conversation history."""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from osprey.state import ChatHistoryFormatter
+from osprey.state.history import ChatHistoryManager, estimate_tokens
+
+
+def conversation(turns: int, size: int = 400) -> list:
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"question {i} " + "q" * size, id=f"h{i}"))
+        messages.append(AIMessage(content=f"answer {i} " + "a" * size, id=f"a{i}"))
+    return messages
+
+
+class RecordingSummarizer:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, previous, messages, max_tokens):
+        self.calls.append((previous, [m.id for m in messages]))
+        return f"{previous or ''}+{len(messages)}"
+
+
+async def test_short_history_is_passed_unchanged():
+    messages = conversation(2)
+
+    window = await ChatHistoryManager(max_tokens=4000).build_window(messages)
+
+    assert window.messages == messages
+    assert window.summary is None
+    assert window.saved_tokens == 0
+
+
+async def test_disabled_budget_keeps_full_history():
+    messages = conversation(50)
+
+    window = await ChatHistoryManager(max_tokens=0).build_window(messages)
+
+    assert window.messages == messages
+
+
+async def test_long_history_is_windowed_with_summary():
+    messages = conversation(50)
+    summarizer = RecordingSummarizer()
+    manager = ChatHistoryManager(max_tokens=1000, summarizer=summarizer)
+
+    window = await manager.build_window(messages)
+
+    assert isinstance(window.messages[0], SystemMessage)
+    assert window.messages[-1] is messages[-1]
+    # Window starts at a user message and fits the budget
+    assert isinstance(window.messages[1], HumanMessage)
+    assert window.window_tokens <= 1000
+    assert window.saved_tokens > 0.9 * window.full_tokens
+    assert window.summary_updated
+    assert len(summarizer.calls) == 1
+    assert "Summary of the" in ChatHistoryFormatter.format_for_llm(window.messages)
+
+
+async def test_summary_is_reused_until_window_slides():
+    messages = conversation(50)
+    summarizer = RecordingSummarizer()
+    manager = ChatHistoryManager(max_tokens=1000, summarizer=summarizer)
+    window = await manager.build_window(messages)
+    cache = window.cache
+
+    # One more turn still fits in the refilled window: no new summary
+    messages += conversation(51)[-2:]
+    window = await manager.build_window(messages, cache)
+    assert not window.summary_updated
+    assert len(summarizer.calls) == 1
+
+    # Keep talking until the window slides; only new evictions are summarized
+    covered = cache["covered"]
+    for turn in range(52, 60):
+        messages += [
+            HumanMessage(content="q" * 400, id=f"h{turn}"),
+            AIMessage(content="a" * 400, id=f"a{turn}"),
+        ]
+        window = await manager.build_window(messages, window.cache)
+        if window.summary_updated:
+            break
+    assert len(summarizer.calls) == 2
+    previous, evicted = summarizer.calls[1]
+    assert previous == cache["summary"]
+    assert evicted[0] == messages[covered].id
+
+
+async def test_stale_cache_is_ignored():
+    messages = conversation(50)
+    manager = ChatHistoryManager(max_tokens=1000, summarizer=RecordingSummarizer())
+    stale = {"summary": "old conversation", "covered": 10, "last_id": "other"}
+
+    window = await manager.build_window(messages, stale)
+
+    assert "old conversation" not in window.summary
+
+
+async def test_min_recent_messages_exceed_budget():
+    messages = conversation(10, size=4000)
+
+    window = await ChatHistoryManager(max_tokens=100, min_recent_messages=4).build_window(messages)
+
+    assert window.messages[-4:] == messages[-4:]
+    assert window.summarized_count == len(messages) - 4
+
+
+async def test_extractive_summary_is_bounded():
+    messages = conversation(200)
+
+    window = await ChatHistoryManager(max_tokens=1000, summary_max_tokens=200).build_window(
+        messages
+    )
+
+    assert estimate_tokens(window.summary) <= 200
+    # The most recent evicted message survives the truncation
+    assert f"answer {window.summarized_count // 2 - 1}" in window.summary
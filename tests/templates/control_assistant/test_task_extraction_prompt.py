@@ -114,8 +114,8 @@ def mock_infrastructure():
 class TestControlSystemTaskExtractionPrompt:
     """Test suite for control assistant task extraction prompt customization."""
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_custom_prompt_is_used(self, mock_llm, sample_messages):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_custom_prompt_is_used(self, mock_llm, sample_messages):
         """Test that the custom control system prompt builder is used instead of framework default."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -128,7 +128,7 @@ class TestControlSystemTaskExtractionPrompt:
 
         # Call task extraction (infrastructure is mocked by autouse fixture)
         logger = MagicMock()
-        _extract_task(sample_messages, retrieval_result=None, logger=logger)
+        await _extract_task(sample_messages, retrieval_result=None, logger=logger)
 
         # Verify LLM was called
         assert mock_llm.called, "LLM should have been called for task extraction"
@@ -146,8 +146,8 @@ class TestControlSystemTaskExtractionPrompt:
             or "control system operations" in prompt.lower()
         ), "Prompt should contain control system specific role"
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_bpm_terminology_in_prompt(self, mock_llm, bpm_messages):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_bpm_terminology_in_prompt(self, mock_llm, bpm_messages):
         """Test that the prompt clarifies BPM = Beam Position Monitor (not beats per minute)."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -160,7 +160,7 @@ class TestControlSystemTaskExtractionPrompt:
 
         # Call task extraction with BPM in the message
         logger = MagicMock()
-        _extract_task(bpm_messages, retrieval_result=None, logger=logger)
+        await _extract_task(bpm_messages, retrieval_result=None, logger=logger)
 
         # Get the prompt
         call_args = mock_llm.call_args
@@ -175,8 +175,8 @@ class TestControlSystemTaskExtractionPrompt:
             "Prompt should explicitly state BPM is NOT beats per minute"
         )
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_control_system_terminology_present(self, mock_llm, sample_messages):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_control_system_terminology_present(self, mock_llm, sample_messages):
         """Test that control system terminology is included in the prompt."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -189,7 +189,7 @@ class TestControlSystemTaskExtractionPrompt:
 
         # Call task extraction
         logger = MagicMock()
-        _extract_task(sample_messages, retrieval_result=None, logger=logger)
+        await _extract_task(sample_messages, retrieval_result=None, logger=logger)
 
         # Get the prompt
         call_args = mock_llm.call_args
@@ -211,8 +211,8 @@ class TestControlSystemTaskExtractionPrompt:
             f"Found: {terms_found}. Prompt excerpt: {prompt[:500]}"
         )
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_control_system_guidelines_present(self, mock_llm, sample_messages):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_control_system_guidelines_present(self, mock_llm, sample_messages):
         """Test that control system specific guidelines are in the prompt."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -225,7 +225,7 @@ class TestControlSystemTaskExtractionPrompt:
 
         # Call task extraction
         logger = MagicMock()
-        _extract_task(sample_messages, retrieval_result=None, logger=logger)
+        await _extract_task(sample_messages, retrieval_result=None, logger=logger)
 
         # Get the prompt
         call_args = mock_llm.call_args
@@ -241,8 +241,8 @@ class TestControlSystemTaskExtractionPrompt:
             "Prompt should mention channel reference resolution"
         )
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_framework_defaults_not_present(self, mock_llm, sample_messages):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_framework_defaults_not_present(self, mock_llm, sample_messages):
         """Test that framework default examples are NOT present (we use only control system examples)."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -255,7 +255,7 @@ class TestControlSystemTaskExtractionPrompt:
 
         # Call task extraction
         logger = MagicMock()
-        _extract_task(sample_messages, retrieval_result=None, logger=logger)
+        await _extract_task(sample_messages, retrieval_result=None, logger=logger)
 
         # Get the prompt
         call_args = mock_llm.call_args
@@ -289,8 +289,8 @@ class TestControlSystemTaskExtractionPrompt:
 class TestTaskExtractionIntegration:
     """Integration tests for task extraction with custom prompt."""
 
-    @patch("osprey.infrastructure.task_extraction_node.get_chat_completion")
-    def test_full_extraction_flow_with_custom_prompt(self, mock_llm):
+    @patch("osprey.infrastructure.task_extraction_node.aget_chat_completion")
+    async def test_full_extraction_flow_with_custom_prompt(self, mock_llm):
         """Test the complete task extraction flow uses the custom prompt."""
         from osprey.infrastructure.task_extraction_node import _extract_task
 
@@ -309,7 +309,7 @@ class TestTaskExtractionIntegration:
 
         # Call task extraction
         logger = MagicMock()
-        result = _extract_task(messages, retrieval_result=None, logger=logger)
+        result = await _extract_task(messages, retrieval_result=None, logger=logger)
 
         # Verify result
         assert result == expected_task